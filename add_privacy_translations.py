@@ -1,263 +0,0 @@
-#!/usr/bin/env python3
-import json
-
-# German translations
-de_privacy = {
-    "TITLE": "Datenschutzerklärung",
-    "LAST_UPDATED": "Letzte Aktualisierung",
-    "INTRO_TITLE": "Einführung",
-    "INTRO_TEXT": "Music Rights Platform (\"wir\", \"uns\", \"unser\" oder \"Unternehmen\") betreibt die Music Rights Platform Website und Anwendung. Diese Datenschutzerklärung erläutert, wie wir Ihre Informationen sammeln, verwenden, offenlegen und schützen, wenn Sie unseren Service nutzen.",
-    "PASSION_PROJECT": "Dies ist ein Leidenschaftsprojekt – Kein kommerzieller Service",
-    "PASSION_1": "Diese Plattform ist ein persönliches, nicht-kommerzielles Projekt, das von einer Einzelperson erstellt wurde.",
-    "PASSION_2": "Es ist kein eingetragenes Unternehmen, keine LLC oder juristische Person.",
-    "PASSION_3": "Es gibt kein dediziertes Support-Team, keine Kunden-Hotline oder Service Level Agreement (SLA).",
-    "PASSION_4": "Funktionen, Verfügbarkeit und Funktionalität werden nur auf \"Best-Effort\"-Basis bereitgestellt.",
-    "PASSION_5": "Wir geben keine Garantien bezüglich Zuverlässigkeit, Verfügbarkeit, Genauigkeit oder Eignung für einen bestimmten Zweck.",
-    "NO_LIABILITY": "Keine Haftung für Schäden oder Verluste",
-    "NO_LIABILITY_TEXT": "Durch die Nutzung dieser Plattform erkennen Sie an und stimmen zu, dass wir KEINE Verantwortung oder Haftung für Verluste, Schäden, Datenverluste oder andere Konsequenzen übernehmen, die aus Ihrer Nutzung dieses Service entstehen. Nutzung vollständig auf eigenes Risiko.",
-    "ACKNOWLEDGMENT": "Anerkennung der Bedingungen",
-    "GDPR_COMPLIANCE": "Obwohl dies ein Leidenschaftsprojekt ist, entsprechen wir der <strong>Datenschutz-Grundverordnung (DSGVO)</strong> und den geltenden europäischen Datenschutzgesetzen.",
-    "INVITE_TITLE": "Nur-Einladung Zugang & Recht auf Verweigerung des Service",
-    "NOT_PUBLIC": "Kein öffentlicher Service",
-    "INVITE_ACCESS": "Diese Plattform ist nur auf Einladung und befindet sich derzeit in geschlossener Beta. Der Zugang wird nach unserem alleinigen Ermessen gewährt.",
-    "INVITE_1": "Die Registrierung kann einen Einladungscode oder manuelle Genehmigung erfordern.",
-    "INVITE_2": "Wir garantieren nicht jedem Zugang, der ihn beantragt.",
-    "INVITE_3": "Ihr Zugang kann jederzeit ohne vorherige Ankündigung widerrufen werden.",
-    "WE_RESERVE": "Wir behalten uns das Recht vor, den Service zu verweigern",
-    "RESERVE_1": "Wir können den Zugang für jeden Benutzer jederzeit aus beliebigem Grund verweigern, aussetzen oder beenden.",
-    "RESERVE_2": "Wir sind nicht verpflichtet, Erklärungen für Ablehnung oder Beendigung zu liefern.",
-    "RESERVE_3": "Wir haften nicht für Konsequenzen der Kontosperrung oder -beendigung.",
-    "YOU_ACKNOWLEDGE": "Sie erkennen an",
-    "ACKNOWLEDGE_1": "Dieser Service ist experimentell, kann sich ändern und ohne Warnung eingestellt werden.",
-    "ACKNOWLEDGE_2": "Es gibt keinen Anspruch auf fortgesetzten Zugang oder Verfügbarkeit.",
-    "ACKNOWLEDGE_3": "Wir machen keine Zusagen bezüglich Funktionsverfügbarkeit oder Datenpersistenz.",
-    "ACKNOWLEDGE_4": "Die Nutzung dieser Plattform ist ein Privileg, kein Recht.",
-    "CONTROLLER_TITLE": "Datenverantwortlicher & Kontaktinformationen",
-    "CONTROLLER_TEXT": "Der für Ihre personenbezogenen Daten verantwortliche Datenverantwortliche ist der Plattformbetreiber.",
-    "CONTACT_TITLE": "Kontakt",
-    "CONTACT_TEXT": "Für Datenschutzanfragen nutzen Sie die In-App-Support-Funktion (falls verfügbar).",
-    "GDPR_REQUESTS": "DSGVO-Anfragen betroffener Personen",
-    "GDPR_REQUESTS_TEXT": "Für DSGVO-Anfragen kontaktieren Sie uns über die oben genannten Methoden. Wir antworten innerhalb von 30 Tagen.",
-    "DPA_TITLE": "Datenschutzbehörde",
-    "DPA_TEXT": "Sie können sich bei Bedenken an Ihre lokale Datenschutzbehörde wenden.",
-    "COLLECTION_TITLE": "Welche Informationen wir sammeln",
-    "VOLUNTARY_TITLE": "Von Ihnen bereitgestellte Informationen (freiwillig)",
-    "VOLUNTARY_TEXT": "Wir sammeln Informationen, die Sie freiwillig bereitstellen:",
-    "ACCOUNT_INFO": "Kontoinformationen",
-    "ACCOUNT_INFO_TEXT": "E-Mail, Passwort (gehasht), Anzeigename, optionales Profilfoto.",
-    "PROFILE_INFO": "Profildaten",
-    "PROFILE_INFO_TEXT": "Name, Pseudonym/Nickname, IPI, ISNI, PRO/CMO, Kontaktdaten.",
-    "WORK_INFO": "Musikwerke & Metadaten",
-    "WORK_INFO_TEXT": "Songtitel, ISWC-Codes, ISRC, Veröffentlichungsdaten, Mitarbeiter, Aufteilungen.",
-    "RIGHTS_INFO": "Rechteinhaberinformationen",
-    "RIGHTS_INFO_TEXT": "Komponist, Texter, Verleger, Interpretendetails, Rollen, KI-Offenlegungen.",
-    "SPLIT_INFO": "Protokoll & Aufteilungsvereinbarungen",
-    "SPLIT_INFO_TEXT": "Aufteilungsprozentsätze, Unterschriften, QR-Codes, PDF-Protokolldokumente.",
-    "IMPORTANT": "Wichtig",
-    "USER_RESPONSIBILITY": "Sie sind allein verantwortlich für die Richtigkeit der von Ihnen hochgeladenen Informationen.",
-    "NO_VERIFY": "Wir überprüfen die Richtigkeit der von Benutzern bereitgestellten Daten nicht.",
-    "AUTO_TITLE": "Automatisch gesammelte Informationen",
-    "AUTO_TEXT": "Wir sammeln automatisch technische Informationen:",
-    "AUTO_1": "Geräteinformationen (Typ, OS, Browser)",
-    "AUTO_2": "IP-Adresse und ungefährer Standort",
-    "AUTO_3": "Zeitstempel und Sitzungsdauer",
-    "AUTO_4": "Besuchte Seiten und genutzte Funktionen",
-    "AUTO_5": "Fehlerprotokolle und Leistungsmetriken",
-    "AUTO_PURPOSE": "Diese Daten werden für Funktionalität, Sicherheit, Fehlersuche und Verbesserungen verwendet.",
-    "MUSIC_TITLE": "Musikindustrie-spezifische Daten",
-    "MUSIC_TEXT": "Wir sammeln Musikrechteverwaltungsdaten:",
-    "NICKNAME_LABEL": "Nicknames/Pseudonyme",
-    "NICKNAME_TEXT": "Künstlernamen oder Aliase, die Sie professionell verwenden.",
-    "IPI_LABEL": "IPI-Nummer",
-    "IPI_TEXT": "Eindeutige Kennung, die von Verwertungsgesellschaften vergeben wird.",
-    "ISNI_LABEL": "ISNI",
-    "ISNI_TEXT": "International Standard Name Identifier für Mitwirkende.",
-    "CMO_LABEL": "CMO/PRO-Mitgliedschaft",
-    "CMO_TEXT": "Ihre Zugehörigkeit zu Organisationen wie GEMA, ASCAP, PRS.",
-    "AI_LABEL": "KI-Offenlegung",
-    "AI_TEXT": "Ob KI bei der Werkerstellung beteiligt war.",
-    "NICKNAME_SYSTEM": "Nickname/Profil-ID-System",
-    "NICKNAME_1": "Wir generieren eine eindeutige profile_id für jeden Benutzer.",
-    "NICKNAME_2": "Sie können einen Nickname erstellen, der mit Ihrer profile_id verknüpft ist.",
-    "NICKNAME_3": "Nicknames sind öffentlich sichtbar, wenn Ihr Profil öffentlich ist.",
-    "AI_DISCLOSURES": "KI-Offenlegungen",
-    "AI_DISC_1": "Sie können angeben, ob ein Werk KI-Tools verwendet hat.",
-    "AI_DISC_2": "Diese Information erscheint in öffentlichen Werkmetadaten und Protokollen.",
-    "AI_DISC_3": "Genaue Offenlegung liegt in Ihrer Verantwortung.",
-    "DISCLAIMER": "Haftungsausschluss",
-    "DISCLAIMER_TEXT": "Wir sind KEIN Ersatz für Rechtsberatung oder professionelle Musikverleger. Dies ist ein Tool zur persönlichen Aufzeichnung.",
-    "LEGAL_BASIS_TITLE": "Rechtsgrundlage für die Verarbeitung (DSGVO)",
-    "LEGAL_BASIS_TEXT": "Wir verarbeiten Ihre Daten auf Grundlage von:",
-    "BASIS_CONTRACT": "Vertragsnotwendigkeit",
-    "BASIS_CONTRACT_TEXT": "Zur Bereitstellung unseres Service (Kontoerstellung, Speicherung von Werken, Protokollen).",
-    "BASIS_INTEREST": "Berechtigte Interessen",
-    "BASIS_INTEREST_TEXT": "Zur Verbesserung der Plattform, Gewährleistung der Sicherheit, Betrugsvorbeugung.",
-    "BASIS_LEGAL": "Rechtliche Verpflichtungen",
-    "BASIS_LEGAL_TEXT": "Zur Einhaltung geltender Gesetze.",
-    "BASIS_CONSENT": "Einwilligung",
-    "BASIS_CONSENT_TEXT": "Wo ausdrücklich angefordert (Marketing, optionale Funktionen).",
-    "USAGE_TITLE": "Wie wir Ihre Informationen verwenden",
-    "USAGE_TEXT": "Wir verwenden Ihre personenbezogenen Daten zu folgenden Zwecken:",
-    "USAGE_1": "Erstellung und Verwaltung Ihres Kontos.",
-    "USAGE_2": "Ermöglichung von Zusammenarbeit und Rechteverwaltung.",
-    "USAGE_3": "Generierung von Protokolldokumenten und QR-Codes.",
-    "USAGE_4": "Kommunikation mit Ihnen (Benachrichtigungen, Warnungen).",
-    "USAGE_5": "Verbesserung der Plattformfunktionalität.",
-    "USAGE_6": "Gewährleistung der Sicherheit und Missbrauchsvorbeugung.",
-    "USAGE_7": "Einhaltung gesetzlicher Verpflichtungen.",
-    "NO_ADS": "Wir verwenden Ihre Daten nicht für Werbung und verkaufen sie nicht an Dritte.",
-    "NO_GUARANTEES": "Keine Garantien",
-    "NO_GUARANTEES_TEXT": "Wir geben keine Garantien bezüglich Datengenauigkeit oder Plattformverfügbarkeit.",
-    "SHARING_TITLE": "Wann und wie wir Ihre Informationen teilen",
-    "PROVIDERS_TITLE": "Dienstleister & Infrastruktur",
-    "PROVIDERS_TEXT": "Wir nutzen Drittanbieterdienste:",
-    "SUPABASE_DESC": "Backend für Authentifizierung, Datenbank, Speicherung.",
-    "SUPABASE_1": "Datenspeicherort: EU-Region (DSGVO-konform)",
-    "SUPABASE_2": "Verarbeitete Daten: E-Mail, Passwörter, Profile, Werke, Protokolle",
-    "SUPABASE_3": "Sicherheit: TLS/SSL-Verschlüsselung, Zugriffskontrollen",
-    "SUPABASE_4": "Datenschutzerklärung",
-    "SUPABASE_5": "Verwendet Subprozessoren (AWS) mit DSGVO-konformen DPAs.",
-    "AUTH_STORAGE": "Authentifizierung & Sitzungsspeicherung",
-    "AUTH_STORAGE_TEXT": "Supabase verwendet Tokens, die im Browser-localStorage für Sitzungen gespeichert werden.",
-    "NETLIFY_DESC": "Frontend-Hosting und Content Delivery.",
-    "NETLIFY_1": "Verarbeitete Daten: IP-Adressen, Browserdaten",
-    "NETLIFY_2": "Sicherheit: HTTPS-Verschlüsselung, DDoS-Schutz",
-    "NETLIFY_3": "Datenschutzerklärung",
-    "PROVIDERS_DISCLAIMER": "Wir können die Sicherheit oder Verfügbarkeit von Drittanbietern nicht garantieren.",
-    "COLLAB_TITLE": "Zusammenarbeit & gemeinsame Arbeitsbereiche",
-    "COLLAB_TEXT": "Bei der Zusammenarbeit sind Ihre geteilten Daten für Mitarbeiter sichtbar.",
-    "COLLAB_1": "Sie kontrollieren, welche Informationen Sie teilen.",
-    "COLLAB_2": "Wir sind nicht verantwortlich dafür, wie andere geteilte Informationen verwenden.",
-    "COLLAB_3": "Seien Sie vorsichtig beim Arbeitsbereichszugriff.",
-    "LEGAL_REQ_TITLE": "Rechtliche Anforderungen",
-    "LEGAL_REQ_TEXT": "Wir können Informationen offenlegen, wenn gesetzlich vorgeschrieben:",
-    "LEGAL_1": "Einhaltung von Vorladungen oder Gerichtsbeschlüssen.",
-    "LEGAL_2": "Durchsetzung unserer Nutzungsbedingungen.",
-    "LEGAL_3": "Schutz von Rechten, Eigentum oder Sicherheit.",
-    "LEGAL_LIMITATION": "Als Leidenschaftsprojekt ist unsere Fähigkeit, rechtliche Anfragen anzufechten, begrenzt.",
-    "TRANSFER_TITLE": "Internationale Datenübertragungen",
-    "TRANSFER_TEXT": "Daten werden hauptsächlich in der EU gespeichert. Einige Subprozessoren arbeiten global mit angemessenen Schutzmaßnahmen (Standardvertragsklauseln, DSGVO-konforme DPAs).",
-    "COOKIES_TITLE": "Cookies, lokale Speicherung & Tracking",
-    "COOKIES_SUB": "Was sind Cookies?",
-    "COOKIES_TEXT": "Wir verwenden KEINE traditionellen Tracking-Cookies oder Analytics-Dienste.",
-    "COOKIES_AUTH": "Supabase verwendet sichere Tokens in localStorage für die Authentifizierung.",
-    "STORAGE_TITLE": "Was wir lokal speichern",
-    "STORAGE_TEXT": "Wir verwenden Browser-localStorage für:",
-    "STORAGE_1": "Authentifizierungs-Tokens",
-    "STORAGE_2": "Benutzereinstellungen (Arbeitsbereich, Theme)",
-    "STORAGE_LOCAL": "Diese Daten verbleiben auf Ihrem Gerät.",
-    "NO_TRACK_TITLE": "Kein Drittanbieter-Tracking",
-    "NO_TRACK_TEXT": "Wir verwenden kein Google Analytics, Facebook Pixel oder ähnliche Tools.",
-    "FUTURE_CHANGE": "Wenn wir Analytics hinzufügen, werden wir diese Richtlinie aktualisieren und Einwilligung einholen.",
-    "QR_TITLE": "QR-Code-Scannen",
-    "QR_TEXT": "Unsere QR-Code-Scanfunktionalität:",
-    "QR_1_LABEL": "Browser-Kamerazugriff",
-    "QR_1": "Wir fordern temporären Kamerazugriff über Browser-Berechtigungen an.",
-    "QR_2_LABEL": "Datenverarbeitung",
-    "QR_2": "Kamerastream wird lokal in Ihrem Browser verarbeitet. Kein Video hochgeladen.",
-    "QR_3_LABEL": "QR-Code-Daten",
-    "QR_3": "Wenn ein QR-Code eine Protokoll-ID enthält, fragen wir unsere Datenbank ab.",
-    "QR_4_LABEL": "Datenschutz",
-    "QR_4": "Wir speichern keine Kamerabilder oder Videos.",
-    "RETENTION_TITLE": "Datenspeicherung & Löschung",
-    "RETENTION_TEXT": "Wir bewahren Daten nur so lange wie nötig auf.",
-    "DELETION_TITLE": "Kontolöschung",
-    "DELETION_TEXT": "Sie können jederzeit die Löschung Ihres Kontos beantragen.",
-    "PERIODS_TITLE": "Aufbewahrungsfristen",
-    "PERIOD_1_LABEL": "Aktive Konten",
-    "PERIOD_1": "Daten werden aufbewahrt, solange das Konto aktiv ist.",
-    "PERIOD_2_LABEL": "Gelöschte Konten",
-    "PERIOD_2": "Personenbezogene Daten werden innerhalb von 30 Tagen gelöscht.",
-    "PERIOD_3_LABEL": "Geteilte Daten",
-    "PERIOD_3": "Geteilte Werkmetadaten können für Mitarbeiter sichtbar bleiben.",
-    "PERIOD_4_LABEL": "Backups",
-    "PERIOD_4": "Backups bleiben bis zu 90 Tage erhalten.",
-    "PERIOD_5_LABEL": "Rechtliche Aufbewahrung",
-    "PERIOD_5": "Daten, die Gegenstand rechtlicher Untersuchungen sind, werden bis zur Klärung aufbewahrt.",
-    "PERIOD_6_LABEL": "Protokolle",
-    "PERIOD_6": "Serverprotokolle werden bis zu 12 Monate aufbewahrt.",
-    "DISCONTINUE_TITLE": "Service-Einstellung",
-    "DISCONTINUE_TEXT": "Bei Einstellung werden wir angemessene Anstrengungen unternehmen, um Benutzer zu benachrichtigen und Datenexport zu ermöglichen.",
-    "RIGHTS_TITLE": "Ihre Rechte unter der DSGVO",
-    "RIGHTS_TEXT": "Sie haben folgende Rechte:",
-    "RIGHT_1": "Auskunftsrecht",
-    "RIGHT_1_TEXT": "Fordern Sie eine Kopie Ihrer personenbezogenen Daten an.",
-    "RIGHT_2": "Recht auf Berichtigung",
-    "RIGHT_2_TEXT": "Korrigieren Sie ungenaue Daten.",
-    "RIGHT_3": "Recht auf Löschung",
-    "RIGHT_3_TEXT": "Beantragen Sie die Löschung Ihrer Daten.",
-    "RIGHT_4": "Recht auf Einschränkung der Verarbeitung",
-    "RIGHT_4_TEXT": "Begrenzen Sie, wie wir Ihre Daten verwenden.",
-    "RIGHT_5": "Recht auf Datenübertragbarkeit",
-    "RIGHT_5_TEXT": "Erhalten Sie Ihre Daten in maschinenlesbarem Format.",
-    "RIGHT_6": "Widerspruchsrecht",
-    "RIGHT_6_TEXT": "Widersprechen Sie der Verarbeitung basierend auf berechtigten Interessen.",
-    "RIGHT_7": "Recht auf Widerruf der Einwilligung",
-    "RIGHT_7_TEXT": "Widerrufen Sie die Einwilligung jederzeit.",
-    "EXERCISE_TITLE": "Wie Sie Ihre Rechte ausüben",
-    "EXERCISE_LABEL": "Um Rechte auszuüben:",
-    "EXERCISE_1": "Kontaktieren Sie uns über die Informationen in Abschnitt 3.",
-    "EXERCISE_2": "Wir antworten innerhalb von 30 Tagen.",
-    "EXERCISE_3": "Wir können Ihre Identität überprüfen.",
-    "LIMITATIONS": "Einschränkungen",
-    "LIMITATIONS_TEXT": "Bestimmte Rechte können durch gesetzliche Verpflichtungen eingeschränkt sein.",
-    "COMPLAINT": "Beschwerderecht",
-    "COMPLAINT_TEXT": "Reichen Sie Beschwerden bei Ihrer lokalen Datenschutzbehörde ein.",
-    "SECURITY_TITLE": "Datensicherheit",
-    "SECURITY_TEXT": "Wir ergreifen angemessene Sicherheitsmaßnahmen:",
-    "SECURITY_1": "Verschlüsselung: HTTPS/TLS für Datenübertragung.",
-    "SECURITY_2": "Gehashte Passwörter: Verwendung von bcrypt.",
-    "SECURITY_3": "Zugriffskontrollen: Begrenzter Backend-Zugriff.",
-    "SECURITY_4": "Regelmäßige Updates: Sicherheitspatches werden angewendet.",
-    "HOWEVER": "Jedoch",
-    "SECURITY_LIMITS": "Kein System ist 100% sicher. Uns fehlen Sicherheitsmaßnahmen auf Unternehmensniveau. Nutzung auf eigenes Risiko.",
-    "BEST_PRACTICES": "Ihre Verantwortung",
-    "PRACTICE_1": "Verwenden Sie ein starkes, einzigartiges Passwort.",
-    "PRACTICE_2": "Teilen Sie keine Anmeldedaten.",
-    "PRACTICE_3": "Melden Sie sich auf gemeinsam genutzten Geräten ab.",
-    "PRACTICE_4": "Melden Sie verdächtige Aktivitäten sofort.",
-    "BREACH_TITLE": "Benachrichtigung bei Datenverletzungen",
-    "BREACH_TEXT": "Wir werden Sie und Behörden innerhalb von 72 Stunden nach einer Verletzung benachrichtigen.",
-    "CHILDREN_TITLE": "Datenschutz von Kindern",
-    "CHILDREN_TEXT": "Dieser Service ist nicht für Personen unter 16 Jahren. Wir sammeln wissentlich keine Daten von Kindern.",
-    "WARRANTY_TITLE": "Keine Garantien oder Zusicherungen",
-    "WARRANTY_TEXT": "DIESER SERVICE WIRD \"WIE BESEHEN\" OHNE GARANTIEN BEREITGESTELLT.",
-    "WARRANTY_LIST": "Wir geben keine Garantien bezüglich Verfügbarkeit, Genauigkeit, Datensicherung oder rechtlicher Gültigkeit von Dokumenten.",
-    "USE_RISK": "Sie nutzen diese Plattform vollständig auf eigenes Risiko.",
-    "LIABILITY_TITLE": "Haftungsbeschränkung",
-    "LIABILITY_TEXT": "WIR HAFTEN NICHT FÜR:",
-    "LIABILITY_LIST": "Direkte, indirekte, Folgeschäden; Verlust von Daten, Einnahmen oder Gewinnen; Fehler oder Verstöße; Ausfallzeiten oder Unterbrechungen; Handlungen Dritter.",
-    "LIABILITY_ACK": "Dies ist ein kostenloses, experimentelles Projekt. Wir tragen keine rechtliche Verantwortung. Suchen Sie kommerzielle Alternativen, wenn Sie garantierte Zuverlässigkeit benötigen.",
-    "CHANGES_TITLE": "Änderungen dieser Datenschutzerklärung",
-    "CHANGES_TEXT": "Wir können diese Richtlinie aktualisieren. Änderungen werden mit aktualisiertem \"Letzte Aktualisierung\" Datum veröffentlicht.",
-    "CONTINUED_USE": "Fortgesetzte Nutzung nach Änderungen bedeutet Akzeptanz.",
-    "ACCEPTANCE_TITLE": "Akzeptanz dieser Richtlinie",
-    "BY_USING": "Durch die Nutzung der Music Rights Platform erkennen Sie an:",
-    "ACCEPT_1": "Dies ist ein Leidenschaftsprojekt, kein kommerzieller Service.",
-    "ACCEPT_2": "Keine Garantien für Verfügbarkeit, Genauigkeit oder Zuverlässigkeit.",
-    "ACCEPT_3": "Wir haften nicht für Schäden oder Verluste.",
-    "ACCEPT_4": "Wir können den Zugang jederzeit verweigern oder beenden.",
-    "ACCEPT_5": "Sie verstehen Ihre DSGVO-Rechte.",
-    "ACCEPT_6": "Sie akzeptieren die Risiken der Nutzung einer experimentellen Plattform.",
-    "NO_AGREE": "Wenn Sie nicht zustimmen, nutzen Sie diesen Service nicht.",
-    "CONTACT_SECTION": "Kontaktinformationen & Beschwerden",
-    "NO_SUPPORT": "Kein dediziertes Support-Team. Antworten können verzögert sein.",
-    "USE_INAPP": "Nutzen Sie die In-App-Support-Funktion oder Kontaktinfo in Abschnitt 3.",
-    "SERIOUS_CONCERNS": "Für ernsthafte Datenschutzbedenken",
-    "DPA_CONTACT": "Kontaktieren Sie Ihre lokale Datenschutzbehörde:",
-    "FOOTER": "Dies ist ein Leidenschaftsprojekt. Nutzung auf eigenes Risiko."
-}
-
-# Read de.json
-with open('public/assets/i18n/de.json', 'r', encoding='utf-8') as f:
-    de_data = json.load(f)
-
-# Add PRIVACY section
-de_data['PRIVACY'] = de_privacy
-
-# Write back
-with open('public/assets/i18n/de.json', 'w', encoding='utf-8') as f:
-    json.dump(de_data, f, ensure_ascii=False, indent=2)
-
-print("✅ German PRIVACY translations added!")
-print(f"   Total keys: {len(de_privacy)}")
@@ -1,260 +0,0 @@
-#!/usr/bin/env python3
-import json
-
-# Read Ukrainian file
-with open('public/assets/i18n/ua.json', 'r', encoding='utf-8') as f:
-    ua_data = json.load(f)
-
-# Complete Ukrainian PRIVACY translations - ALL 243 keys
-ua_data["PRIVACY"] = {
-    "TITLE": "Політика конфіденційності",
-    "LAST_UPDATED": "Остання актуалізація",
-    "INTRO_TITLE": "Вступ",
-    "INTRO_TEXT": "Music Rights Platform (\"ми\", \"наш\" або \"Компанія\") керує веб-сайтом і застосунком Music Rights Platform. Ця Політика конфіденційності пояснює, як ми збираємо, використовуємо, розкриваємо та захищаємо вашу інформацію під час використання нашого Сервісу.",
-    "PASSION_PROJECT": "Це Проєкт із Пристрастю—Не Комерційний Сервіс",
-    "PASSION_1": "Ця платформа є некомерційним персональним проєктом, створеним окремою особою.",
-    "PASSION_2": "Це не зареєстрована компанія, ТОВ чи юридична особа.",
-    "PASSION_3": "Немає спеціальної команди підтримки, гарячої лінії або Угоди про рівень обслуговування (SLA).",
-    "PASSION_4": "Функції, час безвідмовної роботи та функціональність надаються лише \"в міру можливості\".",
-    "PASSION_5": "Ми не даємо жодних гарантій щодо надійності, доступності, точності чи придатності для будь-якої конкретної мети.",
-    "NO_LIABILITY": "Без Відповідальності за Збитки чи Втрати",
-    "NO_LIABILITY_TEXT": "Використовуючи цю платформу, ви визнаєте та погоджуєтеся, що ми НЕ несемо ЖОДНОЇ відповідальності за втрати, збитки, втрату даних чи інші наслідки, що виникають внаслідок використання вами цього Сервісу. Використання повністю на ваш власний ризик.",
-    "ACKNOWLEDGMENT": "Визнання Умов",
-    "GDPR_COMPLIANCE": "Хоча це персональний проєкт, ми дотримуємось <strong>Загального регламенту захисту даних (GDPR)</strong> та відповідних європейських законів про захист даних.",
-    "INVITE_TITLE": "Доступ Лише за Запрошенням & Право Відмови у Сервісі",
-    "NOT_PUBLIC": "Не Публічний Сервіс",
-    "INVITE_ACCESS": "Ця платформа доступна лише за запрошенням і наразі знаходиться в закритому бета-тестуванні. Доступ надається на наш власний розсуд.",
-    "INVITE_1": "Реєстрація може вимагати коду запрошення або ручного схвалення.",
-    "INVITE_2": "Ми не гарантуємо доступ кожному, хто його запитує.",
-    "INVITE_3": "Ваш доступ може бути відкликаний у будь-який час без попередження.",
-    "WE_RESERVE": "Ми залишаємо за собою право відмовити у Сервісі",
-    "RESERVE_1": "Ми можемо відмовити, призупинити або припинити доступ для будь-якого користувача в будь-який час з будь-якої причини.",
-    "RESERVE_2": "Ми не зобов'язані надавати пояснення щодо відмови або припинення.",
-    "RESERVE_3": "Ми не несемо відповідальності за наслідки блокування чи припинення облікового запису.",
-    "YOU_ACKNOWLEDGE": "Ви визнаєте",
-    "ACKNOWLEDGE_1": "Цей сервіс є експериментальним, може змінюватися та бути припиненим без попередження.",
-    "ACKNOWLEDGE_2": "Немає права на постійний доступ чи доступність.",
-    "ACKNOWLEDGE_3": "Ми не даємо обіцянок щодо доступності функцій чи збереження даних.",
-    "ACKNOWLEDGE_4": "Використання цієї платформи є привілеєм, а не правом.",
-    "CONTROLLER_TITLE": "Контролер Даних & Контактна Інформація",
-    "CONTROLLER_TEXT": "Контролером даних, відповідальним за ваші персональні дані, є оператор платформи.",
-    "CONTACT_TITLE": "Контакт",
-    "CONTACT_TEXT": "Для запитів щодо конфіденційності використовуйте функцію підтримки в застосунку (якщо доступна).",
-    "GDPR_REQUESTS": "Запити суб'єктів даних GDPR",
-    "GDPR_REQUESTS_TEXT": "Для запитів GDPR зв'яжіться з нами через вищевказані методи. Ми відповімо протягом 30 днів.",
-    "DPA_TITLE": "Орган захисту даних",
-    "DPA_TEXT": "Ви можете звернутися до місцевого органу захисту даних з будь-якими проблемами.",
-    "COLLECTION_TITLE": "Яку Інформацію Ми Збираємо",
-    "VOLUNTARY_TITLE": "Інформація, Яку Ви Надаєте (Добровільно)",
-    "VOLUNTARY_TEXT": "Ми збираємо інформацію, яку ви добровільно надаєте:",
-    "ACCOUNT_INFO": "Інформація Облікового Запису",
-    "ACCOUNT_INFO_TEXT": "Електронна пошта, пароль (хешований), ім'я для відображення, опціональне фото профілю.",
-    "PROFILE_INFO": "Дані Профілю",
-    "PROFILE_INFO_TEXT": "Ім'я, псевдонім/нікнейм, IPI, ISNI, PRO/CMO, контактні дані.",
-    "WORK_INFO": "Музичні Твори & Метадані",
-    "WORK_INFO_TEXT": "Назви пісень, коди ISWC, ISRC, дати релізів, співавтори, розподіли.",
-    "RIGHTS_INFO": "Інформація про Правовласників",
-    "RIGHTS_INFO_TEXT": "Композитор, автор слів, видавець, деталі виконавця, ролі, розкриття ШІ.",
-    "SPLIT_INFO": "Протокол & Угоди про Розподіл",
-    "SPLIT_INFO_TEXT": "Відсотки розподілу, підписи, QR-коди, PDF-документи протоколів.",
-    "IMPORTANT": "Важливо",
-    "USER_RESPONSIBILITY": "Ви несете повну відповідальність за точність інформації, яку ви завантажуєте.",
-    "NO_VERIFY": "Ми не перевіряємо точність даних, наданих користувачами.",
-    "AUTO_TITLE": "Автоматично Зібрана Інформація",
-    "AUTO_TEXT": "Ми автоматично збираємо технічну інформацію:",
-    "AUTO_1": "Інформація про пристрій (тип, ОС, браузер)",
-    "AUTO_2": "IP-адреса та приблизне місцезнаходження",
-    "AUTO_3": "Часові мітки та тривалість сесії",
-    "AUTO_4": "Відвідані сторінки та використані функції",
-    "AUTO_5": "Журнали помилок та метрики продуктивності",
-    "AUTO_PURPOSE": "Ці дані використовуються для функціональності, безпеки, налагодження та вдосконалення.",
-    "MUSIC_TITLE": "Дані, Специфічні для Музичної Індустрії",
-    "MUSIC_TEXT": "Ми збираємо дані управління музичними правами:",
-    "NICKNAME_LABEL": "Псевдоніми/Нікнейми",
-    "NICKNAME_TEXT": "Сценічні імена або псевдоніми, які ви використовуєте професійно.",
-    "IPI_LABEL": "Номер IPI",
-    "IPI_TEXT": "Унікальний ідентифікатор, призначений організаціями з колективного управління.",
-    "ISNI_LABEL": "ISNI",
-    "ISNI_TEXT": "Міжнародний стандартний ідентифікатор імені для учасників.",
-    "CMO_LABEL": "Членство в CMO/PRO",
-    "CMO_TEXT": "Ваша приналежність до організацій, таких як GEMA, ASCAP, PRS.",
-    "AI_LABEL": "Розкриття ШІ",
-    "AI_TEXT": "Чи використовувався штучний інтелект у створенні твору.",
-    "NICKNAME_SYSTEM": "Система Псевдонімів/Ідентифікаторів Профілю",
-    "NICKNAME_1": "Ми генеруємо унікальний profile_id для кожного користувача.",
-    "NICKNAME_2": "Ви можете створити псевдонім, пов'язаний з вашим profile_id.",
-    "NICKNAME_3": "Псевдоніми видимі публічно, якщо ваш профіль публічний.",
-    "AI_DISCLOSURES": "Розкриття ШІ",
-    "AI_DISC_1": "Ви можете вказати, чи використовувалися інструменти ШІ у творі.",
-    "AI_DISC_2": "Ця інформація з'являється в публічних метаданих твору та протоколах.",
-    "AI_DISC_3": "Точне розкриття є вашою відповідальністю.",
-    "DISCLAIMER": "Відмова від Відповідальності",
-    "DISCLAIMER_TEXT": "Ми НЕ є заміною юридичної консультації чи професійних музичних видавців. Це інструмент для особистого обліку.",
-    "LEGAL_BASIS_TITLE": "Правова Підстава для Обробки (GDPR)",
-    "LEGAL_BASIS_TEXT": "Ми обробляємо ваші дані на підставі:",
-    "BASIS_CONTRACT": "Договірна Необхідність",
-    "BASIS_CONTRACT_TEXT": "Для надання нашого Сервісу (створення облікового запису, зберігання творів, протоколів).",
-    "BASIS_INTEREST": "Законні Інтереси",
-    "BASIS_INTEREST_TEXT": "Для покращення платформи, забезпечення безпеки, запобігання шахрайству.",
-    "BASIS_LEGAL": "Юридичні Зобов'язання",
-    "BASIS_LEGAL_TEXT": "Для дотримання чинних законів.",
-    "BASIS_CONSENT": "Згода",
-    "BASIS_CONSENT_TEXT": "Коли явно запитується (маркетинг, опціональні функції).",
-    "USAGE_TITLE": "Як Ми Використовуємо Вашу Інформацію",
-    "USAGE_TEXT": "Ми використовуємо ваші персональні дані для:",
-    "USAGE_1": "Створення та управління вашим обліковим записом.",
-    "USAGE_2": "Забезпечення співпраці та управління правами.",
-    "USAGE_3": "Генерації протокольних документів та QR-кодів.",
-    "USAGE_4": "Зв'язку з вами (повідомлення, сповіщення).",
-    "USAGE_5": "Покращення функціональності платформи.",
-    "USAGE_6": "Забезпечення безпеки та запобігання зловживанням.",
-    "USAGE_7": "Дотримання юридичних зобов'язань.",
-    "NO_ADS": "Ми не використовуємо ваші дані для реклами та не продаємо їх третім особам.",
-    "NO_GUARANTEES": "Без Гарантій",
-    "NO_GUARANTEES_TEXT": "Ми не даємо гарантій щодо точності даних чи часу безвідмовної роботи платформи.",
-    "SHARING_TITLE": "Коли та Як Ми Ділимося Вашою Інформацією",
-    "PROVIDERS_TITLE": "Постачальники Послуг & Інфраструктура",
-    "PROVIDERS_TEXT": "Ми використовуємо сторонні сервіси:",
-    "SUPABASE_DESC": "Бекенд для аутентифікації, бази даних, зберігання.",
-    "SUPABASE_1": "Розташування даних: регіон ЄС (відповідає GDPR)",
-    "SUPABASE_2": "Оброблені дані: електронна пошта, паролі, профілі, твори, протоколи",
-    "SUPABASE_3": "Безпека: шифрування TLS/SSL, контроль доступу",
-    "SUPABASE_4": "Політика конфіденційності",
-    "SUPABASE_5": "Використовує субпроцесорів (AWS) з DPA, що відповідають GDPR.",
-    "AUTH_STORAGE": "Аутентифікація & Зберігання Сесій",
-    "AUTH_STORAGE_TEXT": "Supabase використовує токени, збережені в localStorage браузера для сесій.",
-    "NETLIFY_DESC": "Хостинг фронтенду та доставка контенту.",
-    "NETLIFY_1": "Оброблені дані: IP-адреси, дані браузера",
-    "NETLIFY_2": "Безпека: шифрування HTTPS, захист DDoS",
-    "NETLIFY_3": "Політика конфіденційності",
-    "PROVIDERS_DISCLAIMER": "Ми не можемо гарантувати безпеку чи час безвідмовної роботи сторонніх постачальників.",
-    "COLLAB_TITLE": "Співпраця & Спільні Робочі Простори",
-    "COLLAB_TEXT": "При співпраці ваші спільні дані видимі співавторам.",
-    "COLLAB_1": "Ви контролюєте, якою інформацією ділитеся.",
-    "COLLAB_2": "Ми не несемо відповідальності за те, як інші використовують спільну інформацію.",
-    "COLLAB_3": "Будьте обережні з доступом до робочого простору.",
-    "LEGAL_REQ_TITLE": "Юридичні Вимоги",
-    "LEGAL_REQ_TEXT": "Ми можемо розкрити інформацію, якщо цього вимагає закон:",
-    "LEGAL_1": "Виконання судових повісток або судових наказів.",
-    "LEGAL_2": "Забезпечення виконання наших Умов надання послуг.",
-    "LEGAL_3": "Захист прав, власності або безпеки.",
-    "LEGAL_LIMITATION": "Як проєкт із пристрастю, наша здатність оскаржити юридичні запити обмежена.",
-    "TRANSFER_TITLE": "Міжнародні Передачі Даних",
-    "TRANSFER_TEXT": "Дані в основному зберігаються в ЄС. Деякі субпроцесори працюють глобально з належними гарантіями (Стандартні договірні застереження, DPA, що відповідають GDPR).",
-    "COOKIES_TITLE": "Файли cookie, Локальне Зберігання & Відстеження",
-    "COOKIES_SUB": "Що таке Файли cookie?",
-    "COOKIES_TEXT": "Ми НЕ використовуємо традиційні файли cookie відстеження або сервіси аналітики.",
-    "COOKIES_AUTH": "Supabase використовує безпечні токени в localStorage для аутентифікації.",
-    "STORAGE_TITLE": "Що Ми Зберігаємо Локально",
-    "STORAGE_TEXT": "Ми використовуємо localStorage браузера для:",
-    "STORAGE_1": "Токенів аутентифікації",
-    "STORAGE_2": "Налаштувань користувача (робочий простір, тема)",
-    "STORAGE_LOCAL": "Ці дані залишаються на вашому пристрої.",
-    "NO_TRACK_TITLE": "Без Стороннього Відстеження",
-    "NO_TRACK_TEXT": "Ми не використовуємо Google Analytics, Facebook Pixel або подібні інструменти.",
-    "FUTURE_CHANGE": "Якщо ми додамо аналітику, ми оновимо цю політику та отримаємо згоду.",
-    "QR_TITLE": "Сканування QR-Коду",
-    "QR_TEXT": "Наша функція сканування QR-коду:",
-    "QR_1_LABEL": "Доступ до Камери Браузера",
-    "QR_1": "Ми запитуємо тимчасовий доступ до камери через дозволи браузера.",
-    "QR_2_LABEL": "Обробка Даних",
-    "QR_2": "Потік камери обробляється локально у вашому браузері. Відео не завантажується.",
-    "QR_3_LABEL": "Дані QR-Коду",
-    "QR_3": "Якщо QR-код містить ідентифікатор протоколу, ми запитуємо нашу базу даних.",
-    "QR_4_LABEL": "Конфіденційність",
-    "QR_4": "Ми не зберігаємо зображення камери або відео.",
-    "RETENTION_TITLE": "Зберігання та Видалення Даних",
-    "RETENTION_TEXT": "Ми зберігаємо дані лише стільки, скільки необхідно.",
-    "DELETION_TITLE": "Видалення Облікового Запису",
-    "DELETION_TEXT": "Ви можете запитати видалення облікового запису в будь-який час.",
-    "PERIODS_TITLE": "Періоди Зберігання",
-    "PERIOD_1_LABEL": "Активні Облікові Записи",
-    "PERIOD_1": "Дані зберігаються, поки обліковий запис активний.",
-    "PERIOD_2_LABEL": "Видалені Облікові Записи",
-    "PERIOD_2": "Персональні дані видаляються протягом 30 днів.",
-    "PERIOD_3_LABEL": "Спільні Дані",
-    "PERIOD_3": "Спільні метадані творів можуть залишатися видимими для співавторів.",
-    "PERIOD_4_LABEL": "Резервні Копії",
-    "PERIOD_4": "Резервні копії зберігаються до 90 днів.",
-    "PERIOD_5_LABEL": "Юридичні Утримання",
-    "PERIOD_5": "Дані, що підлягають юридичному розслідуванню, зберігаються до вирішення.",
-    "PERIOD_6_LABEL": "Журнали",
-    "PERIOD_6": "Журнали сервера зберігаються до 12 місяців.",
-    "DISCONTINUE_TITLE": "Припинення Сервісу",
-    "DISCONTINUE_TEXT": "Якщо ми припинимо роботу, ми докладемо розумних зусиль для повідомлення користувачів та надання експорту даних.",
-    "RIGHTS_TITLE": "Ваші Права Згідно з GDPR",
-    "RIGHTS_TEXT": "Ви маєте такі права:",
-    "RIGHT_1": "Право на Доступ",
-    "RIGHT_1_TEXT": "Запитувати копію ваших персональних даних.",
-    "RIGHT_2": "Право на Виправлення",
-    "RIGHT_2_TEXT": "Виправити неточні дані.",
-    "RIGHT_3": "Право на Видалення",
-    "RIGHT_3_TEXT": "Запитати видалення ваших даних.",
-    "RIGHT_4": "Право на Обмеження Обробки",
-    "RIGHT_4_TEXT": "Обмежити, як ми використовуємо ваші дані.",
-    "RIGHT_5": "Право на Портативність Даних",
-    "RIGHT_5_TEXT": "Отримати ваші дані у машиночитаному форматі.",
-    "RIGHT_6": "Право Заперечувати",
-    "RIGHT_6_TEXT": "Заперечувати проти обробки на основі законних інтересів.",
-    "RIGHT_7": "Право Відкликати Згоду",
-    "RIGHT_7_TEXT": "Відкликати згоду в будь-який час.",
-    "EXERCISE_TITLE": "Як Скористатися Вашими Правами",
-    "EXERCISE_LABEL": "Для реалізації прав:",
-    "EXERCISE_1": "Зв'яжіться з нами, використовуючи інформацію в розділі 3.",
-    "EXERCISE_2": "Ми відповімо протягом 30 днів.",
-    "EXERCISE_3": "Ми можемо перевірити вашу особу.",
-    "LIMITATIONS": "Обмеження",
-    "LIMITATIONS_TEXT": "Деякі права можуть бути обмежені юридичними зобов'язаннями.",
-    "COMPLAINT": "Право Подати Скаргу",
-    "COMPLAINT_TEXT": "Подати скаргу до вашого місцевого органу захисту даних.",
-    "SECURITY_TITLE": "Безпека Даних",
-    "SECURITY_TEXT": "Ми вживаємо розумних заходів безпеки:",
-    "SECURITY_1": "Шифрування: HTTPS/TLS для передачі даних.",
-    "SECURITY_2": "Хешовані Паролі: З використанням bcrypt.",
-    "SECURITY_3": "Контроль Доступу: Обмежений доступ до бекенду.",
-    "SECURITY_4": "Регулярні Оновлення: Застосовуються патчі безпеки.",
-    "HOWEVER": "Проте",
-    "SECURITY_LIMITS": "Жодна система не є на 100% безпечною. Ми не маємо заходів безпеки корпоративного рівня. Використовуйте на власний ризик.",
-    "BEST_PRACTICES": "Ваша Відповідальність",
-    "PRACTICE_1": "Використовуйте надійний, унікальний пароль.",
-    "PRACTICE_2": "Не ділітеся обліковими даними для входу.",
-    "PRACTICE_3": "Виходьте з облікового запису на спільних пристроях.",
-    "PRACTICE_4": "Негайно повідомляйте про підозрілу активність.",
-    "BREACH_TITLE": "Повідомлення про Порушення Даних",
-    "BREACH_TEXT": "Ми повідомимо вас та органи влади протягом 72 годин після порушення.",
-    "CHILDREN_TITLE": "Конфіденційність Дітей",
-    "CHILDREN_TEXT": "Цей Сервіс не призначений для осіб віком до 16 років. Ми свідомо не збираємо дані від дітей.",
-    "WARRANTY_TITLE": "Відсутність Гарантій чи Запевнень",
-    "WARRANTY_TEXT": "ЦЕЙ СЕРВІС НАДАЄТЬСЯ \"ЯК Є\" БЕЗ ГАРАНТІЙ.",
-    "WARRANTY_LIST": "Ми не даємо гарантій щодо часу безвідмовної роботи, точності, резервного копіювання даних чи юридичної дійсності документів.",
-    "USE_RISK": "Ви користуєтесь цією платформою повністю на свій ризик.",
-    "LIABILITY_TITLE": "Обмеження Відповідальності",
-    "LIABILITY_TEXT": "МИ НЕ НЕСЕМО ВІДПОВІДАЛЬНОСТІ ЗА БУДЬ-ЯКІ:",
-    "LIABILITY_LIST": "Прямі, непрямі, побічні збитки; втрату даних, доходів чи прибутку; помилки чи порушення; простої чи перерви; дії третіх осіб.",
-    "LIABILITY_ACK": "Це безкоштовний експериментальний проєкт. Ми не несемо юридичної відповідальності. Шукайте комерційні альтернативи, якщо вам потрібна гарантована надійність.",
-    "CHANGES_TITLE": "Зміни до Цієї Політики Конфіденційності",
-    "CHANGES_TEXT": "Ми можемо оновити цю політику. Зміни публікуються з оновленою датою \"Остання актуалізація\".",
-    "CONTINUED_USE": "Подальше використання після змін означає прийняття.",
-    "ACCEPTANCE_TITLE": "Прийняття Цієї Політики",
-    "BY_USING": "Використовуючи Music Rights Platform, ви визнаєте:",
-    "ACCEPT_1": "Це проєкт із пристрастю, а не комерційний сервіс.",
-    "ACCEPT_2": "Немає гарантій часу безвідмовної роботи, точності чи надійності.",
-    "ACCEPT_3": "Ми не несемо відповідальності за збитки чи втрати.",
-    "ACCEPT_4": "Ми можемо відмовити чи припинити доступ у будь-який час.",
-    "ACCEPT_5": "Ви розумієте свої права GDPR.",
-    "ACCEPT_6": "Ви приймаєте ризики використання експериментальної платформи.",
-    "NO_AGREE": "Якщо ви не згодні, не використовуйте цей Сервіс.",
-    "CONTACT_SECTION": "Контактна Інформація & Скарги",
-    "NO_SUPPORT": "Немає спеціальної команди підтримки. Відповіді можуть бути затримані.",
-    "USE_INAPP": "Використовуйте функцію підтримки в застосунку або контактну інформацію в розділі 3.",
-    "SERIOUS_CONCERNS": "Для Серйозних Проблем із Конфіденційністю",
-    "DPA_CONTACT": "Зв'яжіться з вашим місцевим органом захисту даних:",
-    "FOOTER": "Це проєкт із пристрастю. Використання на власний ризик."
-}
-
-# Write back to file with proper formatting
-with open('public/assets/i18n/ua.json', 'w', encoding='utf-8') as f:
-    json.dump(ua_data, f, ensure_ascii=False, indent=2)
-
-print("✅ Complete Ukrainian PRIVACY translations fixed!")
-print(f"Total PRIVACY keys: {len(ua_data['PRIVACY'])}")
@@ -1,182 +0,0 @@
-#!/usr/bin/env python3
-import json
-
-# Read Ukrainian file
-with open('public/assets/i18n/ua.json', 'r', encoding='utf-8') as f:
-    ua_data = json.load(f)
-
-# Ukrainian PRIVACY translations
-ua_data["PRIVACY"] = {
-    "LAST_UPDATED": "Остання актуалізація",
-    "INTRO_TITLE": "Вступ",
-    "INTRO_TEXT": "Music Rights Platform (\"ми\", \"наш\" або \"Компанія\") керує веб-сайтом і застосунком Music Rights Platform. Ця Політика конфіденційності пояснює, як ми збираємо, використовуємо та захищаємо вашу інформацію під час використання нашого Сервісу.",
-    "PASSION_PROJECT": "Це Проєкт із Пристрастю – Не Комерційний Сервіс",
-    "PASSION_1": "Ця платформа є некомерційним персональним проєктом, створеним окремою особою.",
-    "PASSION_2": "Це не зареєстрована компанія, ТОВ чи юридична особа.",
-    "PASSION_3": "Немає спеціальної команди підтримки, гарячої лінії або Угоди про рівень обслуговування (SLA).",
-    "PASSION_4": "Функції, час безвідмовної роботи та функціональність надаються лише \"в міру можливості\".",
-    "PASSION_5": "Ми не даємо жодних гарантій щодо надійності, доступності, точності чи придатності для будь-якої конкретної мети.",
-    "NO_LIABILITY": "Без Відповідальності за Збитки чи Втрати",
-    "NO_LIABILITY_TEXT": "Використовуючи цю платформу, ви визнаєте та погоджуєтеся, що ми НЕ несемо ЖОДНОЇ відповідальності за втрати, збитки, втрату даних чи інші наслідки, що виникають внаслідок використання вами цього Сервісу. Використання повністю на ваш власний ризик.",
-    "ACKNOWLEDGMENT": "Визнання Умов",
-    "GDPR_COMPLIANCE": "Хоча це персональний проєкт, ми дотримуємось <strong>Загального регламенту захисту даних (GDPR)</strong> та відповідних європейських законів про захист даних.",
-    "INVITE_TITLE": "Доступ Лише за Запрошенням & Право Відмови у Сервісі",
-    "NOT_PUBLIC": "Не Публічний Сервіс",
-    "INVITE_ACCESS": "Ця платформа доступна лише за запрошенням і наразі знаходиться в закритому бета-тестуванні. Доступ надається на наш власний розсуд.",
-    "INVITE_1": "Реєстрація може вимагати коду запрошення або ручного схвалення.",
-    "INVITE_2": "Ми не гарантуємо доступ кожному, хто його запитує.",
-    "INVITE_3": "Ваш доступ може бути відкликаний у будь-який час без попередження.",
-    "WE_RESERVE": "Ми залишаємо за собою право відмовити у Сервісі",
-    "RESERVE_1": "Ми можемо відмовити, призупинити або припинити доступ для будь-якого користувача в будь-який час з будь-якої причини.",
-    "RESERVE_2": "Ми не зобов'язані надавати пояснення щодо відмови або припинення.",
-    "RESERVE_3": "Ми не несемо відповідальності за наслідки блокування чи припинення облікового запису.",
-    "YOU_ACKNOWLEDGE": "Ви визнаєте",
-    "ACKNOWLEDGE_1": "Цей сервіс є експериментальним, може змінюватися та бути припиненим без попередження.",
-    "ACKNOWLEDGE_2": "Немає права на постійний доступ чи доступність.",
-    "ACKNOWLEDGE_3": "Ми не даємо обіцянок щодо доступності функцій чи збереження даних.",
-    "ACKNOWLEDGE_4": "Використання цієї платформи є привілеєм, а не правом.",
-    "CONTROLLER_TITLE": "Контролер Даних & Контактна Інформація",
-    "CONTROLLER_TEXT": "Контролером даних, відповідальним за ваші персональні дані, є оператор платформи.",
-    "CONTACT_TITLE": "Контакт",
-    "CONTACT_TEXT": "Для запитів щодо конфіденційності використовуйте функцію підтримки в застосунку (якщо доступна).",
-    "GDPR_REQUESTS": "Запити суб'єктів даних GDPR",
-    "GDPR_REQUESTS_TEXT": "Для запитів GDPR зв'яжіться з нами через вищевказані методи. Ми відповімо протягом 30 днів.",
-    "DPA_TITLE": "Орган захисту даних",
-    "DPA_TEXT": "Ви можете звернутися до місцевого органу захисту даних з будь-якими проблемами.",
-    "COLLECTION_TITLE": "Яку Інформацію Ми Збираємо",
-    "VOLUNTARY_TITLE": "Інформація, Яку Ви Надаєте (Добровільно)",
-    "VOLUNTARY_TEXT": "Ми збираємо інформацію, яку ви добровільно надаєте:",
-    "ACCOUNT_INFO": "Інформація Облікового Запису",
-    "ACCOUNT_INFO_TEXT": "Електронна пошта, пароль (хешований), ім'я для відображення, опціональне фото профілю.",
-    "PROFILE_INFO": "Дані Профілю",
-    "PROFILE_INFO_TEXT": "Ім'я, псевдонім/нікнейм, IPI, ISNI, PRO/CMO, контактні дані.",
-    "WORK_INFO": "Музичні Твори & Метадані",
-    "WORK_INFO_TEXT": "Назви пісень, коди ISWC, ISRC, дати релізів, співавтори, розподіли.",
-    "RIGHTS_INFO": "Інформація про Правовласників",
-    "RIGHTS_INFO_TEXT": "Композитор, автор слів, видавець, деталі виконавця, ролі, розкриття ШІ.",
-    "SPLIT_INFO": "Протокол & Угоди про Розподіл",
-    "SPLIT_INFO_TEXT": "Відсотки розподілу, підписи, QR-коди, PDF-документи протоколів.",
-    "IMPORTANT": "Важливо",
-    "USER_RESPONSIBILITY": "Ви несете повну відповідальність за точність інформації, яку ви завантажуєте.",
-    "NOT_LIABLE": "Ми не несемо відповідальності за неточні чи шахрайські дані, внесені користувачами.",
-    "AUTOMATIC_TITLE": "Автоматично Зібрана Інформація",
-    "AUTOMATIC_TEXT": "Ми можемо збирати:",
-    "LOG_DATA": "Дані Журналу",
-    "LOG_DATA_TEXT": "IP-адреса, тип браузера, сторінки, які відвідано, час доступу.",
-    "COOKIES": "Файли cookie & Технології Відстеження",
-    "COOKIES_TEXT": "Для аутентифікації, налаштувань користувача, аналітики.",
-    "DEVICE_INFO": "Інформація про Пристрій",
-    "DEVICE_INFO_TEXT": "Операційна система, тип браузера, мовні налаштування.",
-    "THIRD_PARTY_TITLE": "Сторонні Сервіси",
-    "SUPABASE_TITLE": "Supabase (Бекенд як Сервіс)",
-    "SUPABASE_PURPOSE": "Мета",
-    "SUPABASE_PURPOSE_TEXT": "Ми використовуємо Supabase для аутентифікації, зберігання бази даних та управління користувачами.",
-    "DATA_STORED": "Збережені Дані",
-    "DATA_STORED_TEXT": "Облікові дані користувачів, профілі, твори, правовласники, протоколи.",
-    "SUPABASE_LOCATION": "Розташування",
-    "SUPABASE_LOCATION_TEXT": "Дані можуть зберігатися в центрах обробки даних Supabase (можливо, ЄС чи США).",
-    "SUPABASE_COMPLIANCE": "Відповідність",
-    "SUPABASE_COMPLIANCE_TEXT": "Supabase дотримується GDPR. Деталі дивіться в їхній Політиці конфіденційності.",
-    "CLOUDFLARE_TITLE": "Cloudflare (CDN & Безпека)",
-    "CLOUDFLARE_PURPOSE": "Мета",
-    "CLOUDFLARE_PURPOSE_TEXT": "Cloudflare може використовуватися для доставки контенту, захисту DDoS та безпеки.",
-    "CLOUDFLARE_DATA": "Збережені Дані",
-    "CLOUDFLARE_DATA_TEXT": "IP-адреса, дані журналу, трафік.",
-    "CLOUDFLARE_POLICY": "Їхня Політика",
-    "CLOUDFLARE_POLICY_TEXT": "Дивіться Політику конфіденційності Cloudflare.",
-    "PURPOSE_TITLE": "Як Ми Використовуємо Вашу Інформацію",
-    "PURPOSE_TEXT": "Ми використовуємо ваші дані для:",
-    "PURPOSE_1": "Надання та обслуговування Сервісу",
-    "PURPOSE_2": "Аутентифікації користувачів та управління обліковими записами",
-    "PURPOSE_3": "Обробки інформації про права та генерації протоколів",
-    "PURPOSE_4": "Покращення функціональності та виправлення помилок",
-    "PURPOSE_5": "Дотримання правових зобов'язань (GDPR, запити правоохоронців)",
-    "PURPOSE_6": "Відповіді на запити підтримки",
-    "NO_MARKETING": "Ми НЕ використовуємо ваші дані для:",
-    "NO_MARKETING_TEXT": "Маркетинг, реклама, продаж третім особам, профілювання чи автоматизоване прийняття рішень.",
-    "RETENTION_TITLE": "Зберігання та Видалення Даних",
-    "RETENTION_TEXT": "Ми зберігаємо дані, поки:",
-    "RETENTION_1": "Ваш обліковий запис активний, АБО",
-    "RETENTION_2": "Це необхідно для юридичних зобов'язань.",
-    "DELETE_ACCOUNT": "Видалення Облікового Запису",
-    "DELETE_ACCOUNT_TEXT": "Ви можете видалити свій обліковий запис у налаштуваннях профілю. Це назавжди видалить:",
-    "DELETE_1": "Ваш профіль",
-    "DELETE_2": "Усі твори та метадані",
-    "DELETE_3": "Правовласників та розподіли",
-    "DELETE_4": "Протоколи та підписи",
-    "DELETE_5": "Робочі простори та членства",
-    "IRREVERSIBLE": "Це необоротно. Резервних копій немає.",
-    "SHARING_TITLE": "Обмін Даними та Розкриття",
-    "NO_SELLING": "Ми НЕ продаємо ваші дані.",
-    "SHARE_TEXT": "Ми можемо ділитися даними лише:",
-    "SHARE_1": "З постачальниками послуг (Supabase, Cloudflare) для надання сервісу",
-    "SHARE_2": "При юридичній вимозі (судові ордери, повістки)",
-    "SHARE_3": "З користувачами в тому ж робочому просторі (якщо ви ділитеся інформацією про твори)",
-    "SHARE_4": "З вашою явною згодою",
-    "GDPR_RIGHTS_TITLE": "Ваші Права GDPR",
-    "GDPR_RIGHTS_TEXT": "Згідно з GDPR, ви маєте:",
-    "RIGHT_ACCESS": "Право на доступ",
-    "RIGHT_ACCESS_TEXT": "Запитувати копію своїх даних.",
-    "RIGHT_RECTIFICATION": "Право на виправлення",
-    "RIGHT_RECTIFICATION_TEXT": "Виправляти неточні дані.",
-    "RIGHT_ERASURE": "Право на видалення (\"Право бути забутим\")",
-    "RIGHT_ERASURE_TEXT": "Видалити ваші дані.",
-    "RIGHT_RESTRICT": "Право на обмеження обробки",
-    "RIGHT_RESTRICT_TEXT": "Обмежити обробку в певних випадках.",
-    "RIGHT_PORTABILITY": "Право на портативність даних",
-    "RIGHT_PORTABILITY_TEXT": "Експортувати дані у машиночитаному форматі.",
-    "RIGHT_OBJECT": "Право заперечувати",
-    "RIGHT_OBJECT_TEXT": "Заперечувати проти обробки (обмежене застосування для необхідної обробки).",
-    "RIGHT_WITHDRAW": "Право відкликати згоду",
-    "RIGHT_WITHDRAW_TEXT": "Відкликати згоду в будь-який час.",
-    "RIGHT_COMPLAIN": "Право на скаргу",
-    "RIGHT_COMPLAIN_TEXT": "Подати скаргу до органу захисту даних.",
-    "EXERCISE_RIGHTS": "Щоб скористатися цими правами:",
-    "EXERCISE_TEXT": "Використовуйте функції в застосунку (Експорт даних, Видалення облікового запису) АБО зв'яжіться з підтримкою.",
-    "SECURITY_TITLE": "Безпека Даних",
-    "SECURITY_MEASURES": "Ми вживаємо розумних заходів:",
-    "SECURITY_1": "Шифрування паролів (хешування bcrypt)",
-    "SECURITY_2": "HTTPS/TLS для передачі даних",
-    "SECURITY_3": "Контроль доступу на основі ролей (через Supabase RLS)",
-    "SECURITY_4": "Регулярні оновлення безпеки",
-    "NO_GUARANTEE": "Немає Гарантії Безпеки",
-    "NO_GUARANTEE_TEXT": "Жодна система не є на 100% безпечною. Ми не можемо гарантувати абсолютний захист від порушень, атак чи несанкціонованого доступу.",
-    "INTERNATIONAL_TITLE": "Міжнародна Передача Даних",
-    "INTERNATIONAL_TEXT": "Ваші дані можуть зберігатися на серверах за межами вашої країни (можливо, ЄС, США). Використовуючи цей Сервіс, ви погоджуєтеся на таку передачу.",
-    "TRANSFER_COMPLIANCE": "Ми покладаємося на відповідність GDPR наших постачальників послуг (Supabase, Cloudflare).",
-    "CHILDREN_TITLE": "Конфіденційність Дітей",
-    "CHILDREN_TEXT": "Цей Сервіс не призначений для осіб віком до 16 років. Ми свідомо не збираємо дані від дітей.",
-    "WARRANTY_TITLE": "Відсутність Гарантій чи Заяв",
-    "WARRANTY_TEXT": "ЦЕЙ СЕРВІС НАДАЄТЬСЯ \"ЯК Є\" БЕЗ ГАРАНТІЙ.",
-    "WARRANTY_LIST": "Ми не даємо гарантій щодо доступності, точності, резервного копіювання даних чи юридичної дійсності документів.",
-    "USE_RISK": "Ви користуєтесь цією платформою повністю на свій ризик.",
-    "LIABILITY_TITLE": "Обмеження Відповідальності",
-    "LIABILITY_TEXT": "МИ НЕ НЕСЕМО ВІДПОВІДАЛЬНОСТІ ЗА:",
-    "LIABILITY_LIST": "Прямі, непрямі, побічні збитки; Втрату даних, доходів чи прибутку; Помилки чи порушення; Простої чи перерви; Дії третіх осіб.",
-    "LIABILITY_ACK": "Це безкоштовний експериментальний проєкт. Ми не несемо юридичної відповідальності. Шукайте комерційні альтернативи, якщо вам потрібна гарантована надійність.",
-    "CHANGES_TITLE": "Зміни до Цієї Політики Конфіденційності",
-    "CHANGES_TEXT": "Ми можемо оновити цю Політику. Зміни будуть опубліковані з оновленою датою \"Остання актуалізація\".",
-    "CONTINUED_USE": "Подальше використання після змін означає прийняття.",
-    "ACCEPTANCE_TITLE": "Прийняття Цієї Політики",
-    "BY_USING": "Використовуючи Music Rights Platform, ви визнаєте:",
-    "ACCEPT_1": "Це проєкт із пристрастю, а не комерційний сервіс.",
-    "ACCEPT_2": "Немає гарантій доступності, точності чи надійності.",
-    "ACCEPT_3": "Ми не несемо відповідальності за збитки чи втрати.",
-    "ACCEPT_4": "Ми можемо відмовити чи припинити доступ у будь-який час.",
-    "ACCEPT_5": "Ви розумієте свої права GDPR.",
-    "ACCEPT_6": "Ви приймаєте ризики використання експериментальної платформи.",
-    "NO_AGREE": "Якщо ви не згодні, не використовуйте цей Сервіс.",
-    "CONTACT_SECTION": "Контактна Інформація & Скарги",
-    "NO_SUPPORT": "Немає спеціальної команди підтримки. Відповіді можуть бути затримані.",
-    "USE_INAPP": "Використовуйте функцію підтримки в застосунку або контактну інформацію в розділі 3.",
-    "SERIOUS_CONCERNS": "Для серйозних проблем із конфіденційністю",
-    "DPA_CONTACT": "Зв'яжіться з вашим місцевим органом захисту даних:",
-    "FOOTER": "Це проєкт із пристрастю. Використання на власний ризик."
-}
-
-# Write back to file with proper formatting
-with open('public/assets/i18n/ua.json', 'w', encoding='utf-8') as f:
-    json.dump(ua_data, f, ensure_ascii=False, indent=2)
-
-print("✅ Ukrainian PRIVACY translations fixed!")
-print(f"Total PRIVACY keys: {len(ua_data['PRIVACY'])}")
@@ -1,7 +1,7 @@
 import { CommonModule } from '@angular/common';
 import { Component, OnInit, computed, inject, signal } from '@angular/core';
 import { TranslateModule } from '@ngx-translate/core';
-import { AdminAnalyticsService, AdminOverviewSnapshot } from '../services/admin-analytics.service';
+import { AdminAnalyticsService, AdminOverviewSnapshot, WeeklyCount } from '../services/admin-analytics.service';
 
 @Component({
   selector: 'app-admin-overview',
@@ -38,6 +38,27 @@ export class AdminOverviewComponent implements OnInit {
       .join(' ');
   });
 
+  /** One row per week with the count of every weekly series, oldest week first. */
+  protected readonly weeklyActivity = computed(() => {
+    const snapshot = this.snapshot();
+    if (!snapshot) {
+      return [];
+    }
+
+    const countsByWeek = (series: WeeklyCount[]) => new Map(series.map((point) => [point.week, point.count]));
+    const works = countsByWeek(snapshot.weeklyWorks);
+    const protocols = countsByWeek(snapshot.weeklyProtocols);
+    const waitlist = countsByWeek(snapshot.weeklyWaitlist);
+
+    return snapshot.weeklySignups.map((point) => ({
+      week: point.week,
+      signups: point.count,
+      works: works.get(point.week) ?? 0,
+      protocols: protocols.get(point.week) ?? 0,
+      waitlist: waitlist.get(point.week) ?? 0
+    }));
+  });
+
   async ngOnInit(): Promise<void> {
     await this.loadSnapshot();
   }
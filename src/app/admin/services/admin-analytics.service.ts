@@ -9,7 +9,25 @@ export interface AdminOverviewSnapshot {
   worksHumanOnly: number;
   worksAiAssisted: number;
   worksAiGenerated: number;
-  weeklySignups: Array<{ week: string; count: number }>;
+  weeklySignups: WeeklyCount[];
+  weeklyWorks: WeeklyCount[];
+  weeklyProtocols: WeeklyCount[];
+  weeklyWaitlist: WeeklyCount[];
+  refreshedAt: string | null;
+}
+
+export interface WeeklyCount {
+  week: string;
+  count: number;
+}
+
+function parseWeekly(payload: unknown): WeeklyCount[] {
+  return (Array.isArray(payload) ? payload : [])
+    .map((entry: any) => ({
+      week: typeof entry?.week === 'string' ? entry.week : '',
+      count: Number(entry?.count ?? 0)
+    }))
+    .filter((entry: WeeklyCount) => Boolean(entry.week));
 }
 
 @Injectable({ providedIn: 'root' })
@@ -23,14 +41,6 @@ export class AdminAnalyticsService {
       throw error;
     }
 
-    const weeklyPayload = Array.isArray(data?.weeklySignups) ? data.weeklySignups : [];
-    const weeklySignups = weeklyPayload
-      .map((entry: any) => ({
-        week: typeof entry?.week === 'string' ? entry.week : '',
-        count: Number(entry?.count ?? 0)
-      }))
-      .filter((entry: AdminOverviewSnapshot['weeklySignups'][number]) => Boolean(entry.week));
-
     return {
       totalUsers: Number(data?.totalUsers ?? 0),
       activeUsers: Number(data?.activeUsers ?? 0),
@@ -39,7 +49,11 @@ export class AdminAnalyticsService {
       worksHumanOnly: Number(data?.worksHumanOnly ?? 0),
       worksAiAssisted: Number(data?.worksAiAssisted ?? 0),
       worksAiGenerated: Number(data?.worksAiGenerated ?? 0),
-      weeklySignups
+      weeklySignups: parseWeekly(data?.weeklySignups),
+      weeklyWorks: parseWeekly(data?.weeklyWorks),
+      weeklyProtocols: parseWeekly(data?.weeklyProtocols),
+      weeklyWaitlist: parseWeekly(data?.weeklyWaitlist),
+      refreshedAt: typeof data?.refreshedAt === 'string' ? data.refreshedAt : null
     };
   }
 }
@@ -1,6 +1,7 @@
 import { Routes } from '@angular/router';
 import { AuthGuard } from '../guards/auth.guard';
 import { AdminGuard } from '../guards/admin.guard';
+import { LegalPageGuard } from '../guards/legal-page.guard';
 
 export const routes: Routes = [
     { path: '', loadComponent: () => import('./landing/landing').then(m => m.LandingComponent) },
@@ -124,8 +125,10 @@ export const routes: Routes = [
         loadComponent: () => import('./public-profile/public-profile').then(m => m.PublicProfileComponent)
     },
     {
+        // Prerendered per locale by the i18n build, served without the app.
         path: 'privacy-policy',
-        loadComponent: () => import('./legal/privacy-policy/privacy-policy').then(m => m.PrivacyPolicyComponent)
+        canActivate: [LegalPageGuard('privacy')],
+        children: []
     },
     {
         path: 'terms-of-service',
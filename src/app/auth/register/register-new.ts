@@ -5,6 +5,7 @@ import { TranslateModule } from '@ngx-translate/core';
 import { Router, RouterLink } from '@angular/router';
 import { SupabaseService } from '../../services/supabase.service';
 import { AuthRecoveryService, type SecurityQuestion } from '../../services/auth-recovery.service';
+import { I18N_KEYS } from '../../services/i18n-keys.generated';
 
 // Import Lucide Icons
 import { 
@@ -100,13 +101,13 @@ export class RegisterNewComponent {
     if (/[!@#$%^&*(),.?":{}|<>]/.test(password)) strength += 10;
 
     if (strength < 40) {
-      label = 'AUTH.WEAK';
+      label = I18N_KEYS.AUTH.WEAK;
       color = '#ef4444';
     } else if (strength < 75) {
-      label = 'AUTH.MEDIUM';
+      label = I18N_KEYS.AUTH.MEDIUM;
       color = '#f59e0b';
     } else {
-      label = 'AUTH.STRONG';
+      label = I18N_KEYS.AUTH.STRONG;
       color = '#10b981';
     }
 
@@ -221,7 +222,7 @@ export class RegisterNewComponent {
         }
       } catch (error) {
         console.error('Display name validation failed:', error);
-        this.errorMessage.set('AUTH.REGISTRATION_ERROR');
+        this.errorMessage.set(I18N_KEYS.AUTH.REGISTRATION_ERROR);
         return;
       }
     }
@@ -244,7 +245,7 @@ export class RegisterNewComponent {
     const confirmPassword = this.passwordForm.get('confirmPassword')?.value;
 
     if (password !== confirmPassword) {
-      this.errorMessage.set('AUTH.PASSWORDS_DO_NOT_MATCH');
+      this.errorMessage.set(I18N_KEYS.AUTH.PASSWORDS_DO_NOT_MATCH);
       return;
     }
 
@@ -263,7 +264,7 @@ export class RegisterNewComponent {
     const question2 = this.recoveryForm.get('question2')?.value;
 
     if (question1 === question2) {
-      this.errorMessage.set('AUTH.QUESTIONS_MUST_BE_DIFFERENT');
+      this.errorMessage.set(I18N_KEYS.AUTH.QUESTIONS_MUST_BE_DIFFERENT);
       return;
     }
 
@@ -285,7 +286,7 @@ export class RegisterNewComponent {
     const codeExists = this.backupCodes().some(code => code.includes(enteredCode));
 
     if (!codeExists) {
-      this.errorMessage.set('AUTH.INVALID_BACKUP_CODE');
+      this.errorMessage.set(I18N_KEYS.AUTH.INVALID_BACKUP_CODE);
       return;
     }
 
@@ -331,18 +332,18 @@ export class RegisterNewComponent {
         );
       }
 
-      this.successMessage.set('AUTH.REGISTRATION_SUCCESS');
+      this.successMessage.set(I18N_KEYS.AUTH.REGISTRATION_SUCCESS);
       setTimeout(() => {
         sessionStorage.setItem('displayName', normalizedDisplayName);
         this.router.navigate(['/profile/edit']);
       }, 2000);
     } catch (error: any) {
       console.error('Registration error:', error);
-      const message = error?.message || 'AUTH.REGISTRATION_ERROR';
+      const message = error?.message || I18N_KEYS.AUTH.REGISTRATION_ERROR;
 
-      if (message === 'AUTH.DISPLAY_NAME_TAKEN') {
+      if (message === I18N_KEYS.AUTH.DISPLAY_NAME_TAKEN) {
         this.setDisplayNameTakenError();
-      } else if (message === 'AUTH.USERNAME_TAKEN') {
+      } else if (message === I18N_KEYS.AUTH.USERNAME_TAKEN) {
         const control = this.accountForm.get('username');
         const existingErrors = control?.errors || {};
         control?.setErrors({ ...existingErrors, usernameTaken: true });
@@ -555,7 +556,7 @@ export class RegisterNewComponent {
     this.displayNameAvailable.set(false);
 
     if (showGlobalMessage) {
-      this.errorMessage.set('AUTH.DISPLAY_NAME_TAKEN');
+      this.errorMessage.set(I18N_KEYS.AUTH.DISPLAY_NAME_TAKEN);
     }
   }
 
@@ -567,7 +568,7 @@ export class RegisterNewComponent {
       control.setErrors(Object.keys(others).length ? others : null);
     }
 
-    if (this.errorMessage() === 'AUTH.DISPLAY_NAME_TAKEN') {
+    if (this.errorMessage() === I18N_KEYS.AUTH.DISPLAY_NAME_TAKEN) {
       this.errorMessage.set('');
     }
   }
@@ -1,4 +1,5 @@
 import { TestBed } from '@angular/core/testing';
+import { provideHttpClient } from '@angular/common/http';
 import { AuthRecoveryService } from './auth-recovery.service';
 
 describe('AuthRecoveryService', () => {
@@ -6,7 +7,7 @@ describe('AuthRecoveryService', () => {
 
   beforeEach(() => {
     TestBed.configureTestingModule({
-      providers: [AuthRecoveryService]
+      providers: [AuthRecoveryService, provideHttpClient()]
     });
     service = TestBed.inject(AuthRecoveryService);
   });
@@ -1,5 +1,6 @@
-import { Injectable } from '@angular/core';
+import { Injectable, inject } from '@angular/core';
 import { SupabaseService } from './supabase.service';
+import { ReferenceDataService } from './reference-data';
 import { BehaviorSubject, Observable } from 'rxjs';
 import { environment } from '../../environments/environment';
 
@@ -40,6 +41,7 @@ export interface StartRecoveryResult {
   providedIn: 'root'
 })
 export class AuthRecoveryService {
+  private readonly referenceData = inject(ReferenceDataService);
   private recoveryState$ = new BehaviorSubject<RecoveryState>({
     step: 'select-method',
     method: null,
@@ -62,6 +64,9 @@ export class AuthRecoveryService {
    * Get list of available security questions
    */
   async getSecurityQuestions(): Promise<SecurityQuestion[]> {
+    const reference = await this.referenceData.load();
+    if (reference) return reference.securityQuestions;
+
     const { data, error } = await this.supabase.client
       .from('security_questions')
       .select('*')
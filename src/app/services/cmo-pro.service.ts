@@ -1,12 +1,18 @@
 import { Injectable, inject } from '@angular/core';
 import { SupabaseService } from './supabase.service';
+import { ReferenceDataService } from './reference-data';
 import type { CmoProOrganization, CmoProOrganizationType } from '../models/cmo-pro.model';
 
+/** Reads the published reference asset when there is one, Supabase otherwise. */
 @Injectable({ providedIn: 'root' })
 export class CmoProService {
   private readonly supabase = inject(SupabaseService);
+  private readonly referenceData = inject(ReferenceDataService);
 
   async getAll(): Promise<CmoProOrganization[]> {
+    const reference = await this.referenceData.load();
+    if (reference) return reference.organizations;
+
     const { data, error } = await this.supabase.client
       .from('cmo_pro_organizations')
       .select('*')
@@ -18,6 +24,9 @@ export class CmoProService {
   }
 
   async getByCountry(country: string): Promise<CmoProOrganization[]> {
+    const reference = await this.referenceData.load();
+    if (reference) return reference.organizationsByCountry(country);
+
     const { data, error } = await this.supabase.client
       .rpc('get_cmo_pro_by_country', { p_country: country } as Record<string, unknown>);
 
@@ -26,6 +35,9 @@ export class CmoProService {
   }
 
   async getByType(type: CmoProOrganizationType): Promise<CmoProOrganization[]> {
+    const reference = await this.referenceData.load();
+    if (reference) return reference.organizationsByType(type);
+
     const { data, error } = await this.supabase.client
       .rpc('get_cmo_pro_by_type', { p_type: type } as Record<string, unknown>);
 
@@ -34,6 +46,9 @@ export class CmoProService {
   }
 
   async getByRegion(region: string): Promise<CmoProOrganization[]> {
+    const reference = await this.referenceData.load();
+    if (reference) return reference.organizationsByRegion(region);
+
     const { data, error } = await this.supabase.client
       .rpc('get_cmo_pro_by_region', { p_region: region } as Record<string, unknown>);
 
@@ -42,6 +57,14 @@ export class CmoProService {
   }
 
   async search(term: string): Promise<CmoProOrganization[]> {
+    const reference = await this.referenceData.load();
+    if (reference) {
+      const needle = term.toLowerCase();
+      return reference.organizations.filter(
+        org => org.acronym.toLowerCase().includes(needle) || org.name.toLowerCase().includes(needle)
+      );
+    }
+
     const likeValue = `%${term}%`;
     const { data, error } = await this.supabase.client
       .from('cmo_pro_organizations')
@@ -0,0 +1,44 @@
+import { InterpolationFunction } from '@ngx-translate/core';
+
+import { CompiledTranslateParser, hydrateCatalog } from './compiled-catalog';
+
+describe('hydrateCatalog', () => {
+  const catalog = hydrateCatalog({
+    SPLITS: {
+      TITLE: 'Splits',
+      SAVE_DISABLED_OVER: ['', 'category', ' exceeds 100% by ', 'value', '%.']
+    },
+    GREETING: ['Hi ', 'user.name']
+  }) as Record<string, any>;
+
+  it('should keep static strings as plain strings', () => {
+    expect(catalog['SPLITS'].TITLE).toBe('Splits');
+  });
+
+  it('should turn segment arrays into interpolation functions', () => {
+    const fn = catalog['SPLITS'].SAVE_DISABLED_OVER as InterpolationFunction;
+    expect(fn({ value: 5, category: 'Master' })).toBe('Master exceeds 100% by 5%.');
+  });
+
+  it('should resolve dotted placeholder names and keep unknown ones', () => {
+    const fn = catalog['GREETING'] as InterpolationFunction;
+    expect(fn({ user: { name: 'Ana' } })).toBe('Hi Ana');
+    expect(fn()).toBe('Hi {{user.name}}');
+  });
+});
+
+describe('CompiledTranslateParser', () => {
+  const parser = new CompiledTranslateParser();
+
+  it('should call interpolation functions directly', () => {
+    expect(parser.interpolate(params => `n=${params?.['n']}`, { n: 3 })).toBe('n=3');
+  });
+
+  it('should return strings without placeholders untouched', () => {
+    expect(parser.interpolate('Plain text', { value: 1 })).toBe('Plain text');
+  });
+
+  it('should still interpolate legacy placeholder strings', () => {
+    expect(parser.interpolate('Total {{ value }}%', { value: 40 })).toBe('Total 40%');
+  });
+});
@@ -0,0 +1,78 @@
+import { Injectable } from '@angular/core';
+import {
+  InterpolationFunction,
+  InterpolationParameters,
+  TranslateDefaultParser,
+  TranslationObject
+} from '@ngx-translate/core';
+
+/** A string split at its placeholders: text at even positions, placeholder names at odd ones. */
+export type CompiledSegments = string[];
+
+function lookup(params: InterpolationParameters | undefined, path: string): unknown {
+  if (!params) {
+    return undefined;
+  }
+  if (path in params) {
+    return (params as Record<string, unknown>)[path];
+  }
+  return path.split('.').reduce<unknown>(
+    (value, part) => (value && typeof value === 'object' ? (value as Record<string, unknown>)[part] : undefined),
+    params
+  );
+}
+
+function toInterpolation(segments: CompiledSegments): InterpolationFunction {
+  return (params?: InterpolationParameters) => {
+    let out = '';
+    for (let i = 0; i < segments.length; i++) {
+      if (i % 2 === 0) {
+        out += segments[i];
+        continue;
+      }
+      const value = lookup(params, segments[i]);
+      out += value === undefined || value === null ? `{{${segments[i]}}}` : String(value);
+    }
+    return out;
+  };
+}
+
+/**
+ * Turns a compiled catalog or bundle (`python -m tools.i18n build`) into a translation object
+ * in one pass: segment arrays become interpolation functions, so `instant()` never runs the
+ * placeholder regex on them.
+ */
+export function hydrateCatalog(messages: TranslationObject): TranslationObject {
+  const walk = (node: unknown): unknown => {
+    if (Array.isArray(node)) {
+      return toInterpolation(node as CompiledSegments);
+    }
+    if (node && typeof node === 'object') {
+      const result: Record<string, unknown> = {};
+      for (const [key, child] of Object.entries(node)) {
+        result[key] = walk(child);
+      }
+      return result;
+    }
+    return node;
+  };
+  // ngx-translate stores interpolation functions alongside strings.
+  return walk(messages) as TranslationObject;
+}
+
+/**
+ * Parser for precompiled catalogs: functions are called directly and strings without
+ * placeholders are returned as-is; only legacy strings with `{{ }}` reach the regex parser.
+ */
+@Injectable()
+export class CompiledTranslateParser extends TranslateDefaultParser {
+  override interpolate(expr: InterpolationFunction | string, params?: InterpolationParameters): string | undefined {
+    if (typeof expr === 'function') {
+      return expr(params);
+    }
+    if (typeof expr === 'string' && !expr.includes('{{')) {
+      return expr;
+    }
+    return super.interpolate(expr, params);
+  }
+}
@@ -0,0 +1,271 @@
+import { TestBed } from '@angular/core/testing';
+import { provideHttpClient } from '@angular/common/http';
+import { HttpTestingController, provideHttpClientTesting } from '@angular/common/http/testing';
+
+import { HashedTranslateLoader, I18nRouteManifest, routeNamespaces } from './hashed-translate-loader';
+import { readArtifact, storeArtifact } from './locale-delta';
+
+describe('HashedTranslateLoader', () => {
+  let loader: HashedTranslateLoader;
+  let http: HttpTestingController;
+
+  beforeEach(() => {
+    localStorage.clear();
+    TestBed.configureTestingModule({
+      providers: [provideHttpClient(), provideHttpClientTesting()]
+    });
+    loader = TestBed.inject(HashedTranslateLoader);
+    http = TestBed.inject(HttpTestingController);
+  });
+
+  afterEach(() => http.verify());
+
+  const noRouteManifest = () =>
+    http.expectOne('/assets/i18n/build/routes.json').flush('', { status: 404, statusText: 'Not Found' });
+
+  const flushRouteManifest = () => {
+    http.expectOne('/assets/i18n/build/routes.json').flush({
+      version: 1,
+      shell: ['NAV'],
+      routes: { 'works/:id/splits': ['SPLITS', 'WORKS'] }
+    });
+    http.expectOne('/assets/i18n/build/bundles.json').flush({
+      version: 1,
+      fallback: 'en',
+      locales: {
+        de: {
+          NAV: { hash: 'aaaaaaaaaaaa', bytes: 10 },
+          SPLITS: { hash: 'bbbbbbbbbbbb', bytes: 10 },
+          WORKS: { hash: 'cccccccccccc', bytes: 10 }
+        }
+      }
+    });
+  };
+
+  it('should load the hashed build artifact listed in the map', () => {
+    let result: unknown;
+    loader.getTranslation('de').subscribe(translations => (result = translations));
+
+    noRouteManifest();
+    http.expectOne('/assets/i18n/build/i18n-map.json').flush({ version: 1, locales: { de: 'abc123def456' } });
+    http.expectOne('/assets/i18n/build/de/_all.abc123def456.json').flush({ TITLE: 'Titel' });
+
+    expect(result).toEqual({ TITLE: 'Titel' });
+  });
+
+  it('should prefer the precompiled catalog and hydrate it', () => {
+    let result: any;
+    loader.getTranslation('en').subscribe(translations => (result = translations));
+
+    noRouteManifest();
+    http.expectOne('/assets/i18n/build/i18n-map.json').flush({
+      version: 1,
+      locales: { en: 'aaaaaaaaaaaa' },
+      compiled: { en: 'bbbbbbbbbbbb' }
+    });
+    http.expectOne('/assets/i18n/build/en/_compiled.bbbbbbbbbbbb.json').flush({
+      SPLITS: { TITLE: 'Splits', OVER: ['Over by ', 'value'] }
+    });
+
+    expect(result.SPLITS.TITLE).toBe('Splits');
+    expect(result.SPLITS.OVER({ value: 3 })).toBe('Over by 3');
+  });
+
+  it('should fall back to the plain locale file without build output', () => {
+    loader.getTranslation('en').subscribe();
+
+    noRouteManifest();
+    http.expectOne('/assets/i18n/build/i18n-map.json').flush('', { status: 404, statusText: 'Not Found' });
+    http.expectOne('/assets/i18n/en.json').flush({});
+  });
+
+  it('should fetch the map only once', () => {
+    loader.getTranslation('en').subscribe();
+    noRouteManifest();
+    http.expectOne('/assets/i18n/build/i18n-map.json').flush({ version: 1, locales: {} });
+    http.expectOne('/assets/i18n/en.json').flush({});
+
+    loader.getTranslation('ua').subscribe();
+    http.expectNone('/assets/i18n/build/i18n-map.json');
+    http.expectNone('/assets/i18n/build/routes.json');
+    http.expectOne('/assets/i18n/ua.json').flush({});
+  });
+
+  it('should load only the shell bundles listed in the route manifest', () => {
+    let result: unknown;
+    loader.getTranslation('de').subscribe(translations => (result = translations));
+
+    flushRouteManifest();
+    http.expectOne('/assets/i18n/build/de/NAV.aaaaaaaaaaaa.json').flush({ NAV: { HOME: 'Start' } });
+
+    expect(result).toEqual({ NAV: { HOME: 'Start' } });
+  });
+
+  it('should return the full catalog again without refetching its bundles', () => {
+    loader.getTranslation('de').subscribe();
+    flushRouteManifest();
+    http.expectOne('/assets/i18n/build/de/NAV.aaaaaaaaaaaa.json').flush({ NAV: { HOME: 'Start' } });
+
+    let result: unknown;
+    loader.getTranslation('de').subscribe(translations => (result = translations));
+    http.expectNone(request => request.url.includes('/de/'));
+    expect(result).toEqual({ NAV: { HOME: 'Start' } });
+  });
+
+  it('should use a bundle inlined into the page instead of fetching it', () => {
+    const script = document.createElement('script');
+    script.id = 'i18n-seed';
+    script.type = 'application/json';
+    script.textContent = JSON.stringify({
+      lang: 'de',
+      bundles: { NAV: { hash: 'aaaaaaaaaaaa', data: { NAV: { HOME: 'Start' } } } }
+    });
+    document.head.appendChild(script);
+    try {
+      const seeded = TestBed.runInInjectionContext(() => new HashedTranslateLoader());
+      expect(seeded.seedTranslations('de')).toEqual({ NAV: { HOME: 'Start' } });
+      expect(seeded.seedTranslations('en')).toBeNull();
+
+      let result: unknown;
+      seeded.getTranslation('de').subscribe(translations => (result = translations));
+      flushRouteManifest();
+      http.expectNone(request => request.url.includes('/de/'));
+      expect(result).toEqual({ NAV: { HOME: 'Start' } });
+    } finally {
+      script.remove();
+    }
+  });
+
+  it('should expand short-key arrays with the shared key tree', () => {
+    let result: unknown;
+    loader.getTranslation('de').subscribe(translations => (result = translations));
+
+    noRouteManifest();
+    http.expectOne('/assets/i18n/build/i18n-map.json').flush({
+      version: 1,
+      keys: 'dddddddddddd',
+      locales: { de: 'aaaaaaaaaaaa' },
+      short: { de: 'eeeeeeeeeeee' }
+    });
+    http.expectOne('/assets/i18n/build/_keys/tree.dddddddddddd.json').flush({ TITLE: 0, NAV: { HOME: 0, WORKS: 0 } });
+    http.expectOne('/assets/i18n/build/de/_short.eeeeeeeeeeee.json').flush(['Titel', 'Start', null]);
+
+    expect(result).toEqual({ TITLE: 'Titel', NAV: { HOME: 'Start' } });
+  });
+
+  it('should resolve bundle values through the locale string table', () => {
+    let result: unknown;
+    loader.getTranslation('de').subscribe(translations => (result = translations));
+
+    http.expectOne('/assets/i18n/build/routes.json').flush({ version: 1, shell: ['NAV'], routes: {} });
+    http.expectOne('/assets/i18n/build/bundles.json').flush({
+      version: 1,
+      locales: { de: { NAV: { hash: 'aaaaaaaaaaaa', bytes: 10 } } },
+      strings: { de: { hash: 'ffffffffffff', bytes: 10 } }
+    });
+    http.expectOne('/assets/i18n/build/de/NAV.aaaaaaaaaaaa.json').flush({ NAV: { HOME: 0, BACK: 'Zurück' } });
+    http.expectOne('/assets/i18n/build/de/_strings.ffffffffffff.json').flush(['Start']);
+
+    expect(result).toEqual({ NAV: { HOME: 'Start', BACK: 'Zurück' } });
+  });
+
+  it('should hydrate compiled segments in a bundle', () => {
+    let result: any;
+    loader.getTranslation('de').subscribe(translations => (result = translations));
+
+    http.expectOne('/assets/i18n/build/routes.json').flush({ version: 1, shell: ['SPLITS'], routes: {} });
+    http.expectOne('/assets/i18n/build/bundles.json').flush({
+      version: 1,
+      locales: { de: { SPLITS: { hash: 'aaaaaaaaaaaa', bytes: 10 } } },
+      strings: { de: { hash: 'ffffffffffff', bytes: 10 } }
+    });
+    http
+      .expectOne('/assets/i18n/build/de/SPLITS.aaaaaaaaaaaa.json')
+      .flush({ SPLITS: { TITLE: 0, OVER: ['Über 100 % um ', 'value', ' %'] } });
+    http.expectOne('/assets/i18n/build/de/_strings.ffffffffffff.json').flush(['Anteile']);
+
+    expect(result.SPLITS.TITLE).toBe('Anteile');
+    expect(result.SPLITS.OVER({ value: 5 })).toBe('Über 100 % um 5 %');
+  });
+
+  it('should patch a stored bundle to the published version', () => {
+    storeArtifact('de', 'NAV', 'aaaaaaaaaaaa', { NAV: { HOME: 'Start', BACK: 'Zurück' } });
+    let result: unknown;
+    loader.getTranslation('de').subscribe(translations => (result = translations));
+
+    http.expectOne('/assets/i18n/build/routes.json').flush({ version: 1, shell: ['NAV'], routes: {} });
+    http.expectOne('/assets/i18n/build/bundles.json').flush({
+      version: 1,
+      versions: 'versions.json',
+      locales: { de: { NAV: { hash: 'bbbbbbbbbbbb', bytes: 10 } } }
+    });
+    http.expectOne('/assets/i18n/build/versions.json').flush({
+      version: 1,
+      keep: 5,
+      locales: { de: { NAV: { current: 'bbbbbbbbbbbb', previous: ['aaaaaaaaaaaa'], deltas: { aaaaaaaaaaaa: 40 } } } }
+    });
+    http
+      .expectOne('/assets/i18n/build/de/NAV.aaaaaaaaaaaa-bbbbbbbbbbbb.json')
+      .flush([['replace', '/NAV/HOME', 'Startseite']]);
+
+    expect(result).toEqual({ NAV: { HOME: 'Startseite', BACK: 'Zurück' } });
+    expect(readArtifact('de', 'NAV')?.hash).toBe('bbbbbbbbbbbb');
+  });
+
+  it('should use a stored artifact of the published hash without fetching it', () => {
+    storeArtifact('de', '_all', 'abc123def456', { TITLE: 'Titel' });
+    let result: unknown;
+    loader.getTranslation('de').subscribe(translations => (result = translations));
+
+    noRouteManifest();
+    http
+      .expectOne('/assets/i18n/build/i18n-map.json')
+      .flush({ version: 1, versions: 'versions.json', locales: { de: 'abc123def456' } });
+
+    expect(result).toEqual({ TITLE: 'Titel' });
+  });
+
+  it('should report merged fallbacks from the bundle index', () => {
+    let merged: boolean | undefined;
+    loader.fallbackMerged().subscribe(value => (merged = value));
+
+    flushRouteManifest();
+    expect(merged).toBe(true);
+  });
+
+  it('should report unmerged fallbacks without build output', () => {
+    let merged: boolean | undefined;
+    loader.fallbackMerged().subscribe(value => (merged = value));
+
+    noRouteManifest();
+    http.expectOne('/assets/i18n/build/i18n-map.json').flush('', { status: 404, statusText: 'Not Found' });
+    expect(merged).toBe(false);
+  });
+
+  it('should fetch a route\'s missing bundles in parallel, once', () => {
+    let result: unknown;
+    loader.loadRoute('de', '/works/42/splits?tab=1').subscribe(translations => (result = translations));
+
+    flushRouteManifest();
+    http.expectOne('/assets/i18n/build/de/SPLITS.bbbbbbbbbbbb.json').flush({ SPLITS: { TITLE: 'Anteile' } });
+    http.expectOne('/assets/i18n/build/de/WORKS.cccccccccccc.json').flush({ WORKS: { TITLE: 'Werke' } });
+    expect(result).toEqual({ SPLITS: { TITLE: 'Anteile' }, WORKS: { TITLE: 'Werke' } });
+
+    loader.loadRoute('de', '/works/7/splits').subscribe(translations => (result = translations));
+    http.expectNone(request => request.url.includes('/de/'));
+    expect(result).toBeNull();
+  });
+
+  it('should match route patterns segment by segment', () => {
+    const manifest: I18nRouteManifest = {
+      version: 1,
+      shell: [],
+      routes: { '': ['LANDING'], 'works/:id/splits': ['SPLITS'], works: ['WORKS'] }
+    };
+
+    expect(routeNamespaces(manifest, '/')).toEqual(['LANDING']);
+    expect(routeNamespaces(manifest, '/works/1/splits#top')).toEqual(['SPLITS']);
+    expect(routeNamespaces(manifest, '/works/')).toEqual(['WORKS']);
+    expect(routeNamespaces(manifest, '/unknown')).toEqual([]);
+  });
+});
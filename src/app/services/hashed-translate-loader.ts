@@ -0,0 +1,307 @@
+import { Injectable, inject } from '@angular/core';
+import { DOCUMENT } from '@angular/common';
+import { HttpClient } from '@angular/common/http';
+import { TranslateLoader, TranslationObject } from '@ngx-translate/core';
+import { Observable, catchError, forkJoin, map, of, shareReplay, switchMap, tap, throwError } from 'rxjs';
+import { hydrateCatalog } from './compiled-catalog';
+import { I18nSeed, readSeed } from './i18n-seed';
+import { I18nVersions, PatchOperation, applyPatch, readArtifact, storeArtifact } from './locale-delta';
+import { KeyTree, ShortKeyCatalog, bundleTree, hydrateShortKeys } from './short-key-catalog';
+import { StringTable, resolveStrings } from './string-table';
+
+/** Shape of `/assets/i18n/build/i18n-map.json`, written by `python -m tools.i18n build`. */
+export interface I18nHashMap {
+  version: number;
+  /** Locale merged under every other locale at build time, so it never needs loading alongside. */
+  fallback?: string;
+  locales: Record<string, string>;
+  compiled?: Record<string, string>;
+  /** Flat value arrays (`build --short-keys`), indexed by the key tree with hash `keys`. */
+  short?: Record<string, string>;
+  keys?: string;
+  /** Version manifest (`build --keep-versions`): artifacts are kept locally and updated by patch. */
+  versions?: string;
+}
+
+/** Shape of `/assets/i18n/build/bundles.json`: one hashed bundle per top-level namespace. */
+export interface I18nBundleIndex {
+  version: number;
+  fallback?: string;
+  keys?: string;
+  versions?: string;
+  locales: Record<string, Record<string, { hash: string; bytes: number }>>;
+  short?: Record<string, Record<string, { hash: string; bytes: number }>>;
+  /** Per-locale table of strings shared by several bundles (`build --string-table`). */
+  strings?: Record<string, { hash: string; bytes: number }>;
+}
+
+/** Shape of `/assets/i18n/build/routes.json`: namespaces of the shell and of each route. */
+export interface I18nRouteManifest {
+  version: number;
+  shell: string[];
+  routes: Record<string, string[]>;
+}
+
+interface RouteData {
+  routes: I18nRouteManifest;
+  bundles: I18nBundleIndex;
+}
+
+export const I18N_BASE_URL = '/assets/i18n';
+export const I18N_BUILD_URL = `${I18N_BASE_URL}/build`;
+
+/** Namespaces the route matching `url` needs beyond the shell (`:param` segments match anything). */
+export function routeNamespaces(manifest: I18nRouteManifest, url: string): string[] {
+  const path = url.split(/[?#]/)[0].replace(/^\/+|\/+$/g, '');
+  const segments = path ? path.split('/') : [];
+  for (const [pattern, namespaces] of Object.entries(manifest.routes)) {
+    const parts = pattern ? pattern.split('/') : [];
+    if (parts.length === segments.length && parts.every((part, i) => part.startsWith(':') || part === segments[i])) {
+      return namespaces;
+    }
+  }
+  return [];
+}
+
+/**
+ * Loads locale files by their content-hashed build URL so they can be cached forever.
+ * With a route manifest, only the shell's and the current route's namespace bundles are
+ * fetched and `loadRoute` adds the rest per navigation; otherwise the precompiled catalog
+ * or the whole locale is loaded. Bundles and the precompiled catalog hold strings with
+ * placeholders as segment arrays, hydrated once into interpolation functions. Falls back to the plain `/assets/i18n/<lang>.json` when
+ * the build output is missing (e.g. `ng serve` without running the i18n build).
+ * Built locales already contain the English fallback, see `fallbackMerged`. When the build
+ * lists short-key arrays, those are fetched instead and expanded with the shared key tree.
+ * When it keeps older versions, keyed artifacts are stored locally and a changed one is
+ * fetched as a patch against the stored copy where the build published one. Bundles
+ * inlined into `index.html` (see `seedTranslations`) are used instead of their request.
+ */
+@Injectable({ providedIn: 'root' })
+export class HashedTranslateLoader implements TranslateLoader {
+  private http = inject(HttpClient);
+  private document = inject(DOCUMENT);
+
+  /** Bundle requests (replayed once done), by `<lang>/<namespace>`; failed ones are dropped. */
+  private readonly bundles = new Map<string, Observable<TranslationObject>>();
+
+  private readonly seed: I18nSeed | null = readSeed(this.document);
+
+  /** String table requests by hash. */
+  private readonly stringTables = new Map<string, Observable<StringTable>>();
+
+  /** Key tree requests by hash (in practice one per session). */
+  private readonly keyTrees = new Map<string, Observable<KeyTree>>();
+
+  /** Version manifest requests by file name, made only once a stored artifact is outdated. */
+  private readonly versionManifests = new Map<string, Observable<I18nVersions | null>>();
+
+  private readonly hashMap$: Observable<I18nHashMap | null> = this.http
+    .get<I18nHashMap>(`${I18N_BUILD_URL}/i18n-map.json`)
+    .pipe(
+      catchError(() => of(null)),
+      shareReplay(1)
+    );
+
+  private readonly routeData$: Observable<RouteData | null> = forkJoin({
+    routes: this.http.get<I18nRouteManifest>(`${I18N_BUILD_URL}/routes.json`),
+    bundles: this.http.get<I18nBundleIndex>(`${I18N_BUILD_URL}/bundles.json`)
+  }).pipe(
+    catchError(() => of(null)),
+    shareReplay(1)
+  );
+
+  getTranslation(lang: string): Observable<TranslationObject> {
+    return this.routeData$.pipe(
+      switchMap(data => {
+        if (data?.bundles.locales[lang]) {
+          const url = this.document.location?.pathname ?? '/';
+          const namespaces = [...data.routes.shell, ...routeNamespaces(data.routes, url)];
+          return this.loadBundles(lang, data, namespaces);
+        }
+        return this.wholeLocale(lang);
+      })
+    );
+  }
+
+  /** Bundles the route at `url` still needs in `lang`, or null when nothing is missing. */
+  loadRoute(lang: string, url: string): Observable<TranslationObject | null> {
+    return this.routeData$.pipe(
+      switchMap(data => {
+        const index = data?.bundles.locales[lang];
+        if (!data || !index) {
+          return of(null);
+        }
+        const missing = routeNamespaces(data.routes, url).filter(
+          name => index[name] && !this.bundles.has(`${lang}/${name}`)
+        );
+        return missing.length ? this.loadBundles(lang, data, missing) : of(null);
+      })
+    );
+  }
+
+  /** Whether the served locales have the English fallback merged in, so only the active one is needed. */
+  fallbackMerged(): Observable<boolean> {
+    return this.routeData$.pipe(
+      switchMap(data => (data ? of(data.bundles) : this.hashMap$)),
+      map(index => Boolean(index?.fallback))
+    );
+  }
+
+  /** Strings inlined into the page for `lang`, available before anything is fetched. */
+  seedTranslations(lang: string): TranslationObject | null {
+    const bundles = this.seed?.lang === lang ? Object.values(this.seed.bundles) : [];
+    if (!bundles.length) {
+      return null;
+    }
+    return hydrateCatalog(Object.assign({}, ...bundles.map(bundle => bundle.data)));
+  }
+
+  localeUrl(lang: string): Observable<string> {
+    return this.hashMap$.pipe(map(hashMap => this.urlFor(lang, hashMap)));
+  }
+
+  /** All of `namespaces` in `lang` merged; each bundle is requested once per session. */
+  private loadBundles(lang: string, data: RouteData, namespaces: string[]): Observable<TranslationObject> {
+    const index = data.bundles.locales[lang];
+    const names = [...new Set(namespaces)].filter(name => index[name]);
+    if (!names.length) {
+      return of({});
+    }
+    return forkJoin(names.map(name => this.bundle(lang, name, data.bundles))).pipe(
+      map(bundles => Object.assign({}, ...bundles) as TranslationObject)
+    );
+  }
+
+  private bundle(lang: string, name: string, index: I18nBundleIndex): Observable<TranslationObject> {
+    const key = `${lang}/${name}`;
+    let request = this.bundles.get(key);
+    const seeded = this.seed?.lang === lang ? this.seed.bundles[name] : undefined;
+    if (!request && seeded?.hash === index.locales[lang][name].hash) {
+      request = of(hydrateCatalog(seeded.data));
+      this.bundles.set(key, request);
+    }
+    if (!request) {
+      const short = index.short?.[lang]?.[name];
+      const table = index.strings?.[lang];
+      const translations$ = this.keyTree(short && index.keys).pipe(
+        switchMap(tree =>
+          tree && short
+            ? this.http
+                .get<ShortKeyCatalog>(`${I18N_BUILD_URL}/${lang}/_short.${name}.${short.hash}.json`)
+                .pipe(map(values => hydrateShortKeys(values, bundleTree(tree, name))))
+            : this.artifact<TranslationObject>(lang, name, index.locales[lang][name].hash, index.versions)
+        )
+      );
+      const strings$ = table ? this.stringTable(lang, table.hash) : of(null);
+      request = forkJoin([translations$, strings$]).pipe(
+        map(([translations, strings]) =>
+          hydrateCatalog(strings ? resolveStrings(translations, strings) : translations)
+        ),
+        catchError(error => {
+          this.bundles.delete(key);
+          return throwError(() => error);
+        }),
+        shareReplay(1)
+      );
+      this.bundles.set(key, request);
+    }
+    return request;
+  }
+
+  private stringTable(lang: string, hash: string): Observable<StringTable> {
+    let request = this.stringTables.get(hash);
+    if (!request) {
+      request = this.http.get<StringTable>(`${I18N_BUILD_URL}/${lang}/_strings.${hash}.json`).pipe(shareReplay(1));
+      this.stringTables.set(hash, request);
+    }
+    return request;
+  }
+
+  /** The key tree with this hash, or null without short-key artifacts. */
+  private keyTree(hash: string | undefined): Observable<KeyTree | null> {
+    if (!hash) {
+      return of(null);
+    }
+    let request = this.keyTrees.get(hash);
+    if (!request) {
+      request = this.http.get<KeyTree>(`${I18N_BUILD_URL}/_keys/tree.${hash}.json`).pipe(shareReplay(1));
+      this.keyTrees.set(hash, request);
+    }
+    return request;
+  }
+
+  /**
+   * `build/<lang>/<stem>.<hash>.json`. With a version manifest the result is stored, a stored
+   * copy of this hash is used as is, and an older one is patched when the build kept a delta.
+   */
+  private artifact<T>(lang: string, stem: string, hash: string, versions?: string): Observable<T> {
+    const full$ = this.http.get<T>(`${I18N_BUILD_URL}/${lang}/${stem}.${hash}.json`);
+    if (!versions) {
+      return full$;
+    }
+    const stored = readArtifact<T>(lang, stem);
+    if (stored?.hash === hash) {
+      return of(stored.data);
+    }
+    const fetched$ = !stored
+      ? full$
+      : this.versionManifest(versions).pipe(
+          switchMap(manifest => {
+            const entry = manifest?.locales[lang]?.[stem];
+            if (entry?.current !== hash || entry.deltas[stored.hash] === undefined) {
+              return full$;
+            }
+            return this.http
+              .get<PatchOperation[]>(`${I18N_BUILD_URL}/${lang}/${stem}.${stored.hash}-${hash}.json`)
+              .pipe(
+                map(ops => applyPatch(stored.data, ops)),
+                catchError(() => full$)
+              );
+          })
+        );
+    return fetched$.pipe(tap(data => storeArtifact(lang, stem, hash, data)));
+  }
+
+  private versionManifest(name: string): Observable<I18nVersions | null> {
+    let request = this.versionManifests.get(name);
+    if (!request) {
+      request = this.http.get<I18nVersions>(`${I18N_BUILD_URL}/${name}`).pipe(
+        catchError(() => of(null)),
+        shareReplay(1)
+      );
+      this.versionManifests.set(name, request);
+    }
+    return request;
+  }
+
+  private wholeLocale(lang: string): Observable<TranslationObject> {
+    return this.hashMap$.pipe(
+      switchMap(hashMap => {
+        const short = hashMap?.short?.[lang];
+        return this.keyTree(short && hashMap?.keys).pipe(map(tree => ({ hashMap, tree, short })));
+      }),
+      switchMap(({ hashMap, tree, short }) => {
+        if (tree && short) {
+          return this.http
+            .get<ShortKeyCatalog>(`${I18N_BUILD_URL}/${lang}/_short.${short}.json`)
+            .pipe(map(values => hydrateCatalog(hydrateShortKeys(values, tree))));
+        }
+        const compiled = hashMap?.compiled?.[lang];
+        if (compiled) {
+          return this.artifact<TranslationObject>(lang, '_compiled', compiled, hashMap?.versions).pipe(
+            map(hydrateCatalog)
+          );
+        }
+        const hash = hashMap?.locales?.[lang];
+        return hash
+          ? this.artifact<TranslationObject>(lang, '_all', hash, hashMap?.versions)
+          : this.http.get<TranslationObject>(this.urlFor(lang, hashMap));
+      })
+    );
+  }
+
+  private urlFor(lang: string, hashMap: I18nHashMap | null): string {
+    const hash = hashMap?.locales?.[lang];
+    return hash ? `${I18N_BUILD_URL}/${lang}/_all.${hash}.json` : `${I18N_BASE_URL}/${lang}.json`;
+  }
+}
@@ -0,0 +1,1903 @@
+// Generated by `python -m tools.i18n build` from the en catalog. Do not edit.
+
+/** Every translation key of the default locale; leaves hold the dotted key. */
+export const I18N_KEYS = {
+  APP_NAME: 'APP_NAME',
+  TITLE: 'TITLE',
+  WELCOME: 'WELCOME',
+  DESCRIPTION: 'DESCRIPTION',
+  LANGUAGE: 'LANGUAGE',
+  ADMIN: {
+    LABEL: 'ADMIN.LABEL',
+    HEADLINE: 'ADMIN.HEADLINE',
+    WELCOME: 'ADMIN.WELCOME',
+    NAV: {
+      OVERVIEW: 'ADMIN.NAV.OVERVIEW',
+      OVERVIEW_DESC: 'ADMIN.NAV.OVERVIEW_DESC',
+      USERS: 'ADMIN.NAV.USERS',
+      USERS_DESC: 'ADMIN.NAV.USERS_DESC',
+      ANALYTICS: 'ADMIN.NAV.ANALYTICS',
+      ANALYTICS_DESC: 'ADMIN.NAV.ANALYTICS_DESC',
+      INVITES: 'ADMIN.NAV.INVITES',
+      INVITES_DESC: 'ADMIN.NAV.INVITES_DESC',
+      RECOVERY: 'ADMIN.NAV.RECOVERY',
+      RECOVERY_DESC: 'ADMIN.NAV.RECOVERY_DESC',
+      MESSAGING: 'ADMIN.NAV.MESSAGING',
+      MESSAGING_DESC: 'ADMIN.NAV.MESSAGING_DESC',
+    },
+    OVERVIEW: {
+      TITLE: 'ADMIN.OVERVIEW.TITLE',
+      SUBTITLE: 'ADMIN.OVERVIEW.SUBTITLE',
+      LOADING: 'ADMIN.OVERVIEW.LOADING',
+      SIGNUPS_TITLE: 'ADMIN.OVERVIEW.SIGNUPS_TITLE',
+      SIGNUPS_DESC: 'ADMIN.OVERVIEW.SIGNUPS_DESC',
+      REFRESHED_AT: 'ADMIN.OVERVIEW.REFRESHED_AT',
+      LIVE: 'ADMIN.OVERVIEW.LIVE',
+      ACTIVITY_TITLE: 'ADMIN.OVERVIEW.ACTIVITY_TITLE',
+      ACTIVITY_DESC: 'ADMIN.OVERVIEW.ACTIVITY_DESC',
+      ACTIVITY_WEEK: 'ADMIN.OVERVIEW.ACTIVITY_WEEK',
+      ACTIVITY_SIGNUPS: 'ADMIN.OVERVIEW.ACTIVITY_SIGNUPS',
+      ACTIVITY_WORKS: 'ADMIN.OVERVIEW.ACTIVITY_WORKS',
+      ACTIVITY_PROTOCOLS: 'ADMIN.OVERVIEW.ACTIVITY_PROTOCOLS',
+      ACTIVITY_WAITLIST: 'ADMIN.OVERVIEW.ACTIVITY_WAITLIST',
+    },
+    METRICS: {
+      TOTAL_USERS: 'ADMIN.METRICS.TOTAL_USERS',
+      TOTAL_USERS_DESC: 'ADMIN.METRICS.TOTAL_USERS_DESC',
+      ACTIVE_USERS: 'ADMIN.METRICS.ACTIVE_USERS',
+      ACTIVE_USERS_DESC: 'ADMIN.METRICS.ACTIVE_USERS_DESC',
+      DEACTIVATED_USERS: 'ADMIN.METRICS.DEACTIVATED_USERS',
+      DEACTIVATED_USERS_DESC: 'ADMIN.METRICS.DEACTIVATED_USERS_DESC',
+      COMPLETE_WORKS: 'ADMIN.METRICS.COMPLETE_WORKS',
+      COMPLETE_WORKS_DESC: 'ADMIN.METRICS.COMPLETE_WORKS_DESC',
+      HUMAN_WORKS: 'ADMIN.METRICS.HUMAN_WORKS',
+      HUMAN_WORKS_DESC: 'ADMIN.METRICS.HUMAN_WORKS_DESC',
+      AI_ASSISTED: 'ADMIN.METRICS.AI_ASSISTED',
+      AI_ASSISTED_DESC: 'ADMIN.METRICS.AI_ASSISTED_DESC',
+      AI_GENERATED: 'ADMIN.METRICS.AI_GENERATED',
+      AI_GENERATED_DESC: 'ADMIN.METRICS.AI_GENERATED_DESC',
+    },
+    ACTIONS: {
+      REFRESH: 'ADMIN.ACTIONS.REFRESH',
+    },
+    ERRORS: {
+      OVERVIEW_LOAD_FAILED: 'ADMIN.ERRORS.OVERVIEW_LOAD_FAILED',
+      LOAD_USERS: 'ADMIN.ERRORS.LOAD_USERS',
+      UPDATE_USER: 'ADMIN.ERRORS.UPDATE_USER',
+      LOAD_INVITES: 'ADMIN.ERRORS.LOAD_INVITES',
+      CREATE_INVITE: 'ADMIN.ERRORS.CREATE_INVITE',
+      REVOKE_INVITE: 'ADMIN.ERRORS.REVOKE_INVITE',
+      NOT_AUTHENTICATED: 'ADMIN.ERRORS.NOT_AUTHENTICATED',
+    },
+    USERS: {
+      TITLE: 'ADMIN.USERS.TITLE',
+      SUBTITLE: 'ADMIN.USERS.SUBTITLE',
+      SEARCH_LABEL: 'ADMIN.USERS.SEARCH_LABEL',
+      SEARCH_PLACEHOLDER: 'ADMIN.USERS.SEARCH_PLACEHOLDER',
+      FILTER_ALL: 'ADMIN.USERS.FILTER_ALL',
+      FILTER_ACTIVE: 'ADMIN.USERS.FILTER_ACTIVE',
+      FILTER_DEACTIVATED: 'ADMIN.USERS.FILTER_DEACTIVATED',
+      LOADING: 'ADMIN.USERS.LOADING',
+      EMPTY: 'ADMIN.USERS.EMPTY',
+      COLUMNS: {
+        USER: 'ADMIN.USERS.COLUMNS.USER',
+        ROLE: 'ADMIN.USERS.COLUMNS.ROLE',
+        STATUS: 'ADMIN.USERS.COLUMNS.STATUS',
+        ADMIN: 'ADMIN.USERS.COLUMNS.ADMIN',
+        ACTIONS: 'ADMIN.USERS.COLUMNS.ACTIONS',
+      },
+      UNSET_DISPLAY: 'ADMIN.USERS.UNSET_DISPLAY',
+      UNSET_ROLE: 'ADMIN.USERS.UNSET_ROLE',
+      STATUS_ACTIVE: 'ADMIN.USERS.STATUS_ACTIVE',
+      STATUS_DEACTIVATED: 'ADMIN.USERS.STATUS_DEACTIVATED',
+      ADMIN_TRUE: 'ADMIN.USERS.ADMIN_TRUE',
+      ADMIN_FALSE: 'ADMIN.USERS.ADMIN_FALSE',
+      ACTION_REMOVE_ADMIN: 'ADMIN.USERS.ACTION_REMOVE_ADMIN',
+      ACTION_GRANT_ADMIN: 'ADMIN.USERS.ACTION_GRANT_ADMIN',
+      ACTION_RESTORE: 'ADMIN.USERS.ACTION_RESTORE',
+      ACTION_DEACTIVATE: 'ADMIN.USERS.ACTION_DEACTIVATE',
+      PAGINATION_LABEL: 'ADMIN.USERS.PAGINATION_LABEL',
+      PREV: 'ADMIN.USERS.PREV',
+      NEXT: 'ADMIN.USERS.NEXT',
+      PAGE_X_OF_Y: 'ADMIN.USERS.PAGE_X_OF_Y',
+    },
+    INVITES: {
+      TITLE: 'ADMIN.INVITES.TITLE',
+      SUBTITLE: 'ADMIN.INVITES.SUBTITLE',
+      CREATE_HEADING: 'ADMIN.INVITES.CREATE_HEADING',
+      CREATE_HELP: 'ADMIN.INVITES.CREATE_HELP',
+      EXPIRY_LABEL: 'ADMIN.INVITES.EXPIRY_LABEL',
+      EXPIRY_IN_DAYS: 'ADMIN.INVITES.EXPIRY_IN_DAYS',
+      EXPIRY_NEVER: 'ADMIN.INVITES.EXPIRY_NEVER',
+      DAYS_LABEL: 'ADMIN.INVITES.DAYS_LABEL',
+      DAYS_SUFFIX: 'ADMIN.INVITES.DAYS_SUFFIX',
+      CREATE_BUTTON: 'ADMIN.INVITES.CREATE_BUTTON',
+      CREATING: 'ADMIN.INVITES.CREATING',
+      LOADING: 'ADMIN.INVITES.LOADING',
+      EMPTY: 'ADMIN.INVITES.EMPTY',
+      CREATED_AT: 'ADMIN.INVITES.CREATED_AT',
+      EXPIRES_AT: 'ADMIN.INVITES.EXPIRES_AT',
+      STATUS_LABEL: 'ADMIN.INVITES.STATUS_LABEL',
+      NO_EXPIRY: 'ADMIN.INVITES.NO_EXPIRY',
+      COPY: 'ADMIN.INVITES.COPY',
+      REVOKE: 'ADMIN.INVITES.REVOKE',
+      STATUS: {
+        active: 'ADMIN.INVITES.STATUS.active',
+        claimed: 'ADMIN.INVITES.STATUS.claimed',
+        revoked: 'ADMIN.INVITES.STATUS.revoked',
+        expired: 'ADMIN.INVITES.STATUS.expired',
+      },
+    },
+    ANALYTICS: {
+      TITLE: 'ADMIN.ANALYTICS.TITLE',
+      SUBTITLE: 'ADMIN.ANALYTICS.SUBTITLE',
+      WORK_IN_PROGRESS: 'ADMIN.ANALYTICS.WORK_IN_PROGRESS',
+      WORK_IN_PROGRESS_DESC: 'ADMIN.ANALYTICS.WORK_IN_PROGRESS_DESC',
+    },
+    RECOVERY: {
+      TITLE: 'ADMIN.RECOVERY.TITLE',
+      SUBTITLE: 'ADMIN.RECOVERY.SUBTITLE',
+      WORK_IN_PROGRESS: 'ADMIN.RECOVERY.WORK_IN_PROGRESS',
+      WORK_IN_PROGRESS_DESC: 'ADMIN.RECOVERY.WORK_IN_PROGRESS_DESC',
+    },
+    MESSAGING: {
+      TITLE: 'ADMIN.MESSAGING.TITLE',
+      SUBTITLE: 'ADMIN.MESSAGING.SUBTITLE',
+      WORK_IN_PROGRESS: 'ADMIN.MESSAGING.WORK_IN_PROGRESS',
+      WORK_IN_PROGRESS_DESC: 'ADMIN.MESSAGING.WORK_IN_PROGRESS_DESC',
+    },
+  },
+  AI_DISCLOSURE_FORM: {
+    TITLE: 'AI_DISCLOSURE_FORM.TITLE',
+    HINT: 'AI_DISCLOSURE_FORM.HINT',
+    SECTIONS: {
+      IP: 'AI_DISCLOSURE_FORM.SECTIONS.IP',
+      MIXING: 'AI_DISCLOSURE_FORM.SECTIONS.MIXING',
+      MASTERING: 'AI_DISCLOSURE_FORM.SECTIONS.MASTERING',
+      SESSION_MUSICIANS: 'AI_DISCLOSURE_FORM.SECTIONS.SESSION_MUSICIANS',
+      VISUALS: 'AI_DISCLOSURE_FORM.SECTIONS.VISUALS',
+    },
+    OPTIONS: {
+      HUMAN: 'AI_DISCLOSURE_FORM.OPTIONS.HUMAN',
+      AI_ASSISTED: 'AI_DISCLOSURE_FORM.OPTIONS.AI_ASSISTED',
+      AI_GENERATED: 'AI_DISCLOSURE_FORM.OPTIONS.AI_GENERATED',
+      AI_TOOL_LABEL: 'AI_DISCLOSURE_FORM.OPTIONS.AI_TOOL_LABEL',
+      AI_TOOL_PLACEHOLDER: 'AI_DISCLOSURE_FORM.OPTIONS.AI_TOOL_PLACEHOLDER',
+      NOTES_LABEL: 'AI_DISCLOSURE_FORM.OPTIONS.NOTES_LABEL',
+      NOTES_PLACEHOLDER: 'AI_DISCLOSURE_FORM.OPTIONS.NOTES_PLACEHOLDER',
+    },
+    SUMMARY: {
+      TITLE: 'AI_DISCLOSURE_FORM.SUMMARY.TITLE',
+      HUMAN: 'AI_DISCLOSURE_FORM.SUMMARY.HUMAN',
+      AI_ASSISTED: 'AI_DISCLOSURE_FORM.SUMMARY.AI_ASSISTED',
+      AI_ASSISTED_WITH_TOOL: 'AI_DISCLOSURE_FORM.SUMMARY.AI_ASSISTED_WITH_TOOL',
+      AI_GENERATED: 'AI_DISCLOSURE_FORM.SUMMARY.AI_GENERATED',
+      AI_GENERATED_WITH_TOOL: 'AI_DISCLOSURE_FORM.SUMMARY.AI_GENERATED_WITH_TOOL',
+      UNKNOWN: 'AI_DISCLOSURE_FORM.SUMMARY.UNKNOWN',
+    },
+    VALIDATION: {
+      TITLE: 'AI_DISCLOSURE_FORM.VALIDATION.TITLE',
+      INSTRUCTIONS: 'AI_DISCLOSURE_FORM.VALIDATION.INSTRUCTIONS',
+      TOOL_REQUIRED: 'AI_DISCLOSURE_FORM.VALIDATION.TOOL_REQUIRED',
+    },
+  },
+  ARCHIVED_WORKS: {
+    BACK: 'ARCHIVED_WORKS.BACK',
+    TITLE: 'ARCHIVED_WORKS.TITLE',
+    SUBTITLE: 'ARCHIVED_WORKS.SUBTITLE',
+    REFRESH: 'ARCHIVED_WORKS.REFRESH',
+    NO_WORKSPACE: 'ARCHIVED_WORKS.NO_WORKSPACE',
+    ERROR_LOADING: 'ARCHIVED_WORKS.ERROR_LOADING',
+    SEARCH_PLACEHOLDER: 'ARCHIVED_WORKS.SEARCH_PLACEHOLDER',
+    ARCHIVED_LABEL: 'ARCHIVED_WORKS.ARCHIVED_LABEL',
+    ISRC: 'ARCHIVED_WORKS.ISRC',
+    ISWC: 'ARCHIVED_WORKS.ISWC',
+    UPDATED: 'ARCHIVED_WORKS.UPDATED',
+    RESTORE: 'ARCHIVED_WORKS.RESTORE',
+    OPEN: 'ARCHIVED_WORKS.OPEN',
+    EMPTY_TITLE: 'ARCHIVED_WORKS.EMPTY_TITLE',
+    EMPTY_DESC: 'ARCHIVED_WORKS.EMPTY_DESC',
+    BACK_TO_DASHBOARD: 'ARCHIVED_WORKS.BACK_TO_DASHBOARD',
+  },
+  AUTH: {
+    WELCOME_BACK: 'AUTH.WELCOME_BACK',
+    LOGIN_SUBTITLE: 'AUTH.LOGIN_SUBTITLE',
+    JOIN_PLATFORM: 'AUTH.JOIN_PLATFORM',
+    EMAIL: 'AUTH.EMAIL',
+    REQUIRED_FIELD: 'AUTH.REQUIRED_FIELD',
+    INVALID_EMAIL: 'AUTH.INVALID_EMAIL',
+    PASSWORD_REQUIREMENTS: 'AUTH.PASSWORD_REQUIREMENTS',
+    FORGOT_PASSWORD: 'AUTH.FORGOT_PASSWORD',
+    LOG_IN: 'AUTH.LOG_IN',
+    LOGIN: 'AUTH.LOGIN',
+    OR: 'AUTH.OR',
+    SIGN_IN_WITH_GOOGLE: 'AUTH.SIGN_IN_WITH_GOOGLE',
+    NO_ACCOUNT: 'AUTH.NO_ACCOUNT',
+    DONT_HAVE_ACCOUNT: 'AUTH.DONT_HAVE_ACCOUNT',
+    SIGN_UP: 'AUTH.SIGN_UP',
+    REGISTER: 'AUTH.REGISTER',
+    CREATE_ACCOUNT: 'AUTH.CREATE_ACCOUNT',
+    REGISTER_SUBTITLE: 'AUTH.REGISTER_SUBTITLE',
+    DISPLAY_NAME: 'AUTH.DISPLAY_NAME',
+    DISPLAY_NAME_REQUIRED: 'AUTH.DISPLAY_NAME_REQUIRED',
+    DISPLAY_NAME_MIN_LENGTH: 'AUTH.DISPLAY_NAME_MIN_LENGTH',
+    DISPLAY_NAME_TAKEN: 'AUTH.DISPLAY_NAME_TAKEN',
+    CONFIRM_PASSWORD: 'AUTH.CONFIRM_PASSWORD',
+    PASSWORD_RESET_FAILED: 'AUTH.PASSWORD_RESET_FAILED',
+    CONFIRM_PASSWORD_REQUIRED: 'AUTH.CONFIRM_PASSWORD_REQUIRED',
+    PASSWORDS_MUST_MATCH: 'AUTH.PASSWORDS_MUST_MATCH',
+    ALREADY_HAVE_ACCOUNT: 'AUTH.ALREADY_HAVE_ACCOUNT',
+    TERMS_AGREEMENT: 'AUTH.TERMS_AGREEMENT',
+    WEAK: 'AUTH.WEAK',
+    MEDIUM: 'AUTH.MEDIUM',
+    STRONG: 'AUTH.STRONG',
+    REGISTRATION_SUCCESS: 'AUTH.REGISTRATION_SUCCESS',
+    REGISTRATION_ERROR: 'AUTH.REGISTRATION_ERROR',
+    EMAIL_ALREADY_EXISTS: 'AUTH.EMAIL_ALREADY_EXISTS',
+    LOGIN_ERROR: 'AUTH.LOGIN_ERROR',
+    INVALID_CREDENTIALS: 'AUTH.INVALID_CREDENTIALS',
+    BRANDING_TITLE: 'AUTH.BRANDING_TITLE',
+    BRANDING_DESCRIPTION: 'AUTH.BRANDING_DESCRIPTION',
+    BRANDING_TITLE_REGISTER: 'AUTH.BRANDING_TITLE_REGISTER',
+    BRANDING_DESCRIPTION_REGISTER: 'AUTH.BRANDING_DESCRIPTION_REGISTER',
+    FEATURE_1: 'AUTH.FEATURE_1',
+    FEATURE_2: 'AUTH.FEATURE_2',
+    FEATURE_3: 'AUTH.FEATURE_3',
+    REGISTER_FEATURE_1: 'AUTH.REGISTER_FEATURE_1',
+    REGISTER_FEATURE_2: 'AUTH.REGISTER_FEATURE_2',
+    REGISTER_FEATURE_3: 'AUTH.REGISTER_FEATURE_3',
+    PASSWORD_RECOVERY: 'AUTH.PASSWORD_RECOVERY',
+    RECOVERY_SUBTITLE: 'AUTH.RECOVERY_SUBTITLE',
+    VERIFY_USERNAME: 'AUTH.VERIFY_USERNAME',
+    CHOOSE_METHOD: 'AUTH.CHOOSE_METHOD',
+    VERIFY_IDENTITY: 'AUTH.VERIFY_IDENTITY',
+    NEW_PASSWORD: 'AUTH.NEW_PASSWORD',
+    CHOOSE_RECOVERY_METHOD: 'AUTH.CHOOSE_RECOVERY_METHOD',
+    RECOVERY_WITH_QUESTIONS: 'AUTH.RECOVERY_WITH_QUESTIONS',
+    RECOVERY_QUESTIONS_DESC: 'AUTH.RECOVERY_QUESTIONS_DESC',
+    RECOVERY_WITH_CODE: 'AUTH.RECOVERY_WITH_CODE',
+    RECOVERY_CODE_DESC: 'AUTH.RECOVERY_CODE_DESC',
+    VERIFYING: 'AUTH.VERIFYING',
+    CONTINUE: 'AUTH.CONTINUE',
+    BACK_TO_LOGIN: 'AUTH.BACK_TO_LOGIN',
+    BACK: 'AUTH.BACK',
+    USERNAME: 'AUTH.USERNAME',
+    USERNAME_REQUIRED: 'AUTH.USERNAME_REQUIRED',
+    USERNAME_MIN_LENGTH: 'AUTH.USERNAME_MIN_LENGTH',
+    USERNAME_FORMAT_HINT: 'AUTH.USERNAME_FORMAT_HINT',
+    USERNAME_TAKEN: 'AUTH.USERNAME_TAKEN',
+    DISPLAY_NAME_OPTIONAL: 'AUTH.DISPLAY_NAME_OPTIONAL',
+    PRIVACY_FIRST_SIGNUP: 'AUTH.PRIVACY_FIRST_SIGNUP',
+    ACCOUNT: 'AUTH.ACCOUNT',
+    PASSWORD: 'AUTH.PASSWORD',
+    RECOVERY: 'AUTH.RECOVERY',
+    BACKUP_CODES: 'AUTH.BACKUP_CODES',
+    CREATE_SECURE_PASSWORD: 'AUTH.CREATE_SECURE_PASSWORD',
+    PASSWORD_MIN_8_CHARS: 'AUTH.PASSWORD_MIN_8_CHARS',
+    PASSWORD_MIN_LENGTH: 'AUTH.PASSWORD_MIN_LENGTH',
+    SETUP_RECOVERY_OPTIONS: 'AUTH.SETUP_RECOVERY_OPTIONS',
+    RECOVERY_HELP_TEXT: 'AUTH.RECOVERY_HELP_TEXT',
+    SECURITY_QUESTION_1: 'AUTH.SECURITY_QUESTION_1',
+    SECURITY_QUESTION_2: 'AUTH.SECURITY_QUESTION_2',
+    SELECT_QUESTION: 'AUTH.SELECT_QUESTION',
+    YOUR_ANSWER: 'AUTH.YOUR_ANSWER',
+    ENTER_ANSWER: 'AUTH.ENTER_ANSWER',
+    SAVE_BACKUP_CODES: 'AUTH.SAVE_BACKUP_CODES',
+    BACKUP_CODES_HELP_TEXT: 'AUTH.BACKUP_CODES_HELP_TEXT',
+    COPY_CODE: 'AUTH.COPY_CODE',
+    DOWNLOAD_CODES: 'AUTH.DOWNLOAD_CODES',
+    CODES_SHOWN_ONCE: 'AUTH.CODES_SHOWN_ONCE',
+    CONFIRM_ONE_CODE: 'AUTH.CONFIRM_ONE_CODE',
+    ENTER_ONE_CODE_FROM_LIST: 'AUTH.ENTER_ONE_CODE_FROM_LIST',
+    INVALID_BACKUP_CODE: 'AUTH.INVALID_BACKUP_CODE',
+    CREATING_ACCOUNT: 'AUTH.CREATING_ACCOUNT',
+    COMPLETE_REGISTRATION: 'AUTH.COMPLETE_REGISTRATION',
+    ACCOUNT_CREATED: 'AUTH.ACCOUNT_CREATED',
+    REDIRECTING_TO_DASHBOARD: 'AUTH.REDIRECTING_TO_DASHBOARD',
+    PRIVACY_FIRST: 'AUTH.PRIVACY_FIRST',
+    NO_EMAIL_COLLECTION: 'AUTH.NO_EMAIL_COLLECTION',
+    FEATURE_USERNAME_AUTH: 'AUTH.FEATURE_USERNAME_AUTH',
+    FEATURE_SECURITY_QUESTIONS: 'AUTH.FEATURE_SECURITY_QUESTIONS',
+    FEATURE_BACKUP_CODES: 'AUTH.FEATURE_BACKUP_CODES',
+    PASSWORDS_DO_NOT_MATCH: 'AUTH.PASSWORDS_DO_NOT_MATCH',
+    QUESTIONS_MUST_BE_DIFFERENT: 'AUTH.QUESTIONS_MUST_BE_DIFFERENT',
+    ANSWER_SECURITY_QUESTIONS: 'AUTH.ANSWER_SECURITY_QUESTIONS',
+    QUESTION: 'AUTH.QUESTION',
+    VERIFY_ANSWERS: 'AUTH.VERIFY_ANSWERS',
+    ENTER_RECOVERY_CODE: 'AUTH.ENTER_RECOVERY_CODE',
+    RECOVERY_CODE: 'AUTH.RECOVERY_CODE',
+    CODE_FORMAT_HINT: 'AUTH.CODE_FORMAT_HINT',
+    VERIFY_CODE: 'AUTH.VERIFY_CODE',
+    CREATE_NEW_PASSWORD: 'AUTH.CREATE_NEW_PASSWORD',
+    PASSWORD_RESET_SUCCESS: 'AUTH.PASSWORD_RESET_SUCCESS',
+    PASSWORD_RESET_SUCCESS_MESSAGE: 'AUTH.PASSWORD_RESET_SUCCESS_MESSAGE',
+    RETURN_TO_LOGIN: 'AUTH.RETURN_TO_LOGIN',
+    SECURE_RECOVERY: 'AUTH.SECURE_RECOVERY',
+    NO_EMAIL_REQUIRED: 'AUTH.NO_EMAIL_REQUIRED',
+    FEATURE_STRONG_SECURITY: 'AUTH.FEATURE_STRONG_SECURITY',
+    RESET_PASSWORD: 'AUTH.RESET_PASSWORD',
+    RESETTING_PASSWORD: 'AUTH.RESETTING_PASSWORD',
+    RECOVERY_CODE_ALREADY_USED: 'AUTH.RECOVERY_CODE_ALREADY_USED',
+    RECOVERY_NOT_SETUP: 'AUTH.RECOVERY_NOT_SETUP',
+  },
+  BUTTONS: {
+    SAVE: 'BUTTONS.SAVE',
+    CANCEL: 'BUTTONS.CANCEL',
+    DELETE: 'BUTTONS.DELETE',
+    EDIT: 'BUTTONS.EDIT',
+    CLOSE: 'BUTTONS.CLOSE',
+    CONFIRM: 'BUTTONS.CONFIRM',
+    BACK: 'BUTTONS.BACK',
+    NEXT: 'BUTTONS.NEXT',
+    SUBMIT: 'BUTTONS.SUBMIT',
+    SEARCH: 'BUTTONS.SEARCH',
+    FILTER: 'BUTTONS.FILTER',
+    EXPORT: 'BUTTONS.EXPORT',
+    IMPORT: 'BUTTONS.IMPORT',
+    DOWNLOAD: 'BUTTONS.DOWNLOAD',
+    UPLOAD: 'BUTTONS.UPLOAD',
+    ADD: 'BUTTONS.ADD',
+    REMOVE: 'BUTTONS.REMOVE',
+  },
+  COMMON: {
+    LOADING: 'COMMON.LOADING',
+    SAVING: 'COMMON.SAVING',
+    SAVE: 'COMMON.SAVE',
+    ERROR: 'COMMON.ERROR',
+    SUCCESS: 'COMMON.SUCCESS',
+    WARNING: 'COMMON.WARNING',
+    INFO: 'COMMON.INFO',
+    OPTIONAL: 'COMMON.OPTIONAL',
+    CANCEL: 'COMMON.CANCEL',
+    BACK: 'COMMON.BACK',
+    DELETE: 'COMMON.DELETE',
+    EDIT: 'COMMON.EDIT',
+    CLOSE: 'COMMON.CLOSE',
+    CONFIRM: 'COMMON.CONFIRM',
+    NEXT: 'COMMON.NEXT',
+    PREVIOUS: 'COMMON.PREVIOUS',
+    SUBMIT: 'COMMON.SUBMIT',
+    SEARCH: 'COMMON.SEARCH',
+    FILTER: 'COMMON.FILTER',
+    EXPORT: 'COMMON.EXPORT',
+    DOWNLOAD: 'COMMON.DOWNLOAD',
+    UPLOAD: 'COMMON.UPLOAD',
+    ADD: 'COMMON.ADD',
+    REMOVE: 'COMMON.REMOVE',
+    SELECT: 'COMMON.SELECT',
+    CLEAR: 'COMMON.CLEAR',
+    RESET: 'COMMON.RESET',
+    APPLY: 'COMMON.APPLY',
+    YES: 'COMMON.YES',
+    NO: 'COMMON.NO',
+    OK: 'COMMON.OK',
+    RETRY: 'COMMON.RETRY',
+    ALL: 'COMMON.ALL',
+    CREATING: 'COMMON.CREATING',
+    NOTES: 'COMMON.NOTES',
+    COPY: 'COMMON.COPY',
+    COPIED: 'COMMON.COPIED',
+  },
+  DASHBOARD: {
+    WELCOME: 'DASHBOARD.WELCOME',
+    DASHBOARD: 'DASHBOARD.DASHBOARD',
+    YOUR_PROFILE: 'DASHBOARD.YOUR_PROFILE',
+    YOUR_PROJECTS: 'DASHBOARD.YOUR_PROJECTS',
+    EDIT_PROFILE: 'DASHBOARD.EDIT_PROFILE',
+    VIEW_QR_CODE: 'DASHBOARD.VIEW_QR_CODE',
+    YOUR_WORKSPACES: 'DASHBOARD.YOUR_WORKSPACES',
+    CURRENT_WORKSPACE: 'DASHBOARD.CURRENT_WORKSPACE',
+    NO_WORKSPACES: 'DASHBOARD.NO_WORKSPACES',
+    NO_PROJECTS: 'DASHBOARD.NO_PROJECTS',
+    CREATE_FIRST_PROJECT: 'DASHBOARD.CREATE_FIRST_PROJECT',
+    CREATE_FIRST_WORKSPACE: 'DASHBOARD.CREATE_FIRST_WORKSPACE',
+    EMAIL: 'DASHBOARD.EMAIL',
+    LOGOUT: 'DASHBOARD.LOGOUT',
+    NICKNAME: 'DASHBOARD.NICKNAME',
+    USER_NUMBER: 'DASHBOARD.USER_NUMBER',
+    PRIMARY_ROLE: 'DASHBOARD.PRIMARY_ROLE',
+    BIO: 'DASHBOARD.BIO',
+    SPOTIFY: 'DASHBOARD.SPOTIFY',
+    QUICK_ACTIONS: 'DASHBOARD.QUICK_ACTIONS',
+    COMPLETION: 'DASHBOARD.COMPLETION',
+    UPDATE_WORK_DATA: 'DASHBOARD.UPDATE_WORK_DATA',
+    MANAGE_RIGHTS_HOLDERS: 'DASHBOARD.MANAGE_RIGHTS_HOLDERS',
+    ARCHIVE_PROJECT: 'DASHBOARD.ARCHIVE_PROJECT',
+    PROTOCOLS: 'DASHBOARD.PROTOCOLS',
+    ARCHIVE: 'DASHBOARD.ARCHIVE',
+  },
+  ERRORS: {
+    GENERIC: 'ERRORS.GENERIC',
+    NETWORK: 'ERRORS.NETWORK',
+    UNAUTHORIZED: 'ERRORS.UNAUTHORIZED',
+    NOT_FOUND: 'ERRORS.NOT_FOUND',
+    VALIDATION: 'ERRORS.VALIDATION',
+    SERVER: 'ERRORS.SERVER',
+  },
+  FOOTER: {
+    COPYRIGHT: 'FOOTER.COPYRIGHT',
+    PRIVACY: 'FOOTER.PRIVACY',
+    TERMS: 'FOOTER.TERMS',
+    CONTACT: 'FOOTER.CONTACT',
+  },
+  GDPR: {
+    COOKIES_TITLE: 'GDPR.COOKIES_TITLE',
+    COOKIES_DESCRIPTION: 'GDPR.COOKIES_DESCRIPTION',
+    COOKIES_DETAILS: 'GDPR.COOKIES_DETAILS',
+    CUSTOMIZE: 'GDPR.CUSTOMIZE',
+    ACCEPT_ALL: 'GDPR.ACCEPT_ALL',
+    ACCEPT_SELECTED: 'GDPR.ACCEPT_SELECTED',
+    REJECT_ALL: 'GDPR.REJECT_ALL',
+    COOKIE_PREFERENCES: 'GDPR.COOKIE_PREFERENCES',
+    ESSENTIAL: 'GDPR.ESSENTIAL',
+    ESSENTIAL_DESC: 'GDPR.ESSENTIAL_DESC',
+    ANALYTICS: 'GDPR.ANALYTICS',
+    ANALYTICS_DESC: 'GDPR.ANALYTICS_DESC',
+    MARKETING: 'GDPR.MARKETING',
+    MARKETING_DESC: 'GDPR.MARKETING_DESC',
+    THIRD_PARTY: 'GDPR.THIRD_PARTY',
+    THIRD_PARTY_DESC: 'GDPR.THIRD_PARTY_DESC',
+    DATA_EXPORT: 'GDPR.DATA_EXPORT',
+    DATA_EXPORT_TITLE: 'GDPR.DATA_EXPORT_TITLE',
+    DATA_EXPORT_DESC: 'GDPR.DATA_EXPORT_DESC',
+    DATA_EXPORT_DESCRIPTION: 'GDPR.DATA_EXPORT_DESCRIPTION',
+    DATA_EXPORT_DOWNLOAD: 'GDPR.DATA_EXPORT_DOWNLOAD',
+    DATA_EXPORT_GENERATING: 'GDPR.DATA_EXPORT_GENERATING',
+    DATA_EXPORT_SUCCESS: 'GDPR.DATA_EXPORT_SUCCESS',
+    DATA_EXPORT_FAILED: 'GDPR.DATA_EXPORT_FAILED',
+    DATA_EXPORT_FOOTER: 'GDPR.DATA_EXPORT_FOOTER',
+    DELETE_ACCOUNT_TITLE: 'GDPR.DELETE_ACCOUNT_TITLE',
+    DELETE_ACCOUNT_WARNING_TITLE: 'GDPR.DELETE_ACCOUNT_WARNING_TITLE',
+    DELETE_ACCOUNT_WARNING_TEXT: 'GDPR.DELETE_ACCOUNT_WARNING_TEXT',
+    DELETE_ACCOUNT_WHAT_DELETED: 'GDPR.DELETE_ACCOUNT_WHAT_DELETED',
+    DELETE_ACCOUNT_ITEM_PROFILE: 'GDPR.DELETE_ACCOUNT_ITEM_PROFILE',
+    DELETE_ACCOUNT_ITEM_WORKSPACES: 'GDPR.DELETE_ACCOUNT_ITEM_WORKSPACES',
+    DELETE_ACCOUNT_ITEM_WORKS: 'GDPR.DELETE_ACCOUNT_ITEM_WORKS',
+    DELETE_ACCOUNT_ITEM_RIGHTS: 'GDPR.DELETE_ACCOUNT_ITEM_RIGHTS',
+    DELETE_ACCOUNT_ITEM_SPLITS: 'GDPR.DELETE_ACCOUNT_ITEM_SPLITS',
+    DELETE_ACCOUNT_ITEM_PROTOCOLS: 'GDPR.DELETE_ACCOUNT_ITEM_PROTOCOLS',
+    DELETE_ACCOUNT_ITEM_CONSENTS: 'GDPR.DELETE_ACCOUNT_ITEM_CONSENTS',
+    DELETE_ACCOUNT_IMPORTANT: 'GDPR.DELETE_ACCOUNT_IMPORTANT',
+    DELETE_ACCOUNT_NOTE_IRREVERSIBLE: 'GDPR.DELETE_ACCOUNT_NOTE_IRREVERSIBLE',
+    DELETE_ACCOUNT_NOTE_COLLABORATORS: 'GDPR.DELETE_ACCOUNT_NOTE_COLLABORATORS',
+    DELETE_ACCOUNT_NOTE_EXPORT: 'GDPR.DELETE_ACCOUNT_NOTE_EXPORT',
+    DELETE_ACCOUNT_EXPORT_PROMPT: 'GDPR.DELETE_ACCOUNT_EXPORT_PROMPT',
+    DELETE_ACCOUNT_BUTTON: 'GDPR.DELETE_ACCOUNT_BUTTON',
+    DELETE_ACCOUNT_CONFIRM_TITLE: 'GDPR.DELETE_ACCOUNT_CONFIRM_TITLE',
+    DELETE_ACCOUNT_CONFIRM_TEXT: 'GDPR.DELETE_ACCOUNT_CONFIRM_TEXT',
+    DELETE_ACCOUNT_CONFIRM_PASSWORD_LABEL: 'GDPR.DELETE_ACCOUNT_CONFIRM_PASSWORD_LABEL',
+    DELETE_ACCOUNT_CONFIRM_PASSWORD_PLACEHOLDER: 'GDPR.DELETE_ACCOUNT_CONFIRM_PASSWORD_PLACEHOLDER',
+    DELETE_ACCOUNT_CONFIRM_TYPE_LABEL: 'GDPR.DELETE_ACCOUNT_CONFIRM_TYPE_LABEL',
+    DELETE_ACCOUNT_CONFIRM_TYPE_HINT: 'GDPR.DELETE_ACCOUNT_CONFIRM_TYPE_HINT',
+    DELETE_ACCOUNT_CONFIRM_BUTTON: 'GDPR.DELETE_ACCOUNT_CONFIRM_BUTTON',
+    DELETE_ACCOUNT_DELETING: 'GDPR.DELETE_ACCOUNT_DELETING',
+    DELETE_ACCOUNT_ERROR_PASSWORD: 'GDPR.DELETE_ACCOUNT_ERROR_PASSWORD',
+    DELETE_ACCOUNT_ERROR_GENERIC: 'GDPR.DELETE_ACCOUNT_ERROR_GENERIC',
+    PRIVACY_POLICY: 'GDPR.PRIVACY_POLICY',
+    TERMS_OF_SERVICE: 'GDPR.TERMS_OF_SERVICE',
+  },
+  LANDING: {
+    HERO: {
+      TAGLINE: 'LANDING.HERO.TAGLINE',
+      TITLE: 'LANDING.HERO.TITLE',
+      DESCRIPTION: 'LANDING.HERO.DESCRIPTION',
+      BENEFITS: {
+        ONE: 'LANDING.HERO.BENEFITS.ONE',
+        TWO: 'LANDING.HERO.BENEFITS.TWO',
+        THREE: 'LANDING.HERO.BENEFITS.THREE',
+      },
+    },
+    ALREADY_INVITED: {
+      LABEL: 'LANDING.ALREADY_INVITED.LABEL',
+      CTA: 'LANDING.ALREADY_INVITED.CTA',
+    },
+    INVITE: {
+      TOGGLE: 'LANDING.INVITE.TOGGLE',
+      LABEL: 'LANDING.INVITE.LABEL',
+      PLACEHOLDER: 'LANDING.INVITE.PLACEHOLDER',
+      CONTINUE: 'LANDING.INVITE.CONTINUE',
+      HELP: 'LANDING.INVITE.HELP',
+    },
+    FORM: {
+      TITLE: 'LANDING.FORM.TITLE',
+      SUBTITLE: 'LANDING.FORM.SUBTITLE',
+      CONTACT_LABEL: 'LANDING.FORM.CONTACT_LABEL',
+      CONTACT_OPTIONS: {
+        INSTAGRAM: 'LANDING.FORM.CONTACT_OPTIONS.INSTAGRAM',
+        TELEGRAM: 'LANDING.FORM.CONTACT_OPTIONS.TELEGRAM',
+      },
+      CONTACT_HANDLE_LABEL: 'LANDING.FORM.CONTACT_HANDLE_LABEL',
+      CONTACT_HANDLE_PLACEHOLDER: 'LANDING.FORM.CONTACT_HANDLE_PLACEHOLDER',
+      COUNTRY_LABEL: 'LANDING.FORM.COUNTRY_LABEL',
+      COUNTRY_PLACEHOLDER: 'LANDING.FORM.COUNTRY_PLACEHOLDER',
+      CITY_LABEL: 'LANDING.FORM.CITY_LABEL',
+      CITY_PLACEHOLDER: 'LANDING.FORM.CITY_PLACEHOLDER',
+      ROLE_LABEL: 'LANDING.FORM.ROLE_LABEL',
+      ROLE_PLACEHOLDER: 'LANDING.FORM.ROLE_PLACEHOLDER',
+      ROLE_DESCRIPTION_LABEL: 'LANDING.FORM.ROLE_DESCRIPTION_LABEL',
+      ROLE_DESCRIPTION_PLACEHOLDER: 'LANDING.FORM.ROLE_DESCRIPTION_PLACEHOLDER',
+      SUBMIT: 'LANDING.FORM.SUBMIT',
+      SUBMITTING: 'LANDING.FORM.SUBMITTING',
+      ERRORS: {
+        CONTACT_REQUIRED: 'LANDING.FORM.ERRORS.CONTACT_REQUIRED',
+        CONTACT_HANDLE_REQUIRED: 'LANDING.FORM.ERRORS.CONTACT_HANDLE_REQUIRED',
+        CONTACT_HANDLE_SHORT: 'LANDING.FORM.ERRORS.CONTACT_HANDLE_SHORT',
+        COUNTRY_REQUIRED: 'LANDING.FORM.ERRORS.COUNTRY_REQUIRED',
+        ROLE_REQUIRED: 'LANDING.FORM.ERRORS.ROLE_REQUIRED',
+        ROLE_DESCRIPTION_REQUIRED: 'LANDING.FORM.ERRORS.ROLE_DESCRIPTION_REQUIRED',
+        ROLE_DESCRIPTION_SHORT: 'LANDING.FORM.ERRORS.ROLE_DESCRIPTION_SHORT',
+      },
+      ROLES: {
+        ARTIST: 'LANDING.FORM.ROLES.ARTIST',
+        PRODUCER: 'LANDING.FORM.ROLES.PRODUCER',
+        SONGWRITER: 'LANDING.FORM.ROLES.SONGWRITER',
+        MANAGER: 'LANDING.FORM.ROLES.MANAGER',
+        LABEL: 'LANDING.FORM.ROLES.LABEL',
+        PUBLISHER: 'LANDING.FORM.ROLES.PUBLISHER',
+        LAWYER: 'LANDING.FORM.ROLES.LAWYER',
+        COLLECTIVE: 'LANDING.FORM.ROLES.COLLECTIVE',
+        OTHER: 'LANDING.FORM.ROLES.OTHER',
+      },
+    },
+    MESSAGES: {
+      SUCCESS: 'LANDING.MESSAGES.SUCCESS',
+      DUPLICATE: 'LANDING.MESSAGES.DUPLICATE',
+      ERROR: 'LANDING.MESSAGES.ERROR',
+    },
+    STATS: {
+      EYEBROW: 'LANDING.STATS.EYEBROW',
+      TITLE: 'LANDING.STATS.TITLE',
+      DESCRIPTION: 'LANDING.STATS.DESCRIPTION',
+      LOADING: 'LANDING.STATS.LOADING',
+      ERROR: 'LANDING.STATS.ERROR',
+      HIGHLIGHT_LABEL: 'LANDING.STATS.HIGHLIGHT_LABEL',
+      HIGHLIGHT_CAPTION: 'LANDING.STATS.HIGHLIGHT_CAPTION',
+      LABELS: {
+        WAITLIST: 'LANDING.STATS.LABELS.WAITLIST',
+        USERS: 'LANDING.STATS.LABELS.USERS',
+        RIGHTS_HOLDERS: 'LANDING.STATS.LABELS.RIGHTS_HOLDERS',
+        WORKS: 'LANDING.STATS.LABELS.WORKS',
+      },
+      CAPTIONS: {
+        WAITLIST: 'LANDING.STATS.CAPTIONS.WAITLIST',
+        USERS: 'LANDING.STATS.CAPTIONS.USERS',
+        RIGHTS_HOLDERS: 'LANDING.STATS.CAPTIONS.RIGHTS_HOLDERS',
+        WORKS: 'LANDING.STATS.CAPTIONS.WORKS',
+      },
+    },
+    PAIN_POINTS: {
+      TITLE: 'LANDING.PAIN_POINTS.TITLE',
+      AI_DISCLOSURE: {
+        TITLE: 'LANDING.PAIN_POINTS.AI_DISCLOSURE.TITLE',
+        BODY: 'LANDING.PAIN_POINTS.AI_DISCLOSURE.BODY',
+      },
+      PRIVACY: {
+        TITLE: 'LANDING.PAIN_POINTS.PRIVACY.TITLE',
+        BODY: 'LANDING.PAIN_POINTS.PRIVACY.BODY',
+      },
+      COMPLEXITY: {
+        TITLE: 'LANDING.PAIN_POINTS.COMPLEXITY.TITLE',
+        BODY: 'LANDING.PAIN_POINTS.COMPLEXITY.BODY',
+      },
+    },
+    DIFFERENTIATORS: {
+      TITLE: 'LANDING.DIFFERENTIATORS.TITLE',
+      INTRO: 'LANDING.DIFFERENTIATORS.INTRO',
+      RIGHTNOTE: 'LANDING.DIFFERENTIATORS.RIGHTNOTE',
+      OTHERS: 'LANDING.DIFFERENTIATORS.OTHERS',
+      FEATURES: {
+        AI_LOGGING: 'LANDING.DIFFERENTIATORS.FEATURES.AI_LOGGING',
+        AI_LOGGING_YES: 'LANDING.DIFFERENTIATORS.FEATURES.AI_LOGGING_YES',
+        AI_LOGGING_NO: 'LANDING.DIFFERENTIATORS.FEATURES.AI_LOGGING_NO',
+        RIGHTS_AUDIT: 'LANDING.DIFFERENTIATORS.FEATURES.RIGHTS_AUDIT',
+        RIGHTS_AUDIT_YES: 'LANDING.DIFFERENTIATORS.FEATURES.RIGHTS_AUDIT_YES',
+        RIGHTS_AUDIT_NO: 'LANDING.DIFFERENTIATORS.FEATURES.RIGHTS_AUDIT_NO',
+        EXPORT_PROTOCOLS: 'LANDING.DIFFERENTIATORS.FEATURES.EXPORT_PROTOCOLS',
+        EXPORT_PROTOCOLS_YES: 'LANDING.DIFFERENTIATORS.FEATURES.EXPORT_PROTOCOLS_YES',
+        EXPORT_PROTOCOLS_NO: 'LANDING.DIFFERENTIATORS.FEATURES.EXPORT_PROTOCOLS_NO',
+        GDPR: 'LANDING.DIFFERENTIATORS.FEATURES.GDPR',
+        GDPR_YES: 'LANDING.DIFFERENTIATORS.FEATURES.GDPR_YES',
+        GDPR_NO: 'LANDING.DIFFERENTIATORS.FEATURES.GDPR_NO',
+      },
+    },
+    HOW_IT_WORKS: {
+      TITLE: 'LANDING.HOW_IT_WORKS.TITLE',
+      STEP_ONE_TITLE: 'LANDING.HOW_IT_WORKS.STEP_ONE_TITLE',
+      STEP_ONE_BODY: 'LANDING.HOW_IT_WORKS.STEP_ONE_BODY',
+      STEP_TWO_TITLE: 'LANDING.HOW_IT_WORKS.STEP_TWO_TITLE',
+      STEP_TWO_BODY: 'LANDING.HOW_IT_WORKS.STEP_TWO_BODY',
+      STEP_THREE_TITLE: 'LANDING.HOW_IT_WORKS.STEP_THREE_TITLE',
+      STEP_THREE_BODY: 'LANDING.HOW_IT_WORKS.STEP_THREE_BODY',
+    },
+    JOURNEY: {
+      HEADING: 'LANDING.JOURNEY.HEADING',
+      SUBTITLE: 'LANDING.JOURNEY.SUBTITLE',
+    },
+    FOOTER: {
+      TAGLINE: 'LANDING.FOOTER.TAGLINE',
+      PRIVACY: 'LANDING.FOOTER.PRIVACY',
+      TERMS: 'LANDING.FOOTER.TERMS',
+      LOGIN: 'LANDING.FOOTER.LOGIN',
+    },
+  },
+  LANGUAGES: {
+    EN: 'LANGUAGES.EN',
+    DE: 'LANGUAGES.DE',
+    ES: 'LANGUAGES.ES',
+    UA: 'LANGUAGES.UA',
+    FR: 'LANGUAGES.FR',
+    IT: 'LANGUAGES.IT',
+    PT: 'LANGUAGES.PT',
+  },
+  NAV: {
+    BRAND: 'NAV.BRAND',
+    DASHBOARD: 'NAV.DASHBOARD',
+    WORKS: 'NAV.WORKS',
+    PROTOCOLS: 'NAV.PROTOCOLS',
+    RIGHTS_HOLDERS: 'NAV.RIGHTS_HOLDERS',
+    PROFILE: 'NAV.PROFILE',
+    ADMIN_DASHBOARD: 'NAV.ADMIN_DASHBOARD',
+    CURRENT_WORKSPACE: 'NAV.CURRENT_WORKSPACE',
+    MANAGE_WORKSPACES: 'NAV.MANAGE_WORKSPACES',
+    ADD_FIRST_WORKSPACE: 'NAV.ADD_FIRST_WORKSPACE',
+  },
+  NOTIFICATIONS: {
+    PROFILE_CREATED: 'NOTIFICATIONS.PROFILE_CREATED',
+    PROFILE_UPDATED: 'NOTIFICATIONS.PROFILE_UPDATED',
+    WORKSPACE_CREATED: 'NOTIFICATIONS.WORKSPACE_CREATED',
+    WORKSPACE_UPDATED: 'NOTIFICATIONS.WORKSPACE_UPDATED',
+    WORKSPACE_DELETED: 'NOTIFICATIONS.WORKSPACE_DELETED',
+    CHANGES_SAVED: 'NOTIFICATIONS.CHANGES_SAVED',
+    COPIED_TO_CLIPBOARD: 'NOTIFICATIONS.COPIED_TO_CLIPBOARD',
+    QR_CODE_DOWNLOADED: 'NOTIFICATIONS.QR_CODE_DOWNLOADED',
+  },
+  PLACEHOLDERS: {
+    ENTER_EMAIL: 'PLACEHOLDERS.ENTER_EMAIL',
+    ENTER_PASSWORD: 'PLACEHOLDERS.ENTER_PASSWORD',
+    ENTER_NAME: 'PLACEHOLDERS.ENTER_NAME',
+    ENTER_NICKNAME: 'PLACEHOLDERS.ENTER_NICKNAME',
+    SEARCH: 'PLACEHOLDERS.SEARCH',
+    SELECT: 'PLACEHOLDERS.SELECT',
+    OPTIONAL: 'PLACEHOLDERS.OPTIONAL',
+  },
+  PRIVACY: {
+    TITLE: 'PRIVACY.TITLE',
+    LAST_UPDATED: 'PRIVACY.LAST_UPDATED',
+    INTRO_TITLE: 'PRIVACY.INTRO_TITLE',
+    INTRO_TEXT: 'PRIVACY.INTRO_TEXT',
+    PASSION_PROJECT: 'PRIVACY.PASSION_PROJECT',
+    PASSION_1: 'PRIVACY.PASSION_1',
+    PASSION_2: 'PRIVACY.PASSION_2',
+    PASSION_3: 'PRIVACY.PASSION_3',
+    PASSION_4: 'PRIVACY.PASSION_4',
+    PASSION_5: 'PRIVACY.PASSION_5',
+    NO_LIABILITY: 'PRIVACY.NO_LIABILITY',
+    NO_LIABILITY_TEXT: 'PRIVACY.NO_LIABILITY_TEXT',
+    ACKNOWLEDGMENT: 'PRIVACY.ACKNOWLEDGMENT',
+    GDPR_COMPLIANCE: 'PRIVACY.GDPR_COMPLIANCE',
+    INVITE_TITLE: 'PRIVACY.INVITE_TITLE',
+    NOT_PUBLIC: 'PRIVACY.NOT_PUBLIC',
+    INVITE_ACCESS: 'PRIVACY.INVITE_ACCESS',
+    INVITE_1: 'PRIVACY.INVITE_1',
+    INVITE_2: 'PRIVACY.INVITE_2',
+    INVITE_3: 'PRIVACY.INVITE_3',
+    WE_RESERVE: 'PRIVACY.WE_RESERVE',
+    RESERVE_1: 'PRIVACY.RESERVE_1',
+    RESERVE_2: 'PRIVACY.RESERVE_2',
+    RESERVE_3: 'PRIVACY.RESERVE_3',
+    YOU_ACKNOWLEDGE: 'PRIVACY.YOU_ACKNOWLEDGE',
+    ACKNOWLEDGE_1: 'PRIVACY.ACKNOWLEDGE_1',
+    ACKNOWLEDGE_2: 'PRIVACY.ACKNOWLEDGE_2',
+    ACKNOWLEDGE_3: 'PRIVACY.ACKNOWLEDGE_3',
+    ACKNOWLEDGE_4: 'PRIVACY.ACKNOWLEDGE_4',
+    CONTROLLER_TITLE: 'PRIVACY.CONTROLLER_TITLE',
+    CONTROLLER_TEXT: 'PRIVACY.CONTROLLER_TEXT',
+    CONTACT_TITLE: 'PRIVACY.CONTACT_TITLE',
+    CONTACT_TEXT: 'PRIVACY.CONTACT_TEXT',
+    GDPR_REQUESTS: 'PRIVACY.GDPR_REQUESTS',
+    GDPR_REQUESTS_TEXT: 'PRIVACY.GDPR_REQUESTS_TEXT',
+    DPA_TITLE: 'PRIVACY.DPA_TITLE',
+    DPA_TEXT: 'PRIVACY.DPA_TEXT',
+    COLLECTION_TITLE: 'PRIVACY.COLLECTION_TITLE',
+    VOLUNTARY_TITLE: 'PRIVACY.VOLUNTARY_TITLE',
+    VOLUNTARY_TEXT: 'PRIVACY.VOLUNTARY_TEXT',
+    ACCOUNT_INFO: 'PRIVACY.ACCOUNT_INFO',
+    ACCOUNT_INFO_TEXT: 'PRIVACY.ACCOUNT_INFO_TEXT',
+    PROFILE_INFO: 'PRIVACY.PROFILE_INFO',
+    PROFILE_INFO_TEXT: 'PRIVACY.PROFILE_INFO_TEXT',
+    WORK_INFO: 'PRIVACY.WORK_INFO',
+    WORK_INFO_TEXT: 'PRIVACY.WORK_INFO_TEXT',
+    RIGHTS_INFO: 'PRIVACY.RIGHTS_INFO',
+    RIGHTS_INFO_TEXT: 'PRIVACY.RIGHTS_INFO_TEXT',
+    SPLIT_INFO: 'PRIVACY.SPLIT_INFO',
+    SPLIT_INFO_TEXT: 'PRIVACY.SPLIT_INFO_TEXT',
+    IMPORTANT: 'PRIVACY.IMPORTANT',
+    USER_RESPONSIBILITY: 'PRIVACY.USER_RESPONSIBILITY',
+    NO_VERIFY: 'PRIVACY.NO_VERIFY',
+    AUTO_TITLE: 'PRIVACY.AUTO_TITLE',
+    AUTO_TEXT: 'PRIVACY.AUTO_TEXT',
+    AUTO_1: 'PRIVACY.AUTO_1',
+    AUTO_2: 'PRIVACY.AUTO_2',
+    AUTO_3: 'PRIVACY.AUTO_3',
+    AUTO_4: 'PRIVACY.AUTO_4',
+    AUTO_5: 'PRIVACY.AUTO_5',
+    AUTO_PURPOSE: 'PRIVACY.AUTO_PURPOSE',
+    MUSIC_TITLE: 'PRIVACY.MUSIC_TITLE',
+    MUSIC_TEXT: 'PRIVACY.MUSIC_TEXT',
+    NICKNAME_LABEL: 'PRIVACY.NICKNAME_LABEL',
+    NICKNAME_TEXT: 'PRIVACY.NICKNAME_TEXT',
+    IPI_LABEL: 'PRIVACY.IPI_LABEL',
+    IPI_TEXT: 'PRIVACY.IPI_TEXT',
+    ISNI_LABEL: 'PRIVACY.ISNI_LABEL',
+    ISNI_TEXT: 'PRIVACY.ISNI_TEXT',
+    CMO_LABEL: 'PRIVACY.CMO_LABEL',
+    CMO_TEXT: 'PRIVACY.CMO_TEXT',
+    AI_LABEL: 'PRIVACY.AI_LABEL',
+    AI_TEXT: 'PRIVACY.AI_TEXT',
+    NICKNAME_SYSTEM: 'PRIVACY.NICKNAME_SYSTEM',
+    NICKNAME_1: 'PRIVACY.NICKNAME_1',
+    NICKNAME_2: 'PRIVACY.NICKNAME_2',
+    NICKNAME_3: 'PRIVACY.NICKNAME_3',
+    AI_DISCLOSURES: 'PRIVACY.AI_DISCLOSURES',
+    AI_DISC_1: 'PRIVACY.AI_DISC_1',
+    AI_DISC_2: 'PRIVACY.AI_DISC_2',
+    AI_DISC_3: 'PRIVACY.AI_DISC_3',
+    DISCLAIMER: 'PRIVACY.DISCLAIMER',
+    DISCLAIMER_TEXT: 'PRIVACY.DISCLAIMER_TEXT',
+    LEGAL_BASIS_TITLE: 'PRIVACY.LEGAL_BASIS_TITLE',
+    LEGAL_BASIS_TEXT: 'PRIVACY.LEGAL_BASIS_TEXT',
+    BASIS_CONTRACT: 'PRIVACY.BASIS_CONTRACT',
+    BASIS_CONTRACT_TEXT: 'PRIVACY.BASIS_CONTRACT_TEXT',
+    BASIS_INTEREST: 'PRIVACY.BASIS_INTEREST',
+    BASIS_INTEREST_TEXT: 'PRIVACY.BASIS_INTEREST_TEXT',
+    BASIS_LEGAL: 'PRIVACY.BASIS_LEGAL',
+    BASIS_LEGAL_TEXT: 'PRIVACY.BASIS_LEGAL_TEXT',
+    BASIS_CONSENT: 'PRIVACY.BASIS_CONSENT',
+    BASIS_CONSENT_TEXT: 'PRIVACY.BASIS_CONSENT_TEXT',
+    USAGE_TITLE: 'PRIVACY.USAGE_TITLE',
+    USAGE_TEXT: 'PRIVACY.USAGE_TEXT',
+    USAGE_1: 'PRIVACY.USAGE_1',
+    USAGE_2: 'PRIVACY.USAGE_2',
+    USAGE_3: 'PRIVACY.USAGE_3',
+    USAGE_4: 'PRIVACY.USAGE_4',
+    USAGE_5: 'PRIVACY.USAGE_5',
+    USAGE_6: 'PRIVACY.USAGE_6',
+    USAGE_7: 'PRIVACY.USAGE_7',
+    NO_ADS: 'PRIVACY.NO_ADS',
+    NO_GUARANTEES: 'PRIVACY.NO_GUARANTEES',
+    NO_GUARANTEES_TEXT: 'PRIVACY.NO_GUARANTEES_TEXT',
+    SHARING_TITLE: 'PRIVACY.SHARING_TITLE',
+    PROVIDERS_TITLE: 'PRIVACY.PROVIDERS_TITLE',
+    PROVIDERS_TEXT: 'PRIVACY.PROVIDERS_TEXT',
+    SUPABASE_DESC: 'PRIVACY.SUPABASE_DESC',
+    SUPABASE_1: 'PRIVACY.SUPABASE_1',
+    SUPABASE_2: 'PRIVACY.SUPABASE_2',
+    SUPABASE_3: 'PRIVACY.SUPABASE_3',
+    SUPABASE_4: 'PRIVACY.SUPABASE_4',
+    SUPABASE_5: 'PRIVACY.SUPABASE_5',
+    AUTH_STORAGE: 'PRIVACY.AUTH_STORAGE',
+    AUTH_STORAGE_TEXT: 'PRIVACY.AUTH_STORAGE_TEXT',
+    NETLIFY_DESC: 'PRIVACY.NETLIFY_DESC',
+    NETLIFY_1: 'PRIVACY.NETLIFY_1',
+    NETLIFY_2: 'PRIVACY.NETLIFY_2',
+    NETLIFY_3: 'PRIVACY.NETLIFY_3',
+    PROVIDERS_DISCLAIMER: 'PRIVACY.PROVIDERS_DISCLAIMER',
+    COLLAB_TITLE: 'PRIVACY.COLLAB_TITLE',
+    COLLAB_TEXT: 'PRIVACY.COLLAB_TEXT',
+    COLLAB_1: 'PRIVACY.COLLAB_1',
+    COLLAB_2: 'PRIVACY.COLLAB_2',
+    COLLAB_3: 'PRIVACY.COLLAB_3',
+    LEGAL_REQ_TITLE: 'PRIVACY.LEGAL_REQ_TITLE',
+    LEGAL_REQ_TEXT: 'PRIVACY.LEGAL_REQ_TEXT',
+    LEGAL_1: 'PRIVACY.LEGAL_1',
+    LEGAL_2: 'PRIVACY.LEGAL_2',
+    LEGAL_3: 'PRIVACY.LEGAL_3',
+    LEGAL_LIMITATION: 'PRIVACY.LEGAL_LIMITATION',
+    TRANSFER_TITLE: 'PRIVACY.TRANSFER_TITLE',
+    TRANSFER_TEXT: 'PRIVACY.TRANSFER_TEXT',
+    COOKIES_TITLE: 'PRIVACY.COOKIES_TITLE',
+    COOKIES_SUB: 'PRIVACY.COOKIES_SUB',
+    COOKIES_TEXT: 'PRIVACY.COOKIES_TEXT',
+    COOKIES_AUTH: 'PRIVACY.COOKIES_AUTH',
+    STORAGE_TITLE: 'PRIVACY.STORAGE_TITLE',
+    STORAGE_TEXT: 'PRIVACY.STORAGE_TEXT',
+    STORAGE_1: 'PRIVACY.STORAGE_1',
+    STORAGE_2: 'PRIVACY.STORAGE_2',
+    STORAGE_LOCAL: 'PRIVACY.STORAGE_LOCAL',
+    NO_TRACK_TITLE: 'PRIVACY.NO_TRACK_TITLE',
+    NO_TRACK_TEXT: 'PRIVACY.NO_TRACK_TEXT',
+    FUTURE_CHANGE: 'PRIVACY.FUTURE_CHANGE',
+    QR_TITLE: 'PRIVACY.QR_TITLE',
+    QR_TEXT: 'PRIVACY.QR_TEXT',
+    QR_1_LABEL: 'PRIVACY.QR_1_LABEL',
+    QR_1: 'PRIVACY.QR_1',
+    QR_2_LABEL: 'PRIVACY.QR_2_LABEL',
+    QR_2: 'PRIVACY.QR_2',
+    QR_3_LABEL: 'PRIVACY.QR_3_LABEL',
+    QR_3: 'PRIVACY.QR_3',
+    QR_4_LABEL: 'PRIVACY.QR_4_LABEL',
+    QR_4: 'PRIVACY.QR_4',
+    RETENTION_TITLE: 'PRIVACY.RETENTION_TITLE',
+    RETENTION_TEXT: 'PRIVACY.RETENTION_TEXT',
+    DELETION_TITLE: 'PRIVACY.DELETION_TITLE',
+    DELETION_TEXT: 'PRIVACY.DELETION_TEXT',
+    PERIODS_TITLE: 'PRIVACY.PERIODS_TITLE',
+    PERIOD_1_LABEL: 'PRIVACY.PERIOD_1_LABEL',
+    PERIOD_1: 'PRIVACY.PERIOD_1',
+    PERIOD_2_LABEL: 'PRIVACY.PERIOD_2_LABEL',
+    PERIOD_2: 'PRIVACY.PERIOD_2',
+    PERIOD_3_LABEL: 'PRIVACY.PERIOD_3_LABEL',
+    PERIOD_3: 'PRIVACY.PERIOD_3',
+    PERIOD_4_LABEL: 'PRIVACY.PERIOD_4_LABEL',
+    PERIOD_4: 'PRIVACY.PERIOD_4',
+    PERIOD_5_LABEL: 'PRIVACY.PERIOD_5_LABEL',
+    PERIOD_5: 'PRIVACY.PERIOD_5',
+    PERIOD_6_LABEL: 'PRIVACY.PERIOD_6_LABEL',
+    PERIOD_6: 'PRIVACY.PERIOD_6',
+    DISCONTINUE_TITLE: 'PRIVACY.DISCONTINUE_TITLE',
+    DISCONTINUE_TEXT: 'PRIVACY.DISCONTINUE_TEXT',
+    RIGHTS_TITLE: 'PRIVACY.RIGHTS_TITLE',
+    RIGHTS_TEXT: 'PRIVACY.RIGHTS_TEXT',
+    RIGHT_1: 'PRIVACY.RIGHT_1',
+    RIGHT_1_TEXT: 'PRIVACY.RIGHT_1_TEXT',
+    RIGHT_2: 'PRIVACY.RIGHT_2',
+    RIGHT_2_TEXT: 'PRIVACY.RIGHT_2_TEXT',
+    RIGHT_3: 'PRIVACY.RIGHT_3',
+    RIGHT_3_TEXT: 'PRIVACY.RIGHT_3_TEXT',
+    RIGHT_4: 'PRIVACY.RIGHT_4',
+    RIGHT_4_TEXT: 'PRIVACY.RIGHT_4_TEXT',
+    RIGHT_5: 'PRIVACY.RIGHT_5',
+    RIGHT_5_TEXT: 'PRIVACY.RIGHT_5_TEXT',
+    RIGHT_6: 'PRIVACY.RIGHT_6',
+    RIGHT_6_TEXT: 'PRIVACY.RIGHT_6_TEXT',
+    RIGHT_7: 'PRIVACY.RIGHT_7',
+    RIGHT_7_TEXT: 'PRIVACY.RIGHT_7_TEXT',
+    EXERCISE_TITLE: 'PRIVACY.EXERCISE_TITLE',
+    EXERCISE_LABEL: 'PRIVACY.EXERCISE_LABEL',
+    EXERCISE_1: 'PRIVACY.EXERCISE_1',
+    EXERCISE_2: 'PRIVACY.EXERCISE_2',
+    EXERCISE_3: 'PRIVACY.EXERCISE_3',
+    LIMITATIONS: 'PRIVACY.LIMITATIONS',
+    LIMITATIONS_TEXT: 'PRIVACY.LIMITATIONS_TEXT',
+    COMPLAINT: 'PRIVACY.COMPLAINT',
+    COMPLAINT_TEXT: 'PRIVACY.COMPLAINT_TEXT',
+    SECURITY_TITLE: 'PRIVACY.SECURITY_TITLE',
+    SECURITY_TEXT: 'PRIVACY.SECURITY_TEXT',
+    SECURITY_1: 'PRIVACY.SECURITY_1',
+    SECURITY_2: 'PRIVACY.SECURITY_2',
+    SECURITY_3: 'PRIVACY.SECURITY_3',
+    SECURITY_4: 'PRIVACY.SECURITY_4',
+    HOWEVER: 'PRIVACY.HOWEVER',
+    SECURITY_LIMITS: 'PRIVACY.SECURITY_LIMITS',
+    BEST_PRACTICES: 'PRIVACY.BEST_PRACTICES',
+    PRACTICE_1: 'PRIVACY.PRACTICE_1',
+    PRACTICE_2: 'PRIVACY.PRACTICE_2',
+    PRACTICE_3: 'PRIVACY.PRACTICE_3',
+    PRACTICE_4: 'PRIVACY.PRACTICE_4',
+    BREACH_TITLE: 'PRIVACY.BREACH_TITLE',
+    BREACH_TEXT: 'PRIVACY.BREACH_TEXT',
+    CHILDREN_TITLE: 'PRIVACY.CHILDREN_TITLE',
+    CHILDREN_TEXT: 'PRIVACY.CHILDREN_TEXT',
+    WARRANTY_TITLE: 'PRIVACY.WARRANTY_TITLE',
+    WARRANTY_TEXT: 'PRIVACY.WARRANTY_TEXT',
+    WARRANTY_LIST: 'PRIVACY.WARRANTY_LIST',
+    USE_RISK: 'PRIVACY.USE_RISK',
+    LIABILITY_TITLE: 'PRIVACY.LIABILITY_TITLE',
+    LIABILITY_TEXT: 'PRIVACY.LIABILITY_TEXT',
+    LIABILITY_LIST: 'PRIVACY.LIABILITY_LIST',
+    LIABILITY_ACK: 'PRIVACY.LIABILITY_ACK',
+    CHANGES_TITLE: 'PRIVACY.CHANGES_TITLE',
+    CHANGES_TEXT: 'PRIVACY.CHANGES_TEXT',
+    CONTINUED_USE: 'PRIVACY.CONTINUED_USE',
+    ACCEPTANCE_TITLE: 'PRIVACY.ACCEPTANCE_TITLE',
+    BY_USING: 'PRIVACY.BY_USING',
+    ACCEPT_1: 'PRIVACY.ACCEPT_1',
+    ACCEPT_2: 'PRIVACY.ACCEPT_2',
+    ACCEPT_3: 'PRIVACY.ACCEPT_3',
+    ACCEPT_4: 'PRIVACY.ACCEPT_4',
+    ACCEPT_5: 'PRIVACY.ACCEPT_5',
+    ACCEPT_6: 'PRIVACY.ACCEPT_6',
+    NO_AGREE: 'PRIVACY.NO_AGREE',
+    CONTACT_SECTION: 'PRIVACY.CONTACT_SECTION',
+    NO_SUPPORT: 'PRIVACY.NO_SUPPORT',
+    USE_INAPP: 'PRIVACY.USE_INAPP',
+    SERIOUS_CONCERNS: 'PRIVACY.SERIOUS_CONCERNS',
+    DPA_CONTACT: 'PRIVACY.DPA_CONTACT',
+    FOOTER: 'PRIVACY.FOOTER',
+  },
+  PROFILE: {
+    SETUP_TITLE: 'PROFILE.SETUP_TITLE',
+    SETUP_SUBTITLE: 'PROFILE.SETUP_SUBTITLE',
+    EDIT_TITLE: 'PROFILE.EDIT_TITLE',
+    EDIT_SUBTITLE: 'PROFILE.EDIT_SUBTITLE',
+    YOUR_QR_CODE: 'PROFILE.YOUR_QR_CODE',
+    QR_CODE_SUBTITLE: 'PROFILE.QR_CODE_SUBTITLE',
+    HOW_TO_USE_QR: 'PROFILE.HOW_TO_USE_QR',
+    QR_INSTRUCTIONS: 'PROFILE.QR_INSTRUCTIONS',
+    DOWNLOAD_QR_CODE: 'PROFILE.DOWNLOAD_QR_CODE',
+    SAVE_CHANGES: 'PROFILE.SAVE_CHANGES',
+    UPDATE_ERROR: 'PROFILE.UPDATE_ERROR',
+    SELECT_ROLE: 'PROFILE.SELECT_ROLE',
+    PRIMARY_ROLE_REQUIRED: 'PROFILE.PRIMARY_ROLE_REQUIRED',
+    REQUIRED_INFO: 'PROFILE.REQUIRED_INFO',
+    OPTIONAL_INFO: 'PROFILE.OPTIONAL_INFO',
+    SECURITY_TITLE: 'PROFILE.SECURITY_TITLE',
+    SECURITY_SUBTITLE: 'PROFILE.SECURITY_SUBTITLE',
+    CURRENT_PASSWORD: 'PROFILE.CURRENT_PASSWORD',
+    NEW_PASSWORD: 'PROFILE.NEW_PASSWORD',
+    CONFIRM_PASSWORD: 'PROFILE.CONFIRM_PASSWORD',
+    UPDATE_PASSWORD: 'PROFILE.UPDATE_PASSWORD',
+    RECOVERY_CODES_STATUS: 'PROFILE.RECOVERY_CODES_STATUS',
+    RECOVERY_CODES_REMAINING: 'PROFILE.RECOVERY_CODES_REMAINING',
+    RECOVERY_CODES_REGENERATE_HINT: 'PROFILE.RECOVERY_CODES_REGENERATE_HINT',
+    RECOVERY_CODES_THRESHOLD_HINT: 'PROFILE.RECOVERY_CODES_THRESHOLD_HINT',
+    RECOVERY_CODES_REGENERATE: 'PROFILE.RECOVERY_CODES_REGENERATE',
+    RECOVERY_CODES_LIST_TITLE: 'PROFILE.RECOVERY_CODES_LIST_TITLE',
+    RECOVERY_CODES_REGENERATED: 'PROFILE.RECOVERY_CODES_REGENERATED',
+    NICKNAME: 'PROFILE.NICKNAME',
+    NICKNAME_REQUIRED: 'PROFILE.NICKNAME_REQUIRED',
+    NICKNAME_MIN_LENGTH: 'PROFILE.NICKNAME_MIN_LENGTH',
+    NICKNAME_AVAILABLE: 'PROFILE.NICKNAME_AVAILABLE',
+    NICKNAME_TAKEN: 'PROFILE.NICKNAME_TAKEN',
+    NICKNAME_NOT_AVAILABLE: 'PROFILE.NICKNAME_NOT_AVAILABLE',
+    PRIMARY_ROLE: 'PROFILE.PRIMARY_ROLE',
+    SPECIFY_ROLE: 'PROFILE.SPECIFY_ROLE',
+    CUSTOM_ROLE_REQUIRED: 'PROFILE.CUSTOM_ROLE_REQUIRED',
+    SECONDARY_ROLES: 'PROFILE.SECONDARY_ROLES',
+    CREATIVE_ROLES: 'PROFILE.CREATIVE_ROLES',
+    PRODUCTION_ROLES: 'PROFILE.PRODUCTION_ROLES',
+    BUSINESS_ROLES: 'PROFILE.BUSINESS_ROLES',
+    VISUAL_ROLES: 'PROFILE.VISUAL_ROLES',
+    BIO: 'PROFILE.BIO',
+    PRIMARY_LANGUAGE: 'PROFILE.PRIMARY_LANGUAGE',
+    SOCIAL_LINKS: 'PROFILE.SOCIAL_LINKS',
+    SKIP_OPTIONAL: 'PROFILE.SKIP_OPTIONAL',
+    CONTINUE: 'PROFILE.CONTINUE',
+    SAVE_PROFILE: 'PROFILE.SAVE_PROFILE',
+    REQUIRED_FIELDS_ERROR: 'PROFILE.REQUIRED_FIELDS_ERROR',
+    CREATION_ERROR: 'PROFILE.CREATION_ERROR',
+    PROFILE_DETAILS: 'PROFILE.PROFILE_DETAILS',
+    QR_CODE: 'PROFILE.QR_CODE',
+    DANGER_ZONE: 'PROFILE.DANGER_ZONE',
+    DANGER_ZONE_DESC: 'PROFILE.DANGER_ZONE_DESC',
+    EXPORT_ERROR: 'PROFILE.EXPORT_ERROR',
+    NICKNAME_INFO: 'PROFILE.NICKNAME_INFO',
+    PRIMARY_ROLE_SEARCH_PLACEHOLDER: 'PROFILE.PRIMARY_ROLE_SEARCH_PLACEHOLDER',
+    SECONDARY_ROLE_SEARCH_PLACEHOLDER: 'PROFILE.SECONDARY_ROLE_SEARCH_PLACEHOLDER',
+    ROLE_SEARCH_NO_RESULTS: 'PROFILE.ROLE_SEARCH_NO_RESULTS',
+    DISPLAY_NAME: 'PROFILE.DISPLAY_NAME',
+  },
+  PROFILE_HUB: {
+    LOADING: 'PROFILE_HUB.LOADING',
+    SHOW_QR: 'PROFILE_HUB.SHOW_QR',
+    ERROR_ACTION: 'PROFILE_HUB.ERROR_ACTION',
+    ERROR_SKIP: 'PROFILE_HUB.ERROR_SKIP',
+    WELCOME: 'PROFILE_HUB.WELCOME',
+    PROFILE_COMPLETE: 'PROFILE_HUB.PROFILE_COMPLETE',
+    EDIT_CARD_TITLE: 'PROFILE_HUB.EDIT_CARD_TITLE',
+    EDIT_CARD_DESCRIPTION: 'PROFILE_HUB.EDIT_CARD_DESCRIPTION',
+    EDIT_CARD_BADGE: 'PROFILE_HUB.EDIT_CARD_BADGE',
+    PUBLIC_CARD_TITLE: 'PROFILE_HUB.PUBLIC_CARD_TITLE',
+    PUBLIC_CARD_DESCRIPTION: 'PROFILE_HUB.PUBLIC_CARD_DESCRIPTION',
+    PUBLIC_CARD_BADGE: 'PROFILE_HUB.PUBLIC_CARD_BADGE',
+    DASHBOARD_CARD_TITLE: 'PROFILE_HUB.DASHBOARD_CARD_TITLE',
+    DASHBOARD_CARD_DESCRIPTION: 'PROFILE_HUB.DASHBOARD_CARD_DESCRIPTION',
+    DASHBOARD_CARD_BADGE: 'PROFILE_HUB.DASHBOARD_CARD_BADGE',
+    STATS_WORKS: 'PROFILE_HUB.STATS_WORKS',
+    STATS_COLLABORATORS: 'PROFILE_HUB.STATS_COLLABORATORS',
+    STATS_PROTOCOLS: 'PROFILE_HUB.STATS_PROTOCOLS',
+    FOOTER_SKIP: 'PROFILE_HUB.FOOTER_SKIP',
+    ERROR_PROFILE_MISSING: 'PROFILE_HUB.ERROR_PROFILE_MISSING',
+    ERROR_GENERIC: 'PROFILE_HUB.ERROR_GENERIC',
+  },
+  PROTOCOL: {
+    LYRICS: 'PROTOCOL.LYRICS',
+    MUSIC: 'PROTOCOL.MUSIC',
+    STATUS: {
+      DRAFT: 'PROTOCOL.STATUS.DRAFT',
+      SUBMITTED: 'PROTOCOL.STATUS.SUBMITTED',
+      APPROVED: 'PROTOCOL.STATUS.APPROVED',
+      ARCHIVED: 'PROTOCOL.STATUS.ARCHIVED',
+    },
+    PDF: {
+      SPLIT_SHEET_TITLE: 'PROTOCOL.PDF.SPLIT_SHEET_TITLE',
+      PROTOCOL_TITLE: 'PROTOCOL.PDF.PROTOCOL_TITLE',
+      UNTITLED: 'PROTOCOL.PDF.UNTITLED',
+      GENERATED: 'PROTOCOL.PDF.GENERATED',
+      WORK_ID: 'PROTOCOL.PDF.WORK_ID',
+      PROTOCOL_ID: 'PROTOCOL.PDF.PROTOCOL_ID',
+      WORKSPACE: 'PROTOCOL.PDF.WORKSPACE',
+      PAGE: 'PROTOCOL.PDF.PAGE',
+      FOOTER: 'PROTOCOL.PDF.FOOTER',
+      REFERENCE: 'PROTOCOL.PDF.REFERENCE',
+      SECTIONS: {
+        WORK_OVERVIEW: 'PROTOCOL.PDF.SECTIONS.WORK_OVERVIEW',
+        WORK_DETAILS: 'PROTOCOL.PDF.SECTIONS.WORK_DETAILS',
+        IDENTIFICATION_CODES: 'PROTOCOL.PDF.SECTIONS.IDENTIFICATION_CODES',
+        RELEASE_DETAILS: 'PROTOCOL.PDF.SECTIONS.RELEASE_DETAILS',
+        PRODUCTION_METADATA: 'PROTOCOL.PDF.SECTIONS.PRODUCTION_METADATA',
+        SOURCE_WORKS_REMIX: 'PROTOCOL.PDF.SECTIONS.SOURCE_WORKS_REMIX',
+        REFERENCED_WORKS: 'PROTOCOL.PDF.SECTIONS.REFERENCED_WORKS',
+        AI_DISCLOSURES: 'PROTOCOL.PDF.SECTIONS.AI_DISCLOSURES',
+        IP_SUMMARY: 'PROTOCOL.PDF.SECTIONS.IP_SUMMARY',
+        IP_CONTRIBUTORS: 'PROTOCOL.PDF.SECTIONS.IP_CONTRIBUTORS',
+        NEIGHBOURING_SUMMARY: 'PROTOCOL.PDF.SECTIONS.NEIGHBOURING_SUMMARY',
+        NEIGHBOURING_CONTRIBUTORS: 'PROTOCOL.PDF.SECTIONS.NEIGHBOURING_CONTRIBUTORS',
+        PARTICIPATION_SUMMARY: 'PROTOCOL.PDF.SECTIONS.PARTICIPATION_SUMMARY',
+        LYRIC_AUTHORS: 'PROTOCOL.PDF.SECTIONS.LYRIC_AUTHORS',
+        MUSIC_AUTHORS: 'PROTOCOL.PDF.SECTIONS.MUSIC_AUTHORS',
+        NEIGHBOURING_RIGHTSHOLDERS: 'PROTOCOL.PDF.SECTIONS.NEIGHBOURING_RIGHTSHOLDERS',
+        SIGNATURES: 'PROTOCOL.PDF.SECTIONS.SIGNATURES',
+      },
+      FIELDS: {
+        STATUS: 'PROTOCOL.PDF.FIELDS.STATUS',
+        GENRE: 'PROTOCOL.PDF.FIELDS.GENRE',
+        WORK_TYPE: 'PROTOCOL.PDF.FIELDS.WORK_TYPE',
+        WORK_TITLE: 'PROTOCOL.PDF.FIELDS.WORK_TITLE',
+        RELEASE_TITLE: 'PROTOCOL.PDF.FIELDS.RELEASE_TITLE',
+        ALTERNATIVE_TITLE: 'PROTOCOL.PDF.FIELDS.ALTERNATIVE_TITLE',
+        ALTERNATIVE_TITLES: 'PROTOCOL.PDF.FIELDS.ALTERNATIVE_TITLES',
+        PRIMARY_LANGUAGE: 'PROTOCOL.PDF.FIELDS.PRIMARY_LANGUAGE',
+        PRIMARY_LANGUAGES: 'PROTOCOL.PDF.FIELDS.PRIMARY_LANGUAGES',
+        SECONDARY_LANGUAGE: 'PROTOCOL.PDF.FIELDS.SECONDARY_LANGUAGE',
+        SECONDARY_LANGUAGES: 'PROTOCOL.PDF.FIELDS.SECONDARY_LANGUAGES',
+        ALL_LANGUAGES: 'PROTOCOL.PDF.FIELDS.ALL_LANGUAGES',
+        DURATION: 'PROTOCOL.PDF.FIELDS.DURATION',
+        CATALOGUE_NUMBER: 'PROTOCOL.PDF.FIELDS.CATALOGUE_NUMBER',
+        EAN: 'PROTOCOL.PDF.FIELDS.EAN',
+        ISRC: 'PROTOCOL.PDF.FIELDS.ISRC',
+        ISWC: 'PROTOCOL.PDF.FIELDS.ISWC',
+        CREATED_AT: 'PROTOCOL.PDF.FIELDS.CREATED_AT',
+        UPDATED_AT: 'PROTOCOL.PDF.FIELDS.UPDATED_AT',
+        SUBMITTED_AT: 'PROTOCOL.PDF.FIELDS.SUBMITTED_AT',
+        RECORDING_DATE: 'PROTOCOL.PDF.FIELDS.RECORDING_DATE',
+        RELEASE_DATE: 'PROTOCOL.PDF.FIELDS.RELEASE_DATE',
+        COVER_VERSION: 'PROTOCOL.PDF.FIELDS.COVER_VERSION',
+        ORIGINAL_WORK_TITLE: 'PROTOCOL.PDF.FIELDS.ORIGINAL_WORK_TITLE',
+        ORIGINAL_WORK_ISRC: 'PROTOCOL.PDF.FIELDS.ORIGINAL_WORK_ISRC',
+        ORIGINAL_WORK_ISWC: 'PROTOCOL.PDF.FIELDS.ORIGINAL_WORK_ISWC',
+        ORIGINAL_WORK_INFO: 'PROTOCOL.PDF.FIELDS.ORIGINAL_WORK_INFO',
+        NOTES: 'PROTOCOL.PDF.FIELDS.NOTES',
+        CREATION_PROCESS: 'PROTOCOL.PDF.FIELDS.CREATION_PROCESS',
+        SAMPLE_LIBRARIES_USED: 'PROTOCOL.PDF.FIELDS.SAMPLE_LIBRARIES_USED',
+        COMMERCIAL_LICENSE: 'PROTOCOL.PDF.FIELDS.COMMERCIAL_LICENSE',
+        SAMPLE_LIBRARIES: 'PROTOCOL.PDF.FIELDS.SAMPLE_LIBRARIES',
+        SOURCE_WORK: 'PROTOCOL.PDF.FIELDS.SOURCE_WORK',
+        TOOL: 'PROTOCOL.PDF.FIELDS.TOOL',
+        AI: 'PROTOCOL.PDF.FIELDS.AI',
+        EMAIL: 'PROTOCOL.PDF.FIELDS.EMAIL',
+        PRO: 'PROTOCOL.PDF.FIELDS.PRO',
+        CMO: 'PROTOCOL.PDF.FIELDS.CMO',
+        IPI: 'PROTOCOL.PDF.FIELDS.IPI',
+        ROLES: 'PROTOCOL.PDF.FIELDS.ROLES',
+        CONTRIBUTIONS: 'PROTOCOL.PDF.FIELDS.CONTRIBUTIONS',
+        LYRIC_CONTRIBUTORS: 'PROTOCOL.PDF.FIELDS.LYRIC_CONTRIBUTORS',
+        MUSIC_CONTRIBUTORS: 'PROTOCOL.PDF.FIELDS.MUSIC_CONTRIBUTORS',
+        LYRICS_SHARE: 'PROTOCOL.PDF.FIELDS.LYRICS_SHARE',
+        MUSIC_SHARE: 'PROTOCOL.PDF.FIELDS.MUSIC_SHARE',
+        NEIGHBOURING_SHARE: 'PROTOCOL.PDF.FIELDS.NEIGHBOURING_SHARE',
+        COMBINED_IP_TOTAL: 'PROTOCOL.PDF.FIELDS.COMBINED_IP_TOTAL',
+        SPLIT_STATUS: 'PROTOCOL.PDF.FIELDS.SPLIT_STATUS',
+        CONTRIBUTORS: 'PROTOCOL.PDF.FIELDS.CONTRIBUTORS',
+        TOTAL_SHARE: 'PROTOCOL.PDF.FIELDS.TOTAL_SHARE',
+        SIGNATURE: 'PROTOCOL.PDF.FIELDS.SIGNATURE',
+        DATE: 'PROTOCOL.PDF.FIELDS.DATE',
+      },
+      COLUMNS: {
+        RIGHTS_HOLDER: 'PROTOCOL.PDF.COLUMNS.RIGHTS_HOLDER',
+        NAME: 'PROTOCOL.PDF.COLUMNS.NAME',
+        ROLE: 'PROTOCOL.PDF.COLUMNS.ROLE',
+        AKA: 'PROTOCOL.PDF.COLUMNS.AKA',
+        SPLIT: 'PROTOCOL.PDF.COLUMNS.SPLIT',
+        CMO_PRO: 'PROTOCOL.PDF.COLUMNS.CMO_PRO',
+        SHARE: 'PROTOCOL.PDF.COLUMNS.SHARE',
+        DETAILS: 'PROTOCOL.PDF.COLUMNS.DETAILS',
+      },
+      VALUES: {
+        YES: 'PROTOCOL.PDF.VALUES.YES',
+        NO: 'PROTOCOL.PDF.VALUES.NO',
+        HUMAN_CREATED: 'PROTOCOL.PDF.VALUES.HUMAN_CREATED',
+        ASSISTED: 'PROTOCOL.PDF.VALUES.ASSISTED',
+        NOT_APPLICABLE: 'PROTOCOL.PDF.VALUES.NOT_APPLICABLE',
+        NOT_APPLICABLE_INSTRUMENTAL: 'PROTOCOL.PDF.VALUES.NOT_APPLICABLE_INSTRUMENTAL',
+        MUSIC_ONLY: 'PROTOCOL.PDF.VALUES.MUSIC_ONLY',
+        LYRICS: 'PROTOCOL.PDF.VALUES.LYRICS',
+        MUSIC: 'PROTOCOL.PDF.VALUES.MUSIC',
+        NEIGHBOURING: 'PROTOCOL.PDF.VALUES.NEIGHBOURING',
+        MELODY: 'PROTOCOL.PDF.VALUES.MELODY',
+        HARMONY: 'PROTOCOL.PDF.VALUES.HARMONY',
+        ARRANGEMENT: 'PROTOCOL.PDF.VALUES.ARRANGEMENT',
+        UNKNOWN: 'PROTOCOL.PDF.VALUES.UNKNOWN',
+        UNKNOWN_HOLDER: 'PROTOCOL.PDF.VALUES.UNKNOWN_HOLDER',
+      },
+      WORK_TYPES: {
+        STANDARD: 'PROTOCOL.PDF.WORK_TYPES.STANDARD',
+        INSTRUMENTAL: 'PROTOCOL.PDF.WORK_TYPES.INSTRUMENTAL',
+        REMIX: 'PROTOCOL.PDF.WORK_TYPES.REMIX',
+      },
+      WORK_STATUS: {
+        DRAFT: 'PROTOCOL.PDF.WORK_STATUS.DRAFT',
+        REGISTERED: 'PROTOCOL.PDF.WORK_STATUS.REGISTERED',
+        PUBLISHED: 'PROTOCOL.PDF.WORK_STATUS.PUBLISHED',
+        ARCHIVED: 'PROTOCOL.PDF.WORK_STATUS.ARCHIVED',
+      },
+      SPLIT_STATUS: {
+        COMPLETE: 'PROTOCOL.PDF.SPLIT_STATUS.COMPLETE',
+        COMPLETE_INSTRUMENTAL: 'PROTOCOL.PDF.SPLIT_STATUS.COMPLETE_INSTRUMENTAL',
+        INSTRUMENTAL_PENDING: 'PROTOCOL.PDF.SPLIT_STATUS.INSTRUMENTAL_PENDING',
+        INSTRUMENTAL_MISSING: 'PROTOCOL.PDF.SPLIT_STATUS.INSTRUMENTAL_MISSING',
+        OVERALLOCATED: 'PROTOCOL.PDF.SPLIT_STATUS.OVERALLOCATED',
+        INCOMPLETE: 'PROTOCOL.PDF.SPLIT_STATUS.INCOMPLETE',
+        NONE: 'PROTOCOL.PDF.SPLIT_STATUS.NONE',
+      },
+      MESSAGES: {
+        NO_PRODUCTION_METADATA: 'PROTOCOL.PDF.MESSAGES.NO_PRODUCTION_METADATA',
+        NO_SOURCE_WORKS: 'PROTOCOL.PDF.MESSAGES.NO_SOURCE_WORKS',
+        NO_AI_DISCLOSURES: 'PROTOCOL.PDF.MESSAGES.NO_AI_DISCLOSURES',
+        NO_IP_CONTRIBUTORS: 'PROTOCOL.PDF.MESSAGES.NO_IP_CONTRIBUTORS',
+        NO_NEIGHBOURING_CONTRIBUTORS: 'PROTOCOL.PDF.MESSAGES.NO_NEIGHBOURING_CONTRIBUTORS',
+        NO_LYRIC_AUTHORS: 'PROTOCOL.PDF.MESSAGES.NO_LYRIC_AUTHORS',
+        NO_MUSIC_AUTHORS: 'PROTOCOL.PDF.MESSAGES.NO_MUSIC_AUTHORS',
+        NO_NEIGHBOURING_RIGHTSHOLDERS: 'PROTOCOL.PDF.MESSAGES.NO_NEIGHBOURING_RIGHTSHOLDERS',
+        INSTRUMENTAL: 'PROTOCOL.PDF.MESSAGES.INSTRUMENTAL',
+        IP_TEMPORARY: 'PROTOCOL.PDF.MESSAGES.IP_TEMPORARY',
+        NEIGHBOURING_TEMPORARY: 'PROTOCOL.PDF.MESSAGES.NEIGHBOURING_TEMPORARY',
+        SIGNATURES: 'PROTOCOL.PDF.MESSAGES.SIGNATURES',
+      },
+      KINDS: {
+        AUTHOR: 'PROTOCOL.PDF.KINDS.AUTHOR',
+        COMPOSER: 'PROTOCOL.PDF.KINDS.COMPOSER',
+        ARTIST: 'PROTOCOL.PDF.KINDS.ARTIST',
+        PRODUCER: 'PROTOCOL.PDF.KINDS.PRODUCER',
+        PUBLISHER: 'PROTOCOL.PDF.KINDS.PUBLISHER',
+        LABEL: 'PROTOCOL.PDF.KINDS.LABEL',
+        ARRANGER: 'PROTOCOL.PDF.KINDS.ARRANGER',
+        TRANSLATOR: 'PROTOCOL.PDF.KINDS.TRANSLATOR',
+        ENGINEER: 'PROTOCOL.PDF.KINDS.ENGINEER',
+        MASTERING: 'PROTOCOL.PDF.KINDS.MASTERING',
+        OTHER: 'PROTOCOL.PDF.KINDS.OTHER',
+      },
+      ROLES: {
+        LYRICIST: 'PROTOCOL.PDF.ROLES.LYRICIST',
+        COMPOSER: 'PROTOCOL.PDF.ROLES.COMPOSER',
+        ARRANGER: 'PROTOCOL.PDF.ROLES.ARRANGER',
+        PERFORMER: 'PROTOCOL.PDF.ROLES.PERFORMER',
+        CONDUCTOR: 'PROTOCOL.PDF.ROLES.CONDUCTOR',
+        PRODUCER: 'PROTOCOL.PDF.ROLES.PRODUCER',
+        ENGINEER: 'PROTOCOL.PDF.ROLES.ENGINEER',
+        MIXER: 'PROTOCOL.PDF.ROLES.MIXER',
+        OTHER: 'PROTOCOL.PDF.ROLES.OTHER',
+      },
+      AI_SECTIONS: {
+        IP: 'PROTOCOL.PDF.AI_SECTIONS.IP',
+        MIXING: 'PROTOCOL.PDF.AI_SECTIONS.MIXING',
+        MASTERING: 'PROTOCOL.PDF.AI_SECTIONS.MASTERING',
+        SESSION_MUSICIANS: 'PROTOCOL.PDF.AI_SECTIONS.SESSION_MUSICIANS',
+        VISUALS: 'PROTOCOL.PDF.AI_SECTIONS.VISUALS',
+      },
+      CREATION_TYPES: {
+        HUMAN: 'PROTOCOL.PDF.CREATION_TYPES.HUMAN',
+        AI_ASSISTED: 'PROTOCOL.PDF.CREATION_TYPES.AI_ASSISTED',
+        AI_GENERATED: 'PROTOCOL.PDF.CREATION_TYPES.AI_GENERATED',
+      },
+    },
+  },
+  PROTOCOL_LIST: {
+    BACK: 'PROTOCOL_LIST.BACK',
+    TITLE: 'PROTOCOL_LIST.TITLE',
+    SUBTITLE: 'PROTOCOL_LIST.SUBTITLE',
+    REFRESH: 'PROTOCOL_LIST.REFRESH',
+    CREATE: 'PROTOCOL_LIST.CREATE',
+    ACTIVE_WORKSPACE: 'PROTOCOL_LIST.ACTIVE_WORKSPACE',
+    ERROR_LOADING: 'PROTOCOL_LIST.ERROR_LOADING',
+    NEW_PROTOCOL_LABEL: 'PROTOCOL_LIST.NEW_PROTOCOL_LABEL',
+    NEW_PROTOCOL_SUBTITLE: 'PROTOCOL_LIST.NEW_PROTOCOL_SUBTITLE',
+    SELECT_WORK_PLACEHOLDER: 'PROTOCOL_LIST.SELECT_WORK_PLACEHOLDER',
+    START_PROTOCOL: 'PROTOCOL_LIST.START_PROTOCOL',
+    EDIT_WORK: 'PROTOCOL_LIST.EDIT_WORK',
+    EXISTING_PROTOCOL_OPTION: 'PROTOCOL_LIST.EXISTING_PROTOCOL_OPTION',
+    NO_AVAILABLE_WORKS: 'PROTOCOL_LIST.NO_AVAILABLE_WORKS',
+    WORK: 'PROTOCOL_LIST.WORK',
+    STATUS: 'PROTOCOL_LIST.STATUS',
+    UPDATED: 'PROTOCOL_LIST.UPDATED',
+    OPEN: 'PROTOCOL_LIST.OPEN',
+    OPEN_WORK: 'PROTOCOL_LIST.OPEN_WORK',
+    DUPLICATE: 'PROTOCOL_LIST.DUPLICATE',
+    DUPLICATE_TITLE: 'PROTOCOL_LIST.DUPLICATE_TITLE',
+    DUPLICATE_SUBTITLE: 'PROTOCOL_LIST.DUPLICATE_SUBTITLE',
+    SELECT_DUPLICATE_TARGET: 'PROTOCOL_LIST.SELECT_DUPLICATE_TARGET',
+    DUPLICATE_CANCEL: 'PROTOCOL_LIST.DUPLICATE_CANCEL',
+    DUPLICATE_CONFIRM: 'PROTOCOL_LIST.DUPLICATE_CONFIRM',
+    NO_DUPLICATE_TARGETS: 'PROTOCOL_LIST.NO_DUPLICATE_TARGETS',
+    DUPLICATE_ERROR: 'PROTOCOL_LIST.DUPLICATE_ERROR',
+    EMPTY_TITLE: 'PROTOCOL_LIST.EMPTY_TITLE',
+    EMPTY_DESC: 'PROTOCOL_LIST.EMPTY_DESC',
+    GO_TO_WORKS: 'PROTOCOL_LIST.GO_TO_WORKS',
+    CREATE_WORK: 'PROTOCOL_LIST.CREATE_WORK',
+  },
+  PUBLIC_PROFILE: {
+    BACK_TO_APP: 'PUBLIC_PROFILE.BACK_TO_APP',
+    SHARE: 'PUBLIC_PROFILE.SHARE',
+    ADD_TO_WORKSPACE: 'PUBLIC_PROFILE.ADD_TO_WORKSPACE',
+    ADDING: 'PUBLIC_PROFILE.ADDING',
+    IMPORT_COLLABORATOR: 'PUBLIC_PROFILE.IMPORT_COLLABORATOR',
+    SIGN_IN_TO_ADD: 'PUBLIC_PROFILE.SIGN_IN_TO_ADD',
+    ALREADY_IN_WORKSPACE: 'PUBLIC_PROFILE.ALREADY_IN_WORKSPACE',
+    ADDITIONAL_ROLES: 'PUBLIC_PROFILE.ADDITIONAL_ROLES',
+    SOCIAL_AND_MUSIC: 'PUBLIC_PROFILE.SOCIAL_AND_MUSIC',
+    COLLABORATION_TIPS: 'PUBLIC_PROFILE.COLLABORATION_TIPS',
+    TIP_1: 'PUBLIC_PROFILE.TIP_1',
+    TIP_2: 'PUBLIC_PROFILE.TIP_2',
+    TIP_3: 'PUBLIC_PROFILE.TIP_3',
+    NO_PROFILE_FOUND: 'PUBLIC_PROFILE.NO_PROFILE_FOUND',
+    UNABLE_TO_LOAD: 'PUBLIC_PROFILE.UNABLE_TO_LOAD',
+  },
+  REFERENCE: {
+    REGIONS: {
+      EUROPE: 'REFERENCE.REGIONS.EUROPE',
+      AMERICAS: 'REFERENCE.REGIONS.AMERICAS',
+      MIDDLE_EAST: 'REFERENCE.REGIONS.MIDDLE_EAST',
+      OCEANIA: 'REFERENCE.REGIONS.OCEANIA',
+      ASIA: 'REFERENCE.REGIONS.ASIA',
+      AFRICA: 'REFERENCE.REGIONS.AFRICA',
+      OTHER_GLOBAL: 'REFERENCE.REGIONS.OTHER_GLOBAL',
+    },
+    ORGANIZATION_TYPES: {
+      CMO: 'REFERENCE.ORGANIZATION_TYPES.CMO',
+      PRO: 'REFERENCE.ORGANIZATION_TYPES.PRO',
+      BOTH: 'REFERENCE.ORGANIZATION_TYPES.BOTH',
+    },
+    FUNCTION_TYPES: {
+      INSTRUMENT: 'REFERENCE.FUNCTION_TYPES.INSTRUMENT',
+      VOICE: 'REFERENCE.FUNCTION_TYPES.VOICE',
+      RECORDING: 'REFERENCE.FUNCTION_TYPES.RECORDING',
+    },
+    QUESTION_CATEGORIES: {
+      PERSONAL: 'REFERENCE.QUESTION_CATEGORIES.PERSONAL',
+      KNOWLEDGE: 'REFERENCE.QUESTION_CATEGORIES.KNOWLEDGE',
+      EXPERIENCE: 'REFERENCE.QUESTION_CATEGORIES.EXPERIENCE',
+    },
+  },
+  RIGHTS_HOLDERS: {
+    TITLE: 'RIGHTS_HOLDERS.TITLE',
+    ADD_RIGHTS_HOLDER: 'RIGHTS_HOLDERS.ADD_RIGHTS_HOLDER',
+    CREATE_RIGHTS_HOLDER: 'RIGHTS_HOLDERS.CREATE_RIGHTS_HOLDER',
+    EDIT_RIGHTS_HOLDER: 'RIGHTS_HOLDERS.EDIT_RIGHTS_HOLDER',
+    NO_RIGHTS_HOLDERS: 'RIGHTS_HOLDERS.NO_RIGHTS_HOLDERS',
+    NO_RIGHTS_HOLDERS_DESCRIPTION: 'RIGHTS_HOLDERS.NO_RIGHTS_HOLDERS_DESCRIPTION',
+    CREATE_FIRST_RIGHTS_HOLDER: 'RIGHTS_HOLDERS.CREATE_FIRST_RIGHTS_HOLDER',
+    SEARCH_PLACEHOLDER: 'RIGHTS_HOLDERS.SEARCH_PLACEHOLDER',
+    TYPE: 'RIGHTS_HOLDERS.TYPE',
+    TYPE_PERSON: 'RIGHTS_HOLDERS.TYPE_PERSON',
+    TYPE_COMPANY: 'RIGHTS_HOLDERS.TYPE_COMPANY',
+    TYPE_PERSON_DESC: 'RIGHTS_HOLDERS.TYPE_PERSON_DESC',
+    TYPE_COMPANY_DESC: 'RIGHTS_HOLDERS.TYPE_COMPANY_DESC',
+    BASIC_INFO: 'RIGHTS_HOLDERS.BASIC_INFO',
+    FIRST_NAME: 'RIGHTS_HOLDERS.FIRST_NAME',
+    LAST_NAME: 'RIGHTS_HOLDERS.LAST_NAME',
+    COMPANY_NAME: 'RIGHTS_HOLDERS.COMPANY_NAME',
+    FIRST_NAME_REQUIRED: 'RIGHTS_HOLDERS.FIRST_NAME_REQUIRED',
+    LAST_NAME_REQUIRED: 'RIGHTS_HOLDERS.LAST_NAME_REQUIRED',
+    COMPANY_NAME_REQUIRED: 'RIGHTS_HOLDERS.COMPANY_NAME_REQUIRED',
+    NAME_MIN_LENGTH: 'RIGHTS_HOLDERS.NAME_MIN_LENGTH',
+    CONTACT_INFO: 'RIGHTS_HOLDERS.CONTACT_INFO',
+    EMAIL: 'RIGHTS_HOLDERS.EMAIL',
+    PHONE: 'RIGHTS_HOLDERS.PHONE',
+    PROFESSIONAL_DETAILS: 'RIGHTS_HOLDERS.PROFESSIONAL_DETAILS',
+    CMO_PRO: 'RIGHTS_HOLDERS.CMO_PRO',
+    CMO_HINT: 'RIGHTS_HOLDERS.CMO_HINT',
+    IPI_NUMBER: 'RIGHTS_HOLDERS.IPI_NUMBER',
+    IPI_FORMAT: 'RIGHTS_HOLDERS.IPI_FORMAT',
+    IPI_INVALID: 'RIGHTS_HOLDERS.IPI_INVALID',
+    IPI_HELP_A11Y: 'RIGHTS_HOLDERS.IPI_HELP_A11Y',
+    IPI_HELP_TITLE: 'RIGHTS_HOLDERS.IPI_HELP_TITLE',
+    IPI_HELP_BODY: 'RIGHTS_HOLDERS.IPI_HELP_BODY',
+    IPI_HELP_LINK_GEMA: 'RIGHTS_HOLDERS.IPI_HELP_LINK_GEMA',
+    IPI_HELP_LINK_ASCAP: 'RIGHTS_HOLDERS.IPI_HELP_LINK_ASCAP',
+    IPI_HELP_LINK_BMI: 'RIGHTS_HOLDERS.IPI_HELP_LINK_BMI',
+    IPI_HINT_DEFAULT: 'RIGHTS_HOLDERS.IPI_HINT_DEFAULT',
+    IPI_HINT_FORMAT: 'RIGHTS_HOLDERS.IPI_HINT_FORMAT',
+    IPI_HINT_LOOKING: 'RIGHTS_HOLDERS.IPI_HINT_LOOKING',
+    IPI_HINT_FOUND: 'RIGHTS_HOLDERS.IPI_HINT_FOUND',
+    IPI_HINT_FALLBACK: 'RIGHTS_HOLDERS.IPI_HINT_FALLBACK',
+    IPI_HINT_UNKNOWN_NAME: 'RIGHTS_HOLDERS.IPI_HINT_UNKNOWN_NAME',
+    TAX_ID: 'RIGHTS_HOLDERS.TAX_ID',
+    TAX_ID_HINT: 'RIGHTS_HOLDERS.TAX_ID_HINT',
+    NOTES: 'RIGHTS_HOLDERS.NOTES',
+    ADDITIONAL_INFO: 'RIGHTS_HOLDERS.ADDITIONAL_INFO',
+  },
+  ROLES: {
+    ARTIST: 'ROLES.ARTIST',
+    PRODUCER: 'ROLES.PRODUCER',
+    SONGWRITER: 'ROLES.SONGWRITER',
+    COMPOSER: 'ROLES.COMPOSER',
+    LABEL: 'ROLES.LABEL',
+    PUBLISHER: 'ROLES.PUBLISHER',
+    MANAGER: 'ROLES.MANAGER',
+    ENGINEER: 'ROLES.ENGINEER',
+    OTHER: 'ROLES.OTHER',
+  },
+  SECURITY: {
+    Q_CHILDHOOD_FRIEND: 'SECURITY.Q_CHILDHOOD_FRIEND',
+    Q_FIRST_PET: 'SECURITY.Q_FIRST_PET',
+    Q_BIRTH_CITY: 'SECURITY.Q_BIRTH_CITY',
+    Q_MOTHERS_MAIDEN: 'SECURITY.Q_MOTHERS_MAIDEN',
+    Q_FAVORITE_TEACHER: 'SECURITY.Q_FAVORITE_TEACHER',
+    Q_DREAM_JOB: 'SECURITY.Q_DREAM_JOB',
+    Q_FAVORITE_BOOK: 'SECURITY.Q_FAVORITE_BOOK',
+    Q_FIRST_CAR: 'SECURITY.Q_FIRST_CAR',
+    Q_FAVORITE_FOOD: 'SECURITY.Q_FAVORITE_FOOD',
+    Q_FIRST_SCHOOL: 'SECURITY.Q_FIRST_SCHOOL',
+    Q_FIRST_JOB: 'SECURITY.Q_FIRST_JOB',
+    Q_FIRST_VACATION: 'SECURITY.Q_FIRST_VACATION',
+    Q_STREET_GREW_UP: 'SECURITY.Q_STREET_GREW_UP',
+    Q_MEMORABLE_YEAR: 'SECURITY.Q_MEMORABLE_YEAR',
+    Q_OLDEST_SIBLING: 'SECURITY.Q_OLDEST_SIBLING',
+    Q_WEDDING_LOCATION: 'SECURITY.Q_WEDDING_LOCATION',
+    Q_CHILDHOOD_NICKNAME: 'SECURITY.Q_CHILDHOOD_NICKNAME',
+    Q_GRANDFATHER_OCCUPATION: 'SECURITY.Q_GRANDFATHER_OCCUPATION',
+    Q_FIRST_CONCERT: 'SECURITY.Q_FIRST_CONCERT',
+    Q_CHILDHOOD_HERO: 'SECURITY.Q_CHILDHOOD_HERO',
+  },
+  SOCIAL_PLATFORMS: {
+    INSTAGRAM: 'SOCIAL_PLATFORMS.INSTAGRAM',
+    TWITTER: 'SOCIAL_PLATFORMS.TWITTER',
+    FACEBOOK: 'SOCIAL_PLATFORMS.FACEBOOK',
+    TIKTOK: 'SOCIAL_PLATFORMS.TIKTOK',
+    YOUTUBE: 'SOCIAL_PLATFORMS.YOUTUBE',
+    WEBSITE: 'SOCIAL_PLATFORMS.WEBSITE',
+    SPOTIFY: 'SOCIAL_PLATFORMS.SPOTIFY',
+  },
+  SPLITS: {
+    SPLIT_EDITOR: 'SPLITS.SPLIT_EDITOR',
+    IP_RIGHTS: 'SPLITS.IP_RIGHTS',
+    IP_RIGHTS_LONG: 'SPLITS.IP_RIGHTS_LONG',
+    IP_RIGHTS_DESC: 'SPLITS.IP_RIGHTS_DESC',
+    NEIGHBORING_RIGHTS: 'SPLITS.NEIGHBORING_RIGHTS',
+    NEIGHBORING_RIGHTS_DESC: 'SPLITS.NEIGHBORING_RIGHTS_DESC',
+    RIGHTS_HOLDERS: 'SPLITS.RIGHTS_HOLDERS',
+    NO_RIGHTS_HOLDERS_ADDED: 'SPLITS.NO_RIGHTS_HOLDERS_ADDED',
+    ADD_RIGHTS_HOLDER: 'SPLITS.ADD_RIGHTS_HOLDER',
+    ADD_ME: 'SPLITS.ADD_ME',
+    CREATE_NEW: 'SPLITS.CREATE_NEW',
+    CREATE_NEW_RIGHTS_HOLDER: 'SPLITS.CREATE_NEW_RIGHTS_HOLDER',
+    CREATE_AND_ADD: 'SPLITS.CREATE_AND_ADD',
+    TYPE: 'SPLITS.TYPE',
+    ROLE: 'SPLITS.ROLE',
+    PERSON: 'SPLITS.PERSON',
+    COMPANY: 'SPLITS.COMPANY',
+    FIRST_NAME: 'SPLITS.FIRST_NAME',
+    LAST_NAME: 'SPLITS.LAST_NAME',
+    COMPANY_NAME: 'SPLITS.COMPANY_NAME',
+    EMAIL: 'SPLITS.EMAIL',
+    PHONE: 'SPLITS.PHONE',
+    SCAN_QR_CODE: 'SPLITS.SCAN_QR_CODE',
+    SCAN_QR: 'SPLITS.SCAN_QR',
+    ADD_MANUALLY: 'SPLITS.ADD_MANUALLY',
+    ADD_NEW_BY_QR: 'SPLITS.ADD_NEW_BY_QR',
+    ADD_NEW_RIGHTSHOLDER_MANUALLY: 'SPLITS.ADD_NEW_RIGHTSHOLDER_MANUALLY',
+    SELECT_RIGHTS_HOLDER: 'SPLITS.SELECT_RIGHTS_HOLDER',
+    NO_RIGHTS_HOLDERS_AVAILABLE: 'SPLITS.NO_RIGHTS_HOLDERS_AVAILABLE',
+    SCAN_INSTRUCTION: 'SPLITS.SCAN_INSTRUCTION',
+    SCANNING_FOR: 'SPLITS.SCANNING_FOR',
+    QR_CAMERA_PERMISSION_DENIED: 'SPLITS.QR_CAMERA_PERMISSION_DENIED',
+    QR_CAMERA_UNAVAILABLE: 'SPLITS.QR_CAMERA_UNAVAILABLE',
+    SAVE_SPLIT_SHEET: 'SPLITS.SAVE_SPLIT_SHEET',
+    SPLIT_SHEET_SAVED: 'SPLITS.SPLIT_SHEET_SAVED',
+    NO_IP_SPLITS_YET: 'SPLITS.NO_IP_SPLITS_YET',
+    NO_NEIGHBORING_SPLITS_YET: 'SPLITS.NO_NEIGHBORING_SPLITS_YET',
+    ADD_HOLDER_AND_ENSURE_100: 'SPLITS.ADD_HOLDER_AND_ENSURE_100',
+    UNKNOWN_RIGHTS_HOLDER: 'SPLITS.UNKNOWN_RIGHTS_HOLDER',
+    SPLIT_TYPE: 'SPLITS.SPLIT_TYPE',
+    PERCENTAGE: 'SPLITS.PERCENTAGE',
+    NOTES: 'SPLITS.NOTES',
+    REMOVE: 'SPLITS.REMOVE',
+    INTELLECTUAL_PROPERTY_SPLITS: 'SPLITS.INTELLECTUAL_PROPERTY_SPLITS',
+    NEIGHBORING_RIGHTS_SPLITS: 'SPLITS.NEIGHBORING_RIGHTS_SPLITS',
+    AI_DISCLOSURE: 'SPLITS.AI_DISCLOSURE',
+    AI_TOOL: 'SPLITS.AI_TOOL',
+    AI_ASSISTED: 'SPLITS.AI_ASSISTED',
+    AI_GENERATED: 'SPLITS.AI_GENERATED',
+    CREATION_TYPE: 'SPLITS.CREATION_TYPE',
+    HUMAN: 'SPLITS.HUMAN',
+    VIEW_CHANGES: 'SPLITS.VIEW_CHANGES',
+    CHANGE_HISTORY: {
+      TITLE: 'SPLITS.CHANGE_HISTORY.TITLE',
+      DESCRIPTION: 'SPLITS.CHANGE_HISTORY.DESCRIPTION',
+      ERROR: 'SPLITS.CHANGE_HISTORY.ERROR',
+      EMPTY_STATE: 'SPLITS.CHANGE_HISTORY.EMPTY_STATE',
+      CHANGED_FIELD: 'SPLITS.CHANGE_HISTORY.CHANGED_FIELD',
+      OLD_VALUE: 'SPLITS.CHANGE_HISTORY.OLD_VALUE',
+      NEW_VALUE: 'SPLITS.CHANGE_HISTORY.NEW_VALUE',
+      CHANGED_BY: 'SPLITS.CHANGE_HISTORY.CHANGED_BY',
+      CHANGED_AT: 'SPLITS.CHANGE_HISTORY.CHANGED_AT',
+      NOTES: 'SPLITS.CHANGE_HISTORY.NOTES',
+      SUMMARY: 'SPLITS.CHANGE_HISTORY.SUMMARY',
+      EMPTY: 'SPLITS.CHANGE_HISTORY.EMPTY',
+      UNKNOWN_FIELD: 'SPLITS.CHANGE_HISTORY.UNKNOWN_FIELD',
+      UNKNOWN_USER: 'SPLITS.CHANGE_HISTORY.UNKNOWN_USER',
+      SPLIT_LABEL: 'SPLITS.CHANGE_HISTORY.SPLIT_LABEL',
+    },
+    KIND: 'SPLITS.KIND',
+    POSITION_QR_CODE: 'SPLITS.POSITION_QR_CODE',
+    SELECT_SPLIT_TYPES: 'SPLITS.SELECT_SPLIT_TYPES',
+    EDIT_RIGHTS_HOLDER: 'SPLITS.EDIT_RIGHTS_HOLDER',
+    ROLE_HELP_A11Y: 'SPLITS.ROLE_HELP_A11Y',
+    ROLE_HELP_TITLE: 'SPLITS.ROLE_HELP_TITLE',
+    ROLE_HELP_BODY: 'SPLITS.ROLE_HELP_BODY',
+    TOTAL_HINT_EMPTY: 'SPLITS.TOTAL_HINT_EMPTY',
+    TOTAL_HINT_COMPLETE: 'SPLITS.TOTAL_HINT_COMPLETE',
+    TOTAL_HINT_MISSING: 'SPLITS.TOTAL_HINT_MISSING',
+    TOTAL_HINT_OVER: 'SPLITS.TOTAL_HINT_OVER',
+    TOTAL_ALERT_NO_ENTRIES: 'SPLITS.TOTAL_ALERT_NO_ENTRIES',
+    TOTAL_ALERT_MISSING: 'SPLITS.TOTAL_ALERT_MISSING',
+    TOTAL_ALERT_OVER: 'SPLITS.TOTAL_ALERT_OVER',
+    SAVE_DISABLED_NO_ENTRIES: 'SPLITS.SAVE_DISABLED_NO_ENTRIES',
+    SAVE_DISABLED_MISSING: 'SPLITS.SAVE_DISABLED_MISSING',
+    SAVE_DISABLED_OVER: 'SPLITS.SAVE_DISABLED_OVER',
+  },
+  TOOLTIPS: {
+    EDIT: 'TOOLTIPS.EDIT',
+    DELETE: 'TOOLTIPS.DELETE',
+    COPY: 'TOOLTIPS.COPY',
+    DOWNLOAD: 'TOOLTIPS.DOWNLOAD',
+    UPLOAD: 'TOOLTIPS.UPLOAD',
+    INFO: 'TOOLTIPS.INFO',
+    HELP: 'TOOLTIPS.HELP',
+  },
+  VALIDATION: {
+    REQUIRED: 'VALIDATION.REQUIRED',
+    EMAIL: 'VALIDATION.EMAIL',
+    MIN_LENGTH: 'VALIDATION.MIN_LENGTH',
+    MAX_LENGTH: 'VALIDATION.MAX_LENGTH',
+    PATTERN: 'VALIDATION.PATTERN',
+    MIN: 'VALIDATION.MIN',
+    MAX: 'VALIDATION.MAX',
+    URL: 'VALIDATION.URL',
+  },
+  WORKS: {
+    WORKS: 'WORKS.WORKS',
+    ADD_WORK: 'WORKS.ADD_WORK',
+    CREATE_WORK: 'WORKS.CREATE_WORK',
+    SAVE_AND_ADD_HOLDER: 'WORKS.SAVE_AND_ADD_HOLDER',
+    EDIT_WORK: 'WORKS.EDIT_WORK',
+    EDIT_RIGHTS_HOLDERS: 'WORKS.EDIT_RIGHTS_HOLDERS',
+    CREATE_WORK_SUBTITLE: 'WORKS.CREATE_WORK_SUBTITLE',
+    EDIT_WORK_SUBTITLE: 'WORKS.EDIT_WORK_SUBTITLE',
+    CREATE_FIRST_WORK: 'WORKS.CREATE_FIRST_WORK',
+    NO_WORKS: 'WORKS.NO_WORKS',
+    NO_WORKS_DESCRIPTION: 'WORKS.NO_WORKS_DESCRIPTION',
+    NO_RESULTS: 'WORKS.NO_RESULTS',
+    NO_RESULTS_FOR: 'WORKS.NO_RESULTS_FOR',
+    ARCHIVE: 'WORKS.ARCHIVE',
+    ARCHIVE_CONFIRM: 'WORKS.ARCHIVE_CONFIRM',
+    ARCHIVE_SUCCESS: 'WORKS.ARCHIVE_SUCCESS',
+    ARCHIVE_ERROR: 'WORKS.ARCHIVE_ERROR',
+    ARCHIVED_TAB: 'WORKS.ARCHIVED_TAB',
+    VIEW_ARCHIVED: 'WORKS.VIEW_ARCHIVED',
+    RESTORE: 'WORKS.RESTORE',
+    RESTORE_SUCCESS: 'WORKS.RESTORE_SUCCESS',
+    RESTORE_ERROR: 'WORKS.RESTORE_ERROR',
+    RESTORED_TAG: 'WORKS.RESTORED_TAG',
+    SEARCH_PLACEHOLDER: 'WORKS.SEARCH_PLACEHOLDER',
+    BASIC_INFO: 'WORKS.BASIC_INFO',
+    WORK_TYPE: 'WORKS.WORK_TYPE',
+    WORK_TYPE_STANDARD: 'WORKS.WORK_TYPE_STANDARD',
+    WORK_TYPE_STANDARD_DESC: 'WORKS.WORK_TYPE_STANDARD_DESC',
+    WORK_TYPE_INSTRUMENTAL: 'WORKS.WORK_TYPE_INSTRUMENTAL',
+    WORK_TYPE_INSTRUMENTAL_DESC: 'WORKS.WORK_TYPE_INSTRUMENTAL_DESC',
+    WORK_TYPE_REMIX: 'WORKS.WORK_TYPE_REMIX',
+    WORK_TYPE_REMIX_DESC: 'WORKS.WORK_TYPE_REMIX_DESC',
+    WORK_TYPE_LABEL: {
+      standard: 'WORKS.WORK_TYPE_LABEL.standard',
+      instrumental: 'WORKS.WORK_TYPE_LABEL.instrumental',
+      remix: 'WORKS.WORK_TYPE_LABEL.remix',
+    },
+    WORK_TITLE: 'WORKS.WORK_TITLE',
+    RELEASE_TITLE: 'WORKS.RELEASE_TITLE',
+    TITLE_REQUIRED: 'WORKS.TITLE_REQUIRED',
+    ALTERNATIVE_TITLES: 'WORKS.ALTERNATIVE_TITLES',
+    ALTERNATIVE_TITLES_HINT: 'WORKS.ALTERNATIVE_TITLES_HINT',
+    ADD_ALTERNATIVE_TITLE: 'WORKS.ADD_ALTERNATIVE_TITLE',
+    STATUS: 'WORKS.STATUS',
+    IDENTIFICATION_CODES: 'WORKS.IDENTIFICATION_CODES',
+    ISRC: 'WORKS.ISRC',
+    ISWC: 'WORKS.ISWC',
+    ISRC_FORMAT: 'WORKS.ISRC_FORMAT',
+    ISWC_FORMAT: 'WORKS.ISWC_FORMAT',
+    ISRC_INVALID: 'WORKS.ISRC_INVALID',
+    ISWC_INVALID: 'WORKS.ISWC_INVALID',
+    DURATION_AND_DATES: 'WORKS.DURATION_AND_DATES',
+    DURATION: 'WORKS.DURATION',
+    DURATION_MODE: {
+      LABEL: 'WORKS.DURATION_MODE.LABEL',
+      HMS: 'WORKS.DURATION_MODE.HMS',
+      SECONDS: 'WORKS.DURATION_MODE.SECONDS',
+    },
+    HOURS: 'WORKS.HOURS',
+    MINUTES: 'WORKS.MINUTES',
+    SECONDS: 'WORKS.SECONDS',
+    RECORDING_DATE: 'WORKS.RECORDING_DATE',
+    RELEASE_DATE: 'WORKS.RELEASE_DATE',
+    GENRE_AND_LANGUAGES: 'WORKS.GENRE_AND_LANGUAGES',
+    GENRE: 'WORKS.GENRE',
+    SELECT_GENRE: 'WORKS.SELECT_GENRE',
+    LANGUAGES: 'WORKS.LANGUAGES',
+    LANGUAGES_NOTICE: 'WORKS.LANGUAGES_NOTICE',
+    LANGUAGES_HINT: 'WORKS.LANGUAGES_HINT',
+    PRIMARY_LANGUAGE: 'WORKS.PRIMARY_LANGUAGE',
+    PRIMARY_LANGUAGES: 'WORKS.PRIMARY_LANGUAGES',
+    PRIMARY_LANGUAGE_PLACEHOLDER: 'WORKS.PRIMARY_LANGUAGE_PLACEHOLDER',
+    SECONDARY_LANGUAGES: 'WORKS.SECONDARY_LANGUAGES',
+    SECONDARY_LANGUAGES_HINT: 'WORKS.SECONDARY_LANGUAGES_HINT',
+    SECONDARY_LANGUAGE_PLACEHOLDER: 'WORKS.SECONDARY_LANGUAGE_PLACEHOLDER',
+    CUSTOM_LANGUAGE_PLACEHOLDER: 'WORKS.CUSTOM_LANGUAGE_PLACEHOLDER',
+    LANGUAGE_NOT_IN_LIST: 'WORKS.LANGUAGE_NOT_IN_LIST',
+    ADD_PRIMARY_LANGUAGE: 'WORKS.ADD_PRIMARY_LANGUAGE',
+    ADD_SECONDARY_LANGUAGE: 'WORKS.ADD_SECONDARY_LANGUAGE',
+    LANGUAGES_PRIMARY_PREFIX: 'WORKS.LANGUAGES_PRIMARY_PREFIX',
+    LANGUAGES_SECONDARY_PREFIX: 'WORKS.LANGUAGES_SECONDARY_PREFIX',
+    COVER_VERSION_INFO: 'WORKS.COVER_VERSION_INFO',
+    IS_COVER_VERSION: 'WORKS.IS_COVER_VERSION',
+    ORIGINAL_WORK_TITLE: 'WORKS.ORIGINAL_WORK_TITLE',
+    ORIGINAL_TITLE_REQUIRED: 'WORKS.ORIGINAL_TITLE_REQUIRED',
+    ORIGINAL_WORK_ISRC: 'WORKS.ORIGINAL_WORK_ISRC',
+    ORIGINAL_WORK_ISWC: 'WORKS.ORIGINAL_WORK_ISWC',
+    ORIGINAL_WORK_INFO: 'WORKS.ORIGINAL_WORK_INFO',
+    ORIGINAL_WORK_INFO_HINT: 'WORKS.ORIGINAL_WORK_INFO_HINT',
+    SAMPLE_DISCLOSURE_TITLE: 'WORKS.SAMPLE_DISCLOSURE_TITLE',
+    SAMPLE_100_HUMAN: 'WORKS.SAMPLE_100_HUMAN',
+    SAMPLE_100_HUMAN_HINT: 'WORKS.SAMPLE_100_HUMAN_HINT',
+    SAMPLE_LIBRARY_USAGE: 'WORKS.SAMPLE_LIBRARY_USAGE',
+    SAMPLE_LIBRARY_USAGE_HINT: 'WORKS.SAMPLE_LIBRARY_USAGE_HINT',
+    SAMPLE_LIBRARY_NAMES_LABEL: 'WORKS.SAMPLE_LIBRARY_NAMES_LABEL',
+    SAMPLE_LIBRARY_NAMES_PLACEHOLDER: 'WORKS.SAMPLE_LIBRARY_NAMES_PLACEHOLDER',
+    SAMPLE_LIBRARY_NAMES_REQUIRED: 'WORKS.SAMPLE_LIBRARY_NAMES_REQUIRED',
+    SAMPLE_LICENSE_CONFIRM: 'WORKS.SAMPLE_LICENSE_CONFIRM',
+    SAMPLE_LICENSE_REQUIRED: 'WORKS.SAMPLE_LICENSE_REQUIRED',
+    SAMPLE_WARNING_TITLE: 'WORKS.SAMPLE_WARNING_TITLE',
+    SAMPLE_WARNING_TEXT: 'WORKS.SAMPLE_WARNING_TEXT',
+    REMIX_ORIGINALS_TITLE: 'WORKS.REMIX_ORIGINALS_TITLE',
+    REMIX_ORIGINALS_HINT: 'WORKS.REMIX_ORIGINALS_HINT',
+    REMIX_ORIGINAL_LABEL: 'WORKS.REMIX_ORIGINAL_LABEL',
+    REMIX_ORIGINAL_TITLE: 'WORKS.REMIX_ORIGINAL_TITLE',
+    REMIX_ORIGINAL_TITLE_PLACEHOLDER: 'WORKS.REMIX_ORIGINAL_TITLE_PLACEHOLDER',
+    REMIX_ORIGINAL_TITLE_REQUIRED: 'WORKS.REMIX_ORIGINAL_TITLE_REQUIRED',
+    REMIX_ORIGINAL_ISRC: 'WORKS.REMIX_ORIGINAL_ISRC',
+    REMIX_ORIGINAL_ISRC_INVALID: 'WORKS.REMIX_ORIGINAL_ISRC_INVALID',
+    REMIX_ORIGINAL_ISWC: 'WORKS.REMIX_ORIGINAL_ISWC',
+    REMIX_ORIGINAL_ISWC_INVALID: 'WORKS.REMIX_ORIGINAL_ISWC_INVALID',
+    REMIX_ORIGINAL_NOTES: 'WORKS.REMIX_ORIGINAL_NOTES',
+    REMIX_ORIGINAL_NOTES_PLACEHOLDER: 'WORKS.REMIX_ORIGINAL_NOTES_PLACEHOLDER',
+    ADD_ORIGINAL_WORK: 'WORKS.ADD_ORIGINAL_WORK',
+    REMOVE_ORIGINAL_WORK: 'WORKS.REMOVE_ORIGINAL_WORK',
+    ADDITIONAL_NOTES: 'WORKS.ADDITIONAL_NOTES',
+    NOTES: 'WORKS.NOTES',
+    MANAGE_SPLITS: 'WORKS.MANAGE_SPLITS',
+    REVIEW_AND_SUBMIT: 'WORKS.REVIEW_AND_SUBMIT',
+    REVIEW_AND_SAVE: 'WORKS.REVIEW_AND_SAVE',
+    REVIEW_MODAL: {
+      TITLE: 'WORKS.REVIEW_MODAL.TITLE',
+      DESCRIPTION: 'WORKS.REVIEW_MODAL.DESCRIPTION',
+      SECTIONS: {
+        BASIC: 'WORKS.REVIEW_MODAL.SECTIONS.BASIC',
+        PRODUCTION: 'WORKS.REVIEW_MODAL.SECTIONS.PRODUCTION',
+        IDENTIFIERS: 'WORKS.REVIEW_MODAL.SECTIONS.IDENTIFIERS',
+        TIMING: 'WORKS.REVIEW_MODAL.SECTIONS.TIMING',
+        COVER: 'WORKS.REVIEW_MODAL.SECTIONS.COVER',
+        REMIX: 'WORKS.REVIEW_MODAL.SECTIONS.REMIX',
+        AI: 'WORKS.REVIEW_MODAL.SECTIONS.AI',
+      },
+      FIELDS: {
+        TITLE: 'WORKS.REVIEW_MODAL.FIELDS.TITLE',
+        WORK_TYPE: 'WORKS.REVIEW_MODAL.FIELDS.WORK_TYPE',
+        STATUS: 'WORKS.REVIEW_MODAL.FIELDS.STATUS',
+        GENRE: 'WORKS.REVIEW_MODAL.FIELDS.GENRE',
+        LANGUAGES: 'WORKS.REVIEW_MODAL.FIELDS.LANGUAGES',
+        ALTERNATIVE_TITLES: 'WORKS.REVIEW_MODAL.FIELDS.ALTERNATIVE_TITLES',
+        NOTES: 'WORKS.REVIEW_MODAL.FIELDS.NOTES',
+        ISRC: 'WORKS.REVIEW_MODAL.FIELDS.ISRC',
+        ISWC: 'WORKS.REVIEW_MODAL.FIELDS.ISWC',
+        RECORDING_DATE: 'WORKS.REVIEW_MODAL.FIELDS.RECORDING_DATE',
+        RELEASE_DATE: 'WORKS.REVIEW_MODAL.FIELDS.RELEASE_DATE',
+        DURATION: 'WORKS.REVIEW_MODAL.FIELDS.DURATION',
+        COVER: 'WORKS.REVIEW_MODAL.FIELDS.COVER',
+        ORIGINAL_TITLE: 'WORKS.REVIEW_MODAL.FIELDS.ORIGINAL_TITLE',
+        IS_100_PERCENT_HUMAN: 'WORKS.REVIEW_MODAL.FIELDS.IS_100_PERCENT_HUMAN',
+        USES_SAMPLE_LIBRARIES: 'WORKS.REVIEW_MODAL.FIELDS.USES_SAMPLE_LIBRARIES',
+        SAMPLE_LIBRARY_NAMES: 'WORKS.REVIEW_MODAL.FIELDS.SAMPLE_LIBRARY_NAMES',
+        HAS_COMMERCIAL_LICENSE: 'WORKS.REVIEW_MODAL.FIELDS.HAS_COMMERCIAL_LICENSE',
+      },
+      ACTIONS: {
+        BACK: 'WORKS.REVIEW_MODAL.ACTIONS.BACK',
+        CONFIRM: 'WORKS.REVIEW_MODAL.ACTIONS.CONFIRM',
+        DOWNLOAD_WORK_DATA: 'WORKS.REVIEW_MODAL.ACTIONS.DOWNLOAD_WORK_DATA',
+        DOWNLOAD_WORK_DATA_HINT: 'WORKS.REVIEW_MODAL.ACTIONS.DOWNLOAD_WORK_DATA_HINT',
+      },
+      EMPTY: {
+        NOT_SET: 'WORKS.REVIEW_MODAL.EMPTY.NOT_SET',
+        NO_LANGUAGES: 'WORKS.REVIEW_MODAL.EMPTY.NO_LANGUAGES',
+        NO_ALTERNATIVE_TITLES: 'WORKS.REVIEW_MODAL.EMPTY.NO_ALTERNATIVE_TITLES',
+        NO_NOTES: 'WORKS.REVIEW_MODAL.EMPTY.NO_NOTES',
+        NOT_APPLICABLE: 'WORKS.REVIEW_MODAL.EMPTY.NOT_APPLICABLE',
+      },
+    },
+    VIEW_CHANGES: 'WORKS.VIEW_CHANGES',
+    CHANGE_HISTORY: {
+      TITLE: 'WORKS.CHANGE_HISTORY.TITLE',
+      DESCRIPTION: 'WORKS.CHANGE_HISTORY.DESCRIPTION',
+      ERROR: 'WORKS.CHANGE_HISTORY.ERROR',
+      EMPTY_STATE: 'WORKS.CHANGE_HISTORY.EMPTY_STATE',
+      CHANGED_FIELD: 'WORKS.CHANGE_HISTORY.CHANGED_FIELD',
+      OLD_VALUE: 'WORKS.CHANGE_HISTORY.OLD_VALUE',
+      NEW_VALUE: 'WORKS.CHANGE_HISTORY.NEW_VALUE',
+      CHANGED_BY: 'WORKS.CHANGE_HISTORY.CHANGED_BY',
+      CHANGED_AT: 'WORKS.CHANGE_HISTORY.CHANGED_AT',
+      NOTES: 'WORKS.CHANGE_HISTORY.NOTES',
+      SUMMARY: 'WORKS.CHANGE_HISTORY.SUMMARY',
+      EMPTY: 'WORKS.CHANGE_HISTORY.EMPTY',
+      UNKNOWN_FIELD: 'WORKS.CHANGE_HISTORY.UNKNOWN_FIELD',
+      UNKNOWN_USER: 'WORKS.CHANGE_HISTORY.UNKNOWN_USER',
+      TYPE: {
+        WORK_CREATE: 'WORKS.CHANGE_HISTORY.TYPE.WORK_CREATE',
+        WORK_UPDATE: 'WORKS.CHANGE_HISTORY.TYPE.WORK_UPDATE',
+        WORK_DELETE: 'WORKS.CHANGE_HISTORY.TYPE.WORK_DELETE',
+        SPLIT_CREATE: 'WORKS.CHANGE_HISTORY.TYPE.SPLIT_CREATE',
+        SPLIT_UPDATE: 'WORKS.CHANGE_HISTORY.TYPE.SPLIT_UPDATE',
+        SPLIT_DELETE: 'WORKS.CHANGE_HISTORY.TYPE.SPLIT_DELETE',
+        HISTORY_SNAPSHOT: 'WORKS.CHANGE_HISTORY.TYPE.HISTORY_SNAPSHOT',
+        UNKNOWN: 'WORKS.CHANGE_HISTORY.TYPE.UNKNOWN',
+      },
+    },
+    SUBMISSION_SUCCESS: {
+      CREATED_TITLE: 'WORKS.SUBMISSION_SUCCESS.CREATED_TITLE',
+      UPDATED_TITLE: 'WORKS.SUBMISSION_SUCCESS.UPDATED_TITLE',
+      CREATED_BODY: 'WORKS.SUBMISSION_SUCCESS.CREATED_BODY',
+      UPDATED_BODY: 'WORKS.SUBMISSION_SUCCESS.UPDATED_BODY',
+      PRIMARY_CREATE: 'WORKS.SUBMISSION_SUCCESS.PRIMARY_CREATE',
+      PRIMARY_UPDATE: 'WORKS.SUBMISSION_SUCCESS.PRIMARY_UPDATE',
+      SECONDARY_CREATE: 'WORKS.SUBMISSION_SUCCESS.SECONDARY_CREATE',
+      SECONDARY_UPDATE: 'WORKS.SUBMISSION_SUCCESS.SECONDARY_UPDATE',
+      TERTIARY: 'WORKS.SUBMISSION_SUCCESS.TERTIARY',
+    },
+    ALERTS: {
+      CREATE_SUCCESS: 'WORKS.ALERTS.CREATE_SUCCESS',
+      UPDATE_SUCCESS: 'WORKS.ALERTS.UPDATE_SUCCESS',
+      SUBMIT_FAILED: 'WORKS.ALERTS.SUBMIT_FAILED',
+      MISSING_WORK_ID: 'WORKS.ALERTS.MISSING_WORK_ID',
+    },
+  },
+  WORKSPACE: {
+    CREATE_TITLE: 'WORKSPACE.CREATE_TITLE',
+    CREATE_SUBTITLE: 'WORKSPACE.CREATE_SUBTITLE',
+    NAME: 'WORKSPACE.NAME',
+    NAME_REQUIRED: 'WORKSPACE.NAME_REQUIRED',
+    NAME_MIN_LENGTH: 'WORKSPACE.NAME_MIN_LENGTH',
+    TYPE: 'WORKSPACE.TYPE',
+    DESCRIPTION: 'WORKSPACE.DESCRIPTION',
+    CREATE_WORKSPACE: 'WORKSPACE.CREATE_WORKSPACE',
+    CREATION_ERROR: 'WORKSPACE.CREATION_ERROR',
+    YOUR_WORKSPACES: 'WORKSPACE.YOUR_WORKSPACES',
+    NO_WORKSPACES: 'WORKSPACE.NO_WORKSPACES',
+    CREATE_FIRST: 'WORKSPACE.CREATE_FIRST',
+    MANAGE_WORKSPACES: 'WORKSPACE.MANAGE_WORKSPACES',
+    PROJECT: 'WORKSPACE.PROJECT',
+    CREATE_PROJECT: 'WORKSPACE.CREATE_PROJECT',
+    YOUR_PROJECTS: 'WORKSPACE.YOUR_PROJECTS',
+    NEW_PROJECT: 'WORKSPACE.NEW_PROJECT',
+    CURRENT: 'WORKSPACE.CURRENT',
+    NO_PROJECTS_YET: 'WORKSPACE.NO_PROJECTS_YET',
+    CREATE_FIRST_PROJECT: 'WORKSPACE.CREATE_FIRST_PROJECT',
+    CREATE_NEW_PROJECT: 'WORKSPACE.CREATE_NEW_PROJECT',
+    PROJECT_NAME: 'WORKSPACE.PROJECT_NAME',
+    PROJECT_TYPE: 'WORKSPACE.PROJECT_TYPE',
+    SELECT_TYPE: 'WORKSPACE.SELECT_TYPE',
+    NAME_PLACEHOLDER: 'WORKSPACE.NAME_PLACEHOLDER',
+    TYPE_REQUIRED: 'WORKSPACE.TYPE_REQUIRED',
+    DESCRIPTION_PLACEHOLDER: 'WORKSPACE.DESCRIPTION_PLACEHOLDER',
+    DESCRIPTION_HINT: 'WORKSPACE.DESCRIPTION_HINT',
+    CREATE_PROJECT_BTN: 'WORKSPACE.CREATE_PROJECT_BTN',
+    TYPE_SINGLE: 'WORKSPACE.TYPE_SINGLE',
+    TYPE_EP: 'WORKSPACE.TYPE_EP',
+    TYPE_ALBUM: 'WORKSPACE.TYPE_ALBUM',
+    TYPE_COLLECTION: 'WORKSPACE.TYPE_COLLECTION',
+  },
+  WORKSPACE_TYPES: {
+    BAND: 'WORKSPACE_TYPES.BAND',
+    LABEL: 'WORKSPACE_TYPES.LABEL',
+    PUBLISHER: 'WORKSPACE_TYPES.PUBLISHER',
+    STUDIO: 'WORKSPACE_TYPES.STUDIO',
+    MANAGEMENT: 'WORKSPACE_TYPES.MANAGEMENT',
+    OTHER: 'WORKSPACE_TYPES.OTHER',
+  },
+  role: {
+    group: {
+      creative: 'role.group.creative',
+      technical: 'role.group.technical',
+      business: 'role.group.business',
+      rightsLegal: 'role.group.rightsLegal',
+      live: 'role.group.live',
+      visual: 'role.group.visual',
+      secondary: {
+        artistsCreative: 'role.group.secondary.artistsCreative',
+        songwritingComposition: 'role.group.secondary.songwritingComposition',
+        productionAudio: 'role.group.secondary.productionAudio',
+        recordLabel: 'role.group.secondary.recordLabel',
+        digitalDistribution: 'role.group.secondary.digitalDistribution',
+        marketingGrowth: 'role.group.secondary.marketingGrowth',
+        promotionPR: 'role.group.secondary.promotionPR',
+        publishingRights: 'role.group.secondary.publishingRights',
+        legalBusiness: 'role.group.secondary.legalBusiness',
+        prosCmos: 'role.group.secondary.prosCmos',
+        financeRoyalties: 'role.group.secondary.financeRoyalties',
+        artistManagement: 'role.group.secondary.artistManagement',
+        liveTouring: 'role.group.secondary.liveTouring',
+        visualContent: 'role.group.secondary.visualContent',
+        syncMedia: 'role.group.secondary.syncMedia',
+        musicTech: 'role.group.secondary.musicTech',
+        educationSupport: 'role.group.secondary.educationSupport',
+      },
+    },
+    artist: 'role.artist',
+    songwriter: 'role.songwriter',
+    composer: 'role.composer',
+    lyricist: 'role.lyricist',
+    producer: 'role.producer',
+    dj: 'role.dj',
+    recording_engineer: 'role.recording_engineer',
+    mixing_engineer: 'role.mixing_engineer',
+    mastering_engineer: 'role.mastering_engineer',
+    artist_manager: 'role.artist_manager',
+    booking_agent: 'role.booking_agent',
+    label_rep: 'role.label_rep',
+    a_and_r: 'role.a_and_r',
+    cmo: 'role.cmo',
+    publisher_rep: 'role.publisher_rep',
+    sync_licensing: 'role.sync_licensing',
+    royalty_analyst: 'role.royalty_analyst',
+    pro_cmo_worker: 'role.pro_cmo_worker',
+    music_lawyer: 'role.music_lawyer',
+    business_affairs: 'role.business_affairs',
+    tour_manager: 'role.tour_manager',
+    promoter: 'role.promoter',
+    venue_booker: 'role.venue_booker',
+    visual_artist: 'role.visual_artist',
+    creative_director: 'role.creative_director',
+    video_director: 'role.video_director',
+    recording_artist: 'role.recording_artist',
+    performing_artist: 'role.performing_artist',
+    singer_vocalist: 'role.singer_vocalist',
+    rapper_mc: 'role.rapper_mc',
+    instrumentalist: 'role.instrumentalist',
+    session_musician: 'role.session_musician',
+    touring_musician: 'role.touring_musician',
+    featured_artist: 'role.featured_artist',
+    film_tv_composer: 'role.film_tv_composer',
+    game_composer: 'role.game_composer',
+    arranger: 'role.arranger',
+    orchestrator: 'role.orchestrator',
+    topliner: 'role.topliner',
+    music_producer: 'role.music_producer',
+    executive_producer: 'role.executive_producer',
+    beatmaker: 'role.beatmaker',
+    audio_engineer: 'role.audio_engineer',
+    sound_designer: 'role.sound_designer',
+    studio_engineer: 'role.studio_engineer',
+    studio_owner: 'role.studio_owner',
+    daw_operator: 'role.daw_operator',
+    vocal_producer: 'role.vocal_producer',
+    label_owner: 'role.label_owner',
+    label_president: 'role.label_president',
+    label_manager: 'role.label_manager',
+    label_general_manager: 'role.label_general_manager',
+    head_of_a_and_r: 'role.head_of_a_and_r',
+    a_and_r_manager: 'role.a_and_r_manager',
+    a_and_r_scout: 'role.a_and_r_scout',
+    product_manager_label: 'role.product_manager_label',
+    catalog_manager: 'role.catalog_manager',
+    repertoire_manager: 'role.repertoire_manager',
+    digital_distribution_manager: 'role.digital_distribution_manager',
+    distribution_operations_specialist: 'role.distribution_operations_specialist',
+    dsp_relations_manager: 'role.dsp_relations_manager',
+    content_delivery_manager: 'role.content_delivery_manager',
+    release_manager: 'role.release_manager',
+    metadata_specialist: 'role.metadata_specialist',
+    isrc_upc_administrator: 'role.isrc_upc_administrator',
+    content_ingestion_specialist: 'role.content_ingestion_specialist',
+    platform_partnerships_manager: 'role.platform_partnerships_manager',
+    chief_marketing_officer: 'role.chief_marketing_officer',
+    vp_marketing: 'role.vp_marketing',
+    head_of_digital_marketing: 'role.head_of_digital_marketing',
+    growth_marketing_manager: 'role.growth_marketing_manager',
+    marketing_manager: 'role.marketing_manager',
+    music_marketing_manager: 'role.music_marketing_manager',
+    campaign_manager: 'role.campaign_manager',
+    audience_development_manager: 'role.audience_development_manager',
+    crm_manager: 'role.crm_manager',
+    ecommerce_manager_music: 'role.ecommerce_manager_music',
+    direct_to_fan_manager: 'role.direct_to_fan_manager',
+    publicist: 'role.publicist',
+    pr_manager: 'role.pr_manager',
+    head_of_communications: 'role.head_of_communications',
+    radio_promoter: 'role.radio_promoter',
+    press_officer: 'role.press_officer',
+    media_relations_manager: 'role.media_relations_manager',
+    playlist_pitching_manager: 'role.playlist_pitching_manager',
+    influencer_marketing_manager: 'role.influencer_marketing_manager',
+    music_publisher: 'role.music_publisher',
+    head_of_publishing: 'role.head_of_publishing',
+    publishing_administrator: 'role.publishing_administrator',
+    sub_publishing_manager: 'role.sub_publishing_manager',
+    copyright_administrator: 'role.copyright_administrator',
+    rights_administrator: 'role.rights_administrator',
+    royalty_administrator: 'role.royalty_administrator',
+    licensing_manager: 'role.licensing_manager',
+    sync_licensing_manager: 'role.sync_licensing_manager',
+    entertainment_lawyer: 'role.entertainment_lawyer',
+    music_attorney: 'role.music_attorney',
+    general_counsel: 'role.general_counsel',
+    head_of_legal: 'role.head_of_legal',
+    business_affairs_manager: 'role.business_affairs_manager',
+    contracts_manager: 'role.contracts_manager',
+    contract_administrator: 'role.contract_administrator',
+    compliance_officer: 'role.compliance_officer',
+    ip_counsel: 'role.ip_counsel',
+    pro_executive: 'role.pro_executive',
+    pro_member_relations_manager: 'role.pro_member_relations_manager',
+    cmo_officer: 'role.cmo_officer',
+    rights_registration_specialist: 'role.rights_registration_specialist',
+    works_registration_manager: 'role.works_registration_manager',
+    distribution_analyst_pro_cmo: 'role.distribution_analyst_pro_cmo',
+    royalty_distribution_manager: 'role.royalty_distribution_manager',
+    repertoire_documentation_specialist: 'role.repertoire_documentation_specialist',
+    chief_financial_officer: 'role.chief_financial_officer',
+    finance_director: 'role.finance_director',
+    music_accountant: 'role.music_accountant',
+    royalty_accountant: 'role.royalty_accountant',
+    revenue_analyst: 'role.revenue_analyst',
+    audit_manager: 'role.audit_manager',
+    financial_controller: 'role.financial_controller',
+    payments_payouts_manager: 'role.payments_payouts_manager',
+    business_manager: 'role.business_manager',
+    road_manager: 'role.road_manager',
+    talent_agent: 'role.talent_agent',
+    artist_development_manager: 'role.artist_development_manager',
+    concert_promoter: 'role.concert_promoter',
+    touring_promoter: 'role.touring_promoter',
+    festival_director: 'role.festival_director',
+    stage_manager: 'role.stage_manager',
+    production_manager: 'role.production_manager',
+    foh_engineer: 'role.foh_engineer',
+    monitor_engineer: 'role.monitor_engineer',
+    lighting_designer: 'role.lighting_designer',
+    music_video_director: 'role.music_video_director',
+    video_producer: 'role.video_producer',
+    videographer: 'role.videographer',
+    photographer: 'role.photographer',
+    motion_designer: 'role.motion_designer',
+    graphic_designer: 'role.graphic_designer',
+    brand_designer: 'role.brand_designer',
+    art_director: 'role.art_director',
+    music_supervisor: 'role.music_supervisor',
+    sync_agent: 'role.sync_agent',
+    sync_coordinator: 'role.sync_coordinator',
+    licensing_executive: 'role.licensing_executive',
+    audio_post_production_supervisor: 'role.audio_post_production_supervisor',
+    dsp_editor_curator: 'role.dsp_editor_curator',
+    playlist_editor: 'role.playlist_editor',
+    music_data_analyst: 'role.music_data_analyst',
+    analytics_manager: 'role.analytics_manager',
+    rights_data_manager: 'role.rights_data_manager',
+    content_policy_manager: 'role.content_policy_manager',
+    trust_safety_manager_music: 'role.trust_safety_manager_music',
+    music_industry_consultant: 'role.music_industry_consultant',
+    artist_coach: 'role.artist_coach',
+    music_educator: 'role.music_educator',
+    university_lecturer_music_business: 'role.university_lecturer_music_business',
+    career_development_advisor: 'role.career_development_advisor',
+  },
+} as const;
+
+type Leaves<T> = T extends string ? T : { [K in keyof T]: Leaves<T[K]> }[keyof T];
+
+export type I18nKey = Leaves<typeof I18N_KEYS>;
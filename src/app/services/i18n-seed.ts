@@ -0,0 +1,23 @@
+import { TranslationObject } from '@ngx-translate/core';
+
+/** `<script id="i18n-seed">` in the built `index.html`, written by `python -m tools.i18n inline`. */
+export interface I18nSeed {
+  lang: string;
+  /** Namespace bundles as the build shipped them, by name. */
+  bundles: Record<string, { hash: string; data: TranslationObject }>;
+}
+
+export const I18N_SEED_ID = 'i18n-seed';
+
+/** The seed embedded in `document`, or null when the page has none (e.g. `ng serve`). */
+export function readSeed(document: Document): I18nSeed | null {
+  const text = document.getElementById(I18N_SEED_ID)?.textContent;
+  if (!text) {
+    return null;
+  }
+  try {
+    return JSON.parse(text) as I18nSeed;
+  } catch {
+    return null;
+  }
+}
@@ -1,7 +1,8 @@
 import { Injectable, inject } from '@angular/core';
-import { HttpClient } from '@angular/common/http';
+import { NavigationEnd, NavigationStart, Router } from '@angular/router';
 import { TranslateService } from '@ngx-translate/core';
-import { BehaviorSubject, Observable, of, switchMap, tap } from 'rxjs';
+import { BehaviorSubject, Observable, filter, of, switchMap, tap } from 'rxjs';
+import { HashedTranslateLoader } from './hashed-translate-loader';
 
 export interface AppLanguage {
   code: string;
@@ -11,8 +12,9 @@ export interface AppLanguage {
 
 @Injectable({ providedIn: 'root' })
 export class LanguageService {
-  private http = inject(HttpClient);
+  private loader = inject(HashedTranslateLoader);
   private translate = inject(TranslateService);
+  private router = inject(Router);
 
   readonly languages: AppLanguage[] = [
     { code: 'en', label: 'English', flag: '🇬🇧' },
@@ -21,14 +23,35 @@ export class LanguageService {
     { code: 'ua', label: 'Українська', flag: '🇺🇦' },
   ];
 
+  private readonly defaultLang = 'en';
+  private readonly storageKey = 'language';
   private readonly loadedLanguages = new Set<string>();
-  private readonly currentLangSubject = new BehaviorSubject<string>('en');
+  private readonly currentLangSubject = new BehaviorSubject<string>(this.defaultLang);
   readonly currentLang$ = this.currentLangSubject.asObservable();
+  /** Set once English is registered as ngx-translate's fallback (unbuilt catalogs only). */
+  private defaultLangReady = false;
 
   constructor() {
-    // Ensure default language is ready
-    this.translate.setDefaultLang('en');
-    this.setLanguage('en').subscribe();
+    // Strings inlined into index.html (the landing page's) render before the first fetch.
+    const initial = this.storedLanguage();
+    const seed = this.loader.seedTranslations(initial);
+    if (seed) {
+      this.translate.setTranslation(initial, seed, true);
+      this.translate.use(initial);
+    }
+    this.setLanguage(initial).subscribe();
+
+    // Fetch the next route's strings while its chunk loads; NavigationEnd covers redirects.
+    this.router.events
+      .pipe(
+        filter(
+          (event): event is NavigationStart | NavigationEnd =>
+            event instanceof NavigationStart || event instanceof NavigationEnd
+        )
+      )
+      .subscribe(event => {
+        this.loadRoute(event instanceof NavigationEnd ? event.urlAfterRedirects : event.url);
+      });
   }
 
   get currentLang(): string {
@@ -39,20 +62,82 @@ export class LanguageService {
     const target = code || this.currentLangSubject.value;
 
     return this.loadLanguage(target).pipe(
+      switchMap(() => this.ensureFallback(target)),
       tap(() => {
         this.translate.use(target);
         this.currentLangSubject.next(target);
+        this.storeLanguage(target);
       }),
       switchMap(() => of(target))
     );
   }
 
+  /**
+   * Built locales already contain English for their missing keys; only the plain
+   * source files (no i18n build) still need English loaded as ngx-translate's default.
+   */
+  private ensureFallback(code: string): Observable<unknown> {
+    if (code === this.defaultLang || this.defaultLangReady) {
+      return of(true);
+    }
+    return this.loader.fallbackMerged().pipe(
+      switchMap(merged =>
+        merged
+          ? of(true)
+          : this.loadLanguage(this.defaultLang).pipe(
+              tap(() => {
+                this.translate.setDefaultLang(this.defaultLang);
+                this.defaultLangReady = true;
+              })
+            )
+      )
+    );
+  }
+
+  private loadRoute(url: string): void {
+    // Without merged catalogs the default language backs missing keys, so it needs the route's strings too.
+    const codes = this.defaultLangReady ? [this.currentLang, this.defaultLang] : [this.currentLang];
+    for (const code of new Set(codes)) {
+      if (!this.loadedLanguages.has(code)) {
+        continue;
+      }
+      this.loader.loadRoute(code, url).subscribe({
+        next: translations => {
+          if (translations) {
+            this.translate.setTranslation(code, translations, true);
+          }
+        },
+        error: error => console.error('Failed to load route translations', error)
+      });
+    }
+  }
+
+  /** Prerendered legal page in the language the user picked (see `tools/i18n/legal.py`). */
+  legalPageUrl(page: string): string {
+    return `/legal/${page}.${this.storedLanguage()}.html`;
+  }
+
+  private storedLanguage(): string {
+    if (typeof window === 'undefined') return this.defaultLang;
+    const stored = localStorage.getItem(this.storageKey);
+    return this.languages.some(language => language.code === stored) ? stored! : this.defaultLang;
+  }
+
+  private storeLanguage(code: string): void {
+    if (typeof window === 'undefined') return;
+    try {
+      localStorage.setItem(this.storageKey, code);
+    } catch (error) {
+      console.warn('Unable to remember the selected language.', error);
+    }
+  }
+
   private loadLanguage(code: string): Observable<any> {
     if (this.loadedLanguages.has(code)) {
       return of(true);
     }
 
-    return this.http.get<Record<string, any>>(`/assets/i18n/${code}.json`).pipe(
+    return this.loader.getTranslation(code).pipe(
       tap(translations => {
         this.translate.setTranslation(code, translations, true);
         this.loadedLanguages.add(code);
@@ -0,0 +1,30 @@
+import { applyPatch, readArtifact, storeArtifact } from './locale-delta';
+
+describe('applyPatch', () => {
+  it('should add, replace and remove members without touching the original', () => {
+    const doc = { NAV: { HOME: 'Start', OLD: 'Alt' }, TITLE: 'Titel' };
+    const result = applyPatch(doc, [
+      ['replace', '/NAV/HOME', 'Anfang'],
+      ['remove', '/NAV/OLD'],
+      ['add', '/FORM/SAVE', 'Speichern']
+    ]);
+
+    expect(result).toEqual({ NAV: { HOME: 'Anfang' }, TITLE: 'Titel', FORM: { SAVE: 'Speichern' } });
+    expect(doc.NAV.OLD).toBe('Alt');
+  });
+
+  it('should unescape pointer segments', () => {
+    expect(applyPatch({}, [['add', '/a~1b/c~0d', 'x']])).toEqual({ 'a/b': { 'c~d': 'x' } });
+  });
+});
+
+describe('stored artifacts', () => {
+  beforeEach(() => localStorage.clear());
+
+  it('should round-trip through local storage', () => {
+    storeArtifact('de', 'NAV', 'aaaaaaaaaaaa', { NAV: { HOME: 'Start' } });
+
+    expect(readArtifact('de', 'NAV')).toEqual({ hash: 'aaaaaaaaaaaa', data: { NAV: { HOME: 'Start' } } });
+    expect(readArtifact('de', 'WORKS')).toBeNull();
+  });
+});
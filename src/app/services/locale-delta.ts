@@ -0,0 +1,64 @@
+/** Shape of `/assets/i18n/build/versions.json`, written by `python -m tools.i18n build --keep-versions N`. */
+export interface I18nVersions {
+  version: number;
+  keep: number;
+  /** Per locale and artifact stem: current hash, older hashes kept, patch bytes by older hash. */
+  locales: Record<string, Record<string, { current: string; previous: string[]; deltas: Record<string, number> }>>;
+}
+
+/** One operation of `build/<lang>/<stem>.<old>-<new>.json`: JSON-patch names and pointers, array form. */
+export type PatchOperation = ['add' | 'replace', string, unknown] | ['remove', string];
+
+/** A published artifact kept in the browser, so the next version can arrive as a patch. */
+export interface StoredArtifact<T = unknown> {
+  hash: string;
+  data: T;
+}
+
+const STORAGE_PREFIX = 'i18n:';
+
+function unescape(segment: string): string {
+  return segment.replace(/~1/g, '/').replace(/~0/g, '~');
+}
+
+/** `doc` with `ops` applied; `doc` itself is left untouched. Only object members are patched. */
+export function applyPatch<T>(doc: T, ops: PatchOperation[]): T {
+  const result = structuredClone(doc) as Record<string, unknown>;
+  for (const [op, pointer, value] of ops) {
+    const path = pointer.split('/').slice(1).map(unescape);
+    const name = path.pop();
+    if (name === undefined) {
+      continue;
+    }
+    let node = result;
+    for (const segment of path) {
+      const child = node[segment];
+      node = (child && typeof child === 'object' ? child : (node[segment] = {})) as Record<string, unknown>;
+    }
+    if (op === 'remove') {
+      delete node[name];
+    } else {
+      node[name] = value;
+    }
+  }
+  return result as T;
+}
+
+/** The stored copy of `<lang>/<stem>`, or null when none was kept (or storage is unavailable). */
+export function readArtifact<T>(lang: string, stem: string): StoredArtifact<T> | null {
+  try {
+    const raw = localStorage.getItem(`${STORAGE_PREFIX}${lang}/${stem}`);
+    return raw ? (JSON.parse(raw) as StoredArtifact<T>) : null;
+  } catch {
+    return null;
+  }
+}
+
+/** Keeps `data` as the copy of `<lang>/<stem>`; a full storage just means no patch next time. */
+export function storeArtifact(lang: string, stem: string, hash: string, data: unknown): void {
+  try {
+    localStorage.setItem(`${STORAGE_PREFIX}${lang}/${stem}`, JSON.stringify({ hash, data }));
+  } catch {
+    // quota exceeded or storage disabled
+  }
+}
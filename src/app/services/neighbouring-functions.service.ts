@@ -1,5 +1,6 @@
 import { Injectable, inject } from '@angular/core';
 import { SupabaseService } from './supabase.service';
+import { ReferenceDataService } from './reference-data';
 import type {
   NeighbouringFunction,
   NeighbouringFunctionGroup,
@@ -9,8 +10,12 @@ import type {
 @Injectable({ providedIn: 'root' })
 export class NeighbouringFunctionsService {
   private readonly supabase = inject(SupabaseService);
+  private readonly referenceData = inject(ReferenceDataService);
 
   async getAll(): Promise<NeighbouringFunction[]> {
+    const reference = await this.referenceData.load();
+    if (reference) return reference.neighbouringFunctions;
+
     const { data, error } = await this.supabase.client
       .from('neighbouring_functions')
       .select('*')
@@ -22,6 +27,9 @@ export class NeighbouringFunctionsService {
   }
 
   async getByType(type: NeighbouringFunctionType): Promise<NeighbouringFunction[]> {
+    const reference = await this.referenceData.load();
+    if (reference) return reference.functionsByType(type);
+
     const { data, error } = await this.supabase.client
       .from('neighbouring_functions')
       .select('*')
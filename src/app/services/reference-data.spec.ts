@@ -0,0 +1,128 @@
+import { TestBed } from '@angular/core/testing';
+import { provideHttpClient } from '@angular/common/http';
+import { HttpTestingController, provideHttpClientTesting } from '@angular/common/http/testing';
+
+import { ReferenceData, ReferenceDataService, ReferenceSnapshot, hydrateRows } from './reference-data';
+
+const snapshot: ReferenceSnapshot = {
+  version: 1,
+  organizations: {
+    columns: ['id', 'name', 'acronym', 'organization_type', 'country', 'website'],
+    rows: [
+      ['a', 'American Society of Composers, Authors and Publishers', 'ASCAP', 'PRO', 'US', null],
+      ['b', 'Gesellschaft zur Verwertung von Leistungsschutzrechten', 'GVL', 'BOTH', 'DE', null],
+      ['c', 'PRS for Music', 'PRS', 'PRO', 'GB', null]
+    ],
+    byCountry: { US: [0], DE: [1], GB: [2] },
+    byRegion: { Europe: [1, 2], Americas: [0] },
+    byType: { PRO: [2, 0], BOTH: [1] }
+  },
+  neighbouringFunctions: {
+    columns: ['id', 'type', 'function_name', 'display_order'],
+    rows: [
+      [1, 'instrument', 'Guitar', 1],
+      [2, 'voice', 'Lead vocals', 2]
+    ],
+    byType: { instrument: [0], voice: [1] }
+  },
+  securityQuestions: {
+    columns: ['id', 'question_key', 'question_text', 'category'],
+    rows: [[7, 'SECURITY.Q_FIRST_PET', 'What was the name of your first pet?', 'personal']],
+    byCategory: { personal: [0] }
+  },
+  labels: {
+    en: {
+      regions: { Europe: 'Europe' },
+      organizationTypes: { PRO: 'Performing rights organisation' },
+      functionTypes: { voice: 'Voice' },
+      questionCategories: { personal: 'Personal' },
+      securityQuestions: { 'SECURITY.Q_FIRST_PET': 'What was the name of your first pet?' }
+    },
+    de: {
+      regions: { Europe: 'Europa' },
+      organizationTypes: { PRO: 'Aufführungsrechtegesellschaft' },
+      functionTypes: { voice: 'Stimme' },
+      questionCategories: { personal: 'Persönlich' },
+      securityQuestions: { 'SECURITY.Q_FIRST_PET': 'Wie hieß dein erstes Haustier?' }
+    }
+  }
+};
+
+describe('hydrateRows', () => {
+  it('should key each row by the table columns and add the fixed fields', () => {
+    const [guitar] = hydrateRows(snapshot.neighbouringFunctions, { is_active: true });
+    expect(guitar).toEqual({
+      id: 1,
+      type: 'instrument',
+      function_name: 'Guitar',
+      display_order: 1,
+      is_active: true
+    });
+  });
+});
+
+describe('ReferenceData', () => {
+  const data = new ReferenceData(snapshot);
+
+  it('should resolve the indexes in their stored order', () => {
+    expect(data.organizationsByType('PRO').map(org => org.acronym)).toEqual(['PRS', 'ASCAP']);
+    expect(data.organizationsByRegion('Europe').map(org => org.acronym)).toEqual(['GVL', 'PRS']);
+    expect(data.organizationsByCountry('DE')[0].is_active).toBe(true);
+    expect(data.functionsByType('voice').map(fn => fn.function_name)).toEqual(['Lead vocals']);
+  });
+
+  it('should return nothing for a value without an index entry', () => {
+    expect(data.organizationsByCountry('FR')).toEqual([]);
+  });
+
+  it('should fall back to English labels', () => {
+    expect(data.labels('de')?.regions['Europe']).toBe('Europa');
+    expect(data.labels('ua')?.regions['Europe']).toBe('Europe');
+  });
+});
+
+describe('ReferenceDataService', () => {
+  let service: ReferenceDataService;
+  let http: HttpTestingController;
+
+  beforeEach(() => {
+    TestBed.configureTestingModule({
+      providers: [provideHttpClient(), provideHttpClientTesting()]
+    });
+    service = TestBed.inject(ReferenceDataService);
+    http = TestBed.inject(HttpTestingController);
+  });
+
+  afterEach(() => http.verify());
+
+  // Lets the service's awaits run, so its next request has been made.
+  const tick = () => new Promise(resolve => setTimeout(resolve));
+
+  const flush = async (url: string, body: unknown) => {
+    await tick();
+    http.expectOne(url).flush(body);
+  };
+
+  it('should load the hashed asset named by the map once per session', async () => {
+    const first = service.load();
+    const second = service.load();
+
+    const map = { version: 1, reference: 'abc123def456', bytes: 10 };
+    await flush('/assets/reference/reference-map.json', map);
+    await flush('/assets/reference/reference.abc123def456.json', snapshot);
+
+    const data = await first;
+    expect(await second).toBe(data);
+    expect(data?.securityQuestions[0].question_key).toBe('SECURITY.Q_FIRST_PET');
+  });
+
+  it('should resolve to null without a published asset', async () => {
+    const result = service.load();
+    await tick();
+    http
+      .expectOne('/assets/reference/reference-map.json')
+      .flush('', { status: 404, statusText: 'Not Found' });
+
+    expect(await result).toBeNull();
+  });
+});
@@ -0,0 +1,119 @@
+import { Injectable, inject } from '@angular/core';
+import { HttpClient } from '@angular/common/http';
+import { firstValueFrom } from 'rxjs';
+import type { CmoProOrganization, CmoProOrganizationType } from '../models/cmo-pro.model';
+import type { NeighbouringFunction, NeighbouringFunctionType } from '../models/neighbouring-function.model';
+import type { SecurityQuestion } from './auth-recovery.service';
+
+export const REFERENCE_URL = '/assets/reference';
+
+/** Shape of `/assets/reference/reference-map.json`, written by `python -m tools.refdata build`. */
+export interface ReferenceMap {
+  version: number;
+  reference: string;
+  bytes: number;
+}
+
+/** One table of the artifact: rows as value arrays in `columns` order, indexes as row positions. */
+export interface ReferenceTable {
+  columns: string[];
+  rows: unknown[][];
+}
+
+export interface ReferenceLabels {
+  regions: Record<string, string>;
+  organizationTypes: Record<string, string>;
+  functionTypes: Record<string, string>;
+  questionCategories: Record<string, string>;
+  /** By `question_key`. */
+  securityQuestions: Record<string, string>;
+}
+
+/** Shape of `/assets/reference/reference.<hash>.json`. */
+export interface ReferenceSnapshot {
+  version: number;
+  organizations: ReferenceTable & {
+    byCountry: Record<string, number[]>;
+    byRegion: Record<string, number[]>;
+    byType: Record<string, number[]>;
+  };
+  neighbouringFunctions: ReferenceTable & { byType: Record<string, number[]> };
+  securityQuestions: ReferenceTable & { byCategory: Record<string, number[]> };
+  labels: Record<string, ReferenceLabels>;
+}
+
+/** Rows of `table` as objects keyed by its columns, plus the fixed `extra` fields. */
+export function hydrateRows<T>(table: ReferenceTable, extra: Partial<T> = {}): T[] {
+  return table.rows.map(
+    row => Object.assign(Object.fromEntries(table.columns.map((column, i) => [column, row[i]])), extra) as T
+  );
+}
+
+/** The reference tables of one snapshot, with their indexes resolved to records. */
+export class ReferenceData {
+  readonly organizations: CmoProOrganization[];
+  readonly neighbouringFunctions: NeighbouringFunction[];
+  readonly securityQuestions: SecurityQuestion[];
+
+  constructor(private readonly snapshot: ReferenceSnapshot) {
+    this.organizations = hydrateRows<CmoProOrganization>(snapshot.organizations, { is_active: true });
+    this.neighbouringFunctions = hydrateRows<NeighbouringFunction>(snapshot.neighbouringFunctions, {
+      is_active: true
+    });
+    this.securityQuestions = hydrateRows<SecurityQuestion>(snapshot.securityQuestions);
+  }
+
+  organizationsByCountry(country: string): CmoProOrganization[] {
+    return this.pick(this.organizations, this.snapshot.organizations.byCountry[country]);
+  }
+
+  organizationsByRegion(region: string): CmoProOrganization[] {
+    return this.pick(this.organizations, this.snapshot.organizations.byRegion[region]);
+  }
+
+  organizationsByType(type: CmoProOrganizationType): CmoProOrganization[] {
+    return this.pick(this.organizations, this.snapshot.organizations.byType[type]);
+  }
+
+  functionsByType(type: NeighbouringFunctionType): NeighbouringFunction[] {
+    return this.pick(this.neighbouringFunctions, this.snapshot.neighbouringFunctions.byType[type]);
+  }
+
+  /** Labels in `lang`, or in English when the snapshot has none for it. */
+  labels(lang: string): ReferenceLabels | undefined {
+    return this.snapshot.labels[lang] ?? this.snapshot.labels['en'];
+  }
+
+  private pick<T>(records: T[], positions: number[] | undefined): T[] {
+    return (positions ?? []).map(position => records[position]);
+  }
+}
+
+/**
+ * Loads the reference tables from the content-hashed asset `python -m tools.refdata build`
+ * publishes, once per session. Resolves to null when the asset is missing (e.g. `ng serve`
+ * without running the build) so callers can query Supabase instead.
+ */
+@Injectable({ providedIn: 'root' })
+export class ReferenceDataService {
+  private http = inject(HttpClient);
+
+  private request: Promise<ReferenceData | null> | null = null;
+
+  load(): Promise<ReferenceData | null> {
+    this.request ??= this.fetch();
+    return this.request;
+  }
+
+  private async fetch(): Promise<ReferenceData | null> {
+    try {
+      const map = await firstValueFrom(this.http.get<ReferenceMap>(`${REFERENCE_URL}/reference-map.json`));
+      const snapshot = await firstValueFrom(
+        this.http.get<ReferenceSnapshot>(`${REFERENCE_URL}/reference.${map.reference}.json`)
+      );
+      return new ReferenceData(snapshot);
+    } catch {
+      return null;
+    }
+  }
+}
@@ -0,0 +1,30 @@
+import { KeyTree, bundleTree, hydrateShortKeys } from './short-key-catalog';
+
+describe('hydrateShortKeys', () => {
+  const tree: KeyTree = {
+    TITLE: 0,
+    SPLITS: { TITLE: 0, ROLES: { '2': 0, '10': 0 } },
+    WELCOME: 0
+  };
+
+  it('should assign values in depth-first leaf order', () => {
+    const catalog = hydrateShortKeys(['Title', 'Splits', 'Two', 'Ten', 'Hello'], tree) as Record<string, any>;
+
+    expect(catalog['TITLE']).toBe('Title');
+    expect(catalog['SPLITS'].ROLES).toEqual({ '2': 'Two', '10': 'Ten' });
+    expect(catalog['WELCOME']).toBe('Hello');
+  });
+
+  it('should leave out keys that were not shipped', () => {
+    const catalog = hydrateShortKeys([null, 'Splits', null, null, 'Hello'], tree);
+
+    expect(catalog).toEqual({ SPLITS: { TITLE: 'Splits' }, WELCOME: 'Hello' });
+  });
+
+  it('should cut the tree the way bundles are split', () => {
+    expect(bundleTree(tree, '_root')).toEqual({ TITLE: 0, WELCOME: 0 });
+    expect(hydrateShortKeys(['Splits', 'Two', 'Ten'], bundleTree(tree, 'SPLITS'))).toEqual({
+      SPLITS: { TITLE: 'Splits', ROLES: { '2': 'Two', '10': 'Ten' } }
+    });
+  });
+});
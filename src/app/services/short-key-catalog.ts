@@ -0,0 +1,46 @@
+import { TranslationObject } from '@ngx-translate/core';
+
+/** Shape of `build/_keys/tree.<hash>.json`: key names only, every leaf is `0`. */
+export interface KeyTree {
+  readonly [name: string]: 0 | KeyTree;
+}
+
+/**
+ * Shape of `build/<lang>/_short[.<NS>].<hash>.json`: values in key id order, null when not
+ * shipped; numbers in bundles point into the locale's string table (see `resolveStrings`).
+ */
+export type ShortKeyCatalog = (string | number | null)[];
+
+/** The part of `tree` one namespace bundle covers; `_root` holds the top-level strings. */
+export function bundleTree(tree: KeyTree, name: string): KeyTree {
+  if (name !== '_root') {
+    return { [name]: tree[name] };
+  }
+  return Object.fromEntries(Object.entries(tree).filter(([, child]) => typeof child !== 'object'));
+}
+
+/**
+ * Rebuilds the nested translation object from a value array. Ids are the depth-first
+ * leaf order of `tree`, which `Object.entries` visits exactly as the build numbered them.
+ */
+export function hydrateShortKeys(values: ShortKeyCatalog, tree: KeyTree): TranslationObject {
+  let id = 0;
+  const walk = (node: KeyTree): Record<string, unknown> => {
+    const result: Record<string, unknown> = {};
+    for (const [name, child] of Object.entries(node)) {
+      if (typeof child !== 'object') {
+        const value = values[id++];
+        if (value !== null && value !== undefined) {
+          result[name] = value;
+        }
+        continue;
+      }
+      const nested = walk(child);
+      if (Object.keys(nested).length) {
+        result[name] = nested;
+      }
+    }
+    return result;
+  };
+  return walk(tree) as TranslationObject;
+}
@@ -0,0 +1,16 @@
+import { resolveStrings } from './string-table';
+
+describe('resolveStrings', () => {
+  it('should replace table indexes and keep inline strings', () => {
+    const table = ['Abbrechen', 'Speichern'];
+    const result = resolveStrings({ BUTTONS: { CANCEL: 0, SAVE: 1 }, TITLE: 'Titel' } as any, table) as any;
+
+    expect(result).toEqual({ BUTTONS: { CANCEL: 'Abbrechen', SAVE: 'Speichern' }, TITLE: 'Titel' });
+  });
+
+  it('should leave compiled segment arrays alone', () => {
+    const result = resolveStrings({ OVER: ['Über ', 'value'], SAVE: 0 } as any, ['Speichern']) as any;
+
+    expect(result).toEqual({ OVER: ['Über ', 'value'], SAVE: 'Speichern' });
+  });
+});
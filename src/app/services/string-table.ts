@@ -0,0 +1,26 @@
+import { TranslationObject } from '@ngx-translate/core';
+
+/** Shape of `build/<lang>/_strings.<hash>.json`: strings shared by several bundles of a locale. */
+export type StringTable = string[];
+
+/**
+ * Replaces every number in a bundle with the table string it points at. Values that
+ * point at the same entry end up sharing one string object. Compiled segment arrays
+ * are never interned and are kept as they are.
+ */
+export function resolveStrings(translations: TranslationObject, table: StringTable): TranslationObject {
+  const walk = (node: unknown): unknown => {
+    if (typeof node === 'number') {
+      return table[node];
+    }
+    if (node && typeof node === 'object' && !Array.isArray(node)) {
+      const result: Record<string, unknown> = {};
+      for (const [key, child] of Object.entries(node)) {
+        result[key] = walk(child);
+      }
+      return result;
+    }
+    return node;
+  };
+  return walk(translations) as TranslationObject;
+}
@@ -15,6 +15,7 @@ import { ProfileService } from '../services/profile.service';
 import { QRScannerService } from '../services/qr-scanner.service';
 import { PdfGeneratorService } from '../services/pdf-generator.service';
 import { SupabaseService } from '../services/supabase.service';
+import { I18N_KEYS } from '../services/i18n-keys.generated';
 
 import type { Work, WorkChangeRecord } from '../models/work.model';
 import type { RightsHolder, RightsHolderFormData, RightsHolderKind } from '../../models/rights-holder.model';
@@ -114,15 +115,18 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
 
   protected totalHint(status: SplitTotalStatus): string {
     if (!status.hasEntries) {
-      return this.translate.instant('SPLITS.TOTAL_HINT_EMPTY');
+      return this.translate.instant(I18N_KEYS.SPLITS.TOTAL_HINT_EMPTY);
     }
 
     if (status.state === 'complete') {
-      return this.translate.instant('SPLITS.TOTAL_HINT_COMPLETE');
+      return this.translate.instant(I18N_KEYS.SPLITS.TOTAL_HINT_COMPLETE);
     }
 
     const diff = Math.abs(status.difference).toFixed(2);
-    const key = status.state === 'under' ? 'SPLITS.TOTAL_HINT_MISSING' : 'SPLITS.TOTAL_HINT_OVER';
+    const key =
+      status.state === 'under'
+        ? I18N_KEYS.SPLITS.TOTAL_HINT_MISSING
+        : I18N_KEYS.SPLITS.TOTAL_HINT_OVER;
     return this.translate.instant(key, { value: diff });
   }
 
@@ -187,7 +191,7 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
     }
 
     if (!this.hasAnyEntries()) {
-      return this.translate.instant('SPLITS.SAVE_DISABLED_NO_ENTRIES');
+      return this.translate.instant(I18N_KEYS.SPLITS.SAVE_DISABLED_NO_ENTRIES);
     }
 
     const issue = this.totalStatuses().find(status => status.hasEntries && status.state !== 'complete');
@@ -201,12 +205,15 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
 
     const diff = Math.abs(issue.difference).toFixed(2);
     const categoryLabel = this.translate.instant(this.categoryTranslationKey(issue.category));
-    return this.translate.instant('SPLITS.SAVE_DISABLED_OVER', { value: diff, category: categoryLabel });
+    return this.translate.instant(I18N_KEYS.SPLITS.SAVE_DISABLED_OVER, {
+      value: diff,
+      category: categoryLabel
+    });
   }
 
   private resolveTotalsAlertMessage(): string {
     if (!this.hasAnyEntries()) {
-      return this.translate.instant('SPLITS.TOTAL_ALERT_NO_ENTRIES');
+      return this.translate.instant(I18N_KEYS.SPLITS.TOTAL_ALERT_NO_ENTRIES);
     }
 
     const issue = this.totalStatuses().find(status => status.hasEntries && status.state !== 'complete');
@@ -216,21 +223,25 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
 
     const diff = Math.abs(issue.difference).toFixed(2);
     const categoryLabel = this.translate.instant(this.categoryTranslationKey(issue.category));
-    const key = issue.state === 'under' ? 'SPLITS.TOTAL_ALERT_MISSING' : 'SPLITS.TOTAL_ALERT_OVER';
+    const key =
+      issue.state === 'under'
+        ? I18N_KEYS.SPLITS.TOTAL_ALERT_MISSING
+        : I18N_KEYS.SPLITS.TOTAL_ALERT_OVER;
     return this.translate.instant(key, { value: diff, category: categoryLabel });
   }
 
   protected getChangeTypeTranslationKey(changeType: string): string {
     const mapping: Record<string, string> = {
-      work_create: 'WORKS.CHANGE_HISTORY.TYPE.WORK_CREATE',
-      work_update: 'WORKS.CHANGE_HISTORY.TYPE.WORK_UPDATE',
-      work_delete: 'WORKS.CHANGE_HISTORY.TYPE.WORK_DELETE',
-      split_create: 'WORKS.CHANGE_HISTORY.TYPE.SPLIT_CREATE',
-      split_update: 'WORKS.CHANGE_HISTORY.TYPE.SPLIT_UPDATE',
-      split_delete: 'WORKS.CHANGE_HISTORY.TYPE.SPLIT_DELETE',
+      work_create: I18N_KEYS.WORKS.CHANGE_HISTORY.TYPE.WORK_CREATE,
+      work_update: I18N_KEYS.WORKS.CHANGE_HISTORY.TYPE.WORK_UPDATE,
+      work_delete: I18N_KEYS.WORKS.CHANGE_HISTORY.TYPE.WORK_DELETE,
+      split_create: I18N_KEYS.WORKS.CHANGE_HISTORY.TYPE.SPLIT_CREATE,
+      split_update: I18N_KEYS.WORKS.CHANGE_HISTORY.TYPE.SPLIT_UPDATE,
+      split_delete: I18N_KEYS.WORKS.CHANGE_HISTORY.TYPE.SPLIT_DELETE,
+      history_snapshot: I18N_KEYS.WORKS.CHANGE_HISTORY.TYPE.HISTORY_SNAPSHOT,
     };
 
-    return mapping[changeType] ?? 'WORKS.CHANGE_HISTORY.TYPE.UNKNOWN';
+    return mapping[changeType] ?? I18N_KEYS.WORKS.CHANGE_HISTORY.TYPE.UNKNOWN;
   }
 
   protected describeChangedField(entry: WorkChangeRecord): string | null {
@@ -251,7 +262,9 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
     }
 
     if (trimmed === 'split_id' && entry.split_id) {
-      return this.translate.instant('SPLITS.CHANGE_HISTORY.SPLIT_LABEL', { value: entry.split_id });
+      return this.translate.instant(I18N_KEYS.SPLITS.CHANGE_HISTORY.SPLIT_LABEL, {
+        value: entry.split_id
+      });
     }
 
     const spaced = trimmed.replace(/[_-]+/g, ' ').replace(/\s+/g, ' ');
@@ -303,7 +316,7 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
       this.changeHistory.set(enrichedEntries);
     } catch (error) {
       console.error('Failed to load split change history', error);
-      const fallback = this.translate.instant('SPLITS.CHANGE_HISTORY.ERROR');
+      const fallback = this.translate.instant(I18N_KEYS.SPLITS.CHANGE_HISTORY.ERROR);
       this.changeHistoryError.set(fallback);
     } finally {
       this.changeHistoryLoading.set(false);
@@ -360,7 +373,7 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
 
     const permissionGranted = await this.qrScannerService.requestCameraPermission();
     if (!permissionGranted) {
-      this.errorMessage.set(this.translate.instant('SPLITS.QR_CAMERA_PERMISSION_DENIED'));
+      this.errorMessage.set(this.translate.instant(I18N_KEYS.SPLITS.QR_CAMERA_PERMISSION_DENIED));
       return false;
     }
 
@@ -368,7 +381,7 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
     this.hasCameraSupport.set(supported);
 
     if (!supported) {
-      this.errorMessage.set(this.translate.instant('SPLITS.QR_CAMERA_UNAVAILABLE'));
+      this.errorMessage.set(this.translate.instant(I18N_KEYS.SPLITS.QR_CAMERA_UNAVAILABLE));
     }
 
     return supported;
@@ -389,19 +402,21 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
 
   private describeValue(value: unknown): string {
     if (value === null || value === undefined) {
-      return this.translate.instant('SPLITS.CHANGE_HISTORY.EMPTY');
+      return this.translate.instant(I18N_KEYS.SPLITS.CHANGE_HISTORY.EMPTY);
     }
 
     if (typeof value === 'string') {
       const trimmed = value.trim();
 
       if (!trimmed.length) {
-        return this.translate.instant('SPLITS.CHANGE_HISTORY.EMPTY');
+        return this.translate.instant(I18N_KEYS.SPLITS.CHANGE_HISTORY.EMPTY);
       }
 
       const lowered = trimmed.toLowerCase();
       if (lowered === 'true' || lowered === 'false') {
-        return this.translate.instant(lowered === 'true' ? 'COMMON.YES' : 'COMMON.NO');
+        return this.translate.instant(
+          lowered === 'true' ? I18N_KEYS.COMMON.YES : I18N_KEYS.COMMON.NO
+        );
       }
 
       if (!Number.isNaN(Number(trimmed))) {
@@ -416,12 +431,12 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
     }
 
     if (typeof value === 'boolean') {
-      return this.translate.instant(value ? 'COMMON.YES' : 'COMMON.NO');
+      return this.translate.instant(value ? I18N_KEYS.COMMON.YES : I18N_KEYS.COMMON.NO);
     }
 
     if (Array.isArray(value)) {
       if (!value.length) {
-        return this.translate.instant('SPLITS.CHANGE_HISTORY.EMPTY');
+        return this.translate.instant(I18N_KEYS.SPLITS.CHANGE_HISTORY.EMPTY);
       }
 
       return value.map(item => this.describeValue(item)).join(', ');
@@ -558,7 +573,7 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
       return detailLines.join('\n');
     }
 
-    return this.translate.instant('SPLITS.CHANGE_HISTORY.EMPTY');
+    return this.translate.instant(I18N_KEYS.SPLITS.CHANGE_HISTORY.EMPTY);
   }
 
   private resolveRightsHolderName(id: string): string | null {
@@ -588,11 +603,11 @@ export class SplitEditorComponent implements OnInit, OnDestroy {
   private categoryTranslationKey(category: SplitCategory): string {
     switch (category) {
       case 'lyrics':
-        return 'PROTOCOL.LYRICS';
+        return I18N_KEYS.PROTOCOL.LYRICS;
       case 'music':
-        return 'PROTOCOL.MUSIC';
+        return I18N_KEYS.PROTOCOL.MUSIC;
       default:
-        return 'SPLITS.NEIGHBORING_RIGHTS';
+        return I18N_KEYS.SPLITS.NEIGHBORING_RIGHTS;
     }
   }
 
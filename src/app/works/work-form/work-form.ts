@@ -1124,7 +1124,8 @@ export class WorkFormComponent implements OnInit {
       work_delete: 'WORKS.CHANGE_HISTORY.TYPE.WORK_DELETE',
       split_create: 'WORKS.CHANGE_HISTORY.TYPE.SPLIT_CREATE',
       split_update: 'WORKS.CHANGE_HISTORY.TYPE.SPLIT_UPDATE',
-      split_delete: 'WORKS.CHANGE_HISTORY.TYPE.SPLIT_DELETE'
+      split_delete: 'WORKS.CHANGE_HISTORY.TYPE.SPLIT_DELETE',
+      history_snapshot: 'WORKS.CHANGE_HISTORY.TYPE.HISTORY_SNAPSHOT'
     };
 
     return mapping[changeType] ?? 'WORKS.CHANGE_HISTORY.TYPE.UNKNOWN';
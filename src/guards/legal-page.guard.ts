@@ -0,0 +1,11 @@
+import { DOCUMENT } from '@angular/common';
+import { inject } from '@angular/core';
+import { CanActivateFn } from '@angular/router';
+import { LanguageService } from '../app/services/language.service';
+
+/** Leaves the app for the prerendered page (`public/legal/<page>.<lang>.html`, written by the i18n build). */
+export const LegalPageGuard = (page: string): CanActivateFn => () => {
+  const url = inject(LanguageService).legalPageUrl(page);
+  inject(DOCUMENT).location.assign(url);
+  return false;
+};
@@ -0,0 +1,10 @@
+-- Per-work change history in time order
+-- WorksService.getWorkChangeHistory reads one work's entries by changed_at and
+-- the compaction job (python -m tools.changelog compact) walks the log in
+-- (work_id, changed_at, id) keyset order. The composite index serves both and
+-- makes the single-column work_id index redundant, so it replaces it.
+
+CREATE INDEX IF NOT EXISTS idx_work_change_data_work_changed_at
+  ON public.work_change_data(work_id, changed_at, id);
+
+DROP INDEX IF EXISTS idx_work_change_data_work_id;
@@ -0,0 +1,209 @@
+-- Precomputed counters for the admin overview dashboard.
+-- python -m tools.rollups refresh keeps them current from a per-metric
+-- high-water mark; public.admin_overview_snapshot() only reads them.
+
+BEGIN;
+
+-- 1. Weekly counts per metric, weeks starting on Monday (UTC).
+CREATE TABLE IF NOT EXISTS public.admin_weekly_counts (
+  metric text NOT NULL CHECK (metric IN ('signups', 'works', 'protocols', 'waitlist')),
+  week_start date NOT NULL,
+  total bigint NOT NULL DEFAULT 0,
+  PRIMARY KEY (metric, week_start)
+);
+
+-- 2. Rows created before high_water are counted in admin_weekly_counts.
+CREATE TABLE IF NOT EXISTS public.admin_rollup_state (
+  metric text PRIMARY KEY,
+  high_water timestamptz NOT NULL,
+  refreshed_at timestamptz NOT NULL DEFAULT now()
+);
+
+-- 3. The scalar metrics as of the last refresh (a single row).
+CREATE TABLE IF NOT EXISTS public.admin_overview_totals (
+  id smallint PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+  metrics jsonb NOT NULL,
+  refreshed_at timestamptz NOT NULL DEFAULT now()
+);
+
+ALTER TABLE public.admin_weekly_counts ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.admin_rollup_state ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.admin_overview_totals ENABLE ROW LEVEL SECURITY;
+
+-- 4. The refresh reads only the rows created since the last high-water mark.
+CREATE INDEX IF NOT EXISTS idx_profiles_created_at ON public.profiles (created_at);
+CREATE INDEX IF NOT EXISTS idx_works_created_at ON public.works (created_at);
+CREATE INDEX IF NOT EXISTS idx_waitlist_requests_created_at ON public.waitlist_requests (created_at);
+DO $$
+BEGIN
+  IF to_regclass('public.protocols') IS NOT NULL THEN
+    CREATE INDEX IF NOT EXISTS idx_protocols_created_at ON public.protocols (created_at);
+  END IF;
+END;
+$$;
+
+-- 5. The full aggregation, for the refresh job and for databases it has not run on yet.
+CREATE OR REPLACE FUNCTION public.admin_overview_live()
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  weekly jsonb := '[]'::jsonb;
+  result jsonb;
+BEGIN
+  WITH weeks AS (
+    SELECT generate_series(
+             date_trunc('week', timezone('utc', now()) - interval '5 weeks'),
+             date_trunc('week', timezone('utc', now())),
+             interval '1 week'
+           ) AS week_start
+  ),
+  signups AS (
+    SELECT date_trunc('week', timezone('utc', created_at)) AS week_start,
+           COUNT(*) AS total
+      FROM public.profiles
+     WHERE created_at >= date_trunc('week', timezone('utc', now()) - interval '5 weeks') AT TIME ZONE 'utc'
+     GROUP BY 1
+  )
+  SELECT COALESCE(
+           jsonb_agg(
+             jsonb_build_object(
+               'week', to_char(w.week_start, 'YYYY-MM-DD'),
+               'count', COALESCE(s.total, 0)
+             )
+             ORDER BY w.week_start
+           ),
+           '[]'::jsonb
+         )
+    INTO weekly
+    FROM weeks w
+    LEFT JOIN signups s ON s.week_start = w.week_start;
+
+  WITH work_flags AS (
+    SELECT w.id,
+           COALESCE(BOOL_OR(cd.creation_type = 'ai_assisted'), false) AS has_ai_assisted,
+           COALESCE(BOOL_OR(cd.creation_type = 'ai_generated'), false) AS has_ai_generated
+      FROM public.works w
+      LEFT JOIN public.work_creation_declarations cd ON cd.work_id = w.id
+     GROUP BY w.id
+  ),
+  completed_splits AS (
+    SELECT DISTINCT work_id
+      FROM public.work_splits
+     WHERE is_active IS DISTINCT FROM FALSE
+     GROUP BY work_id, split_type
+    HAVING COALESCE(SUM(ownership_percentage), 0) = 100
+  )
+  SELECT jsonb_build_object(
+           'totalUsers', (SELECT COUNT(*) FROM public.profiles),
+           'activeUsers', (
+             SELECT COUNT(*)
+               FROM public.profiles
+              WHERE COALESCE(is_deactivated, false) = false
+                AND updated_at >= now() - interval '30 days'
+           ),
+           'deactivatedUsers', (
+             SELECT COUNT(*)
+               FROM public.profiles
+              WHERE COALESCE(is_deactivated, false) = true
+           ),
+           'worksWithCompleteSplits', (
+             SELECT COUNT(*) FROM completed_splits
+           ),
+           'worksHumanOnly', (
+             SELECT COUNT(*)
+               FROM work_flags wf
+              WHERE wf.has_ai_assisted = false
+                AND wf.has_ai_generated = false
+           ),
+           'worksAiAssisted', (
+             SELECT COUNT(*)
+               FROM work_flags wf
+              WHERE wf.has_ai_assisted = true
+                AND wf.has_ai_generated = false
+           ),
+           'worksAiGenerated', (
+             SELECT COUNT(*)
+               FROM work_flags wf
+              WHERE wf.has_ai_generated = true
+           ),
+           'weeklySignups', weekly
+         )
+    INTO result;
+
+  RETURN result;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.admin_overview_live() FROM public;
+REVOKE ALL ON FUNCTION public.admin_overview_live() FROM anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.admin_overview_live() TO service_role;
+
+COMMENT ON FUNCTION public.admin_overview_live() IS 'Aggregates the admin overview metrics from the source tables; used by python -m tools.rollups.';
+
+-- 6. The dashboard reads the precomputed rows: a handful of primary key lookups.
+CREATE OR REPLACE FUNCTION public.admin_overview_snapshot()
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  totals jsonb;
+  refreshed timestamptz;
+  weekly jsonb;
+BEGIN
+  IF NOT public.is_current_user_admin() THEN
+    RAISE EXCEPTION 'insufficient_privilege' USING ERRCODE = '42501';
+  END IF;
+
+  SELECT t.metrics, t.refreshed_at
+    INTO totals, refreshed
+    FROM public.admin_overview_totals t
+   WHERE t.id = 1;
+
+  -- Not refreshed yet: aggregate as before.
+  IF totals IS NULL THEN
+    RETURN public.admin_overview_live() || jsonb_build_object('refreshedAt', NULL);
+  END IF;
+
+  WITH weeks AS (
+    SELECT generate_series(
+             date_trunc('week', timezone('utc', now()) - interval '5 weeks'),
+             date_trunc('week', timezone('utc', now())),
+             interval '1 week'
+           )::date AS week_start
+  ),
+  series(metric, name) AS (
+    VALUES ('signups', 'weeklySignups'),
+           ('works', 'weeklyWorks'),
+           ('protocols', 'weeklyProtocols'),
+           ('waitlist', 'weeklyWaitlist')
+  )
+  SELECT jsonb_object_agg(
+           s.name,
+           (
+             SELECT jsonb_agg(
+                      jsonb_build_object(
+                        'week', to_char(w.week_start, 'YYYY-MM-DD'),
+                        'count', COALESCE(c.total, 0)
+                      )
+                      ORDER BY w.week_start
+                    )
+               FROM weeks w
+               LEFT JOIN public.admin_weekly_counts c
+                 ON c.metric = s.metric AND c.week_start = w.week_start
+           )
+         )
+    INTO weekly
+    FROM series s;
+
+  RETURN totals || weekly || jsonb_build_object('refreshedAt', refreshed);
+END;
+$$;
+
+COMMENT ON FUNCTION public.admin_overview_snapshot() IS 'Returns the admin dashboard metrics and weekly counts precomputed by python -m tools.rollups.';
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- Batches of a catalog file that python -m tools.catalog import has written.
+-- Each row is inserted in the transaction that copies the batch's works,
+-- splits and declarations, so it exists exactly when they do.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.import_checkpoints (
+  -- sha256 of the catalog file
+  source text NOT NULL,
+  workspace_id uuid NOT NULL REFERENCES public.workspaces(id) ON DELETE CASCADE,
+  batch_size integer NOT NULL CHECK (batch_size > 0),
+  batch integer NOT NULL CHECK (batch >= 0),
+  works integer NOT NULL CHECK (works >= 0),
+  imported_at timestamptz NOT NULL DEFAULT now(),
+  PRIMARY KEY (source, workspace_id, batch_size, batch)
+);
+
+-- Only the importer's direct connection uses it; no policies for app users.
+ALTER TABLE public.import_checkpoints ENABLE ROW LEVEL SECURITY;
+
+COMMIT;
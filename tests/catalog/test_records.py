@@ -0,0 +1,114 @@
+import pytest
+
+from tools.catalog.records import CatalogError, Rejected, Work, parse_work, read_catalog
+
+HEADER = (
+    'ref,work_title,languages,split_type,ownership_percentage,'
+    'holder_nickname,holder_email,holder_first_name,holder_last_name,creation_ip'
+)
+CSV = f"""{HEADER}
+CAT-1,Night Drive,en|es,music,60,Mira,,,,human
+CAT-1,ignored title,,lyrics,40,,Jo@Example.com,,,
+CAT-2,Dawn,,,,,,,,
+CAT-3,Dusk,,music,100,,,Ana María,López,
+"""
+
+
+def _work(**record):
+    return parse_work(1, {'ref': 'CAT-1', 'work_title': 'Night Drive', **record})
+
+
+def _holder(split_type='music', **holder):
+    work = _work(splits=[{'split_type': split_type, 'ownership_percentage': 100, 'holder': holder}])
+    assert isinstance(work, Work), work
+    return work.splits[0].holder
+
+
+def test_holder_nickname_comes_from_the_first_name_given():
+    assert _holder(nickname=' Mira ', email='x@example.com').nickname == 'mira'
+    assert _holder(display_name='DJ Night Owl').nickname == 'dj-night-owl'
+    assert _holder(first_name='Ana', last_name='López').nickname == 'ana-l-pez'
+    assert _holder(company_name='Blue Note Records').nickname == 'blue-note-records'
+    assert _holder(email='Jo.Smith@Example.com').nickname == 'jo.smith'
+
+
+def test_holder_columns_fill_the_rights_holders_defaults():
+    holder = _holder('publishing', email='Jo@Example.com', ipi_number=123)
+    assert holder.email == 'jo@example.com'
+    assert dict(holder.columns) == {
+        'nickname': 'jo',
+        'email': 'jo@example.com',
+        'type': 'person',
+        'kind': 'publisher',
+        'ipi_number': '123',
+    }
+    assert dict(_holder('master_recording', nickname='label', kind='other').columns)['kind'] == 'other'
+
+
+def test_work_is_rejected_with_every_reason():
+    work = _work(
+        work_title='',
+        status='live',
+        release_date='2025-13-01',
+        splits=[
+            {'split_type': 'music', 'ownership_percentage': 120, 'holder': {'nickname': 'mira'}},
+            {'split_type': 'music', 'ownership_percentage': 50, 'holder': {}},
+            {'split_type': 'music', 'ownership_percentage': 50, 'holder': {'nickname': 'x', 'type': 'band'}},
+        ],
+        declarations=[{'section': 'ip', 'creation_type': 'human'}, {'section': 'ip', 'creation_type': 'human'}],
+    )
+    assert isinstance(work, Rejected)
+    assert work.reasons == (
+        'work_title is required',
+        "status 'live' is not one of draft, registered, published, archived",
+        "release_date '2025-13-01' is not a YYYY-MM-DD date",
+        "split 1 ownership_percentage 120 is not between 0 and 100",
+        'split 2 has no rights holder nickname, name or email',
+        "split 3 holder type 'band' is not one of person, organization, company",
+        'ip is declared twice',
+    )
+
+
+def test_entries_that_are_not_objects_are_rejected_not_raised():
+    work = _work(
+        splits=['mira 100', {'split_type': 'music', 'ownership_percentage': 100, 'holder': 'mira'}, None],
+        declarations=[['ip', 'human']],
+    )
+    assert isinstance(work, Rejected)
+    assert work.reasons == (
+        'split 1 is not an object',
+        'split 2 holder is not an object',
+        'split 3 is not an object',
+        'declaration 1 is not an object',
+    )
+
+
+def test_csv_rows_group_into_works_by_ref(tmp_path):
+    path = tmp_path / 'catalog.csv'
+    path.write_text(CSV, encoding='utf-8')
+    first, second, third = read_catalog(path)
+
+    assert first.columns['work_title'] == 'Night Drive'
+    assert first.columns['languages'] == ['en', 'es']
+    assert [(split.split_type, split.ownership_percentage, split.holder.nickname) for split in first.splits] == [
+        ('music', 60.0, 'mira'),
+        ('lyrics', 40.0, 'jo'),
+    ]
+    assert first.declarations == [{'section': 'ip', 'creation_type': 'human', 'ai_tool': None, 'notes': None}]
+    assert (second.ref, second.splits) == ('CAT-2', [])
+    assert third.splits[0].holder.nickname == 'ana-mar-a-l-pez'
+
+
+def test_csv_without_ref_cannot_be_read(tmp_path):
+    path = tmp_path / 'catalog.csv'
+    path.write_text('work_title\nNight Drive\n', encoding='utf-8')
+    with pytest.raises(CatalogError, match='no ref column'):
+        list(read_catalog(path))
+
+
+def test_bad_json_lines_are_rejected_not_raised(tmp_path):
+    path = tmp_path / 'catalog.jsonl'
+    path.write_text('{"ref": "A", "work_title": "One"}\nnot json\n', encoding='utf-8')
+    work, rejected = read_catalog(path)
+    assert work.ref == 'A'
+    assert rejected == Rejected(2, None, ('is not a JSON object',))
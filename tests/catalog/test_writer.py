@@ -0,0 +1,168 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from tools.catalog.records import WORK_COLUMNS, CatalogError
+from tools.catalog.writer import _COLUMN_TYPES, _HOLDER_COLUMNS, CatalogImporter
+from tools.db import connect
+from tools.i18n.config import REPO_ROOT
+
+WORKSPACE = uuid4()
+OWNER = uuid4()
+# the columns the importer writes, in place of the app's migrations
+SCHEMA = f"""
+CREATE TABLE public.workspaces (id uuid PRIMARY KEY, created_by uuid);
+CREATE TABLE public.rights_holders (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(), workspace_id uuid, created_by uuid,
+  {', '.join(f'{name} text' for name in _HOLDER_COLUMNS)}
+);
+CREATE TABLE public.works (
+  id uuid PRIMARY KEY, workspace_id uuid, created_by uuid,
+  {', '.join(f'{name} {_COLUMN_TYPES.get(name, "text")}' for name in WORK_COLUMNS)}
+);
+CREATE TABLE public.work_splits (
+  work_id uuid REFERENCES public.works, rights_holder_id uuid REFERENCES public.rights_holders, split_type text,
+  rights_layer text, ownership_percentage numeric(5,2), notes text, roles text[], contribution_types jsonb,
+  is_active boolean, created_by uuid
+);
+CREATE TABLE public.work_creation_declarations (
+  work_id uuid REFERENCES public.works, section text, creation_type text, ai_tool text, notes text
+);
+"""
+MIGRATION = REPO_ROOT / 'supabase' / 'migrations' / '20260111_import_checkpoints.sql'
+EXISTING = {'nickname': 'Mira', 'email': 'mira@example.com'}
+
+
+@pytest.fixture
+def dsn(scratch_db):
+    with connect(scratch_db) as connection:
+        connection.execute(SCHEMA)
+        connection.execute(MIGRATION.read_text(encoding='utf-8'))
+        connection.execute('INSERT INTO public.workspaces VALUES (%s, %s)', (WORKSPACE, OWNER))
+        connection.execute(
+            'INSERT INTO public.rights_holders (workspace_id, nickname, email) VALUES (%s, %s, %s)',
+            (WORKSPACE, EXISTING['nickname'], EXISTING['email']),
+        )
+    return scratch_db
+
+
+def _catalog(tmp_path, records):
+    path = tmp_path / 'catalog.jsonl'
+    path.write_text(''.join(json.dumps(record) + '\n' for record in records), encoding='utf-8')
+    return path
+
+
+def _split(split_type, percentage, **holder):
+    return {'split_type': split_type, 'ownership_percentage': percentage, 'holder': holder}
+
+
+def _run(dsn, path, batch_size=2, restart=False):
+    return CatalogImporter(dsn, str(WORKSPACE), batch_size=batch_size, workers=2).run(path, restart)
+
+
+def _titles(dsn):
+    with connect(dsn) as connection:
+        return [title for (title,) in connection.execute('SELECT work_title FROM public.works ORDER BY 1')]
+
+
+def test_splits_point_at_existing_and_new_holders(dsn, tmp_path):
+    path = _catalog(
+        tmp_path,
+        [
+            {
+                'ref': 'A',
+                'work_title': 'Night Drive',
+                'languages': ['en'],
+                'splits': [
+                    _split('music', 50, nickname='MIRA'),
+                    _split('music', 50, email='Jo@Example.com', roles=['composer']),
+                ],
+                'declarations': [{'section': 'ip', 'creation_type': 'human'}],
+            },
+            # matched by email, and the holder created for A is reused
+            {
+                'ref': 'B',
+                'work_title': 'Dawn',
+                'splits': [_split('lyrics', 100, nickname='other', email='MIRA@example.com')],
+            },
+            {'ref': 'C', 'work_title': 'Dusk', 'splits': [_split('publishing', 100, email='jo@example.com')]},
+        ],
+    )
+    report = _run(dsn, path)
+
+    assert (report.works, report.splits, report.declarations, report.holders) == (3, 4, 1, 1)
+    with connect(dsn) as connection:
+        holders = dict(connection.execute('SELECT nickname, id FROM public.rights_holders').fetchall())
+        assert set(holders) == {'Mira', 'jo'}
+        created = connection.execute(
+            'SELECT created_by, workspace_id, type, kind FROM public.rights_holders WHERE nickname = %s', ('jo',)
+        ).fetchone()
+        assert created == (OWNER, WORKSPACE, 'person', 'composer')
+        splits = connection.execute(
+            """SELECT w.work_title, s.rights_holder_id, s.ownership_percentage, s.is_active, s.created_by
+                 FROM public.work_splits s JOIN public.works w ON w.id = s.work_id
+                ORDER BY w.work_title, s.ownership_percentage, s.rights_holder_id = %s""",
+            (holders['Mira'],),
+        ).fetchall()
+        assert [(title, holder, float(share)) for title, holder, share, _, _ in splits] == [
+            ('Dawn', holders['Mira'], 100.0),
+            ('Dusk', holders['jo'], 100.0),
+            ('Night Drive', holders['jo'], 50.0),
+            ('Night Drive', holders['Mira'], 50.0),
+        ]
+        assert {(active, actor) for *_, active, actor in splits} == {(True, OWNER)}
+        work = connection.execute(
+            """SELECT workspace_id, created_by, languages, status, work_type
+                 FROM public.works WHERE work_title = 'Night Drive'"""
+        ).fetchone()
+        assert work == (WORKSPACE, OWNER, ['en'], 'draft', 'standard')
+
+
+def test_rejected_works_are_reported_and_the_rest_written(dsn, tmp_path):
+    path = _catalog(
+        tmp_path,
+        [
+            {'ref': 'A', 'work_title': 'Night Drive'},
+            {'ref': 'B', 'work_title': ''},
+            {'ref': 'C', 'work_title': 'Dusk'},
+        ],
+    )
+    report = _run(dsn, path)
+
+    assert report.works == 2
+    assert [rejected.ref for rejected in report.rejected] == ['B']
+    assert _titles(dsn) == ['Dusk', 'Night Drive']
+
+
+def test_failed_batch_leaves_no_works_and_no_checkpoint(dsn, tmp_path):
+    titles = ['One', 'Two', 'Three', 'Four', 'Five']
+    path = _catalog(tmp_path, [{'ref': title, 'work_title': title} for title in titles])
+    with connect(dsn) as connection:
+        # a database constraint the reader does not check, hit in the second batch
+        connection.execute("ALTER TABLE public.works ADD CONSTRAINT no_three CHECK (work_title <> 'Three')")
+    with pytest.raises(CatalogError, match=r'batch 2 \(records 3-4\) was not written'):
+        _run(dsn, path)
+    with connect(dsn) as connection:
+        batches = connection.execute('SELECT batch, works FROM public.import_checkpoints ORDER BY 1').fetchall()
+        written = {title for (title,) in connection.execute('SELECT work_title FROM public.works')}
+        connection.execute('ALTER TABLE public.works DROP CONSTRAINT no_three')
+    # every recorded batch is in the database and no other one is
+    assert written == {title for batch, _ in batches for title in titles[batch * 2:batch * 2 + 2]}
+    assert 1 not in dict(batches)
+
+    report = _run(dsn, path)
+    assert report.resumed == sum(works for _, works in batches)
+    assert report.works + report.resumed == 5
+    assert _titles(dsn) == sorted(titles)
+
+
+def test_resume_needs_the_same_batch_size(dsn, tmp_path):
+    path = _catalog(tmp_path, [{'ref': 'A', 'work_title': 'Night Drive'}, {'ref': 'B', 'work_title': 'Dawn'}])
+    _run(dsn, path, batch_size=1)
+
+    with pytest.raises(CatalogError, match='--batch-size 1'):
+        _run(dsn, path, batch_size=2)
+    assert _run(dsn, path, batch_size=1).resumed == 2
+    assert _run(dsn, path, batch_size=2, restart=True).works == 2
+    assert _titles(dsn) == ['Dawn', 'Dawn', 'Night Drive', 'Night Drive']
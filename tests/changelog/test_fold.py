@@ -0,0 +1,106 @@
+import json
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+from tools.changelog.compact import SNAPSHOT, _SNAPSHOT_COPY, cutoff_for, fold_work
+from tools.periods import period_start
+
+WORK = uuid4()
+EDITOR = uuid4()
+
+
+def _row(entity_type, field_changed, old, new, day, split_id=None, change_type='update'):
+    return {
+        'id': uuid4(),
+        'work_id': WORK,
+        'split_id': split_id,
+        'entity_type': entity_type,
+        'change_type': change_type,
+        'field_changed': field_changed,
+        'old_value': old,
+        'new_value': new,
+        'changed_by': EDITOR,
+        'changed_at': datetime(2025, 3, day, 12, tzinfo=timezone.utc),
+    }
+
+
+def _columns():
+    names = _SNAPSHOT_COPY.split('(', 1)[1].split(')', 1)[0]
+    return [name.strip() for name in names.split(',')]
+
+
+def test_splits_of_one_work_fold_separately():
+    first, second = uuid4(), uuid4()
+    rows = [
+        _row('split', 'ownership_percentage', '50', '40', 2, first),
+        _row('split', 'ownership_percentage', '50', '60', 3, second),
+        _row('split', 'ownership_percentage', '40', '45', 10, first),
+        _row('split', 'ownership_percentage', '60', '55', 11, second),
+    ]
+    folds, folded = fold_work(rows, 'month')
+
+    assert len(folded) == 4
+    by_split = {fold.split_id: dict(zip(_columns(), fold.snapshot())) for fold in folds}
+    assert set(by_split) == {first, second}
+    assert json.loads(by_split[first]['old_value']) == {'ownership_percentage': '50'}
+    assert json.loads(by_split[first]['new_value']) == {'ownership_percentage': '45'}
+    assert json.loads(by_split[second]['new_value']) == {'ownership_percentage': '55'}
+    assert by_split[second]['split_id'] == second
+    assert by_split[second]['change_type'] == SNAPSHOT
+
+
+def test_work_rows_fold_by_period_and_single_changes_stay():
+    rows = [
+        _row('work', 'title', 'Draft', 'Demo', 2),
+        _row('work', 'title', 'Demo', 'Final', 20),
+        _row('work', 'iswc', None, 'T-123', 28),
+        _row('split', 'ownership_percentage', '50', '40', 5, uuid4()),
+    ]
+    folds, folded = fold_work(rows, 'month')
+
+    assert [fold.entity_type for fold in folds] == ['work']
+    snapshot = dict(zip(_columns(), folds[0].snapshot()))
+    assert snapshot['split_id'] is None
+    assert json.loads(snapshot['old_value']) == {'title': 'Draft', 'iswc': None}
+    assert json.loads(snapshot['new_value']) == {'title': 'Final', 'iswc': 'T-123'}
+    assert snapshot['change_summary'] == '3 changes by 1 user between 2025-03-02 and 2025-03-28'
+    assert len(folded) == 3
+
+
+def test_created_and_deleted_rows_nest_as_objects():
+    split = uuid4()
+    rows = [
+        _row('split', None, None, json.dumps({'ownership_percentage': 50}), 2, split, 'split_create'),
+        _row('split', None, json.dumps({'ownership_percentage': 50}), None, 9, split, 'split_delete'),
+    ]
+    (fold,), _ = fold_work(rows, 'month')
+
+    assert fold.new == {'split_create': {'ownership_percentage': 50}, 'split_delete': None}
+    assert fold.old == {'split_create': None, 'split_delete': {'ownership_percentage': 50}}
+
+
+def test_rows_in_different_periods_stay_apart():
+    rows = [_row('work', 'title', 'Draft', 'Demo', 30), _row('work', 'title', 'Demo', 'Final', 31)]
+    rows[1]['changed_at'] = rows[1]['changed_at'].replace(month=4, day=1)
+
+    assert fold_work(rows, 'quarter') == ([], [])
+    (fold,), _ = fold_work(rows, 'year')
+    assert fold.new == {'title': 'Final'}
+
+
+def test_summary_counts_every_editor():
+    rows = [_row('work', 'title', 'Draft', 'Demo', 3), _row('work', 'notes', None, 'Mixed', 4)]
+    rows[1]['changed_by'] = uuid4()
+    (fold,), _ = fold_work(rows, 'week')
+
+    snapshot = dict(zip(_columns(), fold.snapshot()))
+    assert snapshot['change_summary'] == '2 changes by 2 users between 2025-03-03 and 2025-03-04'
+    assert snapshot['changed_by'] == rows[1]['changed_by']
+
+
+def test_periods_start_on_monday_and_on_the_quarter():
+    moment = datetime(2025, 5, 15, 23, tzinfo=timezone.utc)
+    assert period_start(moment, 'week') == date(2025, 5, 12)
+    assert period_start(moment, 'quarter') == date(2025, 4, 1)
+    assert period_start(moment, 'year') == date(2025, 1, 1)
+    assert cutoff_for(moment, 90, 'month') == datetime(2025, 2, 1, tzinfo=timezone.utc)
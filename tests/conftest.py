@@ -0,0 +1,33 @@
+import os
+import uuid
+
+import pytest
+
+from tools.db import psycopg, resolve_dsn
+
+# server the database-backed tests create their scratch databases on
+TEST_DSN_ENV = 'TEST_DATABASE_URL'
+
+
+@pytest.fixture
+def scratch_db():
+    """DSN of an empty database that exists for one test.
+
+    It is created on the server of ``$TEST_DATABASE_URL``, else ``$DATABASE_URL``
+    or the local Supabase stack, and dropped afterwards. The test is skipped
+    when psycopg is missing or no server answers.
+    """
+    if psycopg is None:
+        pytest.skip('psycopg is not installed')
+    dsn = os.environ.get(TEST_DSN_ENV) or resolve_dsn(None)
+    try:
+        admin = psycopg.connect(dsn, autocommit=True, connect_timeout=3)
+    except psycopg.Error as exc:
+        pytest.skip(f'no Postgres server: {exc}')
+    name = f'tools_test_{uuid.uuid4().hex[:12]}'
+    try:
+        admin.execute(f'CREATE DATABASE {name}')
+        yield psycopg.conninfo.make_conninfo(dsn, dbname=name)
+    finally:
+        admin.execute(f'DROP DATABASE IF EXISTS {name} WITH (FORCE)')
+        admin.close()
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from tools.i18n.config import Layout
+from tools.i18n.manifest import Manifest
+
+LOCALES = ['en', 'de', 'es', 'ua']
+STRINGS = {
+    'en': {
+        '_root': {'TITLE': 'Music Rights'},
+        'NAV': {'HOME': 'Home'},
+        'WORKS': {'TITLE': 'Works', 'EMPTY': 'No works'},
+    },
+    'de': {'_root': {'TITLE': 'Musikrechte'}, 'NAV': {'HOME': 'Start'}, 'WORKS': {'TITLE': 'Werke'}},
+    'es': {'_root': {'TITLE': 'Derechos'}, 'NAV': {'HOME': 'Inicio'}, 'WORKS': {'TITLE': 'Obras'}},
+    'ua': {'_root': {'TITLE': 'Права'}, 'NAV': {'HOME': 'Головна'}, 'WORKS': {'TITLE': 'Твори'}},
+}
+# a shell rendering NAV and one lazy route rendering WORKS
+APP = {
+    'app/app.ts': "import { Component } from '@angular/core';\nconst home = 'NAV.HOME';\n",
+    'app/app.routes.ts': (
+        "import { Routes } from '@angular/router';\n\n"
+        'export const routes: Routes = [\n'
+        "    { path: 'works', loadComponent: () => import('./works/works').then(m => m.Works) },\n"
+        '];\n'
+    ),
+    'app/works/works.ts': "import { Component } from '@angular/core';\nconst title = 'WORKS.TITLE';\n",
+}
+
+
+def write_tree(root, strings=STRINGS, app=APP):
+    for lang, sources in strings.items():
+        folder = root / 'i18n-src' / lang
+        folder.mkdir(parents=True, exist_ok=True)
+        for name, data in sources.items():
+            text = json.dumps(data, ensure_ascii=False, indent=2) + '\n'
+            (folder / f'{name}.json').write_text(text, encoding='utf-8')
+    for name, text in app.items():
+        path = root / 'src' / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+    return Layout(root)
+
+
+@pytest.fixture
+def layout(tmp_path):
+    """A tiny repository: four locales, an app shell and one route."""
+    return write_tree(tmp_path)
+
+
+@pytest.fixture
+def manifest(layout):
+    return Manifest(layout.cache_dir / 'manifest.json')
@@ -0,0 +1,63 @@
+import gzip
+
+from tools.i18n.artifacts import (
+    IMMUTABLE,
+    REVALIDATE,
+    artifact_name,
+    brotli,
+    compressed,
+    netlify_headers,
+    prune,
+    write_artifact,
+)
+from tools.i18n.catalog import minify, short_digest
+
+PAYLOAD = minify({'NAV': {'HOME': 'Home'}})
+
+
+def test_name_is_stable_for_the_same_bytes_and_changes_with_them():
+    assert artifact_name('NAV', PAYLOAD) == artifact_name('NAV', bytes(PAYLOAD)) == f'NAV.{short_digest(PAYLOAD)}.json'
+    assert artifact_name('NAV', minify({'NAV': {'HOME': 'Start'}})) != artifact_name('NAV', PAYLOAD)
+
+
+def test_compressed_siblings_are_reproducible():
+    variants = compressed(PAYLOAD)
+
+    assert gzip.decompress(variants['.gz']) == PAYLOAD
+    assert compressed(PAYLOAD)['.gz'] == variants['.gz']
+    assert ('.br' in variants) == (brotli is not None)
+
+
+def test_existing_artifact_is_not_rewritten(tmp_path):
+    entry = write_artifact(tmp_path, 'NAV', PAYLOAD)
+    path = tmp_path / artifact_name('NAV', PAYLOAD)
+    before = path.stat().st_mtime_ns
+
+    assert entry == {'hash': short_digest(PAYLOAD), 'bytes': len(PAYLOAD)}
+    assert write_artifact(tmp_path, 'NAV', PAYLOAD) == entry
+    assert path.stat().st_mtime_ns == before
+    assert (tmp_path / f'{path.name}.gz').exists()
+
+
+def test_prune_removes_only_unreferenced_artifacts_with_their_siblings(tmp_path):
+    kept = artifact_name('NAV', PAYLOAD)
+    write_artifact(tmp_path, 'NAV', PAYLOAD)
+    write_artifact(tmp_path, 'NAV', minify({'NAV': {'HOME': 'Old'}}))
+    (tmp_path / 'nested').mkdir()
+
+    removed = prune(tmp_path, {kept})
+
+    assert removed and all(not path.name.startswith(kept) for path in removed)
+    assert sorted(path.name for path in tmp_path.iterdir() if path.is_file()) == sorted(
+        [kept, *(kept + suffix for suffix in compressed(PAYLOAD))]
+    )
+    assert (tmp_path / 'nested').is_dir()
+    assert prune(tmp_path / 'missing', set()) == []
+
+
+def test_hashed_files_are_immutable_and_indexes_revalidate():
+    headers = netlify_headers('/assets/i18n/build', ['i18n-map.json'], {'/works': ['/a.json']}).decode('utf-8')
+
+    assert f'/assets/i18n/build/:lang/*\n  Cache-Control: {IMMUTABLE}\n' in headers
+    assert f'/assets/i18n/build/i18n-map.json\n  Cache-Control: {REVALIDATE}\n' in headers
+    assert '/works\n  Link: </a.json>; rel=preload; as=fetch; crossorigin\n' in headers
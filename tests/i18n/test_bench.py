@@ -0,0 +1,50 @@
+import json
+
+from tools.i18n.artifacts import brotli
+from tools.i18n.bench import STAGES, load_budget, metrics, over_budget, run_benchmarks, synthetic_sources, write_budget
+from tools.i18n.sections import reconcile
+
+from .conftest import LOCALES
+
+
+def _results(layout):
+    for lang in layout.locales():
+        reconcile(layout, lang, write=True)
+    return run_benchmarks(layout, [1, 3], repeat=1)
+
+
+def test_report_has_every_stage_and_every_shipped_artifact(layout):
+    results = _results(layout)
+
+    assert [(result['scale'], result['stage']) for result in results['stages']] == [
+        (scale, stage) for scale in (1, 3) for stage in STAGES
+    ]
+    assert all(result['time_ms'] >= 0 and result['peak_kib'] >= 0 for result in results['stages'])
+    assert list(results['sizes']) == LOCALES
+    encodings = ['raw', 'gzip', 'brotli'] if brotli is not None else ['raw', 'gzip']
+    for artifacts in results['sizes'].values():
+        # sizes are taken after --prune-unused: the app never renders TITLE, so there is no _root
+        assert set(artifacts) == {'_all', '_compiled', '_short', 'NAV', 'WORKS'}
+        assert all(list(sizes) == encodings for sizes in artifacts.values())
+    # the results file is plain JSON
+    assert json.loads(json.dumps(results)) == results
+
+
+def test_synthetic_scale_repeats_every_namespace_but_the_root():
+    nav = b'{"HOME": "Home"}'
+    scaled = synthetic_sources({'_root': b'{}', 'NAV': nav}, 3)
+
+    assert scaled == {'_root': b'{}', 'NAV': nav, 'NAV_1': nav, 'NAV_2': nav}
+
+
+def test_fresh_budget_passes_and_a_tighter_one_fails(layout, tmp_path):
+    results = _results(layout)
+    path = tmp_path / 'perf-budget.json'
+    write_budget(path, results)
+    limits = load_budget(path)
+
+    assert set(limits) == set(metrics(results))
+    assert over_budget(results, limits) == []
+    name = 'de/WORKS/raw'
+    tight = {**limits, name: metrics(results)[name][1] - 1}
+    assert over_budget(results, tight) == [(name, metrics(results)[name][1], tight[name])]
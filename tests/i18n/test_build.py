@@ -0,0 +1,41 @@
+import json
+
+from tools.i18n.artifacts import MAP_FILE
+from tools.i18n.bundles import INDEX_FILE
+from tools.i18n.build import build
+
+from .conftest import LOCALES
+
+
+def _read(layout, name):
+    return json.loads((layout.build_dir / name).read_bytes())
+
+
+def test_full_build_publishes_every_locale(layout, manifest):
+    report = build(layout, manifest, layout.locales())
+
+    assert layout.locales() == LOCALES
+    assert sorted(report.applied) == sorted(LOCALES)
+    maps = _read(layout, MAP_FILE)
+    assert list(maps['locales']) == LOCALES
+    for lang in LOCALES:
+        for kind in 'locales', 'compiled':
+            assert any(path.name.endswith(f'.{maps[kind][lang]}.json') for path in (layout.build_dir / lang).iterdir())
+
+
+def test_partial_build_keeps_the_other_locales(layout, manifest):
+    build(layout, manifest, layout.locales())
+    before = _read(layout, MAP_FILE)
+    index = _read(layout, INDEX_FILE)
+    (layout.source_dir / 'de' / 'WORKS.json').write_text('{\n  "TITLE": "Stücke"\n}\n', encoding='utf-8')
+
+    build(layout, manifest, ['de'])
+
+    after = _read(layout, MAP_FILE)
+    assert list(after['locales']) == LOCALES
+    assert after['locales']['de'] != before['locales']['de']
+    for kind in 'locales', 'compiled':
+        assert {lang: after[kind][lang] for lang in LOCALES if lang != 'de'} == {
+            lang: before[kind][lang] for lang in LOCALES if lang != 'de'
+        }
+    assert set(_read(layout, INDEX_FILE)['locales']) == set(index['locales'])
@@ -0,0 +1,57 @@
+import json
+
+from tools.i18n.build import build
+from tools.i18n.bundles import INDEX_FILE, ROOT_BUNDLE, BundleIndex, split_namespaces, write_bundles
+
+DATA = {'TITLE': 'Music Rights', 'NAV': {'HOME': 'Home'}, 'LANGUAGE': 'Language', 'WORKS': {'TITLE': 'Works'}}
+
+
+def test_namespaces_get_a_bundle_and_top_level_strings_share_root():
+    bundles = split_namespaces(DATA)
+
+    assert list(bundles) == [ROOT_BUNDLE, 'NAV', 'WORKS']
+    assert bundles[ROOT_BUNDLE] == {'TITLE': 'Music Rights', 'LANGUAGE': 'Language'}
+    assert bundles['NAV'] == {'NAV': {'HOME': 'Home'}}
+
+
+def test_bundle_hash_follows_its_own_namespace_only(tmp_path):
+    first = write_bundles(tmp_path, 'en', DATA)
+    assert write_bundles(tmp_path, 'en', json.loads(json.dumps(DATA))) == first
+
+    changed = write_bundles(tmp_path, 'en', {**DATA, 'WORKS': {'TITLE': 'Catalogue'}})
+    assert changed['WORKS']['hash'] != first['WORKS']['hash']
+    assert {name: entry for name, entry in changed.items() if name != 'WORKS'} == {
+        name: entry for name, entry in first.items() if name != 'WORKS'
+    }
+    # both versions stay on disk until a build prunes the old one
+    assert (tmp_path / 'en' / f'WORKS.{first["WORKS"]["hash"]}.json').exists()
+
+
+def test_index_keeps_untouched_locales_and_retain_drops_removed_ones(tmp_path):
+    path = tmp_path / INDEX_FILE
+    index = BundleIndex(path, fallback='en')
+    index.update('en', write_bundles(tmp_path, 'en', DATA))
+    index.update('fr', write_bundles(tmp_path, 'fr', DATA))
+    assert index.save()
+    assert not BundleIndex(path, fallback='en').save()
+
+    reloaded = BundleIndex(path, fallback='en')
+    reloaded.update('en', write_bundles(tmp_path, 'en', {**DATA, 'TITLE': 'Rights'}))
+    assert set(reloaded.locales) == {'en', 'fr'}
+    reloaded.retain(['en'])
+    reloaded.save()
+    assert list(json.loads(path.read_bytes())['locales']) == ['en']
+
+
+def test_build_prunes_bundles_no_index_points_at(layout, manifest):
+    build(layout, manifest, layout.locales())
+    old = json.loads((layout.build_dir / INDEX_FILE).read_bytes())['locales']['de']
+    (layout.source_dir / 'de' / 'NAV.json').write_text('{\n  "HOME": "Startseite"\n}\n', encoding='utf-8')
+
+    build(layout, manifest, layout.locales())
+
+    new = json.loads((layout.build_dir / INDEX_FILE).read_bytes())['locales']['de']
+    assert new['NAV'] != old['NAV'] and new['WORKS'] == old['WORKS']
+    names = {path.name for path in (layout.build_dir / 'de').iterdir()}
+    assert f'NAV.{old["NAV"]["hash"]}.json' not in names
+    assert {f'NAV.{new["NAV"]["hash"]}.json', f'WORKS.{new["WORKS"]["hash"]}.json'} <= names
@@ -0,0 +1,53 @@
+import json
+
+from tools.i18n.build import RenderTask, render_locale
+from tools.i18n.compiled import compile_catalog, compile_value
+
+CATALOG = {
+    'SPLITS': {
+        'TITLE': 'Splits',
+        'OVER': '{{ category }} exceeds 100% by {{value}}%.',
+    },
+    'NAV': {'HOME': 'Home'},
+}
+
+
+def test_static_strings_stay_plain():
+    assert compile_value('Exceeds 100%.') == 'Exceeds 100%.'
+
+
+def test_placeholders_alternate_with_text():
+    assert compile_value('{{ category }} exceeds 100% by {{value}}%.') == [
+        '',
+        'category',
+        ' exceeds 100% by ',
+        'value',
+        '%.',
+    ]
+    assert compile_value('Hi {{ user.name }}') == ['Hi ', 'user.name']
+
+
+def test_catalog_keeps_its_shape():
+    compiled = compile_catalog(CATALOG)
+    assert compiled['SPLITS']['TITLE'] == 'Splits'
+    assert compiled['SPLITS']['OVER'][1::2] == ['category', 'value']
+    assert compiled['NAV'] == CATALOG['NAV']
+
+
+def _render(stages, string_table=False):
+    raw = json.dumps(CATALOG).encode('utf-8')
+    return render_locale(RenderTask('en', raw, stages, None, string_table=string_table)).payloads
+
+
+def test_bundles_ship_compiled_and_the_whole_locale_plain():
+    payloads = _render(['locale', 'bundles'])
+    assert json.loads(payloads['locale']['_all'])['SPLITS']['OVER'] == CATALOG['SPLITS']['OVER']
+    bundle = json.loads(payloads['bundles']['SPLITS'])
+    assert bundle == compile_catalog({'SPLITS': CATALOG['SPLITS']})
+
+
+def test_string_table_leaves_segments_alone():
+    payloads = _render(['bundles'], string_table=True)
+    bundle = json.loads(payloads['bundles']['SPLITS'])
+    assert isinstance(bundle['SPLITS']['OVER'], list)
+    assert all(isinstance(segment, str) for segment in bundle['SPLITS']['OVER'])
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from tools.i18n.artifacts import MAP_FILE
+from tools.i18n.build import build
+from tools.i18n.fallback import FALLBACK_FILE, merge_fallback
+
+ENGLISH = {
+    'TITLE': 'Music Rights',
+    'WORKS': {'TITLE': 'Works', 'EMPTY': 'No works', 'FORM': {'SAVE': 'Save', 'HINT': 'Required'}},
+    'NAV': {'HOME': 'Home'},
+}
+
+
+@pytest.mark.parametrize('lang', ['de', 'es', 'ua'])
+def test_missing_keys_are_filled_from_english(lang):
+    own = {'WORKS': {'TITLE': f'Works ({lang})', 'FORM': {'SAVE': f'Save ({lang})'}}}
+    merged, filled = merge_fallback(own, ENGLISH)
+
+    assert merged == {
+        'TITLE': 'Music Rights',
+        'WORKS': {
+            'TITLE': f'Works ({lang})',
+            'EMPTY': 'No works',
+            'FORM': {'SAVE': f'Save ({lang})', 'HINT': 'Required'},
+        },
+        'NAV': {'HOME': 'Home'},
+    }
+    assert filled == ['TITLE', 'WORKS.EMPTY', 'WORKS.FORM.HINT', 'NAV.HOME']
+
+
+def test_translations_are_never_overwritten():
+    own = {
+        'TITLE': 'Musikrechte',
+        # a string where English has a namespace, and the other way round
+        'NAV': 'Navigation',
+        'WORKS': {'TITLE': {'ONE': 'Werk', 'MANY': 'Werke'}, 'EMPTY': '', 'EXTRA': 'Nur auf Deutsch'},
+    }
+    merged, filled = merge_fallback(own, ENGLISH)
+
+    assert merged['TITLE'] == 'Musikrechte'
+    assert merged['NAV'] == 'Navigation'
+    assert merged['WORKS']['TITLE'] == {'ONE': 'Werk', 'MANY': 'Werke'}
+    # an empty translation is still a translation
+    assert merged['WORKS']['EMPTY'] == ''
+    assert list(merged['WORKS']) == ['TITLE', 'EMPTY', 'FORM', 'EXTRA']
+    assert filled == ['WORKS.FORM.SAVE', 'WORKS.FORM.HINT']
+
+
+def test_build_ships_the_merged_locales_and_reports_the_filled_keys(layout, manifest):
+    report = build(layout, manifest, layout.locales())
+    maps = json.loads((layout.build_dir / MAP_FILE).read_bytes())
+
+    assert report.fallback == {'de': ['WORKS.EMPTY'], 'es': ['WORKS.EMPTY'], 'ua': ['WORKS.EMPTY']}
+    german = json.loads((layout.build_dir / 'de' / f'_all.{maps["locales"]["de"]}.json').read_bytes())
+    assert german['WORKS'] == {'TITLE': 'Werke', 'EMPTY': 'No works'}
+    # the committed locale file stays as translated
+    assert 'EMPTY' not in json.loads(layout.locale_file('de').read_bytes())['WORKS']
+    assert json.loads((layout.cache_dir / FALLBACK_FILE).read_bytes())['locales']['ua'] == ['WORKS.EMPTY']
@@ -0,0 +1,85 @@
+import json
+import re
+
+import pytest
+
+from tools.i18n.build import build
+from tools.i18n.inline import SEED_ID, InlineError, built_index, inline_seed, landing_seed, render_seed, write_inline
+
+from .conftest import STRINGS, write_tree
+
+PAGE = (
+    '<!doctype html>\n<html lang="en">\n<head>\n  <title>Music Rights</title>\n</head>\n'
+    '<body><app-root></app-root></body>\n</html>\n'
+)
+LANDING = {'HERO': 'Own your <b>splits</b>', 'TRICKY': '</script><!--<script> "quoted" & ünïcode'}
+_SCRIPT = re.compile(rf'<script id="{SEED_ID}" type="application/json">(?P<json>.*?)</script>', re.S)
+
+
+def _seeds(page):
+    return [json.loads(match['json']) for match in _SCRIPT.finditer(page)]
+
+
+@pytest.fixture
+def layout(tmp_path):
+    layout = write_tree(tmp_path, {**STRINGS, 'en': {**STRINGS['en'], 'LANDING': LANDING}})
+    (tmp_path / 'angular.json').write_text(
+        json.dumps({'projects': {'site': {'architect': {'build': {'options': {'outputPath': 'dist/site'}}}}}}),
+        encoding='utf-8',
+    )
+    return layout
+
+
+def test_seed_goes_in_once_at_the_end_of_head():
+    seed = {'lang': 'en', 'bundles': {'LANDING': {'hash': 'abc', 'data': {'LANDING': LANDING}}}}
+    page = inline_seed(PAGE, seed)
+
+    assert page.count(SEED_ID) == 1
+    assert page.index(SEED_ID) > page.index('<title>')
+    assert page.index(SEED_ID) < page.index('</head>')
+    assert _seeds(page) == [seed]
+
+
+def test_rerun_replaces_the_earlier_seed():
+    first = inline_seed(PAGE, {'lang': 'en', 'bundles': {}})
+    seed = {'lang': 'en', 'bundles': {'LANDING': {'hash': 'def', 'data': {'LANDING': {'HERO': 'New'}}}}}
+
+    assert inline_seed(first, {'lang': 'en', 'bundles': {}}) == first
+    again = inline_seed(first, seed)
+    assert again.count(SEED_ID) == 1
+    assert _seeds(again) == [seed]
+    assert again.replace(render_seed(seed), '') == first.replace(render_seed({'lang': 'en', 'bundles': {}}), '')
+
+
+def test_strings_cannot_end_or_break_the_script_element():
+    seed = {'lang': 'en', 'bundles': {'LANDING': {'hash': 'abc', 'data': {'LANDING': LANDING}}}}
+    script = render_seed(seed)
+    payload = script.removeprefix(f'<script id="{SEED_ID}" type="application/json">').removesuffix('</script>')
+
+    assert '<' not in payload
+    assert json.loads(payload) == seed
+    assert 'ünïcode' in payload
+
+
+def test_written_page_carries_the_shipped_landing_bundle(layout, manifest):
+    build(layout, manifest, layout.locales())
+    target = built_index(layout)
+    target.parent.mkdir(parents=True)
+    target.write_text(PAGE, encoding='utf-8')
+
+    added = write_inline(layout, target)
+    page = target.read_text(encoding='utf-8')
+    assert added == len(page.encode('utf-8')) - len(PAGE.encode('utf-8'))
+    (seed,) = _seeds(page)
+    assert seed['bundles']['LANDING']['data'] == {'LANDING': LANDING}
+    assert seed == landing_seed(layout.build_dir)
+
+    write_inline(layout, target)
+    assert target.read_text(encoding='utf-8') == page
+
+
+def test_missing_build_output_is_reported(layout):
+    with pytest.raises(InlineError, match='run `python -m tools.i18n build` first'):
+        landing_seed(layout.build_dir)
+    with pytest.raises(InlineError, match='has no </head>'):
+        inline_seed('<html></html>', {'lang': 'en', 'bundles': {}})
@@ -0,0 +1,91 @@
+import pytest
+
+from tools.i18n.build import build
+from tools.i18n.legal import LegalError, LegalTemplate, page_name, render_body, render_page
+
+from .conftest import LOCALES, STRINGS, write_tree
+
+TEMPLATE = """<div class="privacy">
+  <!-- Header -->
+  <h1>{{ 'PRIVACY.TITLE' | translate }}</h1>
+  <p>
+    <lucide-icon [img]="Lock" class="icon"></lucide-icon>
+    {{ 'PRIVACY.INTRO' | translate }}
+  </p>
+  <p class="rights" [innerHTML]="'PRIVACY.RIGHTS' | translate"></p>
+</div>
+"""
+CSS = '.privacy { & h1 { color: #333; } }\n'
+PRIVACY = {
+    'en': {'TITLE': 'Privacy', 'INTRO': 'Data & you', 'RIGHTS': 'See <a href="/gdpr">GDPR</a>'},
+    'de': {'TITLE': 'Datenschutz', 'INTRO': 'Daten & Sie'},
+    'es': {'TITLE': 'Privacidad', 'INTRO': 'Datos y usted', 'RIGHTS': 'Ver <b>RGPD</b>'},
+    'ua': {'TITLE': 'Конфіденційність', 'INTRO': 'Дані'},
+}
+
+
+def _data(lang):
+    return {'PRIVACY': PRIVACY[lang], 'LANGUAGES': {'DE': 'Deutsch'}}
+
+
+@pytest.fixture
+def layout(tmp_path):
+    strings = {lang: {**sources, 'PRIVACY': PRIVACY[lang]} for lang, sources in STRINGS.items()}
+    layout = write_tree(tmp_path, strings)
+    layout.legal_source_dir.mkdir(parents=True)
+    (layout.legal_source_dir / 'privacy-policy.html').write_text(TEMPLATE, encoding='utf-8')
+    (layout.legal_source_dir / 'privacy-policy.css').write_text(CSS, encoding='utf-8')
+    return layout
+
+
+def test_strings_replace_the_pipes_and_angular_markup_is_dropped():
+    body = render_body(LegalTemplate('privacy', TEMPLATE, CSS), 'en', _data('en'))
+
+    assert '<h1>Privacy</h1>' in body
+    # interpolated strings are escaped, [innerHTML] ones are not
+    assert 'Data &amp; you' in body
+    assert '<p class="rights">See <a href="/gdpr">GDPR</a></p>' in body
+    assert 'lucide-icon' not in body and '<!--' not in body and 'translate' not in body
+
+
+def test_page_is_self_contained_and_links_every_locale():
+    data = {**_data('ua'), 'PRIVACY': {**PRIVACY['ua'], 'RIGHTS': 'Права'}}
+    page = render_page(LegalTemplate('privacy', TEMPLATE, CSS), 'ua', LOCALES, data).decode('utf-8')
+
+    assert page.startswith('<!doctype html>\n<html lang="uk">')
+    assert '<title>Конфіденційність</title>' in page
+    assert CSS in page and '<script' not in page
+    assert '<link rel="alternate" hreflang="x-default" href="/legal/privacy.en.html">' in page
+    assert '<a href="/legal/privacy.de.html" hreflang="de">Deutsch</a>' in page
+    assert '<a href="/legal/privacy.ua.html" hreflang="uk" aria-current="page">UA</a>' in page
+
+
+def test_missing_string_and_other_angular_syntax_are_refused():
+    with pytest.raises(LegalError, match='PRIVACY.RIGHTS is not a string in the de catalog'):
+        render_body(LegalTemplate('privacy', TEMPLATE, CSS), 'de', _data('de'))
+    bound = LegalTemplate('privacy', '<p *ngIf="show">{{ \'PRIVACY.TITLE\' | translate }}</p>\n', '')
+    with pytest.raises(LegalError, match='cannot prerender'):
+        render_body(bound, 'en', _data('en'))
+
+
+def test_build_writes_one_page_per_locale_with_english_underneath(layout, manifest):
+    report = build(layout, manifest, layout.locales())
+
+    assert report.legal == LOCALES
+    assert {path.name for path in layout.legal_dir.glob('*.html')} == {page_name('privacy', lang) for lang in LOCALES}
+    assert (layout.legal_dir / 'privacy.de.html.gz').exists()
+    german = (layout.legal_dir / 'privacy.de.html').read_text(encoding='utf-8')
+    assert '<h1>Datenschutz</h1>' in german
+    assert 'See <a href="/gdpr">GDPR</a>' in german
+
+
+def test_unchanged_pages_are_not_rewritten_and_stale_ones_pruned(layout, manifest):
+    build(layout, manifest, layout.locales())
+    stale = layout.legal_dir / page_name('privacy', 'fr')
+    stale.write_text('old', encoding='utf-8')
+
+    assert build(layout, manifest, layout.locales()).legal == []
+    assert not stale.exists()
+    (layout.source_dir / 'es' / 'PRIVACY.json').write_text('{\n  "TITLE": "Privacidad y datos"\n}\n', encoding='utf-8')
+    assert build(layout, manifest, ['es']).legal == ['es']
+    assert '<h1>Privacidad y datos</h1>' in (layout.legal_dir / 'privacy.es.html').read_text(encoding='utf-8')
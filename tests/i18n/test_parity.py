@@ -0,0 +1,47 @@
+from tools.i18n.parity import FlatLocale, check_parity, load_baseline, new_issues, write_baseline
+
+EN = FlatLocale(
+    'en',
+    {
+        'LANGUAGE': 'Language',
+        'ADMIN': {'LABEL': 'Admin', 'HEADLINE': 'Administration workspace'},
+        'WORKSPACE': {'NAME': 'Workspace name'},
+        'role': {'composer': 'Composer'},
+    },
+)
+# The mistakes the de and es sources used to make: a namespace nested under
+# another one, a misnamed file, a missing root string.
+DE = FlatLocale(
+    'de',
+    {
+        'WORKSPACE': {'NAME': 'Workspace-Name', 'ADMIN': {'LABEL': 'Admin'}},
+        'WORKSPACES': {'NAME': 'Workspace-Name'},
+        'role': {'composer': 'Komponist'},
+    },
+)
+
+
+def _ids(issues):
+    return sorted(issue.id for issue in issues)
+
+
+def test_whole_namespaces_are_one_issue_each():
+    assert _ids(check_parity(EN, [DE])) == [
+        'extra:de:WORKSPACE.ADMIN.LABEL',
+        'missing:de:LANGUAGE',
+        'namespace:de:ADMIN',
+        'namespace:de:WORKSPACES',
+    ]
+
+
+def test_root_strings_belong_to_no_namespace():
+    assert EN.namespaces == {'ADMIN', 'WORKSPACE', 'role'}
+
+
+def test_baseline_never_accepts_structural_issues(tmp_path):
+    issues = list(check_parity(EN, [DE]))
+    path = tmp_path / 'parity-baseline.json'
+    write_baseline(path, issues)
+
+    assert _ids(new_issues(issues, load_baseline(path))) == ['namespace:de:ADMIN', 'namespace:de:WORKSPACES']
+    assert not any(entry.startswith('namespace:') for entry in load_baseline(path))
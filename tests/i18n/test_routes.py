@@ -0,0 +1,96 @@
+from tools.i18n.routes import parse_routes, preload_links, route_manifest
+
+CATALOG = {
+    'TITLE': 'Music Rights',
+    'COMMON': {'SAVE': 'Save', 'CANCEL': 'Cancel'},
+    'NAV': {'HOME': 'Home'},
+    'WORKS': {'TITLE': 'Works'},
+    'SPLITS': {'TITLE': 'Splits'},
+    'ADMIN': {'TITLE': 'Admin', 'USERS': 'Users'},
+}
+APP = {
+    # the shell renders NAV and a button every page uses
+    'app/app.ts': "import { SaveButton } from './components/save-button';\nconst home = 'NAV.HOME';\n",
+    'app/components/save-button.ts': (
+        "import { Component } from '@angular/core';\n"
+        "@Component({ templateUrl: './save-button.html' })\n"
+        'export class SaveButton {}\n'
+    ),
+    'app/components/save-button.html': "<button>{{ 'COMMON.SAVE' | translate }}</button>\n",
+    'app/app.routes.ts': """import { Routes } from '@angular/router';
+import { Works } from './works/works';
+
+export const routes: Routes = [
+    { path: '', loadComponent: () => import('./landing/landing').then(m => m.Landing) },
+    { path: 'works', component: Works },
+    // { path: 'old', loadComponent: () => import('./old/old').then(m => m.Old) },
+    {
+        path: 'works/:id',
+        loadComponent: () => import('./works/work-layout').then(m => m.WorkLayout),
+        children: [
+            { path: 'splits', loadComponent: () => import('./splits/splits').then(m => m.Splits) },
+        ]
+    },
+    { path: 'admin', loadChildren: () => import('./admin/admin.routes').then(m => m.routes) },
+    { path: 'works', loadComponent: () => import('./landing/landing').then(m => m.Landing) },
+];
+""",
+    'app/landing/landing.ts': "const title = this.translate.instant('TITLE');\n",
+    'app/works/works.ts': "import { SaveButton } from '../components/save-button';\nconst title = 'WORKS.TITLE';\n",
+    'app/works/work-layout.ts': "const back = 'COMMON.CANCEL';\nconst title = 'WORKS.TITLE';\n",
+    'app/splits/splits.ts': "const title = 'SPLITS.TITLE';\n",
+    'app/admin/admin.routes.ts': """import { Routes } from '@angular/router';
+
+export const routes: Routes = [
+    { path: 'users', loadComponent: () => import('./users').then(m => m.Users) },
+];
+""",
+    'app/admin/users.ts': "const users = 'ADMIN.USERS';\n",
+}
+
+
+def _app(tmp_path):
+    for name, text in APP.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+    return tmp_path
+
+
+def test_lazy_children_and_layouts_are_flattened(tmp_path):
+    src = _app(tmp_path)
+    routes = parse_routes(src / 'app' / 'app.routes.ts')
+
+    assert [route.path for route in routes] == ['', 'works', 'works/:id/splits', 'admin/users', 'works']
+    layout = src / 'app' / 'works' / 'work-layout.ts'
+    assert routes[2].entries == [layout.resolve(), (src / 'app' / 'splits' / 'splits.ts').resolve()]
+
+
+def test_each_route_gets_the_bundles_of_its_code(tmp_path):
+    manifest = route_manifest(_app(tmp_path), CATALOG)
+
+    # top-level strings load as the _root bundle
+    assert manifest['routes'][''] == ['_root']
+    # the first declaration of a path wins
+    assert manifest['routes']['works'] == ['WORKS']
+    # a child route needs its parent layout's bundles too
+    assert manifest['routes']['works/:id/splits'] == ['SPLITS', 'WORKS']
+    assert manifest['routes']['admin/users'] == ['ADMIN']
+
+
+def test_namespaces_the_shell_uses_load_once_for_every_route(tmp_path):
+    manifest = route_manifest(_app(tmp_path), CATALOG)
+
+    assert manifest['shell'] == ['COMMON', 'NAV']
+    # COMMON is reached from works and the layout as well, but ships with the shell
+    assert all('COMMON' not in names and 'NAV' not in names for names in manifest['routes'].values())
+    urls = {name: f'/b/{name}.json' for name in CATALOG if isinstance(CATALOG[name], dict)} | {'_root': '/b/_root.json'}
+    links = preload_links(manifest, urls, '/b')
+    assert links['/works/:id/splits'] == [
+        '/b/routes.json',
+        '/b/bundles.json',
+        '/b/COMMON.json',
+        '/b/NAV.json',
+        '/b/SPLITS.json',
+        '/b/WORKS.json',
+    ]
@@ -0,0 +1,122 @@
+import json
+import os
+
+import pytest
+
+from tools.i18n import catalog
+from tools.i18n.config import Layout
+from tools.i18n.members import ScanError, scan_members
+from tools.i18n.sections import MERGE_DIR, MergeError, reconcile
+
+SOURCES = {
+    '_root.json': '{\n  "TITLE": "Music Rights",\n  "LANGUAGE": "Language"\n}\n',
+    'WORKS.json': '{\n  "TITLE": "Works",\n  "EMPTY": "No works yet"\n}\n',
+    # kept as written, not re-indented or re-ordered
+    'AUTH.json': '{\n  "LOGIN":   "Sign in",\n  "EMAIL": "Email"\n}\n',
+}
+
+
+@pytest.fixture
+def layout(tmp_path):
+    folder = tmp_path / 'i18n-src' / 'en'
+    folder.mkdir(parents=True)
+    for name, text in SOURCES.items():
+        (folder / name).write_text(text, encoding='utf-8')
+    return Layout(tmp_path)
+
+
+def _source(layout, name):
+    return layout.source_dir / 'en' / name
+
+
+def _cache(layout):
+    return json.loads((layout.cache_dir / MERGE_DIR / 'en.json').read_bytes())
+
+
+def test_sources_merge_root_first_then_namespaces_by_name(layout):
+    assert reconcile(layout, 'en', write=True).status == 'updated'
+
+    published = layout.locale_file('en').read_bytes()
+    assert list(scan_members(published)) == ['TITLE', 'LANGUAGE', 'AUTH', 'WORKS']
+    assert json.loads(published)['WORKS'] == {'TITLE': 'Works', 'EMPTY': 'No works yet'}
+    assert b'"AUTH": {\n    "LOGIN":   "Sign in",' in published
+
+
+def test_cache_keeps_each_sources_stat_and_digest(layout):
+    reconcile(layout, 'en', write=True)
+    raw = _source(layout, 'WORKS.json').read_bytes()
+    stat = _source(layout, 'WORKS.json').stat()
+
+    entry = _cache(layout)['sources']['WORKS']
+    assert entry['digest'] == catalog.digest(raw)
+    assert entry['stat'] == [stat.st_mtime_ns, stat.st_size]
+    assert entry['members'] == ['WORKS']
+    assert reconcile(layout, 'en', write=True).status == 'unchanged'
+
+
+def test_touched_source_with_the_same_bytes_is_not_re_rendered(layout):
+    reconcile(layout, 'en', write=True)
+    path = _source(layout, 'AUTH.json')
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10**9))
+
+    assert reconcile(layout, 'en', write=True).status == 'unchanged'
+    assert _cache(layout)['sources']['AUTH']['stat'][0] == path.stat().st_mtime_ns
+
+
+def test_edited_source_reports_only_its_namespace(layout):
+    reconcile(layout, 'en', write=True)
+    _source(layout, 'WORKS.json').write_text('{\n  "TITLE": "Catalogue"\n}\n', encoding='utf-8')
+
+    result = reconcile(layout, 'en', write=True)
+    assert (result.status, result.sections) == ('updated', ['WORKS'])
+    assert json.loads(layout.locale_file('en').read_bytes())['WORKS'] == {'TITLE': 'Catalogue'}
+
+
+def test_hand_edit_of_the_published_file_is_not_overwritten(layout):
+    reconcile(layout, 'en', write=True)
+    target = layout.locale_file('en')
+    target.write_bytes(target.read_bytes().replace(b'"Works"', b'"Werke"'))
+
+    result = reconcile(layout, 'en', write=True)
+    assert (result.status, result.sections) == ('edited', ['WORKS'])
+    assert b'"Werke"' in target.read_bytes()
+    assert reconcile(layout, 'en', write=True, force=True).status == 'updated'
+    assert b'"Werke"' not in target.read_bytes()
+
+
+def test_failed_rewrite_leaves_the_published_file_whole(layout, monkeypatch):
+    reconcile(layout, 'en', write=True)
+    target = layout.locale_file('en')
+    before = target.read_bytes()
+    _source(layout, 'WORKS.json').write_text('{\n  "TITLE": "Catalogue"\n}\n', encoding='utf-8')
+
+    def interrupted(source, destination):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(catalog.os, 'replace', interrupted)
+    with pytest.raises(OSError):
+        reconcile(layout, 'en', write=True)
+
+    assert target.read_bytes() == before
+    assert [path.name for path in target.parent.iterdir()] == ['en.json']
+
+
+def test_key_defined_in_two_sources_is_refused(layout):
+    _source(layout, '_root.json').write_text('{\n  "WORKS": "Works"\n}\n', encoding='utf-8')
+    with pytest.raises(MergeError, match='WORKS defined in more than one source file'):
+        reconcile(layout, 'en', write=True)
+
+
+def test_member_spans_survive_escapes_and_nesting():
+    raw = b'{"a": "say \\"}\\" \\\\", "b": {"c": [1, {"d": "}"}]}, "e": 2}'
+    spans = scan_members(raw)
+
+    assert list(spans) == ['a', 'b', 'e']
+    assert json.loads(raw[spans['a'].value_start:spans['a'].value_end]) == 'say "}" \\'
+    assert raw[spans['b'].value_start:spans['b'].value_end] == b'{"c": [1, {"d": "}"}]}'
+    assert raw[spans['e'].key_start:spans['e'].value_end] == b'"e": 2'
+
+
+def test_scan_refuses_an_unterminated_object():
+    with pytest.raises(ScanError):
+        scan_members(b'{"a": {"b": 1}')
@@ -0,0 +1,83 @@
+import json
+
+from tools.i18n.artifacts import MAP_FILE
+from tools.i18n.build import build
+from tools.i18n.bundles import INDEX_FILE
+from tools.i18n.catalog import flatten
+from tools.i18n.shortkeys import (
+    KEYS_DIR,
+    SHORT_LOCALE,
+    TREE_STEM,
+    bundle_trees,
+    js_order,
+    key_tree,
+    render_tree,
+    short_values,
+)
+
+DATA = {
+    'TITLE': 'Music Rights',
+    'NAV': {'HOME': 'Home', '10': 'Ten', '2': 'Two', 'WORKS': 'Works'},
+    'WORKS': {'LIST': {'EMPTY': 'No works', 'TITLE': 'Works'}, 'NAV': 'Back'},
+}
+
+
+def _leaves(tree):
+    for child in tree.values():
+        if isinstance(child, dict):
+            yield from _leaves(child)
+        else:
+            yield child
+
+
+def _paths(tree, prefix=''):
+    """Dotted keys of a shipped tree (leaves ``0``), in id order."""
+    for name, child in tree.items():
+        path = f'{prefix}.{name}' if prefix else name
+        yield from _paths(child, path) if isinstance(child, dict) else [path]
+
+
+def _read(path):
+    return json.loads(path.read_bytes())
+
+
+def test_every_leaf_has_its_own_key_in_javascript_order():
+    tree = key_tree(DATA)
+    leaves = list(_leaves(tree))
+
+    assert len(set(leaves)) == len(leaves) == len(flatten(DATA))
+    assert set(leaves) == set(flatten(DATA))
+    # integer-like names first, as Object.entries visits them
+    assert list(tree['NAV']) == js_order(list(DATA['NAV'])) == ['2', '10', 'HOME', 'WORKS']
+    assert dict(zip(leaves, short_values(DATA, tree))) == flatten(DATA)
+
+
+def test_tree_only_changes_with_the_keys():
+    tree = render_tree(key_tree(DATA))
+    retold = {**DATA, 'NAV': {**DATA['NAV'], 'HOME': 'Start'}}
+
+    assert render_tree(key_tree(json.loads(json.dumps(DATA)))) == tree
+    assert render_tree(key_tree(retold)) == tree
+    assert render_tree(key_tree({**DATA, 'EXTRA': 'New'})) != tree
+
+
+def test_short_arrays_map_back_to_the_original_keys(layout, manifest):
+    build(layout, manifest, layout.locales(), short_keys=True)
+    maps = _read(layout.build_dir / MAP_FILE)
+    index = _read(layout.build_dir / INDEX_FILE)
+    tree = _read(layout.build_dir / KEYS_DIR / f'{TREE_STEM}.{maps["keys"]}.json')
+    english = flatten(_read(layout.locale_file('en')))
+
+    assert sorted(_paths(tree)) == sorted(english)
+    for lang in layout.locales():
+        values = _read(layout.build_dir / lang / f'{SHORT_LOCALE}.{maps["short"][lang]}.json')
+        shipped = dict(zip(_paths(tree), values))
+        # missing translations ship the default locale's string
+        assert shipped == {**english, **flatten(_read(layout.locale_file(lang)))}
+        for bundle, entry in index['short'][lang].items():
+            part = bundle_trees(tree)[bundle]
+            values = _read(layout.build_dir / lang / f'{SHORT_LOCALE}.{bundle}.{entry["hash"]}.json')
+            assert dict(zip(_paths(part), values)) == {key: shipped[key] for key in _paths(part)}
+
+    build(layout, manifest, layout.locales(), short_keys=True)
+    assert _read(layout.build_dir / MAP_FILE)['keys'] == maps['keys']
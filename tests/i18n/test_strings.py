@@ -0,0 +1,64 @@
+import json
+
+from tools.i18n.build import build
+from tools.i18n.bundles import INDEX_FILE, split_namespaces
+from tools.i18n.catalog import flatten
+from tools.i18n.fallback import merge_fallback
+from tools.i18n.manifest import Manifest
+from tools.i18n.strings import STRING_TABLE, intern, render_interned, string_table
+
+from .conftest import STRINGS, write_tree
+
+BUNDLES = {
+    'WORKS': {'WORKS': {'SAVE': 'Save', 'CANCEL': 'Cancel', 'TITLE': 'Works', 'EDIT': {'SAVE': 'Save'}}},
+    'SPLITS': {'SPLITS': {'SAVE': 'Save', 'CANCEL': 'Cancel', 'TITLE': 'Splits'}},
+    'NAV': {'NAV': {'WORKS': 'Works', 'HOME': 'Home', 'AGAIN': 'Home'}},
+}
+
+
+def _resolve(value, table):
+    """What the client does with an interned bundle."""
+    if isinstance(value, dict):
+        return {key: _resolve(child, table) for key, child in value.items()}
+    return table[value] if isinstance(value, int) else value
+
+
+def test_only_strings_of_several_bundles_go_to_the_table():
+    table = string_table(BUNDLES)
+
+    # Save: 3 uses, then Cancel and Works with 2 each in order of first use
+    assert table == ['Save', 'Cancel', 'Works']
+    # repeated inside one bundle only
+    assert 'Home' not in table
+
+
+def test_every_key_maps_back_to_its_string():
+    table = string_table(BUNDLES)
+    index = {text: position for position, text in enumerate(table)}
+    payloads, stats = render_interned(BUNDLES, table, index)
+
+    assert json.loads(payloads[STRING_TABLE]) == table
+    for name, bundle in BUNDLES.items():
+        interned = json.loads(payloads[name])
+        assert flatten(_resolve(interned, table)) == flatten(bundle)
+    assert intern(BUNDLES['NAV'], index)['NAV'] == {'WORKS': 2, 'HOME': 'Home', 'AGAIN': 'Home'}
+    assert (stats.shared, stats.references) == (3, 7)
+    assert stats.after == sum(map(len, payloads.values()))
+
+
+def test_built_bundles_resolve_to_the_locale(tmp_path):
+    strings = {lang: {**sources, 'SPLITS': {'TITLE': sources['WORKS']['TITLE']}} for lang, sources in STRINGS.items()}
+    layout = write_tree(tmp_path, strings)
+    report = build(layout, Manifest(layout.cache_dir / 'manifest.json'), layout.locales(), string_table=True)
+    index = json.loads((layout.build_dir / INDEX_FILE).read_bytes())
+    english = json.loads(layout.locale_file('en').read_bytes())
+
+    for lang in layout.locales():
+        assert report.strings[lang].shared == 1
+        entry = index['strings'][lang]
+        table = json.loads((layout.build_dir / lang / f'{STRING_TABLE}.{entry["hash"]}.json').read_bytes())
+        assert table == [strings[lang]['WORKS']['TITLE']]
+        shipped = split_namespaces(merge_fallback(json.loads(layout.locale_file(lang).read_bytes()), english)[0])
+        for name, bundle in index['locales'][lang].items():
+            interned = json.loads((layout.build_dir / lang / f'{name}.{bundle["hash"]}.json').read_bytes())
+            assert _resolve(interned, table) == shipped[name]
@@ -0,0 +1,42 @@
+import json
+
+from tools.i18n.catalog import flatten
+from tools.i18n.config import Layout
+from tools.i18n.usage import load_keep, prune_unused, scan
+
+CATALOG = {
+    'AUTH': {'SECURITY_QUESTION': 'Security question', 'UNUSED': 'Unused'},
+    'SECURITY': {'Q_FIRST_PET': 'What was the name of your first pet?'},
+}
+REGISTER = """
+<label>{{ 'AUTH.SECURITY_QUESTION' | translate }}</label>
+<option [value]="q.id">{{ q.question_key | translate }}</option>
+"""
+
+
+def _prune(tmp_path, keep):
+    (tmp_path / 'register.html').write_text(REGISTER, encoding='utf-8')
+    index = scan(tmp_path, keep)
+    return prune_unused(CATALOG, index.resolve(flatten(CATALOG)))
+
+
+def test_prune_drops_keys_the_sources_never_name(tmp_path):
+    data, removed = _prune(tmp_path, ())
+    assert data == {'AUTH': {'SECURITY_QUESTION': 'Security question'}}
+    assert sorted(removed) == ['AUTH.UNUSED', 'SECURITY.Q_FIRST_PET']
+
+
+def test_prune_keeps_database_driven_keys_on_the_keep_list(tmp_path):
+    data, removed = _prune(tmp_path, load_keep(Layout().keep_file))
+    assert data['SECURITY'] == CATALOG['SECURITY']
+    assert removed == ['AUTH.UNUSED']
+
+
+def test_missing_keep_list_keeps_nothing(tmp_path):
+    assert load_keep(tmp_path / 'keep-keys.json') == set()
+
+
+def test_keep_list_changes_the_index_digest(tmp_path):
+    keep = tmp_path / 'keep-keys.json'
+    keep.write_text(json.dumps({'SECURITY.Q_*': 'question_key'}), encoding='utf-8')
+    assert scan(tmp_path, load_keep(keep)).digest() != scan(tmp_path).digest()
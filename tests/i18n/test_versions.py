@@ -0,0 +1,92 @@
+import copy
+import json
+
+from tools.i18n.artifacts import artifact_name, write_immutable
+from tools.i18n.catalog import minify, short_digest
+from tools.i18n.versions import VersionManifest, delta_name, json_patch
+
+V1 = {
+    'PRIVACY': {'TITLE': 'Privacy', 'INTRO': 'We keep your data safe.'},
+    'OLD': 'Gone soon',
+    'a/b~c': 'Escaped key',
+    'NAV': {'HOME': 'Home'},
+}
+V2 = {
+    'PRIVACY': {'TITLE': 'Privacy policy', 'INTRO': 'We keep your data safe.', 'NEW': 'Added'},
+    'a/b~c': 'Escaped key, changed',
+    'NAV': 'Navigation',
+    'WORKS': {'TITLE': 'Works'},
+}
+
+
+def apply_patch(doc, ops):
+    """``applyPatch`` from src/app/services/locale-delta.ts."""
+    result = copy.deepcopy(doc)
+    for op, pointer, *value in ops:
+        *path, name = [segment.replace('~1', '/').replace('~0', '~') for segment in pointer.split('/')[1:]]
+        node = result
+        for segment in path:
+            if not isinstance(node.get(segment), dict):
+                node[segment] = {}
+            node = node[segment]
+        if op == 'remove':
+            del node[name]
+        else:
+            node[name] = value[0]
+    return result
+
+
+def test_patch_turns_the_old_version_into_the_new_one():
+    ops = json_patch(V1, V2)
+
+    assert apply_patch(V1, ops) == V2
+    assert ['remove', '/OLD'] in ops
+    assert ['replace', '/a~1b~0c', 'Escaped key, changed'] in ops
+    # objects are patched member by member, other values whole
+    assert ['add', '/PRIVACY/NEW', 'Added'] in ops
+    assert ['replace', '/NAV', 'Navigation'] in ops
+
+
+def test_identical_versions_need_no_operations():
+    assert json_patch(V1, copy.deepcopy(V1)) == []
+
+
+def _publish(versions, directory, data):
+    payload = minify(data)
+    write_immutable(directory, artifact_name('_all', payload), payload)
+    versions.publish(directory, 'ua', '_all', short_digest(payload), payload)
+    return short_digest(payload)
+
+
+def test_published_patch_rebuilds_the_current_version(tmp_path):
+    versions = VersionManifest(tmp_path / 'versions.json', keep=3)
+    big = {**V1, 'FILLER': {f'KEY_{n}': f'Sentence number {n}' for n in range(50)}}
+    old = _publish(versions, tmp_path, big)
+    new = _publish(versions, tmp_path, {**big, 'NAV': {'HOME': 'Start'}})
+
+    entry = versions.locales['ua']['_all']
+    assert (entry['current'], entry['previous']) == (new, [old])
+    ops = json.loads((tmp_path / delta_name('_all', old, new)).read_bytes())
+    assert ops == [['replace', '/NAV/HOME', 'Start']]
+    assert entry['deltas'] == {old: len(minify(ops))}
+    assert apply_patch(big, ops)['NAV'] == {'HOME': 'Start'}
+
+
+def test_history_is_capped_and_large_patches_are_skipped(tmp_path):
+    versions = VersionManifest(tmp_path / 'versions.json', keep=2)
+    hashes = [_publish(versions, tmp_path, {'N': n}) for n in range(3)]
+    # a tiny artifact is smaller than any patch to it
+    assert versions.locales['ua']['_all'] == {'current': hashes[2], 'previous': [hashes[1]], 'deltas': {}}
+    assert versions.files('ua') == {f'_all.{hashes[1]}.json'}
+
+
+def test_smaller_keep_drops_older_versions(tmp_path):
+    path = tmp_path / 'versions.json'
+    versions = VersionManifest(path, keep=3)
+    for n in range(3):
+        _publish(versions, tmp_path, {'N': n})
+    versions.save()
+
+    resized = VersionManifest(path, keep=2)
+    assert resized.resized
+    assert len(resized.locales['ua']['_all']['previous']) == 1
@@ -0,0 +1,57 @@
+import json
+
+from tools.i18n.artifacts import MAP_FILE
+from tools.i18n.build import build
+from tools.i18n.bundles import INDEX_FILE
+from tools.i18n.watch import changed_locales, rebuild, snapshot, watched_files
+
+from .conftest import LOCALES
+
+
+def _read(layout, name):
+    return json.loads((layout.build_dir / name).read_bytes())
+
+
+def _others(entries, lang):
+    return {code: entry for code, entry in entries.items() if code != lang}
+
+
+def test_rebuilding_one_locale_keeps_the_others(layout, manifest):
+    build(layout, manifest, layout.locales())
+    maps, index = _read(layout, MAP_FILE), _read(layout, INDEX_FILE)
+    (layout.source_dir / 'es' / 'WORKS.json').write_text('{\n  "TITLE": "Canciones"\n}\n', encoding='utf-8')
+
+    event = rebuild(layout, manifest, ['es'])
+
+    assert event.error is None
+    assert event.report.applied == ['es']
+    after_maps, after_index = _read(layout, MAP_FILE), _read(layout, INDEX_FILE)
+    assert list(after_maps['locales']) == LOCALES
+    assert _others(after_maps['locales'], 'es') == _others(maps['locales'], 'es')
+    assert _others(after_index['locales'], 'es') == _others(index['locales'], 'es')
+    assert after_index['locales']['es']['WORKS'] != index['locales']['es']['WORKS']
+    for lang in LOCALES:
+        for name, entry in after_index['locales'][lang].items():
+            assert (layout.build_dir / lang / f'{name}.{entry["hash"]}.json').exists()
+
+
+def test_half_typed_source_is_reported_not_raised(layout, manifest):
+    build(layout, manifest, layout.locales())
+    (layout.source_dir / 'de' / 'NAV.json').write_text('{\n  "HOME": ', encoding='utf-8')
+
+    event = rebuild(layout, manifest, ['de'])
+
+    assert event.report is None
+    assert isinstance(event.error, ValueError)
+    assert list(_read(layout, MAP_FILE)['locales']) == LOCALES
+
+
+def test_only_locales_with_changed_sources_are_reported(layout):
+    files = watched_files(layout)
+    before = snapshot(files)
+    path = layout.source_dir / 'ua' / 'NAV.json'
+    path.write_text('{\n  "HOME": "Дім"\n}\n', encoding='utf-8')
+    (layout.source_dir / 'de' / 'EXTRA.json').write_text('{}\n', encoding='utf-8')
+
+    assert set(files.values()) == set(LOCALES)
+    assert changed_locales(layout, before, snapshot(watched_files(layout))) == {'ua', 'de'}
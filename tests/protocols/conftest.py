@@ -0,0 +1,25 @@
+import json
+
+import pytest
+
+WORK_ID = '7f1c1b5e-2d7e-4a40-9d6e-1a2b3c4d5e6f'
+RECORD = {
+    'work': {'id': WORK_ID, 'workspace_id': 'c0ffee00-0000-4000-8000-000000000001', 'work_title': 'Night Drive'},
+    'splits': [
+        {
+            'split_type': 'music',
+            'rights_layer': 'ip',
+            'ownership_percentage': 100,
+            'rights_holder': {'nickname': 'mira', 'email': 'mira@example.com'},
+        }
+    ],
+    'declarations': [{'section': 'ip', 'creation_type': 'human'}],
+}
+
+
+@pytest.fixture
+def document():
+    """(id, JSON text) of one split sheet, as ``source`` reads it."""
+    pytest.importorskip('reportlab')
+    pytest.importorskip('segno')
+    return WORK_ID, json.dumps(RECORD)
@@ -0,0 +1,73 @@
+import json
+import os
+
+import pytest
+
+from tools.protocols.batch import RenderSetup, load_assets
+from tools.protocols.layouts import render_split_sheet
+from tools.protocols.qr import QrCache, _key, document_digest, make_payload, parse_payload
+
+from .conftest import WORK_ID
+
+
+def test_payload_round_trip_and_foreign_codes():
+    payload = make_payload('protocol', WORK_ID, '{"protocol": {}}')
+
+    assert parse_payload(payload) == ('protocol', WORK_ID, document_digest('{"protocol": {}}'))
+    assert parse_payload('https://example.com') is None
+    assert parse_payload(json.dumps({**json.loads(payload), 'platform': 'other'})) is None
+    assert parse_payload(json.dumps({**json.loads(payload), 'id': 'not-a-uuid'})) is None
+
+
+def test_printed_code_decodes_to_the_document(document, tmp_path):
+    pytest.importorskip('pymupdf')
+    pytest.importorskip('zxingcpp')
+    from tools.protocols.verify import DPI, _decode_pages
+
+    document_id, text = document
+    assets = load_assets(RenderSetup('split-sheet', qr_cache=tmp_path / 'qr'))
+    qr = assets.codes.get(make_payload('split-sheet', document_id, text))
+    _, pdf = render_split_sheet(json.loads(text), assets, qr)
+    path = tmp_path / 'scan.pdf'
+    path.write_bytes(pdf)
+
+    codes, error = _decode_pages(str(path), 0, 1, DPI)
+    assert error is None
+    assert [(page, parse_payload(code)) for page, code in codes] == [
+        (1, ('split-sheet', document_id, document_digest(text)))
+    ]
+
+
+def test_cache_encodes_each_payload_once_across_instances(document, tmp_path):
+    payload = make_payload('split-sheet', *document)
+    first = QrCache(tmp_path)
+    code = first.get(payload)
+
+    again = QrCache(tmp_path)
+    assert again.get(payload) == code
+    assert (first.stats.misses, again.stats.hits, again.stats.misses) == (1, 1, 0)
+    assert again.rendering(payload, 'svg').lstrip().startswith(b'<?xml')
+    assert again.rendering(payload, 'png').startswith(b'\x89PNG')
+
+
+def test_eviction_drops_the_least_recently_used_entries(document, tmp_path):
+    cache = QrCache(tmp_path)
+    payloads = [make_payload('split-sheet', WORK_ID, f'{{"n": {n}}}') for n in range(3)]
+    for age, payload in zip((30, 20, 10), payloads):
+        cache.get(payload)
+        path = cache.path(_key(payload))
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns - age * 10**9))
+    total = sum(path.stat().st_size for path in tmp_path.glob('*/*'))
+    # a hit makes the oldest entry the most recently used one
+    cache.get(payloads[0])
+
+    cache.max_bytes = total - 1
+    removed, freed = cache.evict()
+
+    assert removed == 1
+    assert freed == total - sum(path.stat().st_size for path in tmp_path.glob('*/*'))
+    assert [cache.path(_key(payload)).exists() for payload in payloads] == [True, False, True]
+    assert not any(tmp_path.glob(f'*/{_key(payloads[1])}.*'))
+    cache.max_bytes = 0
+    assert cache.evict()[0] == 2
+    assert not any(tmp_path.glob('*/*'))
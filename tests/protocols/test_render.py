@@ -0,0 +1,64 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+from tools.protocols import cli
+from tools.protocols.batch import RenderSetup, load_assets, render_archive
+from tools.protocols.labels import RenderError
+from tools.protocols.layouts import render_split_sheet
+
+from .conftest import WORK_ID
+
+
+def _text(pdf):
+    pymupdf = pytest.importorskip('pymupdf')
+    with pymupdf.open(stream=pdf, filetype='pdf') as document:
+        return ''.join(page.get_text() for page in document)
+
+
+def test_english_split_sheet_renders(document):
+    assets = load_assets(RenderSetup('split-sheet', qr_cache=None))
+    name, pdf = render_split_sheet(json.loads(document[1]), assets)
+
+    assert name == 'protocol-night-drive.pdf'
+    assert pdf.startswith(b'%PDF-')
+    text = _text(pdf)
+    assert 'Night Drive' in text
+    assert assets.labels('SECTIONS.WORK_OVERVIEW') in text
+    assert '@mira' in text
+
+
+def test_archive_keeps_the_documents_that_render(document, tmp_path):
+    broken = ('00000000-0000-4000-8000-000000000000', json.dumps({'splits': []}))
+    output = io.BytesIO()
+    report = render_archive([document, broken], RenderSetup('split-sheet', qr_cache=tmp_path / 'qr'), output, workers=1)
+
+    assert (report.documents, report.qr_encoded) == (1, 2)
+    assert [(document_id, error.split(':')[0]) for document_id, error in report.failed] == [(broken[0], 'KeyError')]
+    with zipfile.ZipFile(output) as archive:
+        assert archive.namelist() == ['protocol-night-drive.pdf']
+        assert archive.read('protocol-night-drive.pdf').startswith(b'%PDF-')
+
+
+def test_ukrainian_without_a_font_is_refused_before_rendering(document):
+    with pytest.raises(RenderError, match=r'the ua labels \(.+\) need a Unicode font: pass --font'):
+        load_assets(RenderSetup('split-sheet', lang='ua', qr_cache=None))
+
+
+def test_cli_reports_the_missing_font_without_a_traceback(document, tmp_path, capsys):
+    output = tmp_path / 'ua.zip'
+
+    # the documents are only read once the labels and fonts are loaded, so no database is needed
+    assert cli.main(['render', '--lang', 'ua', '--no-qr', '-w', WORK_ID, '-o', str(output)]) == 1
+    assert capsys.readouterr().err.startswith('❌ the ua labels')
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unreadable_font_is_a_render_error(document, tmp_path):
+    font = tmp_path / 'Broken.ttf'
+    font.write_bytes(b'not a font')
+
+    with pytest.raises(RenderError, match='cannot load font'):
+        load_assets(RenderSetup('split-sheet', lang='ua', font=font, qr_cache=None))
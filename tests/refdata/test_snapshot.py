@@ -0,0 +1,127 @@
+import json
+
+import pytest
+
+from tools.db import connect
+from tools.i18n.artifacts import artifact_name
+from tools.i18n.catalog import minify
+from tools.i18n.config import Layout
+from tools.refdata.snapshot import MAP_FILE, ReferenceTables, build_snapshot, compile_snapshot, label_key
+
+# the columns the compiler reads, in place of the app's migrations
+SCHEMA = """
+CREATE TABLE public.cmo_pro_organizations (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(), name text, acronym text, organization_type text,
+  country text, website text, is_active boolean DEFAULT true
+);
+CREATE VIEW public.cmo_pro_by_region AS
+SELECT CASE WHEN country IN ('DE', 'UA') THEN 'Europe' ELSE 'Other/Global' END AS region, acronym
+  FROM public.cmo_pro_organizations WHERE is_active = true;
+CREATE TABLE public.neighbouring_functions (
+  id bigserial PRIMARY KEY, type text, function_name text, display_order integer, is_active boolean DEFAULT true
+);
+CREATE TABLE public.security_questions (
+  id bigserial PRIMARY KEY, question_key text, question_text text, category text, display_order integer,
+  is_active boolean DEFAULT true
+);
+INSERT INTO public.cmo_pro_organizations (name, acronym, organization_type, country, website, is_active) VALUES
+  ('Gesellschaft für musikalische Aufführungsrechte', 'GEMA', 'PRO', 'DE', 'https://www.gema.de', true),
+  ('Ukrainian Authors Society', 'UACRR', 'CMO', 'UA', NULL, true),
+  ('American Society of Composers', 'ASCAP', 'PRO', 'US', NULL, true),
+  ('Closed Society', 'OLD', 'PRO', 'DE', NULL, false);
+INSERT INTO public.neighbouring_functions (type, function_name, display_order) VALUES
+  ('performer', 'Lead vocals', 2), ('producer', 'Producer', 1);
+INSERT INTO public.security_questions (question_key, question_text, category, display_order) VALUES
+  ('SECURITY.Q_PET', 'Name of your first pet?', 'personal', 1);
+"""
+LOCALES = {
+    'en': {
+        'REFERENCE': {'REGIONS': {'EUROPE': 'Europe'}, 'ORGANIZATION_TYPES': {'PRO': 'Performing rights'}},
+        'SECURITY': {'Q_PET': 'What was the name of your first pet?'},
+    },
+    'de': {'REFERENCE': {'REGIONS': {'EUROPE': 'Europa'}}},
+}
+
+
+@pytest.fixture
+def layout(tmp_path):
+    layout = Layout(tmp_path / 'repo')
+    for lang, data in LOCALES.items():
+        source = layout.source_dir / lang
+        source.mkdir(parents=True)
+        (source / '_root.json').write_text('{}\n', encoding='utf-8')
+        layout.locale_file(lang).parent.mkdir(parents=True, exist_ok=True)
+        layout.locale_file(lang).write_text(json.dumps(data), encoding='utf-8')
+    return layout
+
+
+@pytest.fixture
+def dsn(scratch_db):
+    with connect(scratch_db) as connection:
+        connection.execute(SCHEMA)
+    return scratch_db
+
+
+def _tables():
+    return ReferenceTables(
+        organizations=[('1', 'GEMA', 'GEMA', 'PRO', 'DE', None), ('2', 'ASCAP', 'ASCAP', 'PRO', 'US', None)],
+        regions=['Europe', 'Americas'],
+        country_order=[0, 1],
+        functions=[(1, 'producer', 'Producer', 1)],
+        questions=[(1, 'SECURITY.Q_PET', 'Name of your first pet?', 'personal')],
+    )
+
+
+def test_label_keys_follow_the_locale_files():
+    assert label_key('Middle East') == 'MIDDLE_EAST'
+    assert label_key('Other/Global') == 'OTHER_GLOBAL'
+
+
+def test_same_tables_give_the_same_artifact(layout):
+    first = minify(compile_snapshot(_tables(), layout))
+
+    assert minify(compile_snapshot(_tables(), layout)) == first
+    edited = _tables()
+    edited.functions = [(1, 'producer', 'Record producer', 1)]
+    assert artifact_name('reference', minify(compile_snapshot(edited, layout))) != artifact_name('reference', first)
+
+
+def test_labels_fall_back_to_english_then_to_the_value(layout):
+    labels = compile_snapshot(_tables(), layout)['labels']
+
+    assert list(labels) == ['en', 'de']
+    assert labels['de']['regions'] == {'Americas': 'Americas', 'Europe': 'Europa'}
+    assert labels['de']['organizationTypes'] == {'PRO': 'Performing rights'}
+    assert labels['en']['securityQuestions'] == {'SECURITY.Q_PET': 'What was the name of your first pet?'}
+
+
+def test_snapshot_holds_active_rows_and_their_indexes(dsn, layout, tmp_path):
+    output = tmp_path / 'reference'
+    report = build_snapshot(dsn, output, layout)
+
+    assert (report.organizations, report.functions, report.questions, report.locales) == (3, 2, 1, 2)
+    data = json.loads((output / report.name).read_bytes())
+    organizations = data['organizations']
+    assert [row[2] for row in organizations['rows']] == ['ASCAP', 'GEMA', 'UACRR']
+    assert organizations['byCountry'] == {'US': [0], 'DE': [1], 'UA': [2]}
+    assert organizations['byRegion'] == {'Europe': [1, 2], 'Other/Global': [0]}
+    assert organizations['byType'] == {'PRO': [1, 0], 'CMO': [2]}
+    assert [row[2] for row in data['neighbouringFunctions']['rows']] == ['Producer', 'Lead vocals']
+
+
+def test_unchanged_snapshot_is_not_rewritten(dsn, layout, tmp_path):
+    output = tmp_path / 'reference'
+    first = build_snapshot(dsn, output, layout)
+    stamps = {path.name: path.stat().st_mtime_ns for path in output.iterdir()}
+
+    again = build_snapshot(dsn, output, layout)
+    assert (again.name, again.changed, again.removed) == (first.name, False, [])
+    assert {path.name: path.stat().st_mtime_ns for path in output.iterdir()} == stamps
+
+    with connect(dsn) as connection:
+        connection.execute("UPDATE public.security_questions SET category = 'memories'")
+    edited = build_snapshot(dsn, output, layout)
+    assert edited.changed and edited.name != first.name
+    assert json.loads((output / MAP_FILE).read_bytes())['reference'] == edited.name.split('.')[1]
+    assert not (output / first.name).exists()
+    assert {path.name for path in output.iterdir()} >= {edited.name, MAP_FILE}
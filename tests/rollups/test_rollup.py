@@ -0,0 +1,131 @@
+from datetime import timedelta
+
+import pytest
+
+from tools.db import connect
+from tools.i18n.config import REPO_ROOT
+from tools.rollups import check, refresh
+
+MIGRATION = REPO_ROOT / 'supabase' / 'migrations' / '20260110_admin_overview_rollups.sql'
+# the Supabase roles and the columns admin_overview_live() reads, in place of the app's migrations
+SCHEMA = """
+DO $$
+DECLARE
+  role_name text;
+BEGIN
+  FOREACH role_name IN ARRAY ARRAY['anon', 'authenticated', 'service_role'] LOOP
+    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = role_name) THEN
+      EXECUTE format('CREATE ROLE %I NOLOGIN', role_name);
+    END IF;
+  END LOOP;
+END;
+$$;
+CREATE TABLE public.profiles (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  is_deactivated boolean DEFAULT false,
+  created_at timestamptz NOT NULL DEFAULT now(),
+  updated_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE TABLE public.works (id uuid PRIMARY KEY DEFAULT gen_random_uuid(), created_at timestamptz NOT NULL DEFAULT now());
+CREATE TABLE public.work_creation_declarations (work_id uuid, creation_type text);
+CREATE TABLE public.work_splits (
+  work_id uuid, split_type text, ownership_percentage numeric(5,2), is_active boolean DEFAULT true
+);
+CREATE TABLE public.protocols (id bigserial PRIMARY KEY, created_at timestamptz NOT NULL DEFAULT now());
+CREATE TABLE public.waitlist_requests (id bigserial PRIMARY KEY, created_at timestamptz NOT NULL DEFAULT now());
+CREATE FUNCTION public.is_current_user_admin() RETURNS boolean LANGUAGE sql AS 'SELECT true';
+"""
+
+
+@pytest.fixture
+def dsn(scratch_db):
+    with connect(scratch_db) as connection:
+        connection.execute(SCHEMA)
+        connection.execute(MIGRATION.read_text(encoding='utf-8'))
+    return scratch_db
+
+
+def _add(dsn, table, weeks_ago, rows=1):
+    with connect(dsn) as connection:
+        connection.execute(
+            f"INSERT INTO {table} (created_at) SELECT now() - %s * interval '1 week' FROM generate_series(1, %s)",
+            (weeks_ago, rows),
+        )
+
+
+def _snapshot(dsn):
+    with connect(dsn) as connection:
+        return connection.execute('SELECT public.admin_overview_snapshot()').fetchone()[0]
+
+
+def _counts(series):
+    return [point['count'] for point in series]
+
+
+def test_snapshot_falls_back_to_live_before_the_first_refresh(dsn):
+    _add(dsn, 'public.profiles', 0, 2)
+    snapshot = _snapshot(dsn)
+
+    assert snapshot['refreshedAt'] is None
+    assert snapshot['totalUsers'] == 2
+
+
+def test_refresh_serves_weekly_counts_and_totals(dsn):
+    _add(dsn, 'public.profiles', 0, 3)
+    _add(dsn, 'public.profiles', 2, 1)
+    _add(dsn, 'public.works', 1, 2)
+    _add(dsn, 'public.waitlist_requests', 5, 4)
+    report = refresh(dsn)
+
+    assert report.totals['totalUsers'] == 4
+    rows = {metric.metric: metric.rows for metric in report.metrics}
+    assert rows == {'signups': 4, 'works': 2, 'protocols': 0, 'waitlist': 4}
+    snapshot = _snapshot(dsn)
+    assert snapshot['refreshedAt'] is not None
+    assert _counts(snapshot['weeklySignups']) == [0, 0, 0, 1, 0, 3]
+    assert _counts(snapshot['weeklyWorks']) == [0, 0, 0, 0, 2, 0]
+    assert _counts(snapshot['weeklyWaitlist']) == [4, 0, 0, 0, 0, 0]
+    assert _counts(snapshot['weeklyProtocols']) == [0] * 6
+
+
+def test_later_refreshes_count_new_rows_once(dsn):
+    _add(dsn, 'public.works', 0, 2)
+    refresh(dsn)
+    _add(dsn, 'public.works', 0, 3)
+    report = refresh(dsn)
+    refresh(dsn)
+
+    works = next(metric for metric in report.metrics if metric.metric == 'works')
+    assert works.since is not None
+    assert _counts(_snapshot(dsn)['weeklyWorks'])[-1] == 5
+    assert check(dsn) == []
+
+
+def test_totals_are_recomputed_once_old_enough(dsn):
+    _add(dsn, 'public.profiles', 0, 1)
+    first = refresh(dsn)
+    _add(dsn, 'public.profiles', 0, 1)
+
+    kept = refresh(dsn, totals_every=timedelta(hours=1))
+    assert kept.totals is None
+    assert kept.totals_at == first.totals_at
+    assert _snapshot(dsn)['totalUsers'] == 1
+    # the weekly counts do not wait for the totals
+    assert _counts(_snapshot(dsn)['weeklySignups'])[-1] == 2
+
+    recomputed = refresh(dsn, totals_every=timedelta(0))
+    assert recomputed.totals['totalUsers'] == 2
+    assert _snapshot(dsn)['totalUsers'] == 2
+
+
+def test_check_finds_rows_backdated_before_the_mark_and_rebuild_fixes_them(dsn):
+    _add(dsn, 'public.works', 0, 1)
+    refresh(dsn)
+    _add(dsn, 'public.works', 3, 2)
+    refresh(dsn)
+
+    drifts = check(dsn)
+    assert [(drift.metric, drift.stored, drift.actual) for drift in drifts] == [('works', 0, 2)]
+
+    refresh(dsn, rebuild=True)
+    assert check(dsn) == []
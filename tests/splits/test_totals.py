@@ -0,0 +1,109 @@
+import gzip
+import json
+
+import pytest
+
+from tools.splits import cli, totals
+from tools.splits.export import ExportError, SplitChunk, read_export
+from tools.splits.totals import SplitTotals, validate
+
+FIELDS = 'work_id,split_type,ownership_percentage,rights_layer,is_active'
+ROWS = [
+    # w1: 99.99 in lyrics, 100 in master_recording
+    ('w1', 'lyrics', 50, '', 'true'),
+    ('w1', 'lyrics', 49.99, 'ip', 'true'),
+    ('w1', 'master_recording', 100, '', 'true'),
+    # w2: 100.01 in music, an inactive row left out
+    ('w2', 'music', 60.01, '', 'true'),
+    ('w2', 'music', 40, '', 'true'),
+    ('w2', 'music', 25, '', 'false'),
+    # w3: exactly 100 across three rows
+    ('w3', 'publishing', 33.33, '', 'true'),
+    ('w3', 'publishing', 33.33, '', 'true'),
+    ('w3', 'publishing', 33.34, '', 'true'),
+]
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(totals, 'np', None)
+    elif totals.np is None:
+        pytest.skip('numpy is not installed')
+    return request.param
+
+
+def _write_csv(path, rows):
+    lines = [FIELDS] + [','.join(map(str, row)) for row in rows]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return path
+
+
+def _write_jsonl(path, rows):
+    names = FIELDS.split(',')
+    with gzip.open(path, 'wt', encoding='utf-8') as handle:
+        for row in rows:
+            record = dict(zip(names, row))
+            record['is_active'] = record['is_active'] == 'true'
+            record['rights_layer'] = record['rights_layer'] or None
+            handle.write(json.dumps(record) + '\n')
+    return path
+
+
+def _summary(result):
+    return {(issue.work_id, issue.split_type): (round(issue.total, 2), issue.rows) for issue in result.issues()}
+
+
+@pytest.mark.parametrize('writer, name', [(_write_csv, 'splits.csv'), (_write_jsonl, 'splits.jsonl.gz')])
+def test_totals_off_by_a_hundredth_are_reported(backend, tmp_path, writer, name):
+    result = validate(read_export(writer(tmp_path / name, ROWS), size=4))
+
+    assert _summary(result) == {('w1', 'lyrics'): (99.99, 2), ('w2', 'music'): (100.01, 2)}
+    assert len(result.works) == 3
+    assert result.groups == 4
+    assert result.rows == 8
+
+
+def test_messages_match_the_database_check(backend, tmp_path):
+    issues = validate(read_export(_write_csv(tmp_path / 'splits.csv', ROWS))).issues()
+
+    assert [issue.message for issue in issues] == [
+        'Splits total 99.99% (missing 0.01%)',
+        'Splits total 100.01% (over by 0.01%)',
+    ]
+
+
+def test_groups_spread_over_chunks_sum_like_one_chunk(backend):
+    whole = SplitTotals()
+    whole.add(SplitChunk.from_columns(['a', 'b', 'a'], ['music', 'music', 'performance'], [None] * 3, [60, 100, 90]))
+    whole.add(SplitChunk.from_columns(['a', 'a'], ['music', 'performance'], [None, 'neighboring'], [40, 5]))
+
+    assert _summary(whole) == {('a', 'performance'): (95.0, 2)}
+    assert whole.groups == 3
+
+
+def test_layers_are_separate_groups(backend):
+    result = SplitTotals()
+    result.add(SplitChunk.from_columns(['a', 'a'], ['performance', 'performance'], ['ip', 'neighboring'], [100, 100]))
+
+    assert result.issues() == []
+    assert result.groups == 2
+
+
+@pytest.mark.parametrize('content, name', [(FIELDS + '\n', 'splits.csv'), ('', 'splits.jsonl')])
+def test_empty_export_has_no_issues(backend, tmp_path, content, name):
+    path = tmp_path / name
+    path.write_text(content, encoding='utf-8')
+    result = validate(read_export(path))
+
+    assert (result.issues(), result.groups, result.rows, len(result.works)) == ([], 0, 0, 0)
+
+
+def test_unknown_split_type_is_an_export_error(tmp_path):
+    path = _write_csv(tmp_path / 'splits.csv', [('w1', 'sync', 100, 'ip', 'true')])
+    with pytest.raises(ExportError):
+        validate(read_export(path))
+
+
+def test_help_renders():
+    assert 'not 100%' in cli.build_parser().format_help()
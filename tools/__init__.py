@@ -0,0 +1 @@
+"""Developer tooling for the Music Rights Platform (run from the repo root)."""
@@ -0,0 +1,14 @@
+"""Bulk import of a publisher's catalog.
+
+Onboarding a catalog through the app means ``WorksService.createWork`` and
+``saveWorkSplits`` for every work, one at a time. This package reads a
+whole catalog file as a stream and writes it to Postgres in batches::
+
+    python -m tools.catalog check catalog.csv                 # validate only
+    python -m tools.catalog import catalog.csv -w <workspace>  # needs psycopg
+"""
+
+from .records import CatalogError, Rejected, Work, read_catalog
+from .writer import CatalogImporter, ImportReport
+
+__all__ = ['CatalogError', 'CatalogImporter', 'ImportReport', 'Rejected', 'Work', 'read_catalog']
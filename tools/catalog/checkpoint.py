@@ -0,0 +1,67 @@
+"""Which batches of a catalog are already in the database.
+
+The importer numbers batches by record position, so a batch is the same
+records on every run over the same file with the same ``--batch-size``.
+The transaction that writes a batch also inserts its row into
+``public.import_checkpoints`` (file digest, workspace, batch size, batch
+number), so a batch is recorded exactly when its works are committed. An
+interrupted import resumes with the batches that have no row, and a batch
+is never written twice: the primary key fails the transaction of a second
+importer that reaches a batch the first one already wrote. Rows recorded
+with another batch size for the same file and workspace are refused.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from .records import CatalogError
+
+_DONE = """SELECT batch, works, batch_size FROM public.import_checkpoints
+ WHERE source = %s AND workspace_id = %s"""
+_RECORD = """INSERT INTO public.import_checkpoints (source, workspace_id, batch_size, batch, works)
+VALUES (%s, %s, %s, %s, %s)"""
+_FORGET = 'DELETE FROM public.import_checkpoints WHERE source = %s AND workspace_id = %s'
+
+
+def file_digest(path: Path) -> str:
+    with path.open('rb') as handle:
+        return hashlib.file_digest(handle, 'sha256').hexdigest()
+
+
+@dataclass
+class Checkpoint:
+    source: str
+    workspace: UUID
+    batch_size: int
+    done: set[int] = field(default_factory=set)
+    # works in the batches already imported
+    works: int = 0
+
+    @classmethod
+    def open(
+        cls, connection: Any, source: Path, workspace: UUID, batch_size: int, restart: bool = False
+    ) -> Checkpoint:
+        """The batches of ``source`` already imported into ``workspace``; with ``restart``, forget them."""
+        checkpoint = cls(file_digest(source), workspace, batch_size)
+        if restart:
+            connection.execute(_FORGET, (checkpoint.source, workspace))
+            return checkpoint
+        rows = connection.execute(_DONE, (checkpoint.source, workspace)).fetchall()
+        other = sorted({size for _, _, size in rows} - {batch_size})
+        if other:
+            raise CatalogError(
+                f'{source.name} was partly imported with --batch-size {other[0]}; '
+                'rerun with that size to resume, or --restart to import it again'
+            )
+        checkpoint.done = {batch for batch, _, _ in rows}
+        checkpoint.works = sum(works for _, works, _ in rows)
+        return checkpoint
+
+    def record(self, cursor: Any, batch: int, works: int) -> None:
+        """Record ``batch`` as imported, in the transaction that writes it."""
+        cursor.execute(_RECORD, (self.source, self.workspace, self.batch_size, batch, works))
@@ -0,0 +1,96 @@
+"""Command line entry point: ``python -m tools.catalog <command>``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from ..db import psycopg, psycopg_pool
+from .records import CatalogError, Rejected, read_catalog
+from .writer import BATCH_WORKS, CatalogImporter
+
+
+def _report_rejected(rejected: list[Rejected], args: argparse.Namespace) -> None:
+    for item in rejected[: None if args.verbose else args.limit]:
+        print(f'❌ {item.label}: {"; ".join(item.reasons)}')
+    if len(rejected) > args.limit and not args.verbose:
+        print(f'   ... and {len(rejected) - args.limit} more (-v lists all)')
+
+
+def cmd_check(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    works = splits = 0
+    rejected: list[Rejected] = []
+    for item in read_catalog(args.catalog):
+        if isinstance(item, Rejected):
+            rejected.append(item)
+        else:
+            works += 1
+            splits += len(item.splits)
+    _report_rejected(rejected, args)
+    mark = '❌' if rejected else '✅'
+    elapsed = time.perf_counter() - started
+    print(f'{mark} {works} works with {splits} splits are valid, {len(rejected)} rejected ({elapsed:.2f} s)')
+    return 1 if rejected else 0
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    if psycopg is not None and psycopg_pool is None and args.workers > 1:
+        print('⚠️  psycopg_pool is not installed, batches are written on one connection (pip install -r tools/requirements.txt)')
+    importer = CatalogImporter(args.dsn, args.workspace, args.user, args.batch_size, args.workers)
+    report = importer.run(args.catalog, args.restart)
+    _report_rejected(report.rejected, args)
+    mark = '❌' if report.rejected else '✅'
+    rate = report.works / report.seconds if report.seconds else 0
+    print(
+        f'{mark} {report.works} works, {report.splits} splits, {report.declarations} declarations and '
+        f'{report.holders} new rights holders imported in {report.seconds:.2f} s ({rate:.0f} works/s), '
+        f'{report.resumed} skipped as already imported, {len(report.rejected)} rejected'
+    )
+    return 1 if report.rejected else 0
+
+
+COMMANDS = {
+    'check': (cmd_check, 'validate a catalog file without writing anything'),
+    'import': (cmd_import, 'write a catalog to Postgres in batches, resuming an interrupted import'),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m tools.catalog', description=__doc__)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('catalog', type=Path, help='catalog file (.csv, .jsonl or .json, optionally .gz)')
+        sub.add_argument('-v', '--verbose', action='store_true', help='list every rejected work')
+        sub.add_argument('--limit', type=int, default=50, help='rejected works to print without -v (default: 50)')
+        if name == 'import':
+            sub.add_argument('-w', '--workspace', required=True, help='workspace id to import into')
+            sub.add_argument('--user', help='auth user id recorded as created_by (default: the workspace owner)')
+            sub.add_argument('--dsn', help='Postgres connection string (default: $DATABASE_URL, then local Supabase)')
+            sub.add_argument(
+                '--batch-size', type=int, default=BATCH_WORKS, help=f'works per transaction (default: {BATCH_WORKS})'
+            )
+            sub.add_argument('--workers', type=int, default=4, help='batches written at once (default: 4)')
+            sub.add_argument('--restart', action='store_true', help='forget the batches imported earlier, import all')
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    handler, _ = COMMANDS[args.command]
+    if not args.catalog.is_file():
+        print(f'❌ {args.catalog} does not exist')
+        return 1
+    errors = (CatalogError, psycopg.Error) if psycopg is not None else (CatalogError,)
+    try:
+        return handler(args)
+    except errors as exc:
+        print(f'❌ {exc}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,387 @@
+"""Read a catalog file as a stream of validated works.
+
+A catalog is JSON Lines or a JSON array with one record per work, or a CSV
+file with one row per split. Either may be gzipped (``.csv.gz``). Only a
+JSON array is read whole. A JSON record holds the ``works`` columns plus
+``splits`` and ``declarations`` lists::
+
+    {"ref": "CAT-0001", "work_title": "Night Drive", "isrc": "...",
+     "splits": [{"split_type": "music", "ownership_percentage": 50,
+                 "holder": {"nickname": "mira", "email": "mira@example.com"}}],
+     "declarations": [{"section": "ip", "creation_type": "human"}]}
+
+In a CSV file, consecutive rows with the same ``ref`` are one work whose
+columns come from its first row. Each row adds one split. Its holder is
+given in ``holder_*`` columns (``holder_nickname``, ``holder_email``, ...).
+A row with no ``split_type`` adds no split. Declarations are
+``creation_<section>`` and ``ai_tool_<section>`` columns, and list columns
+(``languages``, ``roles``, ...) are ``|``-separated.
+
+Values are checked against the constraints in ``supabase/migrations``. A
+work that breaks one is rejected whole with every reason, and the rest of
+the file is still read. Split totals are not checked here; ``python -m
+tools.splits validate --db`` does that after the import.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Iterator
+
+from ..splits.export import IP_SPLIT_TYPES, RIGHTS_LAYERS, SPLIT_TYPES
+
+# works columns an import may set, as WorksService.createWork writes them
+TEXT_COLUMNS = (
+    'work_title', 'release_title', 'isrc', 'iswc', 'catalog_number', 'ean', 'genre', 'original_work_title',
+    'original_work_isrc', 'original_work_iswc', 'original_work_info', 'notes', 'work_type', 'sample_library_names',
+)
+DATE_COLUMNS = ('recording_date', 'release_date')
+BOOL_COLUMNS = ('is_cover_version', 'is_100_percent_human', 'uses_sample_libraries', 'has_commercial_license')
+LIST_COLUMNS = ('alternative_titles', 'languages')
+JSON_COLUMNS = ('original_works', 'primary_languages', 'secondary_languages')
+WORK_COLUMNS = (
+    TEXT_COLUMNS + DATE_COLUMNS + BOOL_COLUMNS + LIST_COLUMNS + JSON_COLUMNS + ('duration_seconds', 'status')
+)
+# Work['status'] (src/app/models/work.model.ts)
+WORK_STATUSES = ('draft', 'registered', 'published', 'archived')
+
+# work_creation_declarations checks (20251231_core_schema_expansion.sql)
+SECTIONS = ('ip', 'mixing', 'mastering', 'session_musicians', 'visuals')
+CREATION_TYPES = ('human', 'ai_assisted', 'ai_generated')
+
+HOLDER_COLUMNS = (
+    'nickname', 'email', 'display_name', 'first_name', 'last_name', 'company_name', 'type', 'kind', 'ipi_number',
+    'cmo_pro',
+)
+HOLDER_TYPES = ('person', 'organization', 'company')
+# default rights holder kind for a split type, when the catalog gives none
+HOLDER_KINDS = {
+    'lyrics': 'author',
+    'music': 'composer',
+    'publishing': 'publisher',
+    'performance': 'artist',
+    'master_recording': 'label',
+    'neighboring_rights': 'artist',
+}
+CONTRIBUTION_TYPES = ('melody', 'harmony', 'arrangement')
+HOLDER_CACHE = 65_536
+
+_TRUE = {True, 'true', 't', '1', 'yes', 1}
+_FALSE = {False, 'false', 'f', '0', 'no', 0, '', None}
+_NICKNAME = re.compile(r'[^a-z0-9._-]+')
+
+
+class CatalogError(ValueError):
+    """The file itself cannot be read; rejected works are reported, not raised."""
+
+
+@dataclass(frozen=True)
+class Holder:
+    """A rights holder as the catalog names it, matched by nickname, then email."""
+
+    nickname: str
+    email: str | None
+    columns: tuple[tuple[str, str], ...]
+
+
+@dataclass
+class Split:
+    holder: Holder
+    split_type: str
+    rights_layer: str
+    ownership_percentage: float
+    notes: str | None = None
+    roles: list[str] = field(default_factory=list)
+    contribution_types: dict[str, bool] = field(default_factory=dict)
+
+
+@dataclass
+class Work:
+    number: int
+    ref: str | None
+    columns: dict[str, Any]
+    splits: list[Split] = field(default_factory=list)
+    declarations: list[dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Rejected:
+    number: int
+    ref: str | None
+    reasons: tuple[str, ...]
+
+    @property
+    def label(self) -> str:
+        return f'{self.ref} (record {self.number})' if self.ref else f'record {self.number}'
+
+
+def normalize_nickname(value: str | None) -> str | None:
+    """``RightsHoldersService.normalizeNickname``."""
+    if not value or not value.strip():
+        return None
+    return re.sub(r'-+', '-', _NICKNAME.sub('-', value.strip().lower())).strip('-') or None
+
+
+def _open(path: Path) -> io.TextIOBase:
+    if path.suffix == '.gz':
+        return io.TextIOWrapper(gzip.open(path), encoding='utf-8', newline='')
+    return path.open(encoding='utf-8', newline='')
+
+
+def _text(value: Any) -> str | None:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _list(value: Any) -> list[str]:
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return [item.strip() for item in str(value or '').split('|') if item.strip()]
+
+
+@lru_cache(maxsize=HOLDER_CACHE)
+def _holder(raw: tuple[str | None, ...], split_type: str) -> Holder | str:
+    """The holder named by ``raw`` (``HOLDER_COLUMNS`` values), or why it is invalid.
+
+    A catalog names the same few holders on most of its rows, so this is cached.
+    """
+    values = dict(zip(HOLDER_COLUMNS, map(_text, raw)))
+    email = values['email'].lower() if values['email'] else None
+    # RightsHoldersService.resolveNickname, minus the random fallback: a
+    # holder must be nameable to be matched again on a later row.
+    nickname = (
+        normalize_nickname(values['nickname'])
+        or normalize_nickname(values['display_name'])
+        or normalize_nickname(f'{values["first_name"] or ""} {values["last_name"] or ""}')
+        or normalize_nickname(values['company_name'])
+        or normalize_nickname(email.split('@')[0] if email else None)
+    )
+    if nickname is None:
+        return 'has no rights holder nickname, name or email'
+    values['type'] = values['type'] or 'person'
+    if values['type'] not in HOLDER_TYPES:
+        return f'holder type {values["type"]!r} is not one of {", ".join(HOLDER_TYPES)}'
+    values['kind'] = values['kind'] or HOLDER_KINDS.get(split_type, 'other')
+    values.update(nickname=nickname, email=email)
+    return Holder(nickname, email, tuple((name, value) for name, value in values.items() if value is not None))
+
+
+class _Checker:
+    """Collects the reasons one work is rejected."""
+
+    def __init__(self) -> None:
+        self.reasons: list[str] = []
+
+    def boolean(self, name: str, value: Any) -> bool:
+        if isinstance(value, str):
+            value = value.strip().lower()
+        if value in _TRUE:
+            return True
+        if value not in _FALSE:
+            self.reasons.append(f'{name} {value!r} is not a boolean')
+        return False
+
+    def json(self, name: str, value: Any) -> Any:
+        if value is None:
+            return []
+        if isinstance(value, str):
+            try:
+                value = json.loads(value) if value.strip() else []
+            except ValueError:
+                self.reasons.append(f'{name} is not valid JSON')
+                return []
+        if not isinstance(value, list):
+            self.reasons.append(f'{name} must be a list')
+            return []
+        return value
+
+    def columns(self, record: dict[str, Any]) -> dict[str, Any]:
+        columns: dict[str, Any] = {name: _text(record.get(name)) for name in TEXT_COLUMNS}
+        if not columns['work_title']:
+            self.reasons.append('work_title is required')
+        columns['work_type'] = columns['work_type'] or 'standard'
+        columns['status'] = _text(record.get('status')) or 'draft'
+        if columns['status'] not in WORK_STATUSES:
+            self.reasons.append(f'status {columns["status"]!r} is not one of {", ".join(WORK_STATUSES)}')
+        for name in DATE_COLUMNS:
+            value = _text(record.get(name))
+            try:
+                columns[name] = value and date.fromisoformat(value)
+            except ValueError:
+                self.reasons.append(f'{name} {value!r} is not a YYYY-MM-DD date')
+        for name in BOOL_COLUMNS:
+            columns[name] = self.boolean(name, record.get(name))
+        for name in LIST_COLUMNS:
+            columns[name] = _list(record.get(name))
+        for name in JSON_COLUMNS:
+            columns[name] = self.json(name, record.get(name))
+        duration = _text(record.get('duration_seconds'))
+        columns['duration_seconds'] = None
+        if duration is not None:
+            try:
+                columns['duration_seconds'] = int(duration)
+                if columns['duration_seconds'] < 0:
+                    raise ValueError
+            except ValueError:
+                self.reasons.append(f'duration_seconds {duration!r} is not a whole number of seconds')
+        return columns
+
+    def holder(self, record: dict[str, Any], split_type: str, label: str) -> Holder | None:
+        raw = tuple(value if value is None or isinstance(value, str) else str(value) for value in map(record.get, HOLDER_COLUMNS))
+        holder = _holder(raw, split_type)
+        if isinstance(holder, str):
+            self.reasons.append(f'{label} {holder}')
+            return None
+        return holder
+
+    def split(self, record: dict[str, Any], holder: dict[str, Any], label: str) -> Split | None:
+        split_type = _text(record.get('split_type'))
+        if split_type not in SPLIT_TYPES:
+            self.reasons.append(f'{label} split_type {split_type!r} is not one of {", ".join(SPLIT_TYPES)}')
+            return None
+        layer = _text(record.get('rights_layer')) or ('ip' if split_type in IP_SPLIT_TYPES else 'neighboring')
+        if layer not in RIGHTS_LAYERS:
+            self.reasons.append(f'{label} rights_layer {layer!r} is not one of {", ".join(RIGHTS_LAYERS)}')
+        value = record.get('ownership_percentage', record.get('percentage'))
+        try:
+            percentage = float(value)
+            if not 0 <= percentage <= 100:
+                raise ValueError
+        except (TypeError, ValueError):
+            self.reasons.append(f'{label} ownership_percentage {value!r} is not between 0 and 100')
+            percentage = 0.0
+        contributions = record.get('contribution_types') or {}
+        if not isinstance(contributions, dict):
+            contributions = {name: True for name in _list(contributions)}
+        unknown = set(contributions) - set(CONTRIBUTION_TYPES)
+        if unknown:
+            self.reasons.append(f'{label} contribution type {sorted(unknown)[0]!r} is not one of {", ".join(CONTRIBUTION_TYPES)}')
+        resolved = self.holder(holder, split_type, label)
+        if resolved is None:
+            return None
+        return Split(
+            resolved, split_type, layer, percentage, _text(record.get('notes')), _list(record.get('roles')),
+            {name: bool(flag) for name, flag in contributions.items()},
+        )
+
+    def declarations(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        declarations = []
+        for index, record in enumerate(records, 1):
+            if not isinstance(record, dict):
+                self.reasons.append(f'declaration {index} is not an object')
+                continue
+            section, kind = _text(record.get('section')), _text(record.get('creation_type'))
+            if section not in SECTIONS:
+                self.reasons.append(f'declaration section {section!r} is not one of {", ".join(SECTIONS)}')
+            elif kind not in CREATION_TYPES:
+                self.reasons.append(f'{section} creation_type {kind!r} is not one of {", ".join(CREATION_TYPES)}')
+            elif any(seen['section'] == section for seen in declarations):
+                # work_creation_declarations_unique_work_section
+                self.reasons.append(f'{section} is declared twice')
+            else:
+                declarations.append({
+                    'section': section,
+                    'creation_type': kind,
+                    'ai_tool': _text(record.get('ai_tool')),
+                    'notes': _text(record.get('notes')),
+                })
+        return declarations
+
+
+def parse_work(number: int, record: dict[str, Any]) -> Work | Rejected:
+    """One catalog record, in the JSON shape, checked and converted to column values."""
+    ref = _text(record.get('ref'))
+    check = _Checker()
+    columns = check.columns(record)
+    splits = record.get('splits') or []
+    if not isinstance(splits, list):
+        check.reasons.append('splits must be a list')
+        splits = []
+    parsed = []
+    for index, split in enumerate(splits, 1):
+        if not isinstance(split, dict):
+            check.reasons.append(f'split {index} is not an object')
+            continue
+        holder = split.get('holder') or {}
+        if not isinstance(holder, dict):
+            check.reasons.append(f'split {index} holder is not an object')
+            continue
+        parsed.append(check.split(split, holder, f'split {index}'))
+    declarations = record.get('declarations') or []
+    declarations = check.declarations(declarations if isinstance(declarations, list) else [])
+    if check.reasons:
+        return Rejected(number, ref, tuple(check.reasons))
+    return Work(number, ref, columns, [split for split in parsed if split is not None], declarations)
+
+
+def _csv_records(handle: io.TextIOBase, name: str) -> Iterator[dict[str, Any]]:
+    """Rows grouped by ``ref`` and reshaped into JSON records."""
+    reader = csv.DictReader(handle)
+    header = reader.fieldnames or []
+    if 'ref' not in header:
+        raise CatalogError(f'{name}: no ref column to group split rows into works')
+    for _, rows in groupby(reader, key=lambda row: row['ref']):
+        rows = list(rows)
+        record: dict[str, Any] = {column: rows[0][column] for column in header if column in WORK_COLUMNS}
+        record['ref'] = rows[0]['ref']
+        record['splits'] = [
+            {
+                'split_type': row.get('split_type'),
+                'ownership_percentage': row.get('ownership_percentage', row.get('percentage')),
+                'rights_layer': row.get('rights_layer'),
+                'notes': row.get('split_notes'),
+                'roles': row.get('roles'),
+                'contribution_types': row.get('contribution_types'),
+                'holder': {column: row.get(f'holder_{column}') for column in HOLDER_COLUMNS},
+            }
+            for row in rows
+            if _text(row.get('split_type'))
+        ]
+        record['declarations'] = [
+            {'section': section, 'creation_type': rows[0][f'creation_{section}'], 'ai_tool': rows[0].get(f'ai_tool_{section}')}
+            for section in SECTIONS
+            if _text(rows[0].get(f'creation_{section}'))
+        ]
+        yield record
+
+
+def _json_line(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def read_catalog(path: Path) -> Iterator[Work | Rejected]:
+    """Every work in ``path``, in file order, numbered from 1."""
+    kind = path.name.removesuffix('.gz').rsplit('.', 1)[-1]
+    if kind not in ('csv', 'jsonl', 'ndjson', 'json'):
+        raise CatalogError(f'{path.name}: expected .csv, .jsonl or .json')
+    with _open(path) as handle:
+        if kind == 'csv':
+            records = _csv_records(handle, path.name)
+        elif kind == 'json':
+            try:
+                records = json.load(handle)
+            except ValueError as exc:
+                raise CatalogError(f'{path.name}: {exc}') from None
+            if not isinstance(records, list):
+                raise CatalogError(f'{path.name}: expected an array of works')
+        else:
+            records = (_json_line(line) for line in handle if line.strip())
+        for number, record in enumerate(records, 1):
+            if not isinstance(record, dict):
+                yield Rejected(number, None, ('is not a JSON object',))
+                continue
+            yield parse_work(number, record)
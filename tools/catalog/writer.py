@@ -0,0 +1,276 @@
+"""Write validated works to Postgres in batched transactions.
+
+``WorksService`` saves a work in three requests and then deletes and
+re-inserts its splits. The importer writes a whole batch of works, their
+splits and their creation declarations with one ``COPY`` per table in a
+single transaction. Work ids are generated here rather than by the
+database, so splits and declarations need no round trip per work. The
+audit triggers on ``works`` and ``work_splits`` still fire for every row,
+as they do for the app, with ``created_by`` as the actor.
+
+Rights holders are resolved on the reading side, one batch at a time, on a
+connection kept for the whole run. The workspace's holders are read once
+and matched by nickname, then email, as
+``RightsHoldersService.findExistingRightsHolder`` does. Holders that are
+still unknown are created in one ``COPY`` and committed before any work
+that uses them. Memory grows with the number of holders, not works.
+
+Batches are written by ``workers`` threads, each on its own pooled
+connection, with at most ``workers`` batches read ahead. Without
+``psycopg_pool`` a single connection writes them in turn. Each batch's
+transaction also records it in ``public.import_checkpoints`` (see
+``checkpoint``), which is what a rerun resumes from.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Iterable
+from uuid import UUID, uuid4
+
+from ..db import open_pool, psycopg, psycopg_pool
+from .checkpoint import Checkpoint
+from .records import (
+    BOOL_COLUMNS,
+    DATE_COLUMNS,
+    JSON_COLUMNS,
+    LIST_COLUMNS,
+    CatalogError,
+    Holder,
+    Rejected,
+    Work,
+    WORK_COLUMNS,
+    normalize_nickname,
+    read_catalog,
+)
+
+BATCH_WORKS = 1_000
+
+_COLUMN_TYPES = {
+    **{name: 'date' for name in DATE_COLUMNS},
+    **{name: 'bool' for name in BOOL_COLUMNS},
+    **{name: 'text[]' for name in LIST_COLUMNS},
+    **{name: 'jsonb' for name in JSON_COLUMNS},
+    'duration_seconds': 'int4',
+}
+_WORKS_COPY = f'COPY public.works (id, workspace_id, created_by, {", ".join(WORK_COLUMNS)}) FROM STDIN'
+_WORKS_TYPES = ['uuid', 'uuid', 'uuid'] + [_COLUMN_TYPES.get(name, 'text') for name in WORK_COLUMNS]
+_SPLITS_COPY = """COPY public.work_splits (work_id, rights_holder_id, split_type, rights_layer, ownership_percentage,
+  notes, roles, contribution_types, is_active, created_by) FROM STDIN"""
+_SPLITS_TYPES = ['uuid', 'uuid', 'text', 'text', 'float8', 'text', 'text[]', 'jsonb', 'bool', 'uuid']
+_DECLARATIONS_COPY = 'COPY public.work_creation_declarations (work_id, section, creation_type, ai_tool, notes) FROM STDIN'
+_DECLARATIONS_TYPES = ['uuid', 'text', 'text', 'text', 'text']
+_HOLDER_COLUMNS = (
+    'nickname', 'email', 'display_name', 'first_name', 'last_name', 'company_name', 'type', 'kind', 'ipi_number',
+    'cmo_pro',
+)
+_HOLDERS_COPY = f'COPY public.rights_holders (id, workspace_id, created_by, {", ".join(_HOLDER_COLUMNS)}) FROM STDIN'
+_HOLDERS_TYPES = ['uuid', 'uuid', 'uuid'] + ['text'] * len(_HOLDER_COLUMNS)
+
+
+@dataclass
+class ImportReport:
+    works: int = 0
+    splits: int = 0
+    declarations: int = 0
+    holders: int = 0
+    resumed: int = 0
+    rejected: list[Rejected] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+@dataclass
+class _Batch:
+    number: int
+    first: int
+    last: int
+    works: list[tuple] = field(default_factory=list)
+    splits: list[tuple] = field(default_factory=list)
+    declarations: list[tuple] = field(default_factory=list)
+
+
+class _Holders:
+    """Rights holder ids of one workspace, by nickname and by email."""
+
+    def __init__(self, connection: Any, workspace: UUID, user: UUID) -> None:
+        self.connection = connection
+        self.workspace = workspace
+        self.user = user
+        self.by_nickname: dict[str, UUID] = {}
+        self.by_email: dict[str, UUID] = {}
+        rows = connection.execute(
+            'SELECT id, nickname, lower(email) FROM public.rights_holders WHERE workspace_id = %s',
+            (workspace,),
+        )
+        for holder_id, nickname, email in rows:
+            nickname = normalize_nickname(nickname)
+            if nickname:
+                self.by_nickname.setdefault(nickname, holder_id)
+            if email:
+                self.by_email.setdefault(email, holder_id)
+
+    def find(self, holder: Holder) -> UUID | None:
+        return self.by_nickname.get(holder.nickname) or (self.by_email.get(holder.email) if holder.email else None)
+
+    def resolve(self, works: list[Work]) -> int:
+        """Create the holders of ``works`` that do not exist yet; returns how many."""
+        missing: list[tuple[UUID, Holder]] = []
+        for work in works:
+            for split in work.splits:
+                holder = split.holder
+                if self.find(holder):
+                    continue
+                holder_id = uuid4()
+                self.by_nickname[holder.nickname] = holder_id
+                if holder.email:
+                    self.by_email.setdefault(holder.email, holder_id)
+                missing.append((holder_id, holder))
+        if not missing:
+            return 0
+        with self.connection.transaction(), self.connection.cursor() as cursor:
+            with cursor.copy(_HOLDERS_COPY) as copy:
+                copy.set_types(_HOLDERS_TYPES)
+                for holder_id, holder in missing:
+                    values = dict(holder.columns)
+                    copy.write_row((holder_id, self.workspace, self.user, *map(values.get, _HOLDER_COLUMNS)))
+        return len(missing)
+
+
+def _write(connection: Any, batch: _Batch, checkpoint: Checkpoint) -> None:
+    with connection.transaction(), connection.cursor() as cursor:
+        for statement, types, rows in (
+            (_WORKS_COPY, _WORKS_TYPES, batch.works),
+            (_SPLITS_COPY, _SPLITS_TYPES, batch.splits),
+            (_DECLARATIONS_COPY, _DECLARATIONS_TYPES, batch.declarations),
+        ):
+            if not rows:
+                continue
+            with cursor.copy(statement) as copy:
+                copy.set_types(types)
+                for row in rows:
+                    copy.write_row(row)
+        checkpoint.record(cursor, batch.number, len(batch.works))
+
+
+def _uuid(value: str, option: str) -> UUID:
+    try:
+        return UUID(value)
+    except ValueError:
+        raise CatalogError(f'{option} {value!r} is not a uuid') from None
+
+
+def _owner(connection: Any, workspace: UUID) -> UUID:
+    row = connection.execute('SELECT created_by FROM public.workspaces WHERE id = %s', (workspace,)).fetchone()
+    if row is None:
+        raise CatalogError(f'workspace {workspace} does not exist')
+    if row[0] is None:
+        raise CatalogError(f'workspace {workspace} has no owner, pass --user')
+    return row[0]
+
+
+class CatalogImporter:
+    def __init__(
+        self,
+        dsn: str | None,
+        workspace: str,
+        user: str | None = None,
+        batch_size: int = BATCH_WORKS,
+        workers: int = 4,
+    ) -> None:
+        self.dsn = dsn
+        self.workspace = _uuid(workspace, '--workspace')
+        self.user = _uuid(user, '--user') if user else None
+        self.batch_size = batch_size
+        self.workers = max(1, workers) if psycopg_pool is not None else 1
+
+    def _batch(self, number: int, works: list[Work], holders: _Holders) -> _Batch:
+        batch = _Batch(number, works[0].number, works[-1].number)
+        for work in works:
+            work_id = uuid4()
+            batch.works.append((work_id, self.workspace, self.user, *map(work.columns.get, WORK_COLUMNS)))
+            batch.splits.extend(
+                (
+                    work_id, holders.find(split.holder), split.split_type, split.rights_layer,
+                    split.ownership_percentage, split.notes, split.roles, split.contribution_types, True, self.user,
+                )
+                for split in work.splits
+            )
+            batch.declarations.extend(
+                (work_id, item['section'], item['creation_type'], item['ai_tool'], item['notes'])
+                for item in work.declarations
+            )
+        return batch
+
+    def run(self, path: Path, restart: bool = False) -> ImportReport:
+        """Import ``path``, skipping the batches an earlier run committed (all of them again with ``restart``)."""
+        report = ImportReport()
+        started = time.perf_counter()
+        pool = open_pool(self.dsn, self.workers + 1)
+        executor = ThreadPoolExecutor(self.workers) if self.workers > 1 else None
+        pending: dict[Future, _Batch] = {}
+
+        def done(batch: _Batch) -> None:
+            report.works += len(batch.works)
+            report.splits += len(batch.splits)
+            report.declarations += len(batch.declarations)
+
+        def settle(futures: Iterable[Future]) -> None:
+            for future in futures:
+                batch = pending.pop(future)
+                if future.exception() is not None:
+                    raise _failed(batch, future.exception())
+                done(batch)
+
+        try:
+            with pool.connection() as connection:
+                self.user = self.user or _owner(connection, self.workspace)
+                checkpoint = Checkpoint.open(connection, path, self.workspace, self.batch_size, restart)
+                holders = _Holders(connection, self.workspace, self.user)
+                batches = groupby(read_catalog(path), key=lambda item: (item.number - 1) // self.batch_size)
+                for number, items in batches:
+                    works = []
+                    for item in items:
+                        if isinstance(item, Rejected):
+                            report.rejected.append(item)
+                        else:
+                            works.append(item)
+                    if number in checkpoint.done:
+                        report.resumed += len(works)
+                        continue
+                    if not works:
+                        continue
+                    report.holders += holders.resolve(works)
+                    batch = self._batch(number, works, holders)
+                    if executor is None:
+                        try:
+                            _write(connection, batch, checkpoint)
+                        except psycopg.Error as exc:
+                            raise _failed(batch, exc) from exc
+                        done(batch)
+                        continue
+                    if len(pending) >= self.workers:
+                        settle(wait(pending, return_when=FIRST_COMPLETED).done)
+                    pending[executor.submit(_borrow, pool, batch, checkpoint)] = batch
+                settle(wait(pending).done)
+        finally:
+            if executor is not None:
+                # batches already running still commit, with their checkpoint rows
+                executor.shutdown(cancel_futures=True)
+            pool.close()
+        report.seconds = time.perf_counter() - started
+        return report
+
+
+def _borrow(pool: Any, batch: _Batch, checkpoint: Checkpoint) -> None:
+    with pool.connection() as connection:
+        _write(connection, batch, checkpoint)
+
+
+def _failed(batch: _Batch, exc: BaseException) -> CatalogError:
+    return CatalogError(
+        f'batch {batch.number + 1} (records {batch.first}-{batch.last}) was not written, rerun to resume: {exc}'
+    )
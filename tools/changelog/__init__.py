@@ -0,0 +1,15 @@
+"""Maintenance of the ``work_change_data`` audit log.
+
+Every edit of a work or split adds rows to the log, and the change history
+panels load all of a work's rows. ``compact`` keeps the recent tail as it
+is and folds older changes into one snapshot row per work, entity and
+period, archiving the rows it replaces::
+
+    python -m tools.changelog compact --dry-run                      # what would be folded
+    python -m tools.changelog compact --archive changes-2026.jsonl.gz  # keep 90 days, fold by month
+    python -m tools.changelog compact --archive old.jsonl.gz --keep-days 365 --period quarter
+"""
+
+from .compact import KEEP_DAYS, PERIODS, SNAPSHOT, CompactReport, Compactor, fold_work, period_start
+
+__all__ = ['CompactReport', 'Compactor', 'KEEP_DAYS', 'PERIODS', 'SNAPSHOT', 'fold_work', 'period_start']
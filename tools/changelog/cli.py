@@ -0,0 +1,71 @@
+"""Command line entry point: ``python -m tools.changelog <command>``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from ..db import psycopg
+from .compact import KEEP_DAYS, PAGE_ROWS, PERIODS, Compactor
+
+
+def cmd_compact(args: argparse.Namespace) -> int:
+    if not args.dry_run and args.archive is None:
+        print('❌ --archive is required, or pass --dry-run')
+        return 1
+    compactor = Compactor(
+        args.dsn, None if args.dry_run else args.archive, args.keep_days, args.period, args.page_size
+    )
+    report = compactor.run()
+    verb = 'would fold' if args.dry_run else 'folded'
+    rate = report.rows / report.seconds if report.seconds else 0
+    print(
+        f'✅ {report.rows} changes before {compactor.cutoff:%Y-%m-%d} read across {report.works} works '
+        f'in {report.seconds:.2f} s ({rate:.0f} rows/s)'
+    )
+    print(f'   {verb} {report.folded} of them into {report.snapshots} {args.period}ly snapshots')
+    if report.folded and report.archived_bytes:
+        print(f'   archive: {args.archive} ({report.archived_bytes / 1_048_576:.1f} MB)')
+    return 0
+
+
+COMMANDS = {
+    'compact': (cmd_compact, 'fold old change-log rows into per-work snapshots and archive them'),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m tools.changelog', description=__doc__)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('--dsn', help='Postgres connection string (default: $DATABASE_URL, then local Supabase)')
+        if name == 'compact':
+            sub.add_argument('--archive', type=Path, help='gzipped JSON Lines file the folded rows are appended to')
+            sub.add_argument('--dry-run', action='store_true', help='count what would be folded, change nothing')
+            sub.add_argument(
+                '--keep-days', type=int, default=KEEP_DAYS, help=f'recent days kept verbatim (default: {KEEP_DAYS})'
+            )
+            sub.add_argument(
+                '--period', choices=PERIODS, default='month', help='one snapshot per work and period (default: month)'
+            )
+            sub.add_argument(
+                '--page-size', type=int, default=PAGE_ROWS, help=f'rows per query and transaction (default: {PAGE_ROWS})'
+            )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    handler, _ = COMMANDS[args.command]
+    errors = (psycopg.Error,) if psycopg is not None else ()
+    try:
+        return handler(args)
+    except errors as exc:
+        print(f'❌ {exc}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
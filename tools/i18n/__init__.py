@@ -0,0 +1,19 @@
+"""Translation toolchain for ``public/assets/i18n``.
+
+Replaces the old one-off ``*_privacy.py`` scripts. Translations are edited in
+``i18n-src/<lang>/<NS>.json`` (one file per namespace, ``_root.json`` for
+top-level strings) and merged into the published locale files; every stage
+is skipped when its inputs are the same as last run.
+
+Usage::
+
+    python -m tools.i18n apply     # regenerate locale files from i18n-src
+    python -m tools.i18n check     # fail if a locale file is out of date
+    python -m tools.i18n diff      # show what apply would change
+    python -m tools.i18n build     # apply, then write minified build output
+"""
+
+from .config import Layout
+from .manifest import Manifest
+
+__all__ = ['Layout', 'Manifest']
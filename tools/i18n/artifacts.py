@@ -0,0 +1,107 @@
+"""Content-hashed, precompressed artifacts and their cache rules.
+
+Every shipped file is written as ``<stem>.<hash>.json`` with ``.gz`` and
+``.br`` siblings at maximum compression, so its URL changes exactly when its
+bytes do and it can be cached forever. ``brotli`` is optional; without it
+only the ``.gz`` sibling is written.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+from .catalog import short_digest, write_atomic
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+MAP_FILE = 'i18n-map.json'
+HEADERS_FILE = '_headers'
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'public, max-age=0, must-revalidate'
+
+
+def compressed(payload: bytes) -> dict[str, bytes]:
+    """Precompressed siblings keyed by file suffix."""
+    # mtime=0 keeps the gzip header, and so the file, reproducible.
+    variants = {'.gz': gzip.compress(payload, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(payload, quality=11)
+    return variants
+
+
+def artifact_name(stem: str, payload: bytes) -> str:
+    return f'{stem}.{short_digest(payload)}.json'
+
+
+def write_immutable(directory: Path, name: str, payload: bytes) -> None:
+    """Write ``payload`` and its compressed siblings unless ``name`` already exists."""
+    target = directory / name
+    if not target.exists():
+        for suffix, data in compressed(payload).items():
+            write_atomic(directory / f'{name}{suffix}', data)
+        write_atomic(target, payload)
+
+
+def write_artifact(directory: Path, stem: str, payload: bytes) -> dict[str, object]:
+    """Write ``payload`` under its hashed name unless it already exists.
+
+    Returns the index entry (``hash`` and raw ``bytes``) for the artifact.
+    """
+    write_immutable(directory, artifact_name(stem, payload), payload)
+    return {'hash': short_digest(payload), 'bytes': len(payload)}
+
+
+def prune(directory: Path, keep: set[str]) -> list[Path]:
+    """Remove hashed artifacts (and siblings) whose ``<stem>.<hash>.json`` is not in ``keep``."""
+    removed = []
+    if not directory.is_dir():
+        return removed
+    for path in directory.iterdir():
+        if not path.is_file():
+            continue
+        base = path.name.removesuffix('.gz').removesuffix('.br')
+        if base not in keep:
+            path.unlink()
+            removed.append(path)
+    return removed
+
+
+def write_map(build_dir: Path, maps: dict[str, dict[str, str]], meta: dict[str, str | None] | None = None) -> bool:
+    """``i18n-map.json``: per artifact kind, locale code -> content hash.
+
+    ``meta`` fields (e.g. the locale merged into all the others) come first;
+    unset ones are left out.
+    """
+    path = build_dir / MAP_FILE
+    head = {'version': 1, **{name: value for name, value in (meta or {}).items() if value}}
+    payload = json.dumps({**head, **maps}, indent=2).encode('utf-8') + b'\n'
+    if path.exists() and path.read_bytes() == payload:
+        return False
+    write_atomic(path, payload)
+    return True
+
+
+def netlify_headers(url_prefix: str, mutable: list[str], preload: dict[str, list[str]] | None = None) -> bytes:
+    """Netlify ``_headers`` rules for the build directory.
+
+    Hashed artifacts live one level down (``<lang>/...``) so a single splat
+    rule covers them without also matching the mutable index files.
+    ``preload`` adds ``Link`` preload headers per page path.
+    """
+    lines = [
+        '# Generated by "python -m tools.i18n build" - do not edit.',
+        f'{url_prefix}/:lang/*',
+        f'  Cache-Control: {IMMUTABLE}',
+    ]
+    for name in mutable:
+        lines += [f'{url_prefix}/{name}', f'  Cache-Control: {REVALIDATE}']
+    for page, urls in (preload or {}).items():
+        lines.append(page)
+        # crossorigin: the app fetches these with fetch(), which uses CORS mode.
+        lines += [f'  Link: <{url}>; rel=preload; as=fetch; crossorigin' for url in urls]
+    return ('\n'.join(lines) + '\n').encode('utf-8')
@@ -0,0 +1,216 @@
+"""Benchmarks for the i18n pipeline, checked against stored budgets.
+
+Every stage the build runs is timed (best of several runs) and run once
+more under ``tracemalloc`` for its peak memory:
+
+``merge``      render every source and assemble the locale file
+``load``       parse the merged locale file
+``serialize``  minify the locale and its compiled catalog
+``split``      split into namespace bundles and minify each
+``compress``   gzip (and brotli, when installed) every payload
+
+Scale ``1`` runs on the real sources of every locale; larger scales run on a
+synthetic default locale that repeats each namespace ``scale`` times under
+suffixed names. Shipped sizes (raw, gzip and brotli bytes per namespace and
+per whole-locale artifact) are measured on the real locales with the
+default locale merged in and after ``--prune-unused``, as ``prebuild`` ships
+them.
+
+``i18n-src/perf-budget.json`` stores a limit per metric; a measurement over
+its limit fails the run. ``--update-budget`` writes the current measurements
+plus headroom (see ``HEADROOM``), so budgets are meant to be refreshed
+deliberately, on the machine that enforces them.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from .artifacts import compressed
+from .bundles import split_namespaces
+from .catalog import flatten, minify, parse, write_atomic
+from .compiled import compile_catalog
+from .config import DEFAULT_LOCALE, Layout
+from .fallback import merge_fallback
+from .sections import ROOT_SOURCE, assemble, render_fragment
+from .shortkeys import SHORT_LOCALE, key_tree, render_short
+from .usage import load_keep, prune_unused, scan
+
+BUDGET_FILE = 'perf-budget.json'
+RESULTS_FILE = 'bench.json'
+SCALES = (1, 10, 100)
+STAGES = ('merge', 'load', 'serialize', 'split', 'compress')
+ENCODINGS = {'.gz': 'gzip', '.br': 'brotli'}
+# metric kind -> (factor, minimum absolute slack) applied by --update-budget
+HEADROOM = {
+    'time_ms': (2.0, 5.0),
+    'peak_kib': (1.25, 64.0),
+    'bytes': (1.05, 64.0),
+}
+
+
+@dataclass
+class StageResult:
+    scale: int
+    stage: str
+    time_ms: float
+    peak_kib: float
+
+
+def synthetic_sources(sources: dict[str, bytes], scale: int) -> dict[str, bytes]:
+    """``sources`` with every namespace repeated ``scale`` times (copies get ``_<n>``)."""
+    scaled = dict(sources)
+    for copy in range(1, scale):
+        for name, raw in sources.items():
+            if name != ROOT_SOURCE:
+                scaled[f'{name}_{copy}'] = raw
+    return scaled
+
+
+def read_sources(layout: Layout, lang: str) -> dict[str, bytes]:
+    return {name: path.read_bytes() for name, path in layout.section_sources(lang).items()}
+
+
+def _measure(stage: Callable[[], Any], repeat: int) -> tuple[float, float]:
+    """Best wall time in ms and peak traced memory in KiB."""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        stage()
+        best = min(best, time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        stage()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best * 1000, peak / 1024
+
+
+def run_stages(locales: dict[str, dict[str, bytes]], scale: int, repeat: int) -> list[StageResult]:
+    """Run the pipeline stage by stage, each consuming the previous stage's output."""
+    state: dict[str, Any] = {}
+
+    def merge() -> None:
+        state['merged'] = {
+            lang: assemble({name: render_fragment(name, raw)[0] for name, raw in sources.items()})
+            for lang, sources in locales.items()
+        }
+
+    def load() -> None:
+        state['data'] = {lang: parse(raw) for lang, raw in state['merged'].items()}
+
+    def serialize() -> None:
+        state['payloads'] = [
+            payload
+            for data in state['data'].values()
+            for payload in (minify(data), minify(compile_catalog(data)))
+        ]
+
+    def split() -> None:
+        state['bundles'] = [
+            minify(bundle) for data in state['data'].values() for bundle in split_namespaces(data).values()
+        ]
+
+    def compress() -> None:
+        for payload in state['payloads'] + state['bundles']:
+            compressed(payload)
+
+    steps = {'merge': merge, 'load': load, 'serialize': serialize, 'split': split, 'compress': compress}
+    return [StageResult(scale, name, *_measure(steps[name], repeat)) for name in STAGES]
+
+
+def _sizes(payload: bytes) -> dict[str, int]:
+    sizes = {'raw': len(payload)}
+    for suffix, data in compressed(payload).items():
+        sizes[ENCODINGS[suffix]] = len(data)
+    return sizes
+
+
+def shipped_sizes(layout: Layout) -> dict[str, dict[str, dict[str, int]]]:
+    """Locale -> artifact (``_all``, ``_compiled``, ``_short`` or namespace) -> encoding -> bytes."""
+    usage = scan(layout.app_dir, load_keep(layout.keep_file))
+    default = parse(layout.locale_file(DEFAULT_LOCALE).read_bytes())
+    tree = key_tree(default)
+    sizes: dict[str, dict[str, dict[str, int]]] = {}
+    for lang in layout.locales():
+        data = parse(layout.locale_file(lang).read_bytes())
+        if lang != DEFAULT_LOCALE:
+            data, _ = merge_fallback(data, default)
+        data, _ = prune_unused(data, usage.resolve(flatten(data)))
+        compiled = compile_catalog(data)
+        entry = {
+            '_all': _sizes(minify(data)),
+            '_compiled': _sizes(minify(compiled)),
+            SHORT_LOCALE: _sizes(render_short(compiled, tree)[SHORT_LOCALE]),
+        }
+        for name, bundle in split_namespaces(compiled).items():
+            entry[name] = _sizes(minify(bundle))
+        sizes[lang] = entry
+    return sizes
+
+
+def run_benchmarks(layout: Layout, scales: list[int], repeat: int) -> dict[str, Any]:
+    real = {lang: read_sources(layout, lang) for lang in layout.locales()}
+    stages: list[StageResult] = []
+    for scale in scales:
+        if scale == 1:
+            stages += run_stages(real, 1, repeat)
+        else:
+            synthetic = {DEFAULT_LOCALE: synthetic_sources(real[DEFAULT_LOCALE], scale)}
+            # Fewer runs at larger scales, but never a single noisy one.
+            stages += run_stages(synthetic, scale, max(2, repeat // scale))
+    return {
+        'stages': [vars(result) for result in stages],
+        'sizes': shipped_sizes(layout),
+    }
+
+
+def metrics(results: dict[str, Any]) -> dict[str, tuple[str, float]]:
+    """Flat ``name -> (kind, value)`` view of the results, as budgets key them."""
+    flat: dict[str, tuple[str, float]] = {}
+    for result in results['stages']:
+        prefix = f'{result["scale"]}x/{result["stage"]}'
+        flat[f'{prefix}/time_ms'] = ('time_ms', result['time_ms'])
+        flat[f'{prefix}/peak_kib'] = ('peak_kib', result['peak_kib'])
+    for lang, artifacts in results['sizes'].items():
+        for name, sizes in artifacts.items():
+            for encoding, size in sizes.items():
+                flat[f'{lang}/{name}/{encoding}'] = ('bytes', size)
+    return flat
+
+
+def load_budget(path: Path) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8')).get('limits', {})
+
+
+def write_budget(path: Path, results: dict[str, Any]) -> None:
+    limits = {}
+    for name, (kind, value) in metrics(results).items():
+        factor, slack = HEADROOM[kind]
+        limits[name] = round(max(value * factor, value + slack), 1)
+    payload = {'version': 1, 'limits': dict(sorted(limits.items()))}
+    write_atomic(path, (json.dumps(payload, indent=2) + '\n').encode('utf-8'))
+
+
+def over_budget(results: dict[str, Any], limits: dict[str, float]) -> list[tuple[str, float, float]]:
+    """``(metric, measured, limit)`` for every budgeted metric over its limit."""
+    return [
+        (name, value, limits[name])
+        for name, (_, value) in metrics(results).items()
+        if name in limits and value > limits[name]
+    ]
+
+
+def write_results(path: Path, results: dict[str, Any]) -> None:
+    write_atomic(path, (json.dumps(results, indent=2) + '\n').encode('utf-8'))
@@ -0,0 +1,512 @@
+"""``build``: apply sections, then produce everything the app ships.
+
+Each stage records the digest of the published locale file it last built
+from, so a locale that did not change is never parsed again. Output under
+``build/<lang>/`` is content-hashed; only ``i18n-map.json`` and
+``bundles.json`` keep fixed names.
+
+Work fans out over a process pool in two rounds: stale locales are parsed,
+pruned and rendered to payloads (one task per locale), then every new
+artifact is written and compressed (one task per file, so brotli at level
+11 spreads across cores). Results are consumed in submission order, so the
+output and the indexes do not depend on scheduling.
+
+Every locale other than the default one ships with the default locale merged
+under it (see ``fallback``), so its stages are also stale when ``en`` changes.
+The key constants module is regenerated whenever ``en`` changes, and with
+``short_keys`` every locale also gets the arrays of ``shortkeys``. With
+``string_table`` the bundles of a locale share one table of their common
+strings (see ``strings``). Bundles, short-key arrays and ``_compiled`` ship
+precompiled (see ``compiled``); only ``_all`` keeps the plain strings. With ``keep_versions`` above one, older versions
+of the keyed artifacts stay published next to patches to the current ones
+(see ``versions``). The legal pages are prerendered per locale whenever its
+strings or their template change (see ``legal``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from .artifacts import MAP_FILE, artifact_name, netlify_headers, prune, write_artifact, write_map
+from .bundles import INDEX_FILE, BundleIndex, split_namespaces
+from .catalog import LocaleSource, digest, flatten, minify, parse, short_digest, write_atomic
+from .compiled import compile_catalog
+from .config import BUILD_URL, DEFAULT_LOCALE, Layout
+from .fallback import FALLBACK_FILE, FallbackReport, merge_fallback
+from .legal import LEGAL_PAGES, load_templates, page_name, render_page, templates_digest, write_page
+from .manifest import Manifest
+from .routes import ROUTES_FILE, preload_links, route_manifest, source_fingerprint, write_route_manifest
+from .sections import MergeError, reconcile
+from .shortkeys import KEYS_DIR, KEYS_MODULE, SHORT_LOCALE, TREE_STEM, KeyTree, key_tree, render_short, write_module, write_tree
+from .strings import STRING_TABLE, InternStats, render_interned, string_table
+from .usage import UsageIndex, load_keep, prune_unused, scan
+from .versions import VERSIONS_FILE, VersionManifest
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Whole-locale artifacts: stem in build/<lang>/ -> key in i18n-map.json
+FULL_LOCALE = '_all'
+COMPILED_LOCALE = '_compiled'
+MAP_KINDS = {FULL_LOCALE: 'locales', COMPILED_LOCALE: 'compiled', SHORT_LOCALE: 'short'}
+# Stages producing one whole-locale artifact: stage -> artifact stem
+WHOLE_LOCALE_STAGES = {'locale': FULL_LOCALE, 'compiled': COMPILED_LOCALE, 'short': SHORT_LOCALE}
+# Opt-in stage (--short-keys); renders from the key tree rather than through RENDERERS
+SHORT_STAGE = 'short'
+
+
+def _render_locale_stage(data: dict[str, Any]) -> dict[str, bytes]:
+    return {FULL_LOCALE: minify(data)}
+
+
+def _render_compiled_stage(data: dict[str, Any]) -> dict[str, bytes]:
+    return {COMPILED_LOCALE: minify(data)}
+
+
+def _render_bundles_stage(data: dict[str, Any]) -> dict[str, bytes]:
+    return {name: minify(bundle) for name, bundle in split_namespaces(data).items()}
+
+
+# stage -> renderer returning artifact stem -> payload; order is build order
+RENDERERS: dict[str, Callable[[dict[str, Any]], dict[str, bytes]]] = {
+    'locale': _render_locale_stage,
+    'compiled': _render_compiled_stage,
+    'bundles': _render_bundles_stage,
+}
+# Stages rendered from the compiled catalog; ``_all`` stays plain for the fallback path.
+COMPILED_STAGES = {'compiled', 'bundles', SHORT_STAGE}
+
+
+@dataclass
+class RenderTask:
+    lang: str
+    raw: bytes
+    stages: list[str]
+    usage: UsageIndex | None
+    # published default locale, merged under ``raw``; None for the default locale itself
+    fallback: bytes | None = None
+    # key tree of the default locale, set when SHORT_STAGE is among ``stages``
+    keys: KeyTree | None = None
+    string_table: bool = False
+
+
+@dataclass
+class Rendered:
+    lang: str
+    # stage -> artifact stem -> payload
+    payloads: dict[str, dict[str, bytes]]
+    unused: list[str] | None
+    # shipped keys filled in from the default locale
+    fallback: list[str] | None = None
+    strings: InternStats | None = None
+
+
+def render_locale(task: RenderTask) -> Rendered:
+    """Worker: parse and transform one locale, render its stale stages."""
+    data = parse(task.raw)
+    filled = None
+    if task.fallback is not None:
+        data, filled = merge_fallback(data, parse(task.fallback))
+    removed = None
+    if task.usage is not None:
+        data, removed = prune_unused(data, task.usage.resolve(flatten(data)))
+        if filled is not None:
+            shipped = flatten(data)
+            filled = [key for key in filled if key in shipped]
+    payloads: dict[str, dict[str, bytes]] = {}
+    compiled = compile_catalog(data) if COMPILED_STAGES.intersection(task.stages) else data
+    stats = index = None
+    if task.string_table:
+        bundles = split_namespaces(compiled)
+        table = string_table(bundles)
+        index = {text: position for position, text in enumerate(table)}
+    for stage in task.stages:
+        if stage == SHORT_STAGE:
+            payloads[stage] = render_short(compiled, task.keys, index)
+        elif stage == 'bundles' and index is not None:
+            payloads[stage], stats = render_interned(bundles, table, index)
+        else:
+            payloads[stage] = RENDERERS[stage](compiled if stage in COMPILED_STAGES else data)
+    return Rendered(task.lang, payloads, removed, filled, stats)
+
+
+def _write_job(job: tuple[Path, str, bytes]) -> dict[str, Any]:
+    """Worker: write one artifact and its compressed siblings."""
+    return write_artifact(*job)
+
+
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+@dataclass
+class BuildReport:
+    applied: list[str] = field(default_factory=list)
+    # stage name -> locales it rebuilt
+    written: dict[str, list[str]] = field(default_factory=dict)
+    pruned: int = 0
+    # locale -> keys dropped from the shipped output by --prune-unused
+    unused: dict[str, list[str]] = field(default_factory=dict)
+    # locale -> shipped keys filled in from the default locale
+    fallback: dict[str, list[str]] = field(default_factory=dict)
+    # the key constants module was rewritten
+    keys_module: bool = False
+    # locale -> string table savings, for locales whose bundles were rebuilt
+    strings: dict[str, InternStats] = field(default_factory=dict)
+    # locale -> patches written from earlier versions
+    deltas: dict[str, int] = field(default_factory=dict)
+    # locales whose legal pages were rewritten
+    legal: list[str] = field(default_factory=list)
+
+
+class Builder:
+    def __init__(
+        self,
+        layout: Layout,
+        manifest: Manifest,
+        *,
+        force: bool = False,
+        prune: bool = False,
+        short_keys: bool = False,
+        string_table: bool = False,
+        keep_versions: int = 1,
+        jobs: int = 1,
+    ):
+        self.layout = layout
+        self.manifest = manifest
+        self.force = force
+        self.jobs = max(1, jobs)
+        self.stages = [*RENDERERS, SHORT_STAGE] if short_keys else list(RENDERERS)
+        self.report = BuildReport()
+        self.usage = scan(layout.app_dir, load_keep(layout.keep_file)) if prune else None
+        # Options that change the output are folded into every stage fingerprint.
+        options = [f'prune:{self.usage.digest()}'] if self.usage else []
+        if string_table:
+            options.append('strings')
+        self.variant = ':'.join(options)
+        self.string_table = string_table
+        self.bundle_index = BundleIndex(layout.build_dir / INDEX_FILE, fallback=DEFAULT_LOCALE)
+        self.fallback_report = FallbackReport(layout.cache_dir / FALLBACK_FILE)
+        self.versions = VersionManifest(layout.build_dir / VERSIONS_FILE, keep_versions)
+        # published default locale, read once the sections are applied
+        self.fallback: LocaleSource | None = None
+        map_path = layout.build_dir / MAP_FILE
+        stored = json.loads(map_path.read_bytes()) if map_path.exists() else {}
+        # artifact stem -> {locale: hash}
+        self.locale_maps: dict[str, dict[str, str]] = {
+            stem: stored.get(kind, {}) for stem, kind in MAP_KINDS.items()
+        }
+        # Short artifacts of an earlier --short-keys build are dropped from every locale.
+        self.drop_short = not short_keys and bool(self.locale_maps[SHORT_LOCALE] or self.bundle_index.short)
+        if not short_keys:
+            self.locale_maps[SHORT_LOCALE] = {}
+            self.bundle_index.short = {}
+        self._keys: KeyTree | None = None
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def keys(self) -> KeyTree:
+        """Key tree of the published default locale."""
+        if self._keys is None:
+            assert self.fallback is not None
+            self._keys = key_tree(self.fallback.data)
+        return self._keys
+
+    def _map(self, fn: Callable[[T], R], items: list[T]) -> list[R]:
+        """``map`` over the process pool when it pays off; results keep input order."""
+        if self.jobs == 1 or len(items) < 2:
+            return [fn(item) for item in items]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.jobs)
+        chunksize = max(1, len(items) // (self.jobs * 4))
+        return list(self._pool.map(fn, items, chunksize=chunksize))
+
+    def _fallback_for(self, lang: str) -> LocaleSource | None:
+        return None if lang == DEFAULT_LOCALE else self.fallback
+
+    def _fingerprint(self, source: LocaleSource) -> str:
+        parts = [source.digest]
+        if self.variant:
+            parts.append(self.variant)
+        fallback = self._fallback_for(source.lang)
+        if fallback is not None:
+            parts.append(f'fallback:{fallback.digest}')
+        if len(parts) == 1:
+            return source.digest
+        return digest(':'.join(parts).encode('utf-8'))
+
+    def _stale_stages(self, source: LocaleSource) -> list[str]:
+        fingerprint = self._fingerprint(source)
+        stale = []
+        for stage in self.stages:
+            if self.force or not self.manifest.fresh(stage, source.lang, fingerprint):
+                stale.append(stage)
+            elif stage in WHOLE_LOCALE_STAGES:
+                stem = WHOLE_LOCALE_STAGES[stage]
+                known = self.locale_maps[stem].get(source.lang)
+                if not known or not (self.layout.build_dir / source.lang / f'{stem}.{known}.json').exists():
+                    stale.append(stage)
+            elif stage == 'bundles' and not self.bundle_index.has(source.lang):
+                stale.append(stage)
+        return stale
+
+    def _artifacts(self, lang: str) -> set[str]:
+        """Hashed file names ``build/<lang>/`` should contain."""
+        names = {
+            f'{name}.{entry["hash"]}.json'
+            for name, entry in self.bundle_index.locales.get(lang, {}).items()
+        }
+        names.update(
+            f'{SHORT_LOCALE}.{name}.{entry["hash"]}.json'
+            for name, entry in self.bundle_index.short.get(lang, {}).items()
+        )
+        if lang in self.bundle_index.strings:
+            names.add(f'{STRING_TABLE}.{self.bundle_index.strings[lang]["hash"]}.json')
+        names.update(self.versions.files(lang))
+        for stem, hashes in self.locale_maps.items():
+            if lang in hashes:
+                names.add(f'{stem}.{hashes[lang]}.json')
+        return names
+
+    def _write(self, rendered: list[Rendered]) -> dict[tuple[str, str], dict[str, Any]]:
+        """Write every payload not already on disk; (lang, stem) -> index entry."""
+        entries: dict[tuple[str, str], dict[str, Any]] = {}
+        jobs: list[tuple[Path, str, bytes]] = []
+        for result in rendered:
+            directory = self.layout.build_dir / result.lang
+            for payloads in result.payloads.values():
+                for stem, payload in payloads.items():
+                    if (directory / artifact_name(stem, payload)).exists():
+                        entries[result.lang, stem] = {'hash': short_digest(payload), 'bytes': len(payload)}
+                    else:
+                        jobs.append((directory, stem, payload))
+        for (directory, stem, _), entry in zip(jobs, self._map(_write_job, jobs)):
+            entries[directory.name, stem] = entry
+        return entries
+
+    def render(self, sources: list[LocaleSource]) -> None:
+        tasks = []
+        for source in sources:
+            stages = self._stale_stages(source)
+            if stages:
+                fallback = self._fallback_for(source.lang)
+                keys = self.keys if SHORT_STAGE in stages else None
+                tasks.append(
+                    RenderTask(
+                        source.lang,
+                        source.raw,
+                        stages,
+                        self.usage,
+                        fallback.raw if fallback else None,
+                        keys,
+                        self.string_table,
+                    )
+                )
+        fingerprints = {source.lang: self._fingerprint(source) for source in sources}
+
+        rendered = self._map(render_locale, tasks)
+        entries = self._write(rendered)
+        for result in rendered:
+            lang = result.lang
+            if result.unused is not None:
+                self.report.unused[lang] = result.unused
+            if result.fallback is not None:
+                self.report.fallback[lang] = result.fallback
+                self.fallback_report.update(lang, result.fallback)
+            if result.strings is not None:
+                self.report.strings[lang] = result.strings
+            for stage, payloads in result.payloads.items():
+                if stage in WHOLE_LOCALE_STAGES:
+                    stem = WHOLE_LOCALE_STAGES[stage]
+                    self.locale_maps[stem][lang] = entries[lang, stem]['hash']
+                if stage == SHORT_STAGE:
+                    prefix = f'{SHORT_LOCALE}.'
+                    self.bundle_index.update_short(
+                        lang,
+                        {stem[len(prefix):]: entries[lang, stem] for stem in payloads if stem.startswith(prefix)},
+                    )
+                elif stage == 'bundles':
+                    names = [name for name in payloads if name != STRING_TABLE]
+                    self.bundle_index.update(lang, {name: entries[lang, name] for name in names})
+                    self.bundle_index.update_strings(lang, entries.get((lang, STRING_TABLE)))
+                if stage != SHORT_STAGE:
+                    self._publish(lang, payloads, entries)
+                self.manifest.record(stage, lang, fingerprints[lang])
+                self.report.written.setdefault(stage, []).append(lang)
+
+    def _publish(self, lang: str, payloads: dict[str, bytes], entries: dict[tuple[str, str], dict[str, Any]]) -> None:
+        """Record new versions of keyed artifacts, writing patches from the older ones."""
+        directory = self.layout.build_dir / lang
+        for stem, payload in payloads.items():
+            if stem == STRING_TABLE:
+                continue
+            written = self.versions.publish(directory, lang, stem, entries[lang, stem]['hash'], payload)
+            if written:
+                self.report.deltas[lang] = self.report.deltas.get(lang, 0) + written
+
+    def legal_pages(self, sources: list[LocaleSource], locales: list[str]) -> None:
+        """Prerender the legal pages of every locale whose strings or templates changed."""
+        directory = self.layout.legal_dir
+        templates = load_templates(self.layout.legal_source_dir)
+        langs = self.layout.locales()
+        for source in sources:
+            fallback = self._fallback_for(source.lang)
+            parts = [source.digest, templates_digest(templates), ','.join(langs)]
+            if fallback is not None:
+                parts.append(fallback.digest)
+            fingerprint = digest(':'.join(parts).encode('utf-8'))
+            names = [page_name(template.page, source.lang) for template in templates]
+            if (
+                not self.force
+                and self.manifest.fresh('legal', source.lang, fingerprint)
+                and all((directory / name).exists() for name in names)
+            ):
+                continue
+            data = source.data if fallback is None else merge_fallback(source.data, fallback.data)[0]
+            written = [
+                write_page(directory, page_name(template.page, source.lang), render_page(template, source.lang, langs, data))
+                for template in templates
+            ]
+            if any(written):
+                self.report.legal.append(source.lang)
+            self.manifest.record('legal', source.lang, fingerprint)
+        if locales == langs:
+            self.report.pruned += len(prune(directory, {page_name(page, lang) for page in LEGAL_PAGES for lang in langs}))
+
+    def routes(self) -> dict[str, Any]:
+        """``routes.json``, re-analysed only when the app or the default locale changed."""
+        path = self.layout.build_dir / ROUTES_FILE
+        source = self.layout.locale_file(DEFAULT_LOCALE).read_bytes()
+        fingerprint = source_fingerprint(self.layout.app_dir, digest(source))
+        if not self.force and path.exists() and self.manifest.fresh('routes', DEFAULT_LOCALE, fingerprint):
+            return json.loads(path.read_bytes())
+        manifest = route_manifest(self.layout.app_dir, parse(source))
+        write_route_manifest(self.layout.build_dir, manifest)
+        self.manifest.record('routes', DEFAULT_LOCALE, fingerprint)
+        return manifest
+
+    def keys_module(self) -> None:
+        """Regenerate the key constants module when the default locale changed."""
+        assert self.fallback is not None
+        fresh = self.manifest.fresh('keys', DEFAULT_LOCALE, self.fallback.digest)
+        if self.force or not fresh or not (self.layout.app_dir / KEYS_MODULE).exists():
+            self.report.keys_module = write_module(self.layout.app_dir, self.keys)
+            self.manifest.record('keys', DEFAULT_LOCALE, self.fallback.digest)
+
+    def _published(self, lang: str) -> dict[str, str]:
+        """Keyed artifacts ``lang`` currently ships: stem -> hash."""
+        stems = {name: entry['hash'] for name, entry in self.bundle_index.locales.get(lang, {}).items()}
+        for stem, hashes in self.locale_maps.items():
+            if lang in hashes and stem != SHORT_LOCALE:
+                stems[stem] = hashes[lang]
+        return stems
+
+    def _preload_urls(self, keys: str | None) -> tuple[dict[str, str], list[str]]:
+        """What the loader fetches in the default locale: bundle URLs by name, plus shared URLs."""
+        base = f'{BUILD_URL}/{DEFAULT_LOCALE}'
+        short = self.bundle_index.short.get(DEFAULT_LOCALE, {}) if keys else {}
+        urls = {
+            name: f'{base}/{SHORT_LOCALE}.{name}.{short[name]["hash"]}.json'
+            if name in short
+            else f'{base}/{name}.{entry["hash"]}.json'
+            for name, entry in self.bundle_index.locales.get(DEFAULT_LOCALE, {}).items()
+        }
+        shared = [f'{BUILD_URL}/{KEYS_DIR}/{TREE_STEM}.{keys}.json'] if short else []
+        table = self.bundle_index.strings.get(DEFAULT_LOCALE)
+        if table:
+            shared.append(f'{base}/{STRING_TABLE}.{table["hash"]}.json')
+        return urls, shared
+
+    def finish(self, locales: list[str]) -> None:
+        """Write the index files and drop artifacts no index points at."""
+        rebuilt = {lang for langs in self.report.written.values() for lang in langs}
+        if self.drop_short or self.versions.resized:
+            rebuilt.update(self.layout.locales())
+        # Only a build of every locale knows which ones are gone; a partial
+        # build (-l, watch) keeps the other locales' entries as they are.
+        if locales == self.layout.locales():
+            self.bundle_index.retain(locales)
+            self.fallback_report.retain(locales)
+            self.versions.retain(locales, {lang: set(self._published(lang)) for lang in locales})
+            self.locale_maps = {
+                stem: {lang: hashes[lang] for lang in locales if lang in hashes}
+                for stem, hashes in self.locale_maps.items()
+            }
+        for lang in locales:
+            for stem, current in self._published(lang).items():
+                self.versions.track(lang, stem, current)
+        for lang in sorted(rebuilt):
+            self.report.pruned += len(prune(self.layout.build_dir / lang, self._artifacts(lang)))
+        if SHORT_STAGE in self.stages:
+            version = write_tree(self.layout.build_dir, self.keys)
+        else:
+            version = None
+            prune(self.layout.build_dir / KEYS_DIR, set())
+        self.bundle_index.keys = version
+        manifest = VERSIONS_FILE if self.versions.keep > 1 else None
+        self.bundle_index.versions = manifest
+        self.bundle_index.save()
+        self.fallback_report.save()
+        self.versions.save()
+        maps = {MAP_KINDS[stem]: hashes for stem, hashes in self.locale_maps.items() if hashes}
+        write_map(self.layout.build_dir, maps, {'fallback': DEFAULT_LOCALE, 'keys': version, 'versions': manifest})
+        bundle_urls, shared = self._preload_urls(version)
+        preload = preload_links(self.routes(), bundle_urls, BUILD_URL, shared)
+        headers = netlify_headers(BUILD_URL, [MAP_FILE, INDEX_FILE, ROUTES_FILE, VERSIONS_FILE], preload)
+        if not self.layout.headers_file.exists() or self.layout.headers_file.read_bytes() != headers:
+            write_atomic(self.layout.headers_file, headers)
+
+    def run(self, locales: list[str]) -> BuildReport:
+        try:
+            for lang in locales:
+                result = reconcile(self.layout, lang, write=True, force=self.force)
+                if result.status == 'edited':
+                    raise MergeError(
+                        f'{lang}: the locale file was edited by hand ({", ".join(result.sections)}); '
+                        f'move the change to i18n-src/{lang}/ or rerun with -f to discard it'
+                    )
+                if result.status == 'updated':
+                    self.report.applied.append(lang)
+            sources = [LocaleSource(lang, self.layout.locale_file(lang).read_bytes()) for lang in locales]
+            by_lang = {source.lang: source for source in sources}
+            self.fallback = by_lang.get(DEFAULT_LOCALE) or LocaleSource(
+                DEFAULT_LOCALE, self.layout.locale_file(DEFAULT_LOCALE).read_bytes()
+            )
+            self.keys_module()
+            self.render(sources)
+            self.legal_pages(sources, locales)
+            self.finish(locales)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+        return self.report
+
+
+def build(
+    layout: Layout,
+    manifest: Manifest,
+    locales: list[str],
+    *,
+    force: bool = False,
+    prune: bool = False,
+    short_keys: bool = False,
+    string_table: bool = False,
+    keep_versions: int = 1,
+    jobs: int = 1,
+) -> BuildReport:
+    builder = Builder(
+        layout,
+        manifest,
+        force=force,
+        prune=prune,
+        short_keys=short_keys,
+        string_table=string_table,
+        keep_versions=keep_versions,
+        jobs=jobs,
+    )
+    return builder.run(locales)
@@ -0,0 +1,109 @@
+"""Split locales into one bundle per top-level namespace.
+
+``build/<lang>/<NS>.<hash>.json`` holds ``{"<NS>": {...}}`` so the client can
+merge it straight into ``TranslateService``. Top-level scalar keys
+(``APP_NAME``, ``TITLE`` ...) are grouped into the ``_root`` bundle.
+``build/bundles.json`` lists every bundle with its short hash and byte size.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from .artifacts import write_artifact
+from .catalog import minify, write_atomic
+
+ROOT_BUNDLE = '_root'
+INDEX_FILE = 'bundles.json'
+
+
+def split_namespaces(data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Partial locale objects keyed by bundle name, in source key order."""
+    bundles: dict[str, dict[str, Any]] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            bundles[key] = {key: value}
+        else:
+            bundles.setdefault(ROOT_BUNDLE, {})[key] = value
+    return bundles
+
+
+class BundleIndex:
+    """The client-facing ``bundles.json``; untouched locales keep their entries.
+
+    ``fallback`` names the locale already merged into every other locale's
+    bundles, so the client knows not to load it alongside them. With short
+    keys, ``short`` lists the array bundles and ``keys`` the key tree they
+    were built for; with a string table, ``strings`` lists each locale's table.
+    ``versions`` names the version manifest when older versions are kept.
+    """
+
+    def __init__(self, path: Path, *, fallback: str | None = None):
+        self.path = path
+        self.fallback = fallback
+        self._stored = b''
+        self.keys: str | None = None
+        self.versions: str | None = None
+        self.locales: dict[str, dict[str, dict[str, Any]]] = {}
+        self.short: dict[str, dict[str, dict[str, Any]]] = {}
+        self.strings: dict[str, dict[str, Any]] = {}
+        if path.exists():
+            self._stored = path.read_bytes()
+            try:
+                stored = json.loads(self._stored)
+            except ValueError:
+                stored = {}
+            self.locales = stored.get('locales', {})
+            self.short = stored.get('short', {})
+            self.strings = stored.get('strings', {})
+
+    def has(self, lang: str) -> bool:
+        return lang in self.locales
+
+    def update(self, lang: str, entries: dict[str, dict[str, Any]]) -> None:
+        self.locales[lang] = entries
+
+    def update_short(self, lang: str, entries: dict[str, dict[str, Any]]) -> None:
+        self.short[lang] = entries
+
+    def update_strings(self, lang: str, entry: dict[str, Any] | None) -> None:
+        if entry is None:
+            self.strings.pop(lang, None)
+        else:
+            self.strings[lang] = entry
+
+    def retain(self, langs: list[str]) -> None:
+        self.locales = {lang: self.locales[lang] for lang in langs if lang in self.locales}
+        self.short = {lang: self.short[lang] for lang in langs if lang in self.short}
+        self.strings = {lang: self.strings[lang] for lang in langs if lang in self.strings}
+
+    def save(self) -> bool:
+        content: dict[str, Any] = {'version': 1}
+        if self.fallback:
+            content['fallback'] = self.fallback
+        if self.keys:
+            content['keys'] = self.keys
+        if self.versions:
+            content['versions'] = self.versions
+        content['locales'] = self.locales
+        if self.short:
+            content['short'] = self.short
+        if self.strings:
+            content['strings'] = self.strings
+        payload = json.dumps(content, indent=2).encode('utf-8') + b'\n'
+        if payload == self._stored:
+            return False
+        write_atomic(self.path, payload)
+        self._stored = payload
+        return True
+
+
+def write_bundles(build_dir: Path, lang: str, data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Write any bundle of ``lang`` not already on disk; return its index entries."""
+    directory = build_dir / lang
+    return {
+        name: write_artifact(directory, name, minify(bundle))
+        for name, bundle in split_namespaces(data).items()
+    }
@@ -0,0 +1,86 @@
+"""Reading, writing, hashing and flattening locale catalogs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+# Length of the hex digest used in artifact names and client manifests.
+SHORT_HASH = 12
+
+# mkstemp creates 0600 files; published files must stay readable by the web server.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def digest(data: bytes) -> str:
+    """Content hash used in manifests and artifact names."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def short_digest(data: bytes) -> str:
+    return digest(data)[:SHORT_HASH]
+
+
+def parse(data: bytes) -> Any:
+    return json.loads(data.decode('utf-8'))
+
+
+def serialize(value: Any) -> bytes:
+    """Pretty form used for committed files (matches the old scripts)."""
+    return (json.dumps(value, ensure_ascii=False, indent=2) + '\n').encode('utf-8')
+
+
+def minify(value: Any) -> bytes:
+    """Compact form used for shipped artifacts."""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace ``path`` in one step so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            handle.write(data)
+        os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def flatten(value: Any, prefix: str = '') -> dict[str, Any]:
+    """Map dotted key paths (``PRIVACY.TITLE``) to leaf values."""
+    if not isinstance(value, dict):
+        return {prefix: value}
+    flat: dict[str, Any] = {}
+    for key, child in value.items():
+        path = f'{prefix}.{key}' if prefix else key
+        if isinstance(child, dict):
+            flat.update(flatten(child, path))
+        else:
+            flat[path] = child
+    return flat
+
+
+@dataclass
+class LocaleSource:
+    """A published locale file, parsed only when some stage needs it."""
+
+    lang: str
+    raw: bytes
+
+    @cached_property
+    def digest(self) -> str:
+        return digest(self.raw)
+
+    @cached_property
+    def data(self) -> dict[str, Any]:
+        return parse(self.raw)
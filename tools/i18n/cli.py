@@ -0,0 +1,339 @@
+"""Command line entry point: ``python -m tools.i18n <command>``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+
+from .artifacts import brotli
+from .bench import BUDGET_FILE, RESULTS_FILE, SCALES, load_budget, over_budget, run_benchmarks, write_budget, write_results
+from .build import build, default_jobs
+from .catalog import parse
+from .config import DEFAULT_LOCALE, REPO_ROOT, Layout
+from .inline import INLINE_NAMESPACES, InlineError, built_index, write_inline
+from .legal import LegalError
+from .manifest import Manifest
+from .parity import (
+    BASELINE_FILE,
+    KINDS,
+    STRUCTURAL,
+    FlatLocale,
+    Issue,
+    check_parity,
+    load_baseline,
+    new_issues,
+    write_baseline,
+)
+from .sections import LocaleResult, MergeError, diff_locale, reconcile
+from .shortkeys import KEYS_MODULE
+from .usage import USAGE_FILE, load_keep, scan, usage_report, write_report
+from .watch import WatchEvent, watch
+
+
+def _locales(layout: Layout, args: argparse.Namespace) -> list[str]:
+    available = layout.locales()
+    if not args.locale:
+        return available
+    unknown = sorted(set(args.locale) - set(available))
+    if unknown:
+        raise SystemExit(f'Unknown locale(s): {", ".join(unknown)}')
+    return [lang for lang in available if lang in args.locale]
+
+
+def _edited(lang: str, result: LocaleResult) -> None:
+    print(
+        f'❌ {lang}: locale file edited by hand ({", ".join(result.sections)}); '
+        f'move the change to i18n-src/{lang}/ or rerun with -f to discard it'
+    )
+
+
+def cmd_apply(layout: Layout, manifest: Manifest, args: argparse.Namespace) -> int:
+    failed = False
+    for lang in _locales(layout, args):
+        result = reconcile(layout, lang, write=True, force=args.force)
+        if result.status == 'updated':
+            print(f'✅ {lang}: updated {", ".join(result.sections) or "member order"}')
+        elif result.status == 'edited':
+            failed = True
+            _edited(lang, result)
+        elif args.verbose:
+            print(f'   {lang}: {result.status}')
+    return 1 if failed else 0
+
+
+def _parity_issues(layout: Layout, langs: list[str], kinds: set[str]) -> list[Issue]:
+    locales = [FlatLocale(lang, parse(layout.locale_file(lang).read_bytes())) for lang in layout.locales()]
+    reference = next(locale for locale in locales if locale.lang == DEFAULT_LOCALE)
+    selected = set(langs) - {DEFAULT_LOCALE}
+    return [
+        issue
+        for issue in check_parity(reference, [locale for locale in locales if locale.lang in selected])
+        if issue.kind in kinds
+    ]
+
+
+def _report_parity(issues: list[Issue]) -> None:
+    for issue in issues:
+        detail = f' ({issue.detail})' if issue.detail else ''
+        print(f'❌ {issue.kind} {issue.lang}:{issue.key}{detail}')
+
+
+def cmd_check(layout: Layout, manifest: Manifest, args: argparse.Namespace) -> int:
+    failed = False
+    langs = _locales(layout, args)
+    for lang in langs:
+        result = reconcile(layout, lang, write=False, force=args.force)
+        if result.status == 'stale':
+            failed = True
+            print(f'❌ {lang}: out of date ({", ".join(result.sections)}), run "python -m tools.i18n apply"')
+        elif result.status == 'edited':
+            failed = True
+            _edited(lang, result)
+        elif args.verbose:
+            print(f'   {lang}: {result.status}')
+    new = new_issues(_parity_issues(layout, langs, set(KINDS)), load_baseline(layout.source_dir / BASELINE_FILE))
+    _report_parity(new)
+    if new:
+        failed = True
+        print('   parity issues above are not in the baseline, see "python -m tools.i18n parity -v"')
+    return 1 if failed else 0
+
+
+def cmd_diff(layout: Layout, manifest: Manifest, args: argparse.Namespace) -> int:
+    for lang in _locales(layout, args):
+        for marker, key in diff_locale(layout, lang):
+            print(f'{marker} {lang}:{key}')
+    return 0
+
+
+def cmd_build(layout: Layout, manifest: Manifest, args: argparse.Namespace) -> int:
+    report = build(
+        layout,
+        manifest,
+        _locales(layout, args),
+        force=args.force,
+        prune=args.prune_unused,
+        short_keys=args.short_keys,
+        string_table=args.string_table,
+        keep_versions=args.keep_versions,
+        jobs=args.jobs,
+    )
+    if brotli is None:
+        print('⚠️  brotli is not installed, .br artifacts were skipped (pip install -r tools/requirements.txt)')
+    for lang in report.applied:
+        print(f'✅ {lang}: sections applied')
+    if report.keys_module:
+        print(f'✅ keys: {(layout.app_dir / KEYS_MODULE).relative_to(layout.root)}')
+    for stage, langs in report.written.items():
+        print(f'✅ {stage}: {", ".join(langs)}')
+    if report.legal:
+        print(f'✅ legal: {", ".join(report.legal)}')
+    for lang, removed in report.unused.items():
+        print(f'✂️  {lang}: dropped {len(removed)} unused keys from the shipped output')
+    for lang, stats in report.strings.items():
+        print(
+            f'✂️  {lang}: string table of {stats.shared} strings replaces {stats.references} copies, '
+            f'bundles {stats.ratio:.1%} smaller'
+        )
+    for lang, count in report.deltas.items():
+        print(f'✅ {lang}: {count} patches from earlier versions')
+    for lang, filled in report.fallback.items():
+        if filled:
+            print(f'⚠️  {lang}: {len(filled)} keys fall back to {DEFAULT_LOCALE} (see .i18n-cache/fallback.json)')
+    if not report.written and args.verbose:
+        print('   build output up to date')
+    return 0
+
+
+def cmd_watch(layout: Layout, manifest: Manifest, args: argparse.Namespace) -> int:
+    def report(event: WatchEvent) -> None:
+        langs = ', '.join(event.locales)
+        if event.error is not None:
+            print(f'❌ {langs}: {event.error}')
+            return
+        summary = ', '.join(event.report.written) or 'up to date'
+        print(f'✅ {langs}: {summary} in {event.elapsed_ms:.0f} ms')
+
+    print(f'Watching {layout.source_dir.relative_to(layout.root)}/ (Ctrl+C to stop)')
+    try:
+        watch(
+            layout,
+            manifest,
+            report,
+            prune=args.prune_unused,
+            short_keys=args.short_keys,
+            string_table=args.string_table,
+            jobs=args.jobs,
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_inline(layout: Layout, manifest: Manifest, args: argparse.Namespace) -> int:
+    target = args.index or built_index(layout)
+    added = write_inline(layout, target)
+    print(f'✅ {DEFAULT_LOCALE} {", ".join(INLINE_NAMESPACES)}: {added} bytes inlined into {target}')
+    return 0
+
+
+def cmd_usage(layout: Layout, manifest: Manifest, args: argparse.Namespace) -> int:
+    index = scan(layout.app_dir, load_keep(layout.keep_file))
+    catalogs = {lang: parse(layout.locale_file(lang).read_bytes()) for lang in _locales(layout, args)}
+    report = usage_report(index, catalogs)
+    target = layout.cache_dir / USAGE_FILE
+    write_report(target, report)
+    print(f'Scanned {index.files} files: {len(index.literals)} literal keys, {len(index.patterns)} patterns')
+    for lang, entry in report['locales'].items():
+        print(f'   {lang}: {entry["used"]}/{entry["keys"]} keys used, {len(entry["unused"])} unused')
+        if args.verbose:
+            for key in entry['unused']:
+                print(f'      - {key}')
+    print(f'Index written to {target.relative_to(layout.root)}')
+    return 0
+
+
+def cmd_parity(layout: Layout, manifest: Manifest, args: argparse.Namespace) -> int:
+    issues = _parity_issues(layout, _locales(layout, args), set(args.kind or KINDS))
+    baseline_path = layout.source_dir / BASELINE_FILE
+    if args.update_baseline:
+        write_baseline(baseline_path, issues)
+        structural = [issue for issue in issues if issue.kind in STRUCTURAL]
+        print(
+            f'✅ accepted {len(issues) - len(structural)} known issues in {baseline_path.relative_to(layout.root)}'
+        )
+        _report_parity(structural)
+        return 1 if structural else 0
+
+    accepted = load_baseline(baseline_path)
+    new = new_issues(issues, accepted)
+    _report_parity(new)
+    if args.verbose:
+        counts = Counter((issue.lang, issue.kind) for issue in issues)
+        for (lang, kind), count in sorted(counts.items()):
+            print(f'   {lang} {kind}: {count}')
+        fixed = accepted - {issue.id for issue in issues}
+        if fixed:
+            print(f'   {len(fixed)} baseline entries no longer occur, run with --update-baseline')
+    return 1 if new else 0
+
+
+def cmd_bench(layout: Layout, manifest: Manifest, args: argparse.Namespace) -> int:
+    if brotli is None:
+        print('⚠️  brotli is not installed, brotli sizes and compression time are not measured')
+    scales = sorted(set(args.scale or SCALES))
+    results = run_benchmarks(layout, scales, args.repeat)
+    write_results(layout.cache_dir / RESULTS_FILE, results)
+    for result in results['stages']:
+        print(f'   {result["scale"]:>3}x {result["stage"]:<10} {result["time_ms"]:9.1f} ms {result["peak_kib"]:10.0f} KiB')
+    for lang, artifacts in results['sizes'].items():
+        for name, sizes in artifacts.items():
+            if args.verbose or name.startswith('_') and name != '_root':
+                encoded = ', '.join(f'{encoding} {size}' for encoding, size in sizes.items())
+                print(f'   {lang} {name}: {encoded} bytes')
+
+    budget_path = layout.source_dir / BUDGET_FILE
+    if args.update_budget:
+        write_budget(budget_path, results)
+        print(f'✅ budget written to {budget_path.relative_to(layout.root)}')
+        return 0
+    limits = load_budget(budget_path)
+    exceeded = over_budget(results, limits)
+    for name, value, limit in exceeded:
+        print(f'❌ {name}: {value:.1f} over budget {limit:.1f}')
+    if not exceeded and limits:
+        print('✅ within budget')
+    return 1 if exceeded else 0
+
+
+COMMANDS = {
+    'apply': (cmd_apply, 'regenerate the locale files from the i18n-src sources'),
+    'check': (cmd_check, 'exit 1 if any locale file is out of date with its sources or has new parity issues'),
+    'diff': (cmd_diff, 'list the keys apply would add (+), remove (-) or change (~)'),
+    'build': (cmd_build, 'apply, then write minified locales and namespace bundles'),
+    'watch': (cmd_watch, 'rebuild the locales whose sources change, until interrupted'),
+    'inline': (cmd_inline, 'embed the landing strings in the built index.html (after ng build)'),
+    'usage': (cmd_usage, 'index translation keys used in src/ and list unused ones'),
+    'parity': (cmd_parity, 'compare every locale with en: keys, placeholders, copied text'),
+    'bench': (cmd_bench, 'time each pipeline stage, measure shipped sizes, check the budget'),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m tools.i18n', description=__doc__)
+    parser.add_argument('--root', type=Path, default=REPO_ROOT, help='repository root')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('-l', '--locale', action='append', help='limit to a locale (repeatable)')
+        sub.add_argument('-f', '--force', action='store_true', help='ignore the manifest and redo all work')
+        sub.add_argument('-v', '--verbose', action='store_true', help='also report skipped locales')
+        if name in ('build', 'watch'):
+            sub.add_argument(
+                '--prune-unused',
+                action='store_true',
+                help='drop keys no template or TS file references from the shipped output',
+            )
+            sub.add_argument(
+                '--short-keys',
+                action='store_true',
+                help='also ship every locale as flat value arrays indexed by key id',
+            )
+            sub.add_argument(
+                '--string-table',
+                action='store_true',
+                help='store strings shared by several bundles once per locale',
+            )
+            sub.add_argument(
+                '-j',
+                '--jobs',
+                type=int,
+                default=default_jobs() if name == 'build' else 1,
+                help='worker processes for rendering and compression (build default: CPU count)',
+            )
+        if name == 'build':
+            sub.add_argument(
+                '--keep-versions',
+                type=int,
+                default=1,
+                metavar='N',
+                help='keep the last N versions of each artifact and write patches to the current one',
+            )
+        if name == 'bench':
+            sub.add_argument('--scale', action='append', type=int, help=f'data scale to run (repeatable, default: {SCALES})')
+            sub.add_argument('--repeat', type=int, default=5, help='timed runs per stage at scale 1, best one counts')
+            sub.add_argument(
+                '--update-budget',
+                action='store_true',
+                help=f'write the measurements plus headroom to i18n-src/{BUDGET_FILE}',
+            )
+        if name == 'inline':
+            sub.add_argument('--index', type=Path, help='index.html to update (default: the ng build output)')
+        if name == 'parity':
+            sub.add_argument('--kind', action='append', choices=KINDS, help='only report this kind (repeatable)')
+            sub.add_argument(
+                '--update-baseline',
+                action='store_true',
+                help=f'accept all current issues into i18n-src/{BASELINE_FILE}',
+            )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    layout = Layout(args.root.resolve())
+    manifest = Manifest(layout.cache_dir / 'manifest.json')
+    handler, _ = COMMANDS[args.command]
+    try:
+        return handler(layout, manifest, args)
+    except (MergeError, LegalError, InlineError) as exc:
+        print(f'❌ {exc}')
+        return 1
+    finally:
+        manifest.save()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Filesystem layout shared by every toolchain command."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_LOCALE = 'en'
+# URL the build directory is served from (public/ is the web root).
+BUILD_URL = '/assets/i18n/build'
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Where sources, published locale files, build output and cache live."""
+
+    root: Path = REPO_ROOT
+
+    @property
+    def app_dir(self) -> Path:
+        """Angular sources scanned for translation keys."""
+        return self.root / 'src'
+
+    @property
+    def source_dir(self) -> Path:
+        return self.root / 'i18n-src'
+
+    @property
+    def keep_file(self) -> Path:
+        """Keys built from data (database values, model constants) that pruning must keep."""
+        return self.source_dir / 'keep-keys.json'
+
+    @property
+    def locales_dir(self) -> Path:
+        return self.root / 'public' / 'assets' / 'i18n'
+
+    @property
+    def build_dir(self) -> Path:
+        return self.locales_dir / 'build'
+
+    @property
+    def legal_source_dir(self) -> Path:
+        """Templates of the prerendered legal pages (not part of the app)."""
+        return self.root / 'src' / 'legal'
+
+    @property
+    def legal_dir(self) -> Path:
+        """Prerendered legal pages, served from ``/legal``."""
+        return self.root / 'public' / 'legal'
+
+    @property
+    def headers_file(self) -> Path:
+        """Netlify ``_headers``; copied to the root of the published site."""
+        return self.root / 'public' / '_headers'
+
+    @property
+    def cache_dir(self) -> Path:
+        return self.root / '.i18n-cache'
+
+    def locale_file(self, lang: str) -> Path:
+        return self.locales_dir / f'{lang}.json'
+
+    def locales(self) -> list[str]:
+        """Locale codes with a source folder, default locale first."""
+        codes = sorted(path.parent.name for path in self.source_dir.glob('*/*.json'))
+        codes = list(dict.fromkeys(codes))
+        if DEFAULT_LOCALE in codes:
+            codes.remove(DEFAULT_LOCALE)
+            codes.insert(0, DEFAULT_LOCALE)
+        return codes
+
+    def section_sources(self, lang: str) -> dict[str, Path]:
+        """Source name (namespace or ``_root``) -> file for one locale, in name order."""
+        folder = self.source_dir / lang
+        if not folder.is_dir():
+            return {}
+        return {path.stem: path for path in sorted(folder.glob('*.json'))}
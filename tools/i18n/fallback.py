@@ -0,0 +1,80 @@
+"""Merge the default locale under every other locale at build time.
+
+The app used to load ``en`` next to the active locale so ngx-translate could
+fall back to it for missing keys. The build now fills those keys in itself:
+every shipped artifact of a locale other than ``en`` (whole locale, compiled
+catalog, namespace bundles) is the locale's own catalog deep-merged over the
+default one, so a session needs one catalog, not two.
+
+``.i18n-cache/fallback.json`` lists, per locale, the keys that were filled
+in from the default locale, i.e. the strings its users still see in English.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from .catalog import write_atomic
+
+FALLBACK_FILE = 'fallback.json'
+
+
+def merge_fallback(data: dict[str, Any], fallback: dict[str, Any]) -> tuple[dict[str, Any], list[str]]:
+    """``data`` deep-merged over ``fallback`` (``data`` wins), plus the keys taken from ``fallback``."""
+    filled: list[str] = []
+
+    def walk(own: dict[str, Any], base: dict[str, Any], prefix: str) -> dict[str, Any]:
+        merged: dict[str, Any] = {}
+        for key, value in base.items():
+            path = f'{prefix}.{key}' if prefix else key
+            if key not in own:
+                merged[key] = value
+                filled.extend(_leaves(value, path))
+            elif isinstance(value, dict) and isinstance(own[key], dict):
+                merged[key] = walk(own[key], value, path)
+            else:
+                merged[key] = own[key]
+        # Keys only the locale has keep their place after the default locale's.
+        for key, value in own.items():
+            if key not in merged:
+                merged[key] = value
+        return merged
+
+    return walk(data, fallback, ''), filled
+
+
+def _leaves(value: Any, path: str) -> list[str]:
+    if not isinstance(value, dict):
+        return [path]
+    return [leaf for key, child in value.items() for leaf in _leaves(child, f'{path}.{key}')]
+
+
+class FallbackReport:
+    """``fallback.json``; locales not rebuilt keep their last entry."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._stored = b''
+        self.locales: dict[str, list[str]] = {}
+        if path.exists():
+            self._stored = path.read_bytes()
+            try:
+                self.locales = json.loads(self._stored).get('locales', {})
+            except ValueError:
+                self.locales = {}
+
+    def update(self, lang: str, keys: list[str]) -> None:
+        self.locales[lang] = sorted(keys)
+
+    def retain(self, langs: list[str]) -> None:
+        self.locales = {lang: self.locales[lang] for lang in langs if lang in self.locales}
+
+    def save(self) -> bool:
+        payload = (json.dumps({'version': 1, 'locales': self.locales}, indent=2) + '\n').encode('utf-8')
+        if payload == self._stored:
+            return False
+        write_atomic(self.path, payload)
+        self._stored = payload
+        return True
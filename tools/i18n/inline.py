@@ -0,0 +1,106 @@
+"""Inline the landing page's strings into the built ``index.html``.
+
+New visitors land on ``/`` in the default locale. Without help, its text
+appears only after the app has booted and fetched ``routes.json``,
+``bundles.json`` and the bundles. ``python -m tools.i18n inline`` (run by
+``npm run build`` as ``postbuild``) embeds the default locale's
+``LANDING`` bundle into the built ``index.html``::
+
+    <script id="i18n-seed" type="application/json">
+    {"lang":"en","bundles":{"LANDING":{"hash":"<bundle hash>","data":{...}}}}
+    </script>
+
+``LanguageService`` hands it to ``TranslateService`` before anything else,
+so the hero and the waitlist form render in the first frame. The loader
+then uses it in place of the bundle with that hash rather than fetching it.
+The bundle is the one ``build`` shipped, so it is pruned like the others.
+With ``--string-table`` its shared strings are resolved, because the page
+has no table yet. Inlining replaces an earlier seed, so it can be rerun.
+
+Only the default locale is inlined. ``index.html`` is served for every
+route and every visitor, and the landing page is what first visits see,
+in ``en``. Other languages load as before.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+from .bundles import INDEX_FILE
+from .catalog import parse, write_atomic
+from .config import DEFAULT_LOCALE, Layout
+
+INLINE_NAMESPACES = ('LANDING',)
+SEED_ID = 'i18n-seed'
+
+_SEED = re.compile(rf'\s*<script id="{SEED_ID}" type="application/json">.*?</script>', re.S)
+
+
+class InlineError(ValueError):
+    pass
+
+
+def built_index(layout: Layout) -> Path:
+    """``index.html`` of the production build, from ``angular.json``."""
+    config = json.loads((layout.root / 'angular.json').read_bytes())
+    name, project = next(iter(config['projects'].items()))
+    output = project['architect']['build'].get('options', {}).get('outputPath', f'dist/{name}')
+    if isinstance(output, dict):
+        output = output.get('base', f'dist/{name}')
+    return layout.root / output / 'browser' / 'index.html'
+
+
+def _resolve(value: Any, table: list[str]) -> Any:
+    if isinstance(value, dict):
+        return {key: _resolve(child, table) for key, child in value.items()}
+    return table[value] if isinstance(value, int) and not isinstance(value, bool) else value
+
+
+def landing_seed(build_dir: Path, lang: str = DEFAULT_LOCALE) -> dict[str, Any]:
+    """The seed of ``lang``: each of ``INLINE_NAMESPACES`` as the build shipped it."""
+    path = build_dir / INDEX_FILE
+    if not path.exists():
+        raise InlineError(f'{path} is missing, run `python -m tools.i18n build` first')
+    index = parse(path.read_bytes())
+    bundles = index.get('locales', {}).get(lang, {})
+    table = None
+    if lang in index.get('strings', {}):
+        table = parse((build_dir / lang / f'_strings.{index["strings"][lang]["hash"]}.json').read_bytes())
+    seed: dict[str, Any] = {}
+    for name in INLINE_NAMESPACES:
+        if name not in bundles:
+            continue
+        digest = bundles[name]['hash']
+        data = parse((build_dir / lang / f'{name}.{digest}.json').read_bytes())
+        seed[name] = {'hash': digest, 'data': _resolve(data, table) if table else data}
+    return {'lang': lang, 'bundles': seed}
+
+
+def render_seed(seed: dict[str, Any]) -> str:
+    # "</script" would end the element early and "<!--" can keep it from
+    # ending at all; "\u003c" is the same JSON string with no "<" in it.
+    payload = json.dumps(seed, ensure_ascii=False, separators=(',', ':')).replace('<', '\\u003c')
+    return f'<script id="{SEED_ID}" type="application/json">{payload}</script>'
+
+
+def inline_seed(page: str, seed: dict[str, Any]) -> str:
+    """``page`` with ``seed`` as the last element of ``<head>``, replacing an earlier one."""
+    page = _SEED.sub('', page)
+    head = page.find('</head>')
+    if head < 0:
+        raise InlineError('index.html has no </head>')
+    return f'{page[:head]}  {render_seed(seed)}\n{page[head:]}'
+
+
+def write_inline(layout: Layout, target: Path) -> int:
+    """Inline the seed into ``target``; returns the bytes it added."""
+    if not target.exists():
+        raise InlineError(f'{target} is missing, run `ng build` first')
+    before = target.read_text(encoding='utf-8')
+    page = inline_seed(before, landing_seed(layout.build_dir))
+    if page != before:
+        write_atomic(target, page.encode('utf-8'))
+    return len(page.encode('utf-8')) - len(_SEED.sub('', before).encode('utf-8'))
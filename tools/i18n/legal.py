@@ -0,0 +1,167 @@
+"""Prerender the legal pages to static HTML, one file per locale.
+
+The privacy policy is a long static text from the ``PRIVACY`` namespace with
+nothing on it that needs the app. Every build renders its template,
+``src/legal/privacy-policy.html``, for each locale to
+``public/legal/privacy.<lang>.html`` (plus ``.gz``/``.br`` siblings):
+
+- ``{{ 'KEY' | translate }}`` becomes the escaped string,
+- ``[innerHTML]="'KEY' | translate"`` puts the string in unescaped, as Angular did,
+- icons (``<lucide-icon>``) and comments are dropped,
+- the stylesheet next to the template is inlined. It is plain CSS with
+  native nesting, so it needs no Sass step.
+
+Each page links to its other locales. It loads no script, so it renders on
+the first response and can be cached like any static file. The
+``/privacy-policy`` route only redirects to it; ``npm start`` runs the build
+first (``prestart``), so the page exists under ``ng serve`` too. ``usage``
+skips ``src/legal``, so the namespace also drops out of the app's pruned
+bundles.
+
+Strings come from the published locale with the default locale merged
+under it, so a page never shows a raw key. A template that uses any other
+Angular syntax is an error, not copied into the page verbatim.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .artifacts import compressed
+from .catalog import digest, write_atomic
+
+# page name in public/legal/ -> (template stem in src/legal/, key of the page title)
+LEGAL_PAGES = {'privacy': ('privacy-policy', 'PRIVACY.TITLE')}
+# locale codes that are not language tags
+HREFLANG = {'ua': 'uk'}
+URL_PREFIX = '/legal'
+
+_INTERPOLATION = re.compile(r"\{\{\s*'(?P<key>[\w.-]+)'\s*\|\s*translate\s*\}\}")
+_INNER_HTML = re.compile(
+    r"""(?P<open><(?P<tag>[\w-]+)\b[^>]*?)\s*\[innerHTML\]="'(?P<key>[\w.-]+)'\s*\|\s*translate"(?P<rest>[^>]*>)</(?P=tag)>"""
+)
+_ICON_LINE = re.compile(r'^[ \t]*<lucide-icon\b[^>]*></lucide-icon>[ \t]*\n', re.M)
+_ICON = re.compile(r'<lucide-icon\b[^>]*></lucide-icon>[ \t]?')
+_COMMENT_LINE = re.compile(r'^[ \t]*<!--.*?-->[ \t]*\n', re.M | re.S)
+_COMMENT = re.compile(r'<!--.*?-->', re.S)
+# anything left that only Angular could have evaluated
+_ANGULAR = re.compile(r'\{\{|\s[\[(*][\w.-]+\]?\)?=|@(?:if|for|switch|defer)\b')
+
+_BASE_CSS = """body { margin: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; }
+.legal-languages { display: flex; justify-content: flex-end; gap: 1rem; max-width: 1200px; margin: 0 auto; padding: 1rem 2rem 0; font-size: 0.9rem; }
+.legal-languages a { color: #667eea; text-decoration: none; }
+.legal-languages a[aria-current] { color: #4a5568; font-weight: 600; }
+"""
+
+
+class LegalError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class LegalTemplate:
+    page: str
+    html: str
+    css: str
+
+    @property
+    def name(self) -> str:
+        return f'{LEGAL_PAGES[self.page][0]}.html'
+
+
+def load_templates(source_dir: Path) -> list[LegalTemplate]:
+    """The templates present in ``source_dir``."""
+    return [
+        LegalTemplate(
+            page,
+            (source_dir / f'{stem}.html').read_text(encoding='utf-8'),
+            (source_dir / f'{stem}.css').read_text(encoding='utf-8'),
+        )
+        for page, (stem, _) in LEGAL_PAGES.items()
+        if (source_dir / f'{stem}.html').exists()
+    ]
+
+
+def templates_digest(templates: list[LegalTemplate]) -> str:
+    return digest(''.join(template.html + template.css for template in templates).encode('utf-8'))
+
+
+def page_name(page: str, lang: str) -> str:
+    return f'{page}.{lang}.html'
+
+
+def _lookup(data: dict[str, Any], key: str) -> str | None:
+    node: Any = data
+    for part in key.split('.'):
+        if not isinstance(node, dict) or part not in node:
+            return None
+        node = node[part]
+    return node if isinstance(node, str) else None
+
+
+def render_body(template: LegalTemplate, lang: str, data: dict[str, Any]) -> str:
+    """The template with every translation in place; raises ``LegalError`` on what it cannot render."""
+
+    def text(key: str) -> str:
+        value = _lookup(data, key)
+        if value is None:
+            raise LegalError(f'{template.name}: {key} is not a string in the {lang} catalog')
+        return value
+
+    body = _COMMENT.sub('', _COMMENT_LINE.sub('', template.html))
+    body = _ICON.sub('', _ICON_LINE.sub('', body))
+    body = _INNER_HTML.sub(lambda m: f'{m["open"]}{m["rest"]}{text(m["key"])}</{m["tag"]}>', body)
+    body = _INTERPOLATION.sub(lambda m: html.escape(text(m['key']), quote=False), body)
+    leftover = _ANGULAR.search(body)
+    if leftover:
+        line = body.count('\n', 0, leftover.start()) + 1
+        raise LegalError(f'{template.name}: cannot prerender {leftover[0].strip()!r} (line {line} after substitution)')
+    return body
+
+
+def render_page(template: LegalTemplate, lang: str, langs: list[str], data: dict[str, Any]) -> bytes:
+    """The complete static page of ``template`` in ``lang``, linking to ``langs``."""
+    title = html.escape(_lookup(data, LEGAL_PAGES[template.page][1]) or template.page)
+    alternates = [
+        f'<link rel="alternate" hreflang="{HREFLANG.get(code, code)}" href="{URL_PREFIX}/{page_name(template.page, code)}">'
+        for code in langs
+    ]
+    alternates.append(f'<link rel="alternate" hreflang="x-default" href="{URL_PREFIX}/{page_name(template.page, langs[0])}">')
+    links = []
+    for code in langs:
+        label = html.escape(_lookup(data, f'LANGUAGES.{code.upper()}') or code.upper())
+        current = ' aria-current="page"' if code == lang else ''
+        links.append(f'<a href="{URL_PREFIX}/{page_name(template.page, code)}" hreflang="{HREFLANG.get(code, code)}"{current}>{label}</a>')
+    lines = [
+        '<!doctype html>',
+        f'<html lang="{HREFLANG.get(lang, lang)}">',
+        '<head>',
+        '<meta charset="utf-8">',
+        '<meta name="viewport" content="width=device-width, initial-scale=1">',
+        f'<title>{title}</title>',
+        *alternates,
+        f'<style>\n{_BASE_CSS}{template.css}</style>',
+        '</head>',
+        '<body>',
+        f'<nav class="legal-languages">{"".join(links)}</nav>',
+        render_body(template, lang, data).rstrip('\n'),
+        '</body>',
+        '</html>',
+        '',
+    ]
+    return '\n'.join(lines).encode('utf-8')
+
+
+def write_page(directory: Path, name: str, payload: bytes) -> bool:
+    """Write ``payload`` and its compressed siblings unless the page is unchanged."""
+    target = directory / name
+    if target.exists() and target.read_bytes() == payload:
+        return False
+    for suffix, data in compressed(payload).items():
+        write_atomic(directory / f'{name}{suffix}', data)
+    write_atomic(target, payload)
+    return True
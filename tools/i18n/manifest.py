@@ -0,0 +1,56 @@
+"""Content-hash manifest that lets commands skip unchanged inputs."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from .catalog import write_atomic
+
+MANIFEST_VERSION = 2
+
+
+class Manifest:
+    """Digests recorded per scope (``locale``, ``compiled``, ``bundles`` ...).
+
+    A scope maps keys such as ``de`` to the digest that was
+    current the last time the corresponding work ran.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._scopes: dict[str, dict[str, str]] = {}
+        self._dirty = False
+        if path.exists():
+            try:
+                stored = json.loads(path.read_text(encoding='utf-8'))
+            except ValueError:
+                stored = {}
+            if stored.get('version') == MANIFEST_VERSION:
+                self._scopes = stored.get('scopes', {})
+
+    def get(self, scope: str, key: str) -> str | None:
+        return self._scopes.get(scope, {}).get(key)
+
+    def fresh(self, scope: str, key: str, value: str) -> bool:
+        return self.get(scope, key) == value
+
+    def record(self, scope: str, key: str, value: str) -> None:
+        entries = self._scopes.setdefault(scope, {})
+        if entries.get(key) != value:
+            entries[key] = value
+            self._dirty = True
+
+    def forget(self, scope: str, key: str) -> None:
+        if self._scopes.get(scope, {}).pop(key, None) is not None:
+            self._dirty = True
+
+    def keys(self, scope: str) -> list[str]:
+        return list(self._scopes.get(scope, {}))
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {'version': MANIFEST_VERSION, 'scopes': self._scopes}
+        write_atomic(self.path, json.dumps(payload, indent=2, sort_keys=True).encode('utf-8'))
+        self._dirty = False
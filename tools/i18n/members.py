@@ -0,0 +1,101 @@
+"""Locate the top-level members of a JSON object without building it.
+
+A single tokenizing pass over the bytes records where every top-level
+member's key starts and its value ends (string escapes and nesting are
+tracked, but no objects are built), so callers can copy members verbatim
+and compare them byte for byte.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+
+_WHITESPACE = b' \t\r\n'
+
+
+@dataclass(frozen=True)
+class Span:
+    """Byte offsets of one top-level member."""
+
+    key_start: int  # opening quote of the key
+    value_start: int
+    value_end: int  # exclusive
+
+
+class ScanError(ValueError):
+    pass
+
+
+def _skip_string(raw: bytes, pos: int) -> int:
+    """Offset just past the string whose opening quote is at ``pos``."""
+    pos += 1
+    while True:
+        quote = raw.find(b'"', pos)
+        if quote < 0:
+            raise ScanError('unterminated string')
+        backslashes = 0
+        while raw[quote - 1 - backslashes] == 0x5C:  # '\\'
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return quote + 1
+        pos = quote + 1
+
+
+def _skip_whitespace(raw: bytes, pos: int) -> int:
+    while pos < len(raw) and raw[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _skip_value(raw: bytes, pos: int) -> int:
+    """Offset just past the JSON value starting at ``pos``."""
+    if raw[pos] == 0x22:  # '"'
+        return _skip_string(raw, pos)
+    if raw[pos] not in b'{[':
+        end = pos
+        while end < len(raw) and raw[end] not in b',}]' and raw[end] not in _WHITESPACE:
+            end += 1
+        return end
+    depth = 0
+    while pos < len(raw):
+        byte = raw[pos]
+        if byte == 0x22:
+            pos = _skip_string(raw, pos)
+            continue
+        if byte in b'{[':
+            depth += 1
+        elif byte in b'}]':
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos += 1
+    raise ScanError('unterminated object')
+
+
+def scan_members(raw: bytes) -> dict[str, Span]:
+    """Spans of the top-level members, in file order."""
+    pos = _skip_whitespace(raw, 0)
+    if pos >= len(raw) or raw[pos] != 0x7B:  # '{'
+        raise ScanError('top-level value is not an object')
+    spans: dict[str, Span] = {}
+    pos = _skip_whitespace(raw, pos + 1)
+    while pos < len(raw) and raw[pos] != 0x7D:  # '}'
+        if raw[pos] != 0x22:
+            raise ScanError(f'expected a key at byte {pos}')
+        key_end = _skip_string(raw, pos)
+        key = json.loads(raw[pos:key_end])
+        colon = _skip_whitespace(raw, key_end)
+        if raw[colon] != 0x3A:  # ':'
+            raise ScanError(f'expected ":" at byte {colon}')
+        value_start = _skip_whitespace(raw, colon + 1)
+        value_end = _skip_value(raw, value_start)
+        # Duplicate keys: the last one wins, as with json.loads.
+        spans.pop(key, None)
+        spans[key] = Span(pos, value_start, value_end)
+        pos = _skip_whitespace(raw, value_end)
+        if pos < len(raw) and raw[pos] == 0x2C:  # ','
+            pos = _skip_whitespace(raw, pos + 1)
+    if pos >= len(raw):
+        raise ScanError('unterminated top-level object')
+    return spans
@@ -0,0 +1,143 @@
+"""Cross-locale parity: namespaces, missing/extra keys, placeholders and copied text.
+
+Each locale is flattened once into a sorted key array; two locales are then
+compared with a single merge walk over the arrays, so the whole check is
+linear in the number of keys and runs in a few milliseconds.
+
+A namespace a locale lacks or has on its own (a source file missing, misnamed
+or nested under another namespace) is one ``namespace`` issue rather than one
+per key. Those are structural mistakes, not untranslated strings, so they are
+never accepted into the baseline.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from .catalog import flatten, write_atomic
+
+_PLACEHOLDER = re.compile(r'\{\{\s*([\w.]+)\s*\}\}')
+_MARKUP = re.compile(r'<[^>]+>|\{\{[^}]*\}\}')
+_WORD = re.compile(r'[^\W\d_]{2,}')
+# Identical short labels ("Email", "Status", "IPI") are fine across locales;
+# only flag copies of real sentences.
+COPY_MIN_WORDS = 4
+
+KINDS = ('namespace', 'missing', 'extra', 'placeholders', 'copied')
+# Kinds that always fail, whatever the baseline says.
+STRUCTURAL = frozenset({'namespace'})
+# Known issues accepted so the check only fails on new ones.
+BASELINE_FILE = 'parity-baseline.json'
+
+
+@dataclass(frozen=True)
+class Issue:
+    kind: str
+    lang: str
+    key: str
+    detail: str = ''
+
+    @property
+    def id(self) -> str:
+        return f'{self.kind}:{self.lang}:{self.key}'
+
+
+class FlatLocale:
+    """A locale flattened once: sorted dotted keys plus their values."""
+
+    def __init__(self, lang: str, data: dict[str, Any]):
+        self.lang = lang
+        self.values = {key: value for key, value in flatten(data).items() if key}
+        self.keys = sorted(self.values)
+        # top-level namespaces; _root strings have no dot and belong to none
+        self.namespaces = {key.split('.', 1)[0] for key in self.keys if '.' in key}
+
+
+def namespace_of(key: str) -> str | None:
+    return key.split('.', 1)[0] if '.' in key else None
+
+
+def merge_diff(left: list[str], right: list[str]) -> tuple[list[str], list[str], list[str]]:
+    """Walk two sorted key arrays once: (only in left, only in right, shared)."""
+    only_left: list[str] = []
+    only_right: list[str] = []
+    shared: list[str] = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        a, b = left[i], right[j]
+        if a == b:
+            shared.append(a)
+            i += 1
+            j += 1
+        elif a < b:
+            only_left.append(a)
+            i += 1
+        else:
+            only_right.append(b)
+            j += 1
+    only_left.extend(left[i:])
+    only_right.extend(right[j:])
+    return only_left, only_right, shared
+
+
+def placeholders(value: Any) -> frozenset[str]:
+    return frozenset(_PLACEHOLDER.findall(value)) if isinstance(value, str) else frozenset()
+
+
+def _is_sentence(value: Any) -> bool:
+    return isinstance(value, str) and len(_WORD.findall(_MARKUP.sub(' ', value))) >= COPY_MIN_WORDS
+
+
+def check_parity(reference: FlatLocale, others: list[FlatLocale]) -> Iterator[Issue]:
+    """Issues for every locale in ``others`` measured against ``reference``."""
+    everyone = [reference, *others]
+    for locale in others:
+        missing, extra, shared = merge_diff(reference.keys, locale.keys)
+        absent = reference.namespaces - locale.namespaces
+        unknown = locale.namespaces - reference.namespaces
+        for namespace in sorted(absent):
+            yield Issue('namespace', locale.lang, namespace, f'missing, {reference.lang} has it')
+        for namespace in sorted(unknown):
+            yield Issue('namespace', locale.lang, namespace, f'not in {reference.lang}')
+        for key in missing:
+            if namespace_of(key) not in absent:
+                yield Issue('missing', locale.lang, key)
+        for key in extra:
+            if namespace_of(key) not in unknown:
+                yield Issue('extra', locale.lang, key)
+        for key in shared:
+            expected = placeholders(reference.values[key])
+            found = placeholders(locale.values[key])
+            if expected != found:
+                detail = f'expected {sorted(expected) or "none"}, found {sorted(found) or "none"}'
+                yield Issue('placeholders', locale.lang, key, detail)
+        for key in locale.keys:
+            value = locale.values[key]
+            if not _is_sentence(value):
+                continue
+            source = next(
+                (other.lang for other in everyone if other is not locale and other.values.get(key) == value),
+                None,
+            )
+            if source:
+                yield Issue('copied', locale.lang, key, f'same text as {source}')
+
+
+def load_baseline(path: Path) -> set[str]:
+    if not path.exists():
+        return set()
+    return set(json.loads(path.read_text(encoding='utf-8')).get('accepted', []))
+
+
+def new_issues(issues: list[Issue], accepted: set[str]) -> list[Issue]:
+    """Issues the baseline does not cover; structural ones are never covered."""
+    return [issue for issue in issues if issue.kind in STRUCTURAL or issue.id not in accepted]
+
+
+def write_baseline(path: Path, issues: list[Issue]) -> None:
+    payload = {'accepted': sorted(issue.id for issue in issues if issue.kind not in STRUCTURAL)}
+    write_atomic(path, (json.dumps(payload, indent=2) + '\n').encode('utf-8'))
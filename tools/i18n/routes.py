@@ -0,0 +1,262 @@
+"""Map every route to the translation namespaces its code renders.
+
+Routes are read from ``app.routes.ts`` and, through ``loadChildren``, from
+the lazy route files, with child paths joined onto their parents. A route's
+code is the static import closure of its component (plus its parent
+layouts), i.e. the modules the bundler puts in or before the route's chunk,
+together with each component's ``templateUrl``. Those files are indexed
+with the same scanner as ``usage`` and the keys they reach are reduced to
+top-level namespaces (top-level strings map to ``_root``).
+
+``build/routes.json`` lists the namespaces of the app shell (``app.ts`` and
+everything it imports) and, per route, the ones it needs on top::
+
+    {"version": 1, "shell": ["NAV", ...], "routes": {"works/:id/splits": ["SPLITS", ...]}}
+
+The loader fetches a route's bundles as soon as navigation starts, in
+parallel with the route's chunk. First visits boot in the default locale
+(later ones in the language the user picked), so the build also turns the
+manifest into ``Link: rel=preload`` headers per page for the default locale,
+and a first load fetches those bundles alongside ``main.js``.
+
+Like everything in this toolchain the TypeScript is matched with regular
+expressions, not parsed; the route files only use the literal forms below.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .bundles import INDEX_FILE, ROOT_BUNDLE
+from .catalog import digest, flatten, write_atomic
+from .usage import SKIP_SUFFIXES, UsageIndex
+
+ROUTES_FILE = 'routes.json'
+ROUTES_ENTRY = Path('app') / 'app.routes.ts'
+SHELL_ENTRY = Path('app') / 'app.ts'
+
+_STATIC_IMPORT = re.compile(r'^\s*import\s[^;]*?\bfrom\s+[\'"](?P<spec>\.[^\'"]+)[\'"]', re.M)
+_NAMED_IMPORT = re.compile(r'^\s*import\s*\{(?P<names>[^}]*)\}\s*from\s+[\'"](?P<spec>\.[^\'"]+)[\'"]', re.M)
+_TEMPLATE_URL = re.compile(r'\btemplateUrl\s*:\s*[\'"](?P<url>[^\'"]+)[\'"]')
+_ROUTES_ARRAY = re.compile(r'\broutes\s*:\s*Routes\s*=\s*\[')
+_PATH = re.compile(r'\bpath\s*:\s*[\'"](?P<path>[^\'"]*)[\'"]')
+_COMPONENT = re.compile(r'\bcomponent\s*:\s*(?P<name>\w+)')
+_LOAD_COMPONENT = re.compile(r'\bloadComponent\s*:\s*\(\)\s*=>\s*import\(\s*[\'"](?P<spec>[^\'"]+)[\'"]')
+_LOAD_CHILDREN = re.compile(r'\bloadChildren\s*:\s*\(\)\s*=>\s*import\(\s*[\'"](?P<spec>[^\'"]+)[\'"]')
+_CHILDREN = re.compile(r'\bchildren\s*:\s*\[')
+_LINE_COMMENT = re.compile(r'^\s*//.*$', re.M)
+
+
+@dataclass
+class Route:
+    path: str
+    # entry modules: the route's component and those of its parent layouts
+    entries: list[Path] = field(default_factory=list)
+
+
+def resolve_module(origin: Path, spec: str) -> Path | None:
+    base = (origin.parent / spec).resolve()
+    for candidate in (base.with_name(base.name + '.ts'), base / 'index.ts'):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _closing(text: str, start: int) -> int:
+    """Offset just past the bracket that closes the one at ``start``."""
+    depth = 0
+    pos = start
+    while pos < len(text):
+        char = text[pos]
+        if char in '\'"`':
+            pos = text.index(char, pos + 1) + 1
+            continue
+        if char in '{[(':
+            depth += 1
+        elif char in '}])':
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos += 1
+    raise ValueError('unbalanced brackets')
+
+
+def _objects(text: str, start: int) -> list[str]:
+    """Top-level ``{...}`` literals of the array whose ``[`` is at ``start``."""
+    end = _closing(text, start) - 1
+    objects = []
+    pos = start + 1
+    while pos < end:
+        if text[pos] == '{':
+            close = _closing(text, pos)
+            objects.append(text[pos:close])
+            pos = close
+        else:
+            pos += 1
+    return objects
+
+
+def _join(parent: str, path: str) -> str:
+    return '/'.join(part for part in (parent, path) if part)
+
+
+def parse_routes(path: Path, prefix: str = '', parents: tuple[Path, ...] = ()) -> list[Route]:
+    """Flattened routes of one route file, lazy children included."""
+    text = _LINE_COMMENT.sub('', path.read_text(encoding='utf-8'))
+    array = _ROUTES_ARRAY.search(text)
+    if array is None:
+        return []
+    named = {
+        name.strip(): match['spec']
+        for match in _NAMED_IMPORT.finditer(text)
+        for name in match['names'].split(',')
+        if name.strip()
+    }
+    return _walk(path, text, array.end() - 1, named, prefix, parents)
+
+
+def _walk(
+    origin: Path,
+    text: str,
+    start: int,
+    named: dict[str, str],
+    prefix: str,
+    parents: tuple[Path, ...],
+) -> list[Route]:
+    routes: list[Route] = []
+    for literal in _objects(text, start):
+        children = _CHILDREN.search(literal)
+        own = literal[:children.start()] + literal[_closing(literal, children.end() - 1):] if children else literal
+        path_match = _PATH.search(own)
+        full = _join(prefix, path_match['path'] if path_match else '')
+        entry = None
+        if load := _LOAD_COMPONENT.search(own):
+            entry = resolve_module(origin, load['spec'])
+        elif (component := _COMPONENT.search(own)) and component['name'] in named:
+            entry = resolve_module(origin, named[component['name']])
+        entries = parents + ((entry,) if entry else ())
+        if entry and not children:
+            routes.append(Route(full, list(entries)))
+        if children:
+            routes += _walk(origin, literal, children.end() - 1, named, full, entries)
+        if lazy := _LOAD_CHILDREN.search(own):
+            target = resolve_module(origin, lazy['spec'])
+            if target:
+                routes += parse_routes(target, full, entries)
+    return routes
+
+
+class RouteAnalyzer:
+    """Per-run caches: each module is read once and indexed once."""
+
+    def __init__(self, catalog: dict[str, Any]):
+        self.catalog = catalog
+        self.keys = flatten(catalog)
+        self._texts: dict[Path, str] = {}
+        self._namespaces: dict[Path, frozenset[str]] = {}
+        self._dependencies: dict[Path, list[Path]] = {}
+
+    def text(self, path: Path) -> str:
+        if path not in self._texts:
+            self._texts[path] = path.read_text(encoding='utf-8')
+        return self._texts[path]
+
+    def dependencies(self, module: Path) -> list[Path]:
+        """Templates and relative static imports of one module."""
+        if module not in self._dependencies:
+            text = self.text(module)
+            found = []
+            for match in _TEMPLATE_URL.finditer(text):
+                template = (module.parent / match['url']).resolve()
+                if template.is_file():
+                    found.append(template)
+            for match in _STATIC_IMPORT.finditer(text):
+                target = resolve_module(module, match['spec'])
+                if target and not target.name.endswith(SKIP_SUFFIXES):
+                    found.append(target)
+            self._dependencies[module] = found
+        return self._dependencies[module]
+
+    def closure(self, entries: list[Path]) -> set[Path]:
+        """Every module statically imported from ``entries`` plus their templates."""
+        seen: set[Path] = set()
+        pending = list(entries)
+        while pending:
+            module = pending.pop()
+            if module in seen:
+                continue
+            seen.add(module)
+            if module.suffix == '.ts':
+                pending += self.dependencies(module)
+        return seen
+
+    def file_namespaces(self, path: Path) -> frozenset[str]:
+        """Bundle names holding the keys one file references."""
+        if path not in self._namespaces:
+            index = UsageIndex()
+            index.add_text(self.text(path))
+            names = set()
+            for key in index.resolve(self.keys):
+                top = key.split('.', 1)[0]
+                names.add(top if isinstance(self.catalog.get(top), dict) else ROOT_BUNDLE)
+            self._namespaces[path] = frozenset(names)
+        return self._namespaces[path]
+
+    def namespaces(self, entries: list[Path]) -> set[str]:
+        return set().union(*(self.file_namespaces(path) for path in self.closure(entries)))
+
+
+def route_manifest(src_dir: Path, catalog: dict[str, Any]) -> dict[str, Any]:
+    """``routes.json`` content for ``catalog`` (the default locale)."""
+    analyzer = RouteAnalyzer(catalog)
+    shell_entry = src_dir / SHELL_ENTRY
+    shell = analyzer.namespaces([shell_entry]) if shell_entry.is_file() else set()
+    routes: dict[str, list[str]] = {}
+    for route in parse_routes(src_dir / ROUTES_ENTRY):
+        # The first declaration wins, as in the router.
+        if route.path not in routes:
+            routes[route.path] = sorted(analyzer.namespaces(route.entries) - shell)
+    return {'version': 1, 'shell': sorted(shell), 'routes': routes}
+
+
+def write_route_manifest(build_dir: Path, manifest: dict[str, Any]) -> bool:
+    path = build_dir / ROUTES_FILE
+    payload = json.dumps(manifest, indent=2).encode('utf-8') + b'\n'
+    if path.exists() and path.read_bytes() == payload:
+        return False
+    write_atomic(path, payload)
+    return True
+
+
+def source_fingerprint(src_dir: Path, catalog_digest: str) -> str:
+    """Changes whenever an app source file or the default locale does (stats only)."""
+    entries = [catalog_digest]
+    for glob in ('app/**/*.ts', 'app/**/*.html'):
+        for path in sorted(src_dir.glob(glob)):
+            stat = path.stat()
+            entries.append(f'{path.relative_to(src_dir)}:{stat.st_mtime_ns}:{stat.st_size}')
+    return digest('\n'.join(entries).encode('utf-8'))
+
+
+def preload_links(
+    manifest: dict[str, Any],
+    bundle_urls: dict[str, str],
+    url_prefix: str,
+    shared: list[str] | None = None,
+) -> dict[str, list[str]]:
+    """Page path -> URLs the first load of that page fetches in the default locale.
+
+    ``bundle_urls`` maps bundle names to the URL the loader fetches for them;
+    ``shared`` are fetched on every page (key tree, string table).
+    """
+    indexes = [f'{url_prefix}/{ROUTES_FILE}', f'{url_prefix}/{INDEX_FILE}', *(shared or [])]
+    links = {}
+    for path, names in manifest['routes'].items():
+        urls = [bundle_urls[name] for name in [*manifest['shell'], *names] if name in bundle_urls]
+        links['/' + path] = indexes + urls
+    return links
+
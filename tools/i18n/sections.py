@@ -0,0 +1,210 @@
+"""Merge the ``i18n-src`` source tree into the published locale files.
+
+``i18n-src/<lang>/<NS>.json`` holds the value of one top-level namespace and
+``_root.json`` the top-level strings; they are the only place translations
+are edited. ``public/assets/i18n/<lang>.json`` is generated from them:
+``_root`` members first, then namespaces in name order, each copied from its
+source text indented one level, so the published file keeps the sources'
+formatting and its diff is exactly the edit.
+
+``.i18n-cache/merge/<lang>.json`` keeps every source's stat, digest and
+rendered fragment, plus the digest and stat of the file last written. A
+source whose mtime and size are unchanged is not read, one that changed is
+hashed and only re-rendered when its bytes differ, and the published file is
+not read while its stat matches the last write. A one-line edit therefore
+costs one small parse and a concatenation, never a load of the whole locale.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .catalog import digest, flatten, parse, write_atomic
+from .config import Layout
+from .members import ScanError, scan_members
+
+ROOT_SOURCE = '_root'
+MERGE_DIR = 'merge'
+CACHE_VERSION = 1
+INDENT = '  '
+
+
+class MergeError(ValueError):
+    pass
+
+
+@dataclass
+class LocaleResult:
+    lang: str
+    # 'unchanged' (skipped via cache), 'current', 'updated', 'stale' or
+    # 'edited' (published file changed by hand, not overwritten)
+    status: str
+    sections: list[str] = field(default_factory=list)
+
+
+class MergeCache:
+    """Per-locale merge state; written only after the locale file is in sync."""
+
+    def __init__(self, path: Path, *, reset: bool = False):
+        self.path = path
+        data: dict[str, Any] = {}
+        if path.exists() and not reset:
+            try:
+                data = json.loads(path.read_bytes())
+            except ValueError:
+                data = {}
+        if data.get('version') != CACHE_VERSION:
+            data = {}
+        # source name -> {'stat', 'digest', 'members', 'fragment'}
+        self.sources: dict[str, dict[str, Any]] = data.get('sources', {})
+        # last written locale file: {'stat', 'digest'}
+        self.output: dict[str, Any] = data.get('output', {})
+        self.dirty = reset
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        payload = {'version': CACHE_VERSION, 'sources': self.sources, 'output': self.output}
+        write_atomic(self.path, json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+        self.dirty = False
+
+
+def _stat(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _indented(text: str) -> str:
+    return text.strip().replace('\n', '\n' + INDENT)
+
+
+def render_fragment(name: str, raw: bytes) -> tuple[str, list[str]]:
+    """Published text of one source file and the top-level keys it provides."""
+    try:
+        value = parse(raw)
+    except ValueError as exc:
+        raise MergeError(f'{name}.json: {exc}') from exc
+    if not isinstance(value, dict):
+        raise MergeError(f'{name}.json: expected an object')
+    if name != ROOT_SOURCE:
+        return f'{INDENT}{json.dumps(name, ensure_ascii=False)}: {_indented(raw.decode("utf-8"))}', [name]
+    nested = [key for key, child in value.items() if isinstance(child, dict)]
+    if nested:
+        raise MergeError(f'{ROOT_SOURCE}.json: {", ".join(nested)} belong in their own source files')
+    members = [
+        INDENT + _indented(raw[span.key_start:span.value_end].decode('utf-8'))
+        for span in scan_members(raw).values()
+    ]
+    return ',\n'.join(members), list(value)
+
+
+def assemble(fragments: dict[str, str]) -> bytes:
+    names = sorted(fragments, key=lambda name: (name != ROOT_SOURCE, name))
+    body = ',\n'.join(fragments[name] for name in names if fragments[name])
+    return f'{{\n{body}\n}}\n'.encode('utf-8') if body else b'{}\n'
+
+
+def _merge(layout: Layout, lang: str, cache: MergeCache) -> tuple[dict[str, str], list[str]]:
+    """Fragment of every source, plus the sources added, changed or removed."""
+    sources = layout.section_sources(lang)
+    changed = [name for name in cache.sources if name not in sources]
+    for name in changed:
+        del cache.sources[name]
+        cache.dirty = True
+    for name, path in sources.items():
+        stat = _stat(path)
+        entry = cache.sources.get(name)
+        if entry is not None and entry['stat'] == stat:
+            continue
+        raw = path.read_bytes()
+        source_digest = digest(raw)
+        if entry is None or entry['digest'] != source_digest:
+            fragment, members = render_fragment(name, raw)
+            entry = {'digest': source_digest, 'members': members, 'fragment': fragment}
+            changed.append(name)
+        entry['stat'] = stat
+        cache.sources[name] = entry
+        cache.dirty = True
+    if changed:
+        clashes = Counter(key for entry in cache.sources.values() for key in entry['members'])
+        duplicated = sorted(key for key, count in clashes.items() if count > 1)
+        if duplicated:
+            raise MergeError(f'{lang}: {", ".join(duplicated)} defined in more than one source file')
+    return {name: entry['fragment'] for name, entry in cache.sources.items()}, sorted(changed)
+
+
+def _differing(published: bytes, output: bytes) -> list[str]:
+    """Top-level keys whose text differs between two renderings of a locale."""
+    try:
+        before = {key: published[span.key_start:span.value_end] for key, span in scan_members(published).items()}
+    except ScanError:
+        before = {}
+    after = {key: output[span.key_start:span.value_end] for key, span in scan_members(output).items()}
+    return sorted(key for key in before.keys() | after.keys() if before.get(key) != after.get(key))
+
+
+def _cache(layout: Layout, lang: str, force: bool) -> MergeCache:
+    return MergeCache(layout.cache_dir / MERGE_DIR / f'{lang}.json', reset=force)
+
+
+def reconcile(layout: Layout, lang: str, *, write: bool, force: bool = False) -> LocaleResult:
+    """Regenerate one locale file from its sources (or just report)."""
+    cache = _cache(layout, lang, force)
+    fragments, changed = _merge(layout, lang, cache)
+    target = layout.locale_file(lang)
+    target_stat = _stat(target)
+    # Our own last write, untouched since: its content is known without reading it.
+    untouched = target_stat is not None and target_stat == cache.output.get('stat')
+    if untouched and not changed:
+        cache.save()
+        return LocaleResult(lang, 'unchanged')
+
+    output = assemble(fragments)
+    output_digest = digest(output)
+    published = None if untouched or target_stat is None else target.read_bytes()
+    if untouched:
+        published_digest = cache.output['digest']
+    else:
+        published_digest = None if published is None else digest(published)
+    if published_digest == output_digest:
+        cache.output = {'stat': target_stat, 'digest': output_digest}
+        cache.dirty = True
+        cache.save()
+        return LocaleResult(lang, 'current')
+
+    sections = changed if published is None else _differing(published, output)
+    # Changed since our last write and not by a checkout that matches the sources.
+    edited = published is not None and cache.output.get('digest') not in (None, published_digest)
+    if edited and not force:
+        return LocaleResult(lang, 'edited', sections)
+    if not write:
+        return LocaleResult(lang, 'stale', sections)
+    write_atomic(target, output)
+    cache.output = {'stat': _stat(target), 'digest': output_digest}
+    cache.dirty = True
+    cache.save()
+    return LocaleResult(lang, 'updated', sections)
+
+
+def diff_locale(layout: Layout, lang: str) -> list[tuple[str, str]]:
+    """``(marker, key)`` pairs apply would produce: ``+`` add, ``-`` drop, ``~`` change."""
+    fragments, _ = _merge(layout, lang, _cache(layout, lang, False))
+    target = layout.locale_file(lang)
+    before = flatten(parse(target.read_bytes())) if target.exists() else {}
+    after = flatten(parse(assemble(fragments)))
+    changes: list[tuple[str, str]] = []
+    for key in sorted(before.keys() | after.keys()):
+        if key not in before:
+            changes.append(('+', key))
+        elif key not in after:
+            changes.append(('-', key))
+        elif before[key] != after[key]:
+            changes.append(('~', key))
+    return changes
@@ -0,0 +1,170 @@
+"""Short-key artifacts: locales shipped as flat arrays of values.
+
+The key names of a locale file are a sizeable part of its bytes, and every
+locale and every release repeats them. With ``build --short-keys`` the key
+tree of the default locale ships once, as ``build/_keys/tree.<hash>.json``
+(names only, every leaf ``0``), and each locale also ships as arrays of
+values in the tree's depth-first leaf order, ``null`` for a key it does not
+ship:
+
+``build/<lang>/_short.<hash>.json``       every key
+``build/<lang>/_short.<NS>.<hash>.json``  the keys of one bundle (``_root``: top-level strings)
+
+The tree only changes when a key is added, renamed or removed, so a client
+keeps it cached across locales and across releases that only change text.
+The indexes name the tree the arrays were built for (``keys``). The walk
+follows JavaScript's property order (integer-like names first, ascending,
+then insertion order), so ``Object.entries`` on the client visits the leaves
+in id order.
+
+Every build also regenerates ``src/app/services/i18n-keys.generated.ts``:
+the same tree as the ``I18N_KEYS`` constant, each leaf holding its dotted
+key, plus the ``I18nKey`` union type. ``translate.instant(I18N_KEYS.PRIVACY.TITLE)``
+then fails to compile on a typo.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any
+
+from .artifacts import prune, write_artifact
+from .bundles import ROOT_BUNDLE
+from .catalog import minify, write_atomic
+
+SHORT_LOCALE = '_short'
+KEYS_DIR = '_keys'
+TREE_STEM = 'tree'
+KEYS_MODULE = Path('app') / 'services' / 'i18n-keys.generated.ts'
+
+# A key tree: nested names, leaves hold the dotted key.
+KeyTree = dict[str, Any]
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_$][\w$]*$')
+_ARRAY_INDEX_LIMIT = 2**32 - 1
+
+
+def _is_index(name: str) -> bool:
+    return name.isdigit() and str(int(name)) == name and int(name) < _ARRAY_INDEX_LIMIT
+
+
+def js_order(names: list[str]) -> list[str]:
+    """``names`` in the order JavaScript enumerates an object's own properties."""
+    indexes = sorted((name for name in names if _is_index(name)), key=int)
+    return indexes + [name for name in names if not _is_index(name)]
+
+
+def key_tree(data: dict[str, Any], prefix: str = '') -> KeyTree:
+    """Skeleton of ``data`` in JavaScript property order, leaves replaced by their dotted key."""
+    tree: KeyTree = {}
+    for name in js_order(list(data)):
+        path = f'{prefix}.{name}' if prefix else name
+        value = data[name]
+        tree[name] = key_tree(value, path) if isinstance(value, dict) else path
+    return tree
+
+
+def render_tree(tree: KeyTree) -> bytes:
+    """Shipped form of ``tree``: names only."""
+
+    def strip(node: KeyTree) -> dict[str, Any]:
+        return {name: strip(child) if isinstance(child, dict) else 0 for name, child in node.items()}
+
+    return minify(strip(tree))
+
+
+def write_tree(build_dir: Path, tree: KeyTree) -> str:
+    """Write the shipped tree, drop older ones; returns its hash."""
+    directory = build_dir / KEYS_DIR
+    entry = write_artifact(directory, TREE_STEM, render_tree(tree))
+    prune(directory, {f'{TREE_STEM}.{entry["hash"]}.json'})
+    return str(entry['hash'])
+
+
+def bundle_trees(tree: KeyTree) -> dict[str, KeyTree]:
+    """The part of ``tree`` each namespace bundle covers, as ``split_namespaces`` splits it."""
+    trees: dict[str, KeyTree] = {}
+    for name, value in tree.items():
+        if isinstance(value, dict):
+            trees[name] = {name: value}
+        else:
+            trees.setdefault(ROOT_BUNDLE, {})[name] = value
+    return trees
+
+
+def short_values(data: dict[str, Any], tree: KeyTree) -> list[Any]:
+    """Values of ``data`` at every leaf of ``tree``, in id order."""
+    values: list[Any] = []
+
+    def walk(node: Any, branch: KeyTree) -> None:
+        for name, child in branch.items():
+            value = node.get(name) if isinstance(node, dict) else None
+            if isinstance(child, dict):
+                walk(value, child)
+            else:
+                values.append(None if isinstance(value, dict) else value)
+
+    walk(data, tree)
+    return values
+
+
+def render_short(data: dict[str, Any], tree: KeyTree, strings: dict[str, int] | None = None) -> dict[str, bytes]:
+    """Artifact stem -> payload for the whole locale and each of its bundles.
+
+    ``strings`` (the locale's string table index) is applied to the bundles only.
+    """
+    payloads = {SHORT_LOCALE: minify(short_values(data, tree))}
+    for name, branch in bundle_trees(tree).items():
+        values = short_values(data, branch)
+        if strings:
+            values = [strings.get(value, value) if isinstance(value, str) else value for value in values]
+        payloads[f'{SHORT_LOCALE}.{name}'] = minify(values)
+    return payloads
+
+
+def _ts_string(value: str) -> str:
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def _ts_name(name: str) -> str:
+    return name if _IDENTIFIER.match(name) else _ts_string(name)
+
+
+def _ts_tree(tree: KeyTree, depth: int) -> list[str]:
+    indent = '  ' * depth
+    lines = []
+    for name, child in tree.items():
+        if isinstance(child, dict):
+            lines.append(f'{indent}{_ts_name(name)}: {{')
+            lines += _ts_tree(child, depth + 1)
+            lines.append(f'{indent}}},')
+        else:
+            lines.append(f'{indent}{_ts_name(name)}: {_ts_string(child)},')
+    return lines
+
+
+def render_module(tree: KeyTree) -> bytes:
+    lines = [
+        '// Generated by `python -m tools.i18n build` from the en catalog. Do not edit.',
+        '',
+        '/** Every translation key of the default locale; leaves hold the dotted key. */',
+        'export const I18N_KEYS = {',
+        *_ts_tree(tree, 1),
+        '} as const;',
+        '',
+        'type Leaves<T> = T extends string ? T : { [K in keyof T]: Leaves<T[K]> }[keyof T];',
+        '',
+        'export type I18nKey = Leaves<typeof I18N_KEYS>;',
+        '',
+    ]
+    return '\n'.join(lines).encode('utf-8')
+
+
+def write_module(src_dir: Path, tree: KeyTree) -> bool:
+    path = src_dir / KEYS_MODULE
+    payload = render_module(tree)
+    if path.exists() and path.read_bytes() == payload:
+        return False
+    write_atomic(path, payload)
+    return True
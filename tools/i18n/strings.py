@@ -0,0 +1,83 @@
+"""Per-locale string table for namespace bundles.
+
+Short labels (``Cancel``, ``Save``, organisation names) recur across
+namespaces. With ``build --string-table`` every string that appears in more
+than one bundle of a locale is stored once, in
+``build/<lang>/_strings.<hash>.json`` (a JSON array, most used first), and
+the bundles hold its index instead: a number where a string would be. All
+translation values are strings, so a number is unambiguous. The client
+resolves the indexes against one parsed table, so a repeated label is one
+string object in memory rather than one per namespace.
+
+Strings repeated inside a single bundle are left alone: gzip already folds
+those, and the table only pays for itself across requests. Whole-locale
+artifacts are single files and are not interned either.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from .catalog import minify
+
+STRING_TABLE = '_strings'
+
+
+@dataclass
+class InternStats:
+    # strings moved to the table and the values now pointing at it
+    shared: int
+    references: int
+    # minified bundle bytes without the table, and with it (table included)
+    before: int
+    after: int
+
+    @property
+    def ratio(self) -> float:
+        """Share of the bundle bytes the table saves."""
+        return 1 - self.after / self.before if self.before else 0.0
+
+    def to_json(self) -> dict[str, Any]:
+        return {**vars(self), 'ratio': round(self.ratio, 4)}
+
+
+def _strings(value: Any) -> list[str]:
+    if isinstance(value, dict):
+        return [text for child in value.values() for text in _strings(child)]
+    return [value] if isinstance(value, str) else []
+
+
+def string_table(bundles: dict[str, Any]) -> list[str]:
+    """Strings found in more than one bundle, most referenced first, then by first use."""
+    bundle_count: Counter[str] = Counter()
+    uses: Counter[str] = Counter()
+    for bundle in bundles.values():
+        found = _strings(bundle)
+        uses.update(found)
+        bundle_count.update(set(found))
+    shared = [text for text in uses if bundle_count[text] > 1]
+    return sorted(shared, key=lambda text: -uses[text])
+
+
+def intern(value: Any, index: dict[str, int]) -> Any:
+    """``value`` with every string found in ``index`` replaced by its position."""
+    if isinstance(value, dict):
+        return {key: intern(child, index) for key, child in value.items()}
+    if isinstance(value, str):
+        return index.get(value, value)
+    return value
+
+
+def render_interned(
+    bundles: dict[str, Any],
+    table: list[str],
+    index: dict[str, int],
+) -> tuple[dict[str, bytes], InternStats]:
+    """Payloads of the interned bundles plus ``table`` (under ``STRING_TABLE``)."""
+    payloads = {name: minify(intern(bundle, index)) for name, bundle in bundles.items()}
+    references = sum(1 for bundle in bundles.values() for text in _strings(bundle) if text in index)
+    payloads[STRING_TABLE] = minify(table)
+    before = sum(len(minify(bundle)) for bundle in bundles.values())
+    return payloads, InternStats(len(table), references, before, sum(map(len, payloads.values())))
@@ -0,0 +1,154 @@
+"""Index which translation keys the Angular sources actually use.
+
+Templates and TypeScript are scanned with regular expressions rather than
+parsed: every quoted dotted string (``'WORKS.TITLE'``) is a candidate key,
+undotted strings count only when piped to ``translate`` or passed to
+``instant``/``get``/``stream``, and runtime-built keys become patterns:
+``'role.' + key`` and `` `role.${key}` `` both turn into ``role.*``.
+References through the generated constants (``I18N_KEYS.WORKS.TITLE``)
+count as the key they name; the generated module itself is not scanned.
+A candidate that names a subtree (``'SPLITS.CHANGE_HISTORY'``) keeps the
+whole subtree. Anything that merely looks like a key but is not in the
+catalog is ignored, so the scan errs on the side of keeping keys.
+
+Keys the sources never spell out because they come from data
+(``{{ q.question_key | translate }}`` with ``SECURITY.Q_*`` from
+``security_questions``) are listed in ``i18n-src/keep-keys.json`` as
+pattern -> reason; ``scan`` adds them to the index's patterns.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from .catalog import digest, flatten, write_atomic
+
+USAGE_FILE = 'key-usage.json'
+SOURCE_GLOBS = ('**/*.html', '**/*.ts')
+SKIP_SUFFIXES = ('.spec.ts', '.generated.ts')
+# src/testing holds spec helpers, not shipped code; src/legal is prerendered, not part of the app
+SKIP_DIRS = ('testing', 'legal')
+
+_DOTTED = r'[A-Za-z_][\w-]*(?:\.[\w-]+)+\.?'
+_WORD = r'[A-Za-z_][\w-]*'
+# 'KEY' / "KEY", remembering what follows so concatenation can be detected.
+_QUOTED = re.compile(rf'(?P<q>[\'"])(?P<key>{_DOTTED})(?P=q)(?P<after>\s*\+)?')
+_PIPED = re.compile(rf'(?P<q>[\'"])(?P<key>{_WORD})(?P=q)\s*\|\s*translate\b')
+_CALLED = re.compile(rf'\b(?:instant|get|stream)\(\s*(?P<q>[\'"`])(?P<key>{_WORD})(?P=q)')
+_TEMPLATE = re.compile(r'`(?P<body>[A-Za-z_][\w.-]*\$\{[^`]*)`')
+_INTERPOLATION = re.compile(r'\$\{[^}]*\}')
+_CONSTANT = re.compile(r'\bI18N_KEYS(?P<path>(?:\??\.\w+)+)')
+
+
+@dataclass
+class UsageIndex:
+    literals: set[str] = field(default_factory=set)
+    # glob-style patterns; ``*`` stands for any runtime-built fragment
+    patterns: set[str] = field(default_factory=set)
+    files: int = 0
+
+    def add_text(self, text: str) -> None:
+        for match in _QUOTED.finditer(text):
+            key = match['key']
+            if match['after'] or key.endswith('.'):
+                self.patterns.add(key + '*')
+            else:
+                self.literals.add(key)
+        for regex in (_PIPED, _CALLED):
+            self.literals.update(match['key'] for match in regex.finditer(text))
+        for match in _CONSTANT.finditer(text):
+            self.literals.add(match['path'].replace('?', '')[1:])
+        for match in _TEMPLATE.finditer(text):
+            pattern = _INTERPOLATION.sub('*', match['body'])
+            if '.' in pattern.replace('*', ''):
+                self.patterns.add(pattern)
+
+    def resolve(self, keys: Iterable[str]) -> set[str]:
+        """The subset of flattened ``keys`` that the sources reference."""
+        keys = list(keys)
+        key_set = set(keys)
+        used = {key for key in self.literals if key in key_set}
+        subtrees = tuple(f'{key}.' for key in self.literals if key not in key_set)
+        if subtrees:
+            used.update(key for key in keys if key.startswith(subtrees))
+        if self.patterns:
+            regex = re.compile(
+                '|'.join(
+                    re.escape(pattern).replace(r'\*', '.*')
+                    for pattern in sorted(self.patterns)
+                )
+            )
+            used.update(key for key in keys if regex.fullmatch(key))
+        return used
+
+    def digest(self) -> str:
+        return digest(json.dumps([sorted(self.literals), sorted(self.patterns)]).encode('utf-8'))
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            'files': self.files,
+            'literals': sorted(self.literals),
+            'patterns': sorted(self.patterns),
+        }
+
+
+def load_keep(path: Path) -> set[str]:
+    """Patterns of the keep-list at ``path`` (none when it does not exist)."""
+    try:
+        return set(json.loads(path.read_bytes()))
+    except FileNotFoundError:
+        return set()
+
+
+def scan(src_dir: Path, keep: Iterable[str] = ()) -> UsageIndex:
+    index = UsageIndex(patterns=set(keep))
+    for glob in SOURCE_GLOBS:
+        for path in sorted(src_dir.glob(glob)):
+            if path.name.endswith(SKIP_SUFFIXES) or path.relative_to(src_dir).parts[0] in SKIP_DIRS:
+                continue
+            index.add_text(path.read_text(encoding='utf-8'))
+            index.files += 1
+    return index
+
+
+def prune_unused(data: dict[str, Any], used: set[str]) -> tuple[dict[str, Any], list[str]]:
+    """Copy of ``data`` without unused leaves (and the objects they empty)."""
+    removed: list[str] = []
+
+    def walk(node: dict[str, Any], prefix: str) -> dict[str, Any]:
+        kept: dict[str, Any] = {}
+        for key, value in node.items():
+            path = f'{prefix}.{key}' if prefix else key
+            if isinstance(value, dict):
+                child = walk(value, path)
+                if child:
+                    kept[key] = child
+            elif path in used:
+                kept[key] = value
+            else:
+                removed.append(path)
+        return kept
+
+    return walk(data, ''), removed
+
+
+def usage_report(index: UsageIndex, catalogs: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Used and unused key counts per locale plus the unused key list."""
+    report: dict[str, Any] = {'index': index.to_json(), 'locales': {}}
+    for lang, data in catalogs.items():
+        keys = flatten(data)
+        used = index.resolve(keys)
+        report['locales'][lang] = {
+            'keys': len(keys),
+            'used': len(used),
+            'unused': sorted(keys.keys() - used),
+        }
+    return report
+
+
+def write_report(path: Path, report: dict[str, Any]) -> None:
+    write_atomic(path, (json.dumps(report, indent=2, ensure_ascii=False) + '\n').encode('utf-8'))
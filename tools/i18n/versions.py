@@ -0,0 +1,146 @@
+"""Keep earlier published versions and ship deltas to the current one.
+
+With ``build --keep-versions N`` the build keeps the last ``N`` versions of
+every keyed artifact (whole locale, compiled catalog, namespace bundles) in
+``build/<lang>/``. When an artifact changes it writes a patch from each
+older version to the new one::
+
+    build/<lang>/<stem>.<old hash>-<new hash>.json
+
+A patch is a list of JSON-patch operations (RFC 6902 names, RFC 6901
+pointers) in compact array form::
+
+    [["replace", "/PRIVACY/TITLE", "..."], ["add", "/PRIVACY/NEW", "..."], ["remove", "/OLD"]]
+
+and is only written when it is smaller than the artifact itself.
+``build/versions.json`` lists, per locale and artifact, the current hash,
+the older ones kept and the byte size of each patch::
+
+    {"version": 1, "keep": 5, "locales": {"ua": {"PRIVACY": {
+        "current": "<hash>", "previous": ["<hash>", ...], "deltas": {"<hash>": 312}}}}}
+
+A client holding version ``k`` of an artifact fetches the patch instead of
+the artifact. Array artifacts (short keys, string tables) are not patched.
+History only accumulates while ``build/`` survives between builds, e.g. in
+the deploy's build cache; a clean build starts over with no deltas.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from .artifacts import write_immutable
+from .catalog import minify, parse, write_atomic
+
+VERSIONS_FILE = 'versions.json'
+
+
+def _pointer(path: str, key: str) -> str:
+    return f'{path}/{key.replace("~", "~0").replace("/", "~1")}'
+
+
+def json_patch(old: dict[str, Any], new: dict[str, Any], path: str = '') -> list[list[Any]]:
+    """Operations turning ``old`` into ``new``; objects are patched member by member."""
+    ops: list[list[Any]] = [['remove', _pointer(path, key)] for key in old if key not in new]
+    for key, value in new.items():
+        pointer = _pointer(path, key)
+        if key not in old:
+            ops.append(['add', pointer, value])
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            ops += json_patch(old[key], value, pointer)
+        elif old[key] != value:
+            ops.append(['replace', pointer, value])
+    return ops
+
+
+def delta_name(stem: str, old: str, new: str) -> str:
+    return f'{stem}.{old}-{new}.json'
+
+
+class VersionManifest:
+    """``versions.json``: artifact history and the deltas between versions."""
+
+    def __init__(self, path: Path, keep: int):
+        self.path = path
+        self.keep = max(1, keep)
+        self._stored = b''
+        # locale -> artifact stem -> {'current', 'previous', 'deltas'}
+        self.locales: dict[str, dict[str, dict[str, Any]]] = {}
+        stored_keep = self.keep
+        if path.exists():
+            self._stored = path.read_bytes()
+            try:
+                stored = json.loads(self._stored)
+            except ValueError:
+                stored = {}
+            self.locales = stored.get('locales', {})
+            stored_keep = stored.get('keep', self.keep)
+        # A different N drops the versions beyond it, in every locale.
+        self.resized = stored_keep != self.keep and bool(self.locales)
+        if self.resized:
+            for artifacts in self.locales.values():
+                for entry in artifacts.values():
+                    entry['previous'] = entry['previous'][: self.keep - 1]
+                    entry['deltas'] = {old: size for old, size in entry['deltas'].items() if old in entry['previous']}
+        if self.keep == 1:
+            self.locales = {}
+
+    def publish(self, directory: Path, lang: str, stem: str, new_hash: str, payload: bytes) -> int:
+        """Record ``payload`` as the current version; returns the number of deltas written."""
+        if self.keep == 1:
+            return 0
+        artifacts = self.locales.setdefault(lang, {})
+        entry = artifacts.get(stem)
+        if entry is not None and entry['current'] == new_hash:
+            return 0
+        history = [entry['current'], *entry['previous']] if entry else []
+        previous, deltas = [], {}
+        new = parse(payload)
+        for old_hash in history:
+            if len(previous) == self.keep - 1:
+                break
+            source = directory / f'{stem}.{old_hash}.json'
+            if old_hash == new_hash or not source.exists():
+                continue
+            previous.append(old_hash)
+            old = parse(source.read_bytes())
+            if not isinstance(old, dict) or not isinstance(new, dict):
+                continue
+            delta = minify(json_patch(old, new))
+            if len(delta) < len(payload):
+                write_immutable(directory, delta_name(stem, old_hash, new_hash), delta)
+                deltas[old_hash] = len(delta)
+        artifacts[stem] = {'current': new_hash, 'previous': previous, 'deltas': deltas}
+        return len(deltas)
+
+    def track(self, lang: str, stem: str, current: str) -> None:
+        """Start the history of an artifact published before versions were kept."""
+        if self.keep > 1:
+            self.locales.setdefault(lang, {}).setdefault(stem, {'current': current, 'previous': [], 'deltas': {}})
+
+    def files(self, lang: str) -> set[str]:
+        """Older versions and deltas ``build/<lang>/`` keeps."""
+        names = set()
+        for stem, entry in self.locales.get(lang, {}).items():
+            names.update(f'{stem}.{old}.json' for old in entry['previous'])
+            names.update(delta_name(stem, old, entry['current']) for old in entry['deltas'])
+        return names
+
+    def retain(self, langs: list[str], stems: dict[str, set[str]]) -> None:
+        """Forget locales and artifacts that are no longer published."""
+        self.locales = {
+            lang: {stem: entry for stem, entry in self.locales[lang].items() if stem in stems.get(lang, set())}
+            for lang in langs
+            if lang in self.locales
+        }
+
+    def save(self) -> bool:
+        content = {'version': 1, 'keep': self.keep, 'locales': self.locales}
+        payload = (json.dumps(content, indent=2) + '\n').encode('utf-8')
+        if payload == self._stored:
+            return False
+        write_atomic(self.path, payload)
+        self._stored = payload
+        return True
@@ -0,0 +1,144 @@
+"""``watch``: rebuild a locale as soon as one of its inputs is saved.
+
+The watcher polls file stats (stdlib only, no inotify dependency) for the
+``i18n-src/<lang>/*.json`` sources.
+Changes are debounced until the tree has been quiet for a short moment, so
+an editor's write-rename-chmod sequence or a multi-file save triggers one
+build. Only the locales whose sources changed go through the builder (all
+of them when the default locale changed, since it is merged into the
+others), which re-renders only the changed sources, rewrites only artifacts whose hash
+changed and writes every file atomically.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from .build import BuildReport, Builder
+from .config import DEFAULT_LOCALE, Layout
+from .manifest import Manifest
+
+POLL_INTERVAL = 0.02
+DEBOUNCE = 0.03
+
+# path -> (mtime_ns, size)
+Snapshot = dict[Path, tuple[int, int]]
+
+
+@dataclass
+class WatchEvent:
+    locales: list[str]
+    report: BuildReport | None
+    error: Exception | None
+    elapsed_ms: float
+
+
+def watched_files(layout: Layout) -> dict[Path, str]:
+    """Every source file, mapped to the locale it belongs to."""
+    files = {}
+    for lang in layout.locales():
+        for path in layout.section_sources(lang).values():
+            files[path] = lang
+    return files
+
+
+def snapshot(paths: dict[Path, str]) -> Snapshot:
+    stats = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        stats[path] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+def changed_locales(layout: Layout, before: Snapshot, after: Snapshot) -> set[str]:
+    langs = set()
+    for path in before.keys() | after.keys():
+        if before.get(path) == after.get(path):
+            continue
+        if path.parent.parent == layout.source_dir:
+            langs.add(path.parent.name)
+    return langs
+
+
+def _scan(layout: Layout) -> Snapshot:
+    # Re-listing picks up section files created or deleted since the last poll.
+    return snapshot(watched_files(layout))
+
+
+def rebuild(
+    layout: Layout,
+    manifest: Manifest,
+    locales: list[str],
+    *,
+    prune: bool = False,
+    short_keys: bool = False,
+    string_table: bool = False,
+    jobs: int = 1,
+) -> WatchEvent:
+    started = time.perf_counter()
+    try:
+        builder = Builder(
+            layout,
+            manifest,
+            prune=prune,
+            short_keys=short_keys,
+            string_table=string_table,
+            jobs=jobs,
+        )
+        report = builder.run(locales)
+        error = None
+    except ValueError as exc:
+        # Typically a half-typed JSON file; the next save triggers another try.
+        report, error = None, exc
+    finally:
+        manifest.save()
+    return WatchEvent(locales, report, error, (time.perf_counter() - started) * 1000)
+
+
+def watch(
+    layout: Layout,
+    manifest: Manifest,
+    on_event: Callable[[WatchEvent], None],
+    *,
+    prune: bool = False,
+    short_keys: bool = False,
+    string_table: bool = False,
+    jobs: int = 1,
+    poll: float = POLL_INTERVAL,
+    debounce: float = DEBOUNCE,
+) -> None:
+    """Poll until interrupted, calling ``on_event`` after every rebuild."""
+    current = _scan(layout)
+    while True:
+        time.sleep(poll)
+        latest = _scan(layout)
+        if latest == current:
+            continue
+        # Debounce: wait until a full interval passes without further changes.
+        while True:
+            time.sleep(debounce)
+            settled = _scan(layout)
+            if settled == latest:
+                break
+            latest = settled
+        pending = changed_locales(layout, current, latest)
+        locales = [lang for lang in layout.locales() if lang in pending or DEFAULT_LOCALE in pending]
+        if locales:
+            event = rebuild(
+                layout,
+                manifest,
+                locales,
+                prune=prune,
+                short_keys=short_keys,
+                string_table=string_table,
+                jobs=jobs,
+            )
+            on_event(event)
+        # A save made during the build differs from ``latest`` and shows up next poll.
+        current = latest
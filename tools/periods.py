@@ -0,0 +1,24 @@
+"""Calendar periods shared by the data tools.
+
+``changelog compact`` folds the change log by period and ``rollups``
+rewinds its watermark to the start of a week; both round a timestamp down
+the same way, in UTC, with weeks starting on Monday.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+PERIODS = ('week', 'month', 'quarter', 'year')
+
+
+def period_start(moment: datetime, period: str) -> date:
+    """First day (UTC) of the ``period`` that contains ``moment``."""
+    day = moment.astimezone(timezone.utc).date()
+    if period == 'week':
+        return day - timedelta(days=day.weekday())
+    if period == 'month':
+        return day.replace(day=1)
+    if period == 'quarter':
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    return day.replace(month=1, day=1)
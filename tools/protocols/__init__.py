@@ -0,0 +1,45 @@
+"""Protocol and split-sheet PDFs rendered in bulk, outside the browser.
+
+``PdfGeneratorService`` draws one document per click in the user's browser.
+This package renders the same layouts for a whole workspace, release or
+protocol status straight from Postgres, across a process pool, into one
+zip archive. Each document carries a QR code naming its row and the digest
+of its data, kept in a content-addressed cache (``.qr-cache``), and a
+folder of scanned documents can be checked against the database::
+
+    python -m tools.protocols render -w <workspace> -o protocols.zip             # split sheets
+    python -m tools.protocols render --layout protocol --status approved -o out.zip
+    python -m tools.protocols render -w <workspace> --lang ua --font DejaVuSans.ttf -o ua.zip
+    python -m tools.protocols qr --layout protocol -w <workspace> --export qr/  # SVG and PNG per protocol
+    python -m tools.protocols verify scans/                                      # QR codes vs. current rows
+"""
+
+from .batch import RenderReport, RenderSetup, render_archive
+from .labels import Labels, RenderError, load_labels
+from .layouts import LAYOUTS, Assets, render_protocol, render_split_sheet
+from .qr import QrCache, QrCode, cache_codes, make_payload, parse_payload
+from .source import Selection, read_documents
+from .verify import Finding, VerifyReport, verify_scans
+
+__all__ = [
+    'Assets',
+    'Finding',
+    'LAYOUTS',
+    'Labels',
+    'QrCache',
+    'QrCode',
+    'RenderError',
+    'RenderReport',
+    'RenderSetup',
+    'Selection',
+    'VerifyReport',
+    'cache_codes',
+    'load_labels',
+    'make_payload',
+    'parse_payload',
+    'read_documents',
+    'render_archive',
+    'render_protocol',
+    'render_split_sheet',
+    'verify_scans',
+]
@@ -0,0 +1,208 @@
+"""Render documents across a process pool into one zip archive.
+
+Each worker process loads what every document shares once, in the pool
+initializer: the translated labels, the TrueType fonts (parsed and
+registered with ReportLab) and the logo (decoded and scaled down to the
+size it is drawn at). QR codes come from the shared on-disk ``QrCache``, so a
+re-render of unchanged documents encodes none. Tasks are small chunks of
+documents, at most two per worker in flight, so memory stays flat however many are selected. Results
+come back in order and go straight into the archive, stored rather than
+deflated since the PDF streams are already compressed. A document that
+fails to render is reported and left out; the others are still written.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Iterable
+
+from ..i18n.config import DEFAULT_LOCALE, REPO_ROOT, Layout
+from .document import LOGO_BOX, Fonts
+from .labels import RenderError, load_labels
+from .layouts import RENDERERS, Assets
+from .qr import CACHE_BYTES, CACHE_DIR, QrCache, make_payload
+
+try:
+    from PIL import Image
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFError, TTFont
+except ImportError:  # pragma: no cover - optional dependency
+    pdfmetrics = None
+
+# documents per task: enough to amortise the round trip, few enough to keep workers busy
+CHUNK_DOCUMENTS = 8
+# pixels per point of the drawn logo
+LOGO_SCALE = 3
+
+
+@dataclass(frozen=True)
+class RenderSetup:
+    """Everything a worker needs to build its ``Assets``; must pickle."""
+
+    layout: str
+    lang: str = DEFAULT_LOCALE
+    font: Path | None = None
+    font_bold: Path | None = None
+    logo: Path | None = None
+    generated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    root: Path = REPO_ROOT
+    # None renders without QR codes
+    qr_cache: Path | None = CACHE_DIR
+    qr_cache_bytes: int = CACHE_BYTES
+
+
+@dataclass
+class RenderReport:
+    documents: int = 0
+    bytes: int = 0
+    failed: list[tuple[str, str]] = field(default_factory=list)
+    seconds: float = 0.0
+    qr_cached: int = 0
+    qr_encoded: int = 0
+
+
+def _register(path: Path) -> str:
+    name = path.stem
+    if name not in pdfmetrics.getRegisteredFontNames():
+        try:
+            pdfmetrics.registerFont(TTFont(name, str(path)))
+        except (OSError, TTFError) as exc:
+            raise RenderError(f'cannot load font {path}: {exc}') from None
+    return name
+
+
+def _logo(path: Path) -> ImageReader:
+    try:
+        image = Image.open(path)
+        image.load()
+    except OSError as exc:
+        raise RenderError(f'cannot load logo {path}: {exc}') from None
+    image.thumbnail((LOGO_BOX[0] * LOGO_SCALE, LOGO_BOX[1] * LOGO_SCALE))
+    return ImageReader(image)
+
+
+def load_assets(setup: RenderSetup) -> Assets:
+    if pdfmetrics is None:
+        raise SystemExit('reportlab is not installed (pip install -r tools/requirements.txt)')
+    labels = load_labels(setup.lang, Layout(setup.root))
+    if setup.font:
+        fonts = Fonts(_register(setup.font), _register(setup.font_bold or setup.font))
+    else:
+        fonts = Fonts()
+        unencodable = labels.unencodable()
+        if unencodable:
+            raise RenderError(
+                f'the {setup.lang} labels ({unencodable[0]}, ...) need a Unicode font: '
+                'pass --font (e.g. DejaVuSans.ttf)'
+            )
+    stamp = setup.generated.strftime('%Y-%m-%d %H:%M UTC')
+    codes = QrCache(setup.qr_cache, setup.qr_cache_bytes) if setup.qr_cache else None
+    return Assets(labels, fonts, stamp, _logo(setup.logo) if setup.logo else None, codes)
+
+
+# set in each worker by the pool initializer
+_assets: Assets | None = None
+
+
+def _init_worker(setup: RenderSetup) -> None:
+    global _assets
+    _assets = load_assets(setup)
+
+
+Results = tuple[list[tuple[str, str, bytes | None]], int, int]
+
+
+def _render_chunk(layout: str, chunk: list[tuple[str, str]]) -> Results:
+    """(id, file name or error, PDF or None) for each document of ``chunk``, and the QR cache hits and misses."""
+    render = RENDERERS[layout]
+    codes = _assets.codes
+    hits, misses = (codes.stats.hits, codes.stats.misses) if codes else (0, 0)
+    results = []
+    for document_id, text in chunk:
+        try:
+            qr = codes.get(make_payload(layout, document_id, text)) if codes else None
+            name, pdf = render(json.loads(text), _assets, qr)
+        except Exception as exc:  # one broken document must not stop the batch
+            results.append((document_id, f'{type(exc).__name__}: {exc}', None))
+        else:
+            results.append((document_id, name, pdf))
+    if codes:
+        hits, misses = codes.stats.hits - hits, codes.stats.misses - misses
+    return results, hits, misses
+
+
+def _chunks(documents: Iterable[tuple[str, str]], size: int) -> Iterable[list[tuple[str, str]]]:
+    chunk: list[tuple[str, str]] = []
+    for document in documents:
+        chunk.append(document)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def render_archive(
+    documents: Iterable[tuple[str, str]],
+    setup: RenderSetup,
+    output: IO[bytes],
+    workers: int = os.cpu_count() or 1,
+    chunk_size: int = CHUNK_DOCUMENTS,
+) -> RenderReport:
+    """Render ``documents`` ((id, JSON text) pairs) into a zip written to ``output``."""
+    global _assets
+    report = RenderReport()
+    started = time.perf_counter()
+    # fails early, in this process, on a missing locale, font or logo
+    _assets = load_assets(setup)
+    names: set[str] = set()
+
+    def write(archive: zipfile.ZipFile, chunk: Results) -> None:
+        results, cached, encoded = chunk
+        report.qr_cached += cached
+        report.qr_encoded += encoded
+        for document_id, name, pdf in results:
+            if pdf is None:
+                report.failed.append((document_id, name))
+                continue
+            if name in names:
+                name = f'{name.removesuffix(".pdf")}-{document_id}.pdf'
+            names.add(name)
+            info = zipfile.ZipInfo(name, setup.generated.timetuple()[:6])
+            archive.writestr(info, pdf, compress_type=zipfile.ZIP_STORED)
+            report.documents += 1
+            report.bytes += len(pdf)
+
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_STORED) as archive:
+        if workers <= 1:
+            for chunk in _chunks(documents, chunk_size):
+                write(archive, _render_chunk(setup.layout, chunk))
+        else:
+            pending: deque[Future] = deque()
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(setup,)) as pool:
+                try:
+                    for chunk in _chunks(documents, chunk_size):
+                        if len(pending) >= workers * 2:
+                            write(archive, pending.popleft().result())
+                        pending.append(pool.submit(_render_chunk, setup.layout, chunk))
+                    while pending:
+                        write(archive, pending.popleft().result())
+                except BrokenProcessPool as exc:
+                    raise RenderError(f'a render worker died: {exc}') from None
+                finally:
+                    for future in pending:
+                        future.cancel()
+    if _assets.codes:
+        _assets.codes.evict()
+    report.seconds = time.perf_counter() - started
+    return report
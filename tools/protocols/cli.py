@@ -0,0 +1,183 @@
+"""Command line entry point: ``python -m tools.protocols <command>``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from ..db import psycopg
+from ..i18n.config import DEFAULT_LOCALE
+from .batch import RenderSetup, render_archive
+from .labels import RenderError
+from .layouts import LAYOUTS
+from .qr import CACHE_BYTES, CACHE_DIR, QrCache, cache_codes
+from .source import Selection, read_documents
+from .verify import DPI, STATUSES, scan_files, verify_scans
+
+PROTOCOL_STATUSES = ('draft', 'submitted', 'approved', 'archived')
+
+
+def _selection(args: argparse.Namespace) -> Selection:
+    return Selection(args.workspace, tuple(args.work or ()), args.release, args.status)
+
+
+def cmd_render(args: argparse.Namespace) -> int:
+    setup = RenderSetup(
+        args.layout,
+        args.lang,
+        args.font,
+        args.font_bold,
+        args.logo,
+        qr_cache=None if args.no_qr else args.qr_cache,
+        qr_cache_bytes=args.qr_cache_mb * 1_048_576,
+    )
+    documents = read_documents(args.dsn, args.layout, _selection(args))
+    to_stdout = str(args.output) == '-'
+    log = sys.stderr if to_stdout else sys.stdout
+    if to_stdout:
+        with os.fdopen(sys.stdout.fileno(), 'wb', closefd=False) as output:
+            report = render_archive(documents, setup, output, args.workers)
+    else:
+        # the archive only appears under its name once it is complete
+        partial = args.output.with_name(args.output.name + '.part')
+        try:
+            with partial.open('wb') as output:
+                report = render_archive(documents, setup, output, args.workers)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        os.replace(partial, args.output)
+
+    for document_id, error in report.failed[: None if args.verbose else args.limit]:
+        print(f'❌ {document_id}: {error}', file=log)
+    if len(report.failed) > args.limit and not args.verbose:
+        print(f'   ... and {len(report.failed) - args.limit} more (-v lists all)', file=log)
+    mark = '❌' if report.failed else '✅'
+    rate = report.documents / report.seconds * 60 if report.seconds else 0
+    print(
+        f'{mark} {report.documents} {args.layout} PDFs ({report.bytes / 1_048_576:.1f} MB) written to {args.output} '
+        f'in {report.seconds:.2f} s ({rate:.0f}/min), {len(report.failed)} failed',
+        file=log,
+    )
+    if report.qr_cached or report.qr_encoded:
+        print(f'   QR codes: {report.qr_cached} from the cache, {report.qr_encoded} encoded', file=log)
+    if not report.documents and not report.failed:
+        print('⚠️  nothing matched the selection', file=log)
+    return 1 if report.failed else 0
+
+
+def cmd_qr(args: argparse.Namespace) -> int:
+    cache = QrCache(args.qr_cache, args.qr_cache_mb * 1_048_576)
+    documents = read_documents(args.dsn, args.layout, _selection(args))
+    stats = cache_codes(documents, args.layout, cache, args.workers, args.export)
+    if not stats.hits and not stats.misses:
+        print('⚠️  nothing matched the selection')
+        return 0
+    print(
+        f'✅ {stats.hits + stats.misses} {args.layout} QR codes in {cache.root}: '
+        f'{stats.hits} already cached, {stats.misses} encoded'
+    )
+    if args.export:
+        print(f'   SVG and PNG renderings copied to {args.export}')
+    return 0
+
+
+def cmd_verify(args: argparse.Namespace) -> int:
+    paths = scan_files(args.scans)
+    if not paths:
+        print(f'⚠️  no PDFs in {args.scans}')
+        return 0
+    report = verify_scans(paths, args.dsn, args.workers, args.dpi)
+    problems = report.problems
+    for finding in problems[: None if args.verbose else args.limit]:
+        where = f'{finding.path} p.{finding.page}' if finding.page else finding.path
+        subject = f' {finding.layout} {finding.document_id}' if finding.document_id else ''
+        detail = f' ({finding.detail})' if finding.detail else ''
+        print(f'❌ {where}: {finding.status}{subject}{detail}')
+    if len(problems) > args.limit and not args.verbose:
+        print(f'   ... and {len(problems) - args.limit} more (-v lists all)')
+    if args.json:
+        args.json.write_text(json.dumps([asdict(finding) for finding in report.findings], indent=2) + '\n')
+    counts = ', '.join(f'{report.count(status)} {status}' for status in STATUSES if report.count(status))
+    mark = '❌' if problems else '✅'
+    print(f'{mark} {report.files} files, {report.pages} pages: {counts or "no QR codes"}')
+    return 1 if problems else 0
+
+
+COMMANDS = {
+    'render': (cmd_render, 'render split sheets or protocols from Postgres into a zip of PDFs'),
+    'qr': (cmd_qr, 'encode the QR codes of the selected documents into the QR cache'),
+    'verify': (cmd_verify, 'check the QR codes of scanned PDFs against the database'),
+}
+
+
+def _add_selection(sub: argparse.ArgumentParser) -> None:
+    sub.add_argument(
+        '--layout', choices=LAYOUTS, default=LAYOUTS[0], help=f'document to render (default: {LAYOUTS[0]})'
+    )
+    sub.add_argument('-w', '--workspace', help='only this workspace id')
+    sub.add_argument('--work', action='append', help='only this work id (repeatable)')
+    sub.add_argument('--release', help='only works or protocols with this release title')
+    sub.add_argument(
+        '--status', choices=PROTOCOL_STATUSES, help='only protocols in this status (split sheets: their works)'
+    )
+
+
+def _add_qr_cache(sub: argparse.ArgumentParser) -> None:
+    sub.add_argument('--qr-cache', type=Path, default=CACHE_DIR, help='QR cache directory (default: .qr-cache)')
+    sub.add_argument(
+        '--qr-cache-mb',
+        type=int,
+        default=CACHE_BYTES // 1_048_576,
+        help=f'evict least recently used QR codes above this size (default: {CACHE_BYTES // 1_048_576})',
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m tools.protocols', description=__doc__)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('-v', '--verbose', action='store_true', help='list every failed document or finding')
+        sub.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1, help='worker processes (default: one per CPU)'
+        )
+        sub.add_argument('--dsn', help='Postgres connection string (default: $DATABASE_URL, then local Supabase)')
+        if name in ('render', 'qr'):
+            _add_selection(sub)
+            _add_qr_cache(sub)
+        if name == 'render':
+            sub.add_argument('-o', '--output', type=Path, required=True, help='zip archive to write (- for stdout)')
+            sub.add_argument('--no-qr', action='store_true', help='leave the QR code off the documents')
+            sub.add_argument('--lang', default=DEFAULT_LOCALE, help=f'locale of the labels (default: {DEFAULT_LOCALE})')
+            sub.add_argument('--font', type=Path, help='TrueType font for the text (needed for non-Latin locales)')
+            sub.add_argument('--font-bold', type=Path, help='TrueType font for headings (default: --font)')
+            sub.add_argument('--logo', type=Path, help='image drawn at the top right of the first page')
+        if name == 'qr':
+            sub.add_argument('--export', type=Path, help='also copy each SVG and PNG here as <layout>-<id>.svg/.png')
+        if name == 'verify':
+            sub.add_argument('scans', type=Path, help='folder of scanned PDFs (searched recursively), or one PDF')
+            sub.add_argument('--dpi', type=int, default=DPI, help=f'rasterising resolution (default: {DPI})')
+            sub.add_argument('--json', type=Path, help='write every finding to this file')
+        if name in ('render', 'verify'):
+            sub.add_argument('--limit', type=int, default=50, help='problems to print without -v (default: 50)')
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    handler, _ = COMMANDS[args.command]
+    errors = (RenderError, psycopg.Error) if psycopg is not None else (RenderError,)
+    try:
+        return handler(args)
+    except errors as exc:
+        print(f'❌ {exc}', file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
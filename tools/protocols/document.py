@@ -0,0 +1,332 @@
+"""Page layout primitives, after the jsPDF helpers of ``PdfGeneratorService``.
+
+jsPDF measures ``y`` from the top of the page and ReportLab from the bottom;
+``Document`` keeps the app's top-down cursor and converts when it draws, so
+the offsets below are the app's (A4 in points, 48 pt margins, Helvetica
+sizes and section colours). Lines wrap with ``simpleSplit``, ReportLab's
+``splitTextToSize``. Unlike the app, every page gets the same footer: page
+number, generation stamp and the protocol reference. The first page carries
+the document's QR code (``qr``) at the top right, drawn as vector runs of
+modules rather than an image, with the logo to its left.
+"""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Sequence
+
+from .qr import QrCode
+
+try:
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.utils import simpleSplit
+    from reportlab.pdfgen.canvas import Canvas
+except ImportError:  # pragma: no cover - optional dependency
+    Canvas = None
+
+# jsPDF's 'a4' in points
+PAGE_WIDTH = 595.28
+PAGE_HEIGHT = 841.89
+MARGIN = 48
+CONTENT_WIDTH = PAGE_WIDTH - MARGIN * 2
+LINE = 12
+TEXT_COLOR = '#1a1a1a'
+# contributor tables: holder, role, split, share, details (the rest of the width)
+COLUMN_WIDTHS = (160, 90, 90, 60, CONTENT_WIDTH - 400)
+SIGNATURES_MAX = 8
+LOGO_BOX = (120, 40)
+# side of the QR code, quiet zone included: 1.2 pt modules for a version 8 code
+QR_BOX = 64
+QR_BORDER = 2
+HEADER_TOP = MARGIN - 16
+
+
+@lru_cache(maxsize=None)
+def _color(value: str) -> HexColor:
+    # ReportLab parses a colour string again on every call; the palette is a dozen colours
+    return HexColor(value)
+
+
+@dataclass(frozen=True)
+class SectionStyle:
+    accent: str
+    header_fill: str
+    header_text: str
+    accent_text: str = '#ffffff'
+
+
+STYLES = {
+    'overview': SectionStyle('#4338ca', '#e0e7ff', '#1e3a8a'),
+    'metadata': SectionStyle('#2563eb', '#dbeafe', '#1d4ed8'),
+    'ai': SectionStyle('#d97706', '#fef3c7', '#92400e'),
+    'ip': SectionStyle('#7c3aed', '#ede9fe', '#5b21b6'),
+    'neighbouring': SectionStyle('#0f766e', '#ccfbf1', '#0f766e'),
+    'signatures': SectionStyle('#374151', '#e5e7eb', '#111827'),
+}
+
+
+@dataclass(frozen=True)
+class Fonts:
+    regular: str = 'Helvetica'
+    bold: str = 'Helvetica-Bold'
+
+
+@dataclass(frozen=True)
+class Footer:
+    page: Callable[[int], str]
+    stamp: str
+    reference: str
+
+
+class Document:
+    """One PDF being drawn; ``y`` is the baseline cursor from the top of the page."""
+
+    def __init__(
+        self, fonts: Fonts, footer: Footer, title: str = '', logo: Any = None, qr: QrCode | None = None
+    ) -> None:
+        if Canvas is None:
+            raise SystemExit('reportlab is not installed (pip install -r tools/requirements.txt)')
+        self.buffer = io.BytesIO()
+        self.canvas = Canvas(self.buffer, pagesize=(PAGE_WIDTH, PAGE_HEIGHT), pageCompression=1)
+        self.canvas.setTitle(title)
+        self.canvas.setCreator('Music Rights Platform')
+        self.fonts = fonts
+        self.footer = footer
+        self.page = 1
+        self.y: float = MARGIN
+        # width and bottom of what is drawn at the top right of the first page
+        self.header_width = 0.0
+        self.header_bottom: float = MARGIN
+        if qr is not None:
+            self._draw_qr(qr)
+        if logo is not None:
+            self._draw_logo(logo)
+        self.body_font()
+
+    # -- drawing state --------------------------------------------------
+
+    def font(self, bold: bool = False, size: float = 10, color: str = TEXT_COLOR) -> None:
+        self._font = self.fonts.bold if bold else self.fonts.regular
+        self._size = size
+        self.canvas.setFont(self._font, size)
+        self.canvas.setFillColor(_color(color))
+
+    def body_font(self) -> None:
+        self.font()
+
+    def split(self, text: str, width: float) -> list[str]:
+        """``text`` wrapped to ``width``; a word longer than a line is broken, as jsPDF does."""
+        lines = []
+        for line in simpleSplit(text, self._font, self._size, width) or ['']:
+            while len(line) > 1 and self.canvas.stringWidth(line, self._font, self._size) > width:
+                cut = len(line) - 1
+                while cut > 1 and self.canvas.stringWidth(line[:cut], self._font, self._size) > width:
+                    cut -= 1
+                lines.append(line[:cut])
+                line = line[cut:]
+            lines.append(line)
+        return lines
+
+    def text(self, x: float, y: float, lines: str | Sequence[str], leading: float = LINE) -> None:
+        if isinstance(lines, str):
+            lines = [lines]
+        for index, line in enumerate(lines):
+            self.canvas.drawString(x, PAGE_HEIGHT - y - index * leading, line)
+
+    def text_right(self, x: float, y: float, text: str) -> None:
+        self.canvas.drawRightString(x, PAGE_HEIGHT - y, text)
+
+    def fill_rect(self, x: float, top: float, width: float, height: float, color: str, radius: float = 0) -> None:
+        self.canvas.setFillColor(_color(color))
+        if radius:
+            self.canvas.roundRect(x, PAGE_HEIGHT - top - height, width, height, radius, stroke=0, fill=1)
+        else:
+            self.canvas.rect(x, PAGE_HEIGHT - top - height, width, height, stroke=0, fill=1)
+
+    def line(self, x1: float, x2: float, y: float, color: str = '#d0d0d0') -> None:
+        self.canvas.setStrokeColor(_color(color))
+        self.canvas.line(x1, PAGE_HEIGHT - y, x2, PAGE_HEIGHT - y)
+
+    # -- pages ------------------------------------------------------------
+
+    def new_page(self) -> None:
+        self._draw_footer()
+        self.canvas.showPage()
+        self.page += 1
+        self.y = MARGIN
+        self.body_font()
+
+    def ensure_space(self, height: float) -> None:
+        if self.y + height > PAGE_HEIGHT - MARGIN:
+            self.new_page()
+
+    def finish(self) -> bytes:
+        self._draw_footer()
+        self.canvas.showPage()
+        self.canvas.save()
+        return self.buffer.getvalue()
+
+    def _draw_footer(self) -> None:
+        bottom = PAGE_HEIGHT - 24
+        self.font(size=8, color='#888888')
+        self.text(MARGIN, bottom, self.footer.page(self.page))
+        self.text(MARGIN, bottom + 10, self.footer.stamp)
+        self.text_right(PAGE_WIDTH - MARGIN, bottom + 10, self.footer.reference)
+
+    def _draw_logo(self, logo: Any) -> None:
+        width, height = logo.getSize()
+        scale = min(LOGO_BOX[0] / width, LOGO_BOX[1] / height)
+        width, height = width * scale, height * scale
+        x = PAGE_WIDTH - MARGIN - self.header_width - width
+        self.canvas.drawImage(logo, x, PAGE_HEIGHT - HEADER_TOP - height, width, height, mask='auto')
+        self.header_width += width + 16
+        self.header_bottom = max(self.header_bottom, HEADER_TOP + height)
+
+    def _draw_qr(self, qr: QrCode) -> None:
+        module = QR_BOX / (qr.size + QR_BORDER * 2)
+        left = PAGE_WIDTH - MARGIN - QR_BOX
+        self.fill_rect(left, HEADER_TOP, QR_BOX, QR_BOX, '#ffffff')
+        # drawn in module units, top-down, so the path is small integers
+        self.canvas.saveState()
+        self.canvas.transform(module, 0, 0, -module, left, PAGE_HEIGHT - HEADER_TOP)
+        path = self.canvas.beginPath()
+        for row, column, length in qr.runs():
+            path.rect(column + QR_BORDER, row + QR_BORDER, length, 1)
+        self.canvas.setFillColor(_color('#000000'))
+        self.canvas.drawPath(path, stroke=0, fill=1)
+        self.canvas.restoreState()
+        self.header_width += QR_BOX + 16
+        self.header_bottom = max(self.header_bottom, HEADER_TOP + QR_BOX)
+
+    # -- blocks -----------------------------------------------------------
+
+    def _title_width(self) -> float:
+        # lines whose baseline is above the bottom of the logo and QR code stop short of them
+        return CONTENT_WIDTH - self.header_width if self.y < self.header_bottom + LINE else CONTENT_WIDTH
+
+    def title(self, title: str, lines: Sequence[str], stamp: str, identifiers: Sequence[str]) -> None:
+        self.font(bold=True, size=22)
+        for line in self.split(title, CONTENT_WIDTH - self.header_width):
+            self.text(MARGIN, self.y, line)
+            self.y += 26
+        self.font(size=12)
+        for line in lines:
+            for part in self.split(line, self._title_width()):
+                self.text(MARGIN, self.y, part)
+                self.y += 14
+        self.font(size=10, color='#555555')
+        self.text(MARGIN, self.y, self.split(stamp, self._title_width())[0])
+        self.y += 14
+        for line in self.split('  •  '.join(identifiers), self._title_width()):
+            self.text(MARGIN, self.y, line)
+            self.y += LINE
+        self.y = max(self.y + 12, self.header_bottom + 16)
+        self.body_font()
+
+    def section(self, title: str, style: SectionStyle) -> None:
+        height = 32
+        self.ensure_space(height + 12)
+        self.fill_rect(MARGIN, self.y, CONTENT_WIDTH, height, style.accent, radius=8)
+        self.font(bold=True, size=14, color=style.accent_text)
+        self.text(MARGIN + 16, self.y + 20, title)
+        self.y += height + 12
+        self.body_font()
+
+    def grid(self, items: Sequence[tuple[str, str]]) -> None:
+        """Label/value pairs in two columns."""
+        width = CONTENT_WIDTH / 2
+        for start in range(0, len(items), 2):
+            row = [(label, self.split(value or '—', width - 12)) for label, value in items[start : start + 2]]
+            height = max(24, *(14 + len(lines) * LINE for _, lines in row))
+            self.ensure_space(height + 4)
+            for column, (label, lines) in enumerate(row):
+                x = MARGIN + column * width
+                self.font(bold=True)
+                self.text(x, self.y, label)
+                self.body_font()
+                self.text(x, self.y + 14, lines)
+            self.y += height + 6
+
+    def paragraph(self, text: str) -> None:
+        if not text:
+            return
+        lines = self.split(text, CONTENT_WIDTH)
+        self.ensure_space(len(lines) * LINE + 4)
+        self.text(MARGIN, self.y, lines)
+        self.y += len(lines) * LINE + 6
+
+    def heading(self, text: str) -> None:
+        self.font(bold=True, size=11)
+        self.ensure_space(18)
+        self.text(MARGIN, self.y, text)
+        self.y += 14
+        self.body_font()
+
+    def table(
+        self,
+        title: str,
+        headers: Sequence[str],
+        rows: Sequence[Sequence[str]],
+        total: tuple[str, str],
+        empty: str,
+        style: SectionStyle,
+    ) -> None:
+        """A contributor table under its section title, with a total row."""
+        self.section(title, style)
+        if not rows:
+            self.paragraph(empty)
+            return
+        self.ensure_space(26)
+        self.fill_rect(MARGIN, self.y - 12, CONTENT_WIDTH, 26, style.header_fill)
+        self.font(bold=True, color=style.header_text)
+        x = MARGIN
+        for header, width in zip(headers, COLUMN_WIDTHS):
+            self.text(x + 8, self.y + 4, header)
+            x += width
+        self.y += 26
+        self.body_font()
+
+        for index, row in enumerate(rows):
+            cells = [self.split(value or '—', width - 16) for value, width in zip(row, COLUMN_WIDTHS)]
+            height = max(len(lines) for lines in cells) * LINE + 6
+            self.ensure_space(height + 6)
+            if index % 2 == 0:
+                self.fill_rect(MARGIN, self.y - 10, CONTENT_WIDTH, height + 10, '#fafafa')
+                self.body_font()
+            x = MARGIN
+            for lines, width in zip(cells, COLUMN_WIDTHS):
+                self.text(x + 8, self.y + 2, lines)
+                x += width
+            self.y += height + 10
+
+        self.ensure_space(30)
+        self.fill_rect(MARGIN, self.y - 12, CONTENT_WIDTH, 26, style.accent)
+        self.font(color=style.accent_text)
+        self.text(MARGIN + 8, self.y + 4, total[0])
+        self.text(MARGIN + sum(COLUMN_WIDTHS[:3]) + 8, self.y + 4, total[1])
+        self.y += 32
+        self.body_font()
+
+    def signatures(
+        self, title: str, note: str, labels: tuple[str, str], people: Sequence[tuple[str, str]], style: SectionStyle
+    ) -> None:
+        """A signature and a date line for each of the first ``SIGNATURES_MAX`` people, on a new page."""
+        if not people:
+            return
+        self.new_page()
+        self.section(title, style)
+        self.paragraph(note)
+        for name, contact in people[:SIGNATURES_MAX]:
+            self.ensure_space(64)
+            self.line(MARGIN, MARGIN + 250, self.y)
+            self.line(MARGIN + 300, MARGIN + 520, self.y)
+            self.font(bold=True)
+            self.text(MARGIN, self.y + 14, labels[0])
+            self.text(MARGIN + 300, self.y + 14, labels[1])
+            self.body_font()
+            self.text(MARGIN, self.y + 30, name)
+            if contact:
+                self.text(MARGIN, self.y + 42, self.split(contact, CONTENT_WIDTH)[0])
+            self.y += 54
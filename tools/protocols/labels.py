@@ -0,0 +1,73 @@
+"""Translated text of the documents, from the published locale files.
+
+Every label lives under ``PROTOCOL.PDF`` in ``i18n-src/<lang>/PROTOCOL.json``
+(protocol statuses reuse ``PROTOCOL.STATUS``). They are read from
+``public/assets/i18n/<lang>.json`` with the default locale merged under it,
+as the legal pages are, so a document never shows a raw key. Placeholders
+use the app's ``{{ name }}`` syntax.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..i18n.catalog import flatten
+from ..i18n.config import DEFAULT_LOCALE, Layout
+from ..i18n.fallback import merge_fallback
+
+NAMESPACE = 'PROTOCOL'
+_PLACEHOLDER = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+
+class RenderError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Labels:
+    lang: str
+    # dotted key below PROTOCOL.PDF (or STATUS.* for PROTOCOL.STATUS) -> text
+    strings: dict[str, str]
+
+    def __call__(self, key: str, **params: object) -> str:
+        text = self.strings.get(key, key)
+        if params:
+            text = _PLACEHOLDER.sub(lambda m: str(params[m[1]]) if m[1] in params else m[0], text)
+        return text
+
+    def option(self, group: str, value: str | None, default: str = '—') -> str:
+        """Label of a database value (``'ai_assisted'`` -> ``CREATION_TYPES.AI_ASSISTED``), else the value."""
+        if not value:
+            return default
+        return self.strings.get(f'{group}.{value.upper()}', value)
+
+    def unencodable(self, encoding: str = 'cp1252') -> list[str]:
+        """Keys whose text the built-in PDF fonts cannot draw."""
+        keys = []
+        for key, text in self.strings.items():
+            try:
+                text.encode(encoding)
+            except UnicodeEncodeError:
+                keys.append(key)
+        return keys
+
+
+def _read(path: Path) -> dict:
+    if not path.is_file():
+        raise RenderError(f'{path} does not exist (python -m tools.i18n apply)')
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def load_labels(lang: str, layout: Layout = Layout()) -> Labels:
+    data = _read(layout.locale_file(lang))
+    if lang != DEFAULT_LOCALE:
+        data, _ = merge_fallback(data, _read(layout.locale_file(DEFAULT_LOCALE)))
+    namespace = data.get(NAMESPACE) or {}
+    strings = flatten(namespace.get('PDF') or {})
+    strings.update(flatten(namespace.get('STATUS') or {}, 'STATUS'))
+    if not strings:
+        raise RenderError(f'{layout.locale_file(lang).name} has no {NAMESPACE}.PDF labels')
+    return Labels(lang, strings)
@@ -0,0 +1,520 @@
+"""The two documents, as ``PdfGeneratorService`` lays them out.
+
+``split-sheet`` is ``generateProtocolPDF`` (and so ``generateSplitSheetPDF``):
+a work, its active splits with their rights holders, and its creation
+declarations. Lyrics and music splits are the intellectual property rows
+and neighbouring-layer splits the neighbouring rows, as the split editor
+passes them. ``protocol`` draws a submitted protocol in the same style: the
+``protocols`` row and its ``protocol_lyric_authors``,
+``protocol_music_authors`` and ``protocol_neighbouring_rightsholders``.
+
+Both take the JSON document ``source`` reads for one work or protocol, and
+the QR code that identifies it, and return the PDF bytes. Dates are printed in ISO form, as the documents of
+one batch are rendered for every reader at once, not in their browser.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable
+
+from ..splits.totals import TOLERANCE
+from .document import STYLES, Document, Footer, Fonts
+from .labels import Labels
+from .qr import QrCache, QrCode
+
+LAYOUTS = ('split-sheet', 'protocol')
+
+
+@dataclass(frozen=True)
+class Assets:
+    """What every document of a batch shares; loaded once per worker."""
+
+    labels: Labels
+    fonts: Fonts
+    stamp: str
+    logo: Any = None
+    codes: QrCache | None = None
+
+
+def filename(title: str | None) -> str:
+    """``protocol-<slug>.pdf``, as ``createProtocolFilename`` names the download."""
+    slug = re.sub(r'[^a-z0-9]+', '-', (title or '').strip().lower() or 'untitled-work').strip('-')[:80]
+    return f'protocol-{slug or "work"}.pdf'
+
+
+def _date(value: str | None) -> str:
+    if not value:
+        return '—'
+    try:
+        return date.fromisoformat(value[:10]).isoformat()
+    except ValueError:
+        return value
+
+
+def _list(items: list[str] | None) -> str:
+    return ', '.join(items) if items else '—'
+
+
+def _unique(names: Any) -> list[str]:
+    seen: dict[str, str] = {}
+    for name in names:
+        name = (name or '').strip() if isinstance(name, str) else ''
+        if name:
+            seen.setdefault(name.lower(), name)
+    return list(seen.values())
+
+
+def _percent(value: float) -> str:
+    return f'{value:.2f}%'
+
+
+def _share(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _clamp(value: float) -> float:
+    return max(0.0, min(value, 100.0))
+
+
+def _state(total: float) -> str:
+    if total > 100 + TOLERANCE:
+        return 'over'
+    return 'complete' if total >= 100 - TOLERANCE else 'under'
+
+
+def _status(t: Labels, totals: list[tuple[float, int]]) -> tuple[str, bool]:
+    """Split status label over (total, rows) groups, and whether the split is temporary."""
+    states = [_state(total) for total, _ in totals]
+    if 'over' in states:
+        return t('SPLIT_STATUS.OVERALLOCATED'), False
+    if not any(count for _, count in totals):
+        return t('SPLIT_STATUS.NONE'), False
+    if 'under' in states:
+        return t('SPLIT_STATUS.INCOMPLETE'), True
+    return t('SPLIT_STATUS.COMPLETE'), False
+
+
+def _document(assets: Assets, title: str, reference: str, qr: QrCode | None) -> Document:
+    t = assets.labels
+    footer = Footer(lambda page: t('PAGE', page=page), t('FOOTER', date=assets.stamp), t('REFERENCE', id=reference))
+    return Document(assets.fonts, footer, title, assets.logo, qr)
+
+
+# -- split sheet ------------------------------------------------------------
+
+
+def _holder_name(t: Labels, holder: dict | None) -> str:
+    """``getRightsHolderName``: @nickname, display name, person name, then company."""
+    if not holder:
+        return t('VALUES.UNKNOWN')
+    nickname = (holder.get('nickname') or '').strip()
+    if nickname:
+        return nickname if nickname.startswith('@') else f'@{nickname}'
+    if holder.get('display_name'):
+        return holder['display_name']
+    if holder.get('type') == 'person':
+        person = f'{holder.get("first_name") or ""} {holder.get("last_name") or ""}'.strip()
+        if person:
+            return person
+    return holder.get('organization_name') or holder.get('company_name') or t('VALUES.UNKNOWN_HOLDER')
+
+
+def _contact(t: Labels, holder: dict | None) -> str:
+    if not holder:
+        return ''
+    parts = [
+        f'{t(label)}: {holder[key]}'
+        for key, label in (('email', 'FIELDS.EMAIL'), ('cmo_pro', 'FIELDS.PRO'), ('ipi_number', 'FIELDS.IPI'))
+        if holder.get(key)
+    ]
+    return ' • '.join(parts)
+
+
+def _holder_ai(t: Labels, disclosure: dict | None) -> str:
+    if not disclosure:
+        return ''
+    parts = [f'{t("FIELDS.AI")}: {t.option("CREATION_TYPES", disclosure.get("creation_type"), "")}']
+    if disclosure.get('ai_tool'):
+        parts.append(f'{t("FIELDS.TOOL")}: {disclosure["ai_tool"]}')
+    if disclosure.get('notes'):
+        parts.append(disclosure['notes'])
+    return ' – '.join(parts)
+
+
+def _contributions(t: Labels, split: dict) -> str:
+    flags = split.get('contribution_types') or {}
+    if split.get('split_type') != 'music' or not isinstance(flags, dict):
+        return ''
+    names = [t(f'VALUES.{name.upper()}') for name in ('melody', 'harmony', 'arrangement') if flags.get(name)]
+    return f'{t("FIELDS.CONTRIBUTIONS")}: {", ".join(names)}' if names else ''
+
+
+def _split_row(t: Labels, split: dict, ip: bool) -> list[str]:
+    holder = split.get('rights_holder')
+    kind = (holder or {}).get('kind')
+    if ip:
+        role = t.option('KINDS', kind, '') or t('KINDS.AUTHOR' if split['split_type'] == 'lyrics' else 'KINDS.COMPOSER')
+        label = t('VALUES.LYRICS' if split['split_type'] == 'lyrics' else 'VALUES.MUSIC')
+        first = _contributions(t, split)
+    else:
+        role = t.option('KINDS', kind, '') or t('ROLES.PERFORMER')
+        label = t('VALUES.NEIGHBOURING')
+        roles = split.get('roles') or []
+        first = f'{t("FIELDS.ROLES")}: {", ".join(roles)}' if roles else ''
+    notes = f'{t("FIELDS.NOTES")}: {split["notes"]}' if split.get('notes') else ''
+    details = [first, _contact(t, holder), _holder_ai(t, (holder or {}).get('ai_disclosure')), notes]
+    share = _percent(_share(split.get('ownership_percentage')))
+    return [_holder_name(t, holder), role, label, share, ' • '.join(part for part in details if part) or '—']
+
+
+def _languages(work: dict) -> tuple[list[str], list[str], list[str]]:
+    def names(selections: Any) -> list[str]:
+        return _unique(item.get('language') for item in selections or () if isinstance(item, dict))
+
+    primary = names(work.get('primary_languages'))
+    secondary = names(work.get('secondary_languages'))
+    return primary, secondary, _unique([*primary, *secondary, *(work.get('languages') or ())])
+
+
+def _duration(seconds: Any) -> str:
+    if not seconds or seconds <= 0:
+        return '—'
+    return f'{int(seconds // 60)}m {int(seconds % 60):02d}s'
+
+
+def _yes_no(t: Labels, value: Any) -> str:
+    return '—' if value is None else t('VALUES.YES' if value else 'VALUES.NO')
+
+
+def render_split_sheet(record: dict, assets: Assets, qr: QrCode | None = None) -> tuple[str, bytes]:
+    t = assets.labels
+    work = record['work']
+    splits = record.get('splits') or []
+    ip_splits = [split for split in splits if split.get('split_type') in ('lyrics', 'music')]
+    neighbouring = [split for split in splits if split.get('rights_layer') == 'neighboring']
+    alternatives = [title for title in work.get('alternative_titles') or () if title]
+    remix = work.get('work_type') == 'remix'
+
+    title = (work.get('release_title') or '').strip() or (work.get('work_title') or '').strip()
+    title = title or (alternatives[0] if alternatives else t('UNTITLED'))
+    if len(alternatives) > 1:
+        title += f' ({", ".join(alternatives[1:])})'
+    doc = _document(assets, title, work['id'], qr)
+    lines = []
+    if work.get('release_title') and title != work['release_title']:
+        lines.append(f'{t("FIELDS.RELEASE_TITLE")}: {work["release_title"]}')
+    if work.get('work_title') and title != work['work_title']:
+        lines.append(f'{t("FIELDS.WORK_TITLE")}: {work["work_title"]}')
+    if alternatives:
+        lines.append(f'{t("FIELDS.ALTERNATIVE_TITLES")}: {", ".join(alternatives)}')
+    doc.title(
+        t('SPLIT_SHEET_TITLE', title=title),
+        lines,
+        t('GENERATED', date=assets.stamp),
+        [f'{t("WORK_ID")}: {work["id"]}', f'{t("WORKSPACE")}: {work.get("workspace_id")}'],
+    )
+
+    primary, secondary, combined = _languages(work)
+    doc.section(t('SECTIONS.WORK_OVERVIEW'), STYLES['overview'])
+    doc.grid([
+        (t('FIELDS.STATUS'), t.option('WORK_STATUS', work.get('status'))),
+        (t('FIELDS.GENRE'), work.get('genre') or '—'),
+        (t('FIELDS.WORK_TYPE'), t.option('WORK_TYPES', work.get('work_type') or 'standard')),
+        (t('FIELDS.PRIMARY_LANGUAGES'), _list(primary)),
+        (t('FIELDS.DURATION'), _duration(work.get('duration_seconds'))),
+        (t('FIELDS.SECONDARY_LANGUAGES'), _list(secondary)),
+        (t('FIELDS.ALTERNATIVE_TITLES'), _list(alternatives)),
+        (t('FIELDS.ALL_LANGUAGES'), _list(combined)),
+        (t('FIELDS.CATALOGUE_NUMBER'), work.get('catalog_number') or '—'),
+        (t('FIELDS.EAN'), work.get('ean') or '—'),
+        (t('FIELDS.CREATED_AT'), _date(work.get('created_at'))),
+        (t('FIELDS.UPDATED_AT'), _date(work.get('updated_at'))),
+    ])
+    if work.get('notes'):
+        doc.paragraph(f'{t("FIELDS.NOTES")}: {work["notes"]}')
+
+    doc.section(t('SECTIONS.IDENTIFICATION_CODES'), STYLES['metadata'])
+    doc.grid([(t('FIELDS.ISRC'), work.get('isrc') or '—'), (t('FIELDS.ISWC'), work.get('iswc') or '—')])
+
+    doc.section(t('SECTIONS.RELEASE_DETAILS'), STYLES['metadata'])
+    doc.grid([
+        (t('FIELDS.RECORDING_DATE'), _date(work.get('recording_date'))),
+        (t('FIELDS.RELEASE_DATE'), _date(work.get('release_date'))),
+        (t('FIELDS.COVER_VERSION'), _yes_no(t, bool(work.get('is_cover_version')))),
+    ])
+    if work.get('is_cover_version'):
+        doc.grid([
+            (t('FIELDS.ORIGINAL_WORK_TITLE'), work.get('original_work_title') or '—'),
+            (t('FIELDS.ORIGINAL_WORK_ISRC'), work.get('original_work_isrc') or '—'),
+            (t('FIELDS.ORIGINAL_WORK_ISWC'), work.get('original_work_iswc') or '—'),
+        ])
+        if work.get('original_work_info'):
+            doc.paragraph(f'{t("FIELDS.ORIGINAL_WORK_INFO")}: {work["original_work_info"]}')
+
+    production = []
+    if isinstance(work.get('is_100_percent_human'), bool):
+        production.append((
+            t('FIELDS.CREATION_PROCESS'),
+            t('VALUES.HUMAN_CREATED' if work['is_100_percent_human'] else 'VALUES.ASSISTED'),
+        ))
+    if isinstance(work.get('uses_sample_libraries'), bool):
+        production.append((t('FIELDS.SAMPLE_LIBRARIES_USED'), _yes_no(t, work['uses_sample_libraries'])))
+    if isinstance(work.get('has_commercial_license'), bool):
+        production.append((t('FIELDS.COMMERCIAL_LICENSE'), _yes_no(t, work['has_commercial_license'])))
+    if production or work.get('sample_library_names'):
+        doc.section(t('SECTIONS.PRODUCTION_METADATA'), STYLES['metadata'])
+        if production:
+            doc.grid(production)
+        else:
+            doc.paragraph(t('MESSAGES.NO_PRODUCTION_METADATA'))
+        if work.get('sample_library_names'):
+            doc.paragraph(f'{t("FIELDS.SAMPLE_LIBRARIES")}: {work["sample_library_names"]}')
+
+    sources = [item for item in work.get('original_works') or () if isinstance(item, dict)]
+    if sources or remix:
+        doc.section(t('SECTIONS.SOURCE_WORKS_REMIX' if remix else 'SECTIONS.REFERENCED_WORKS'), STYLES['metadata'])
+        if not sources:
+            doc.paragraph(t('MESSAGES.NO_SOURCE_WORKS'))
+        for number, source in enumerate(sources, 1):
+            heading = f'{number}. {source["title"]}' if source.get('title') else t('FIELDS.SOURCE_WORK', number=number)
+            doc.heading(heading)
+            codes = [(t(f'FIELDS.{key.upper()}'), source[key]) for key in ('isrc', 'iswc') if source.get(key)]
+            if codes:
+                doc.grid(codes)
+            if source.get('additional_info'):
+                doc.paragraph(f'{t("FIELDS.NOTES")}: {source["additional_info"]}')
+            doc.y += 4
+
+    doc.section(t('SECTIONS.AI_DISCLOSURES'), STYLES['ai'])
+    declarations = record.get('declarations') or []
+    if not declarations:
+        doc.paragraph(t('MESSAGES.NO_AI_DISCLOSURES'))
+    for item in declarations:
+        section = t.option('AI_SECTIONS', item.get('section'))
+        parts = [f'• {section}: {t.option("CREATION_TYPES", item.get("creation_type"))}']
+        if item.get('ai_tool'):
+            parts.append(f'{t("FIELDS.TOOL")}: {item["ai_tool"]}')
+        if item.get('notes'):
+            parts.append(item['notes'])
+        doc.paragraph(' – '.join(parts))
+
+    # buildIPSummary
+    lyrics = [_share(split.get('ownership_percentage')) for split in ip_splits if split['split_type'] == 'lyrics']
+    music = [_share(split.get('ownership_percentage')) for split in ip_splits if split['split_type'] == 'music']
+    lyrics_share, music_share = _clamp(sum(lyrics)), _clamp(sum(music))
+    with_lyrics = work.get('work_type') != 'instrumental'
+    if with_lyrics:
+        combined_share = min(lyrics_share + music_share, 100.0)
+        status, temporary = _status(t, [(sum(lyrics), len(lyrics)), (sum(music), len(music))])
+    else:
+        combined_share = music_share
+        temporary = 0 < music_share < 100
+        status = t(
+            'SPLIT_STATUS.COMPLETE_INSTRUMENTAL' if music_share >= 100
+            else 'SPLIT_STATUS.INSTRUMENTAL_PENDING' if music_share > 0
+            else 'SPLIT_STATUS.INSTRUMENTAL_MISSING'
+        )
+    doc.section(t('SECTIONS.IP_SUMMARY'), STYLES['ip'])
+    doc.grid([
+        (t('FIELDS.LYRIC_CONTRIBUTORS'), str(len(lyrics)) if with_lyrics else t('VALUES.NOT_APPLICABLE_INSTRUMENTAL')),
+        (t('FIELDS.MUSIC_CONTRIBUTORS'), str(len(music))),
+        (t('FIELDS.LYRICS_SHARE'), _percent(lyrics_share) if with_lyrics else t('VALUES.NOT_APPLICABLE')),
+        (t('FIELDS.MUSIC_SHARE'), _percent(music_share)),
+        (
+            t('FIELDS.COMBINED_IP_TOTAL'),
+            _percent(combined_share) if with_lyrics else t('VALUES.MUSIC_ONLY', share=_percent(combined_share)),
+        ),
+        (t('FIELDS.SPLIT_STATUS'), status),
+    ])
+    doc.table(
+        t('SECTIONS.IP_CONTRIBUTORS'),
+        _headers(t, 'RIGHTS_HOLDER', 'ROLE', 'SPLIT'),
+        [_split_row(t, split, True) for split in ip_splits],
+        (t('FIELDS.TOTAL_SHARE'), _percent(combined_share)),
+        t('MESSAGES.NO_IP_CONTRIBUTORS'),
+        STYLES['ip'],
+    )
+    if not with_lyrics:
+        doc.paragraph(t('MESSAGES.INSTRUMENTAL'))
+    if temporary:
+        doc.paragraph(t('MESSAGES.IP_TEMPORARY'))
+
+    # buildNeighbouringSummary
+    shares = [_share(split.get('ownership_percentage')) for split in neighbouring]
+    status, temporary = _status(t, [(sum(shares), len(shares))])
+    doc.section(t('SECTIONS.NEIGHBOURING_SUMMARY'), STYLES['neighbouring'])
+    doc.grid([
+        (t('FIELDS.CONTRIBUTORS'), str(len(shares))),
+        (t('FIELDS.TOTAL_SHARE'), _percent(sum(shares))),
+        (t('FIELDS.SPLIT_STATUS'), status),
+    ])
+    doc.table(
+        t('SECTIONS.NEIGHBOURING_CONTRIBUTORS'),
+        _headers(t, 'RIGHTS_HOLDER', 'ROLE', 'SPLIT'),
+        [_split_row(t, split, False) for split in neighbouring],
+        (t('FIELDS.TOTAL_SHARE'), _percent(sum(shares))),
+        t('MESSAGES.NO_NEIGHBOURING_CONTRIBUTORS'),
+        STYLES['neighbouring'],
+    )
+    if temporary:
+        doc.paragraph(t('MESSAGES.NEIGHBOURING_TEMPORARY'))
+
+    holders: dict[str, dict] = {}
+    for split in ip_splits + neighbouring:
+        holder = split.get('rights_holder')
+        if holder and holder.get('id'):
+            holders.setdefault(holder['id'], holder)
+    _signatures(doc, t, [(_holder_name(t, holder), _contact(t, holder)) for holder in holders.values()])
+    return filename(work.get('work_title')), doc.finish()
+
+
+def _headers(t: Labels, *first: str) -> list[str]:
+    return [t(f'COLUMNS.{name}') for name in (*first, 'SHARE', 'DETAILS')]
+
+
+def _signatures(doc: Document, t: Labels, people: list[tuple[str, str]]) -> None:
+    doc.signatures(
+        t('SECTIONS.SIGNATURES'),
+        t('MESSAGES.SIGNATURES'),
+        (t('FIELDS.SIGNATURE'), t('FIELDS.DATE')),
+        people,
+        STYLES['signatures'],
+    )
+
+
+# -- protocol ---------------------------------------------------------------
+
+
+def _author_name(author: dict) -> str:
+    return ' '.join(part.strip() for part in (author.get(key) for key in ('name', 'middle_name', 'surname')) if part)
+
+
+def _societies(author: dict) -> str:
+    return ' / '.join(author[key] for key in ('cmo_name', 'pro_name') if author.get(key))
+
+
+def _author_contact(t: Labels, author: dict) -> str:
+    parts = [
+        f'{t(label)}: {author[key]}'
+        for key, label in (('cmo_name', 'FIELDS.CMO'), ('pro_name', 'FIELDS.PRO'))
+        if author.get(key)
+    ]
+    return ' • '.join(parts)
+
+
+def _author_row(author: dict, details: str) -> list[str]:
+    return [
+        _author_name(author) or '—',
+        author.get('aka') or '—',
+        _societies(author) or '—',
+        _percent(_share(author.get('participation_percentage'))),
+        details or '—',
+    ]
+
+
+def _music_details(t: Labels, author: dict) -> str:
+    names = [t(f'VALUES.{name.upper()}') for name in ('melody', 'harmony', 'arrangement') if author.get(name) == 1]
+    return f'{t("FIELDS.CONTRIBUTIONS")}: {", ".join(names)}' if names else ''
+
+
+def _neighbouring_details(t: Labels, author: dict) -> str:
+    roles = [t.option('ROLES', role) for role in author.get('roles') or ()]
+    return f'{t("FIELDS.ROLES")}: {", ".join(roles)}' if roles else ''
+
+
+def render_protocol(record: dict, assets: Assets, qr: QrCode | None = None) -> tuple[str, bytes]:
+    t = assets.labels
+    protocol = record['protocol']
+    groups: list[tuple[str, str, list[dict], Callable[[dict], str], str]] = [
+        ('LYRIC_AUTHORS', 'ip', record.get('lyric_authors') or [], lambda author: '', 'FIELDS.LYRICS_SHARE'),
+        (
+            'MUSIC_AUTHORS', 'ip', record.get('music_authors') or [],
+            lambda author: _music_details(t, author), 'FIELDS.MUSIC_SHARE',
+        ),
+        (
+            'NEIGHBOURING_RIGHTSHOLDERS', 'neighbouring', record.get('neighbouring_rightsholders') or [],
+            lambda author: _neighbouring_details(t, author), 'FIELDS.NEIGHBOURING_SHARE',
+        ),
+    ]
+    title = (protocol.get('work_title') or '').strip() or t('UNTITLED')
+    doc = _document(assets, title, protocol['id'], qr)
+    lines = []
+    if protocol.get('release_title') and protocol['release_title'] != title:
+        lines.append(f'{t("FIELDS.RELEASE_TITLE")}: {protocol["release_title"]}')
+    if protocol.get('alternative_title'):
+        lines.append(f'{t("FIELDS.ALTERNATIVE_TITLE")}: {protocol["alternative_title"]}')
+    doc.title(
+        t('PROTOCOL_TITLE', title=title),
+        lines,
+        t('GENERATED', date=assets.stamp),
+        [
+            f'{t("PROTOCOL_ID")}: {protocol["id"]}',
+            f'{t("WORK_ID")}: {protocol.get("work_id")}',
+            f'{t("WORKSPACE")}: {protocol.get("workspace_id")}',
+        ],
+    )
+
+    doc.section(t('SECTIONS.WORK_DETAILS'), STYLES['overview'])
+    details = [
+        (t('FIELDS.STATUS'), t.option('STATUS', protocol.get('status'))),
+        (t('FIELDS.WORK_TITLE'), protocol.get('work_title') or '—'),
+        (t('FIELDS.RELEASE_TITLE'), protocol.get('release_title') or '—'),
+        (t('FIELDS.ALTERNATIVE_TITLE'), protocol.get('alternative_title') or '—'),
+        (t('FIELDS.PRIMARY_LANGUAGE'), protocol.get('primary_language') or '—'),
+        (t('FIELDS.SECONDARY_LANGUAGE'), protocol.get('secondary_language') or '—'),
+        (t('FIELDS.COVER_VERSION'), _yes_no(t, bool(protocol.get('is_cover_version')))),
+    ]
+    if protocol.get('is_cover_version'):
+        details.append((t('FIELDS.ORIGINAL_WORK_TITLE'), protocol.get('original_work_title') or '—'))
+    details += [
+        (t('FIELDS.CREATED_AT'), _date(protocol.get('created_at'))),
+        (t('FIELDS.SUBMITTED_AT'), _date(protocol.get('submitted_at'))),
+    ]
+    doc.grid(details)
+
+    doc.section(t('SECTIONS.IDENTIFICATION_CODES'), STYLES['metadata'])
+    doc.grid([
+        (t('FIELDS.ISRC'), protocol.get('isrc') or '—'),
+        (t('FIELDS.ISWC'), protocol.get('iswc') or '—'),
+        (t('FIELDS.EAN'), protocol.get('ean') or '—'),
+        (t('FIELDS.CATALOGUE_NUMBER'), protocol.get('catalog_number') or '—'),
+    ])
+
+    totals = [(sum(_share(author.get('participation_percentage')) for author in authors), len(authors))
+              for _, _, authors, _, _ in groups]
+    status, _ = _status(t, totals)
+    doc.section(t('SECTIONS.PARTICIPATION_SUMMARY'), STYLES['ip'])
+    summary = []
+    for (section, _, authors, _, share_label), (total, _) in zip(groups, totals):
+        summary += [(t(f'SECTIONS.{section}'), str(len(authors))), (t(share_label), _percent(total))]
+    doc.grid(summary + [(t('FIELDS.SPLIT_STATUS'), status)])
+
+    for (section, style, authors, detail, _), (total, count) in zip(groups, totals):
+        doc.table(
+            t(f'SECTIONS.{section}'),
+            _headers(t, 'NAME', 'AKA', 'CMO_PRO'),
+            [_author_row(author, detail(author)) for author in authors],
+            (t('FIELDS.TOTAL_SHARE'), _percent(total)),
+            t(f'MESSAGES.NO_{section}'),
+            STYLES[style],
+        )
+        if count and _state(total) == 'under':
+            doc.paragraph(t('MESSAGES.NEIGHBOURING_TEMPORARY' if style == 'neighbouring' else 'MESSAGES.IP_TEMPORARY'))
+
+    people: dict[str, tuple[str, str]] = {}
+    for _, _, authors, _, _ in groups:
+        for author in authors:
+            name = _author_name(author)
+            if name:
+                people.setdefault(name.lower(), (name, _author_contact(t, author)))
+    _signatures(doc, t, list(people.values()))
+    return filename(protocol.get('work_title')), doc.finish()
+
+
+RENDERERS = {'split-sheet': render_split_sheet, 'protocol': render_protocol}
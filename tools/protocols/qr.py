@@ -0,0 +1,248 @@
+"""QR codes that tie a printed document to the row it was rendered from.
+
+The payload is JSON in the shape of the app's ``QRConnectionData``::
+
+    {"platform":"music-rights-platform","type":"protocol","id":"<uuid>","digest":"<12 hex>"}
+
+``digest`` hashes the JSON document ``source`` read for the protocol or work,
+so a scan can be checked against the current row: the same digest means the
+paper still says what the database says.
+
+Encoding a QR code (Reed-Solomon blocks, eight masks scored) costs more than
+drawing it, and a batch re-rendered with unchanged data encodes the same
+payloads again. ``QrCache`` keeps every code on disk under the SHA-256 of
+its payload (``<root>/<ab>/<hash>.json``, the module matrix, with ``.svg``
+and ``.png`` renderings beside it), so each payload is encoded once across
+runs and processes. A hit refreshes the entry's mtime and ``evict`` removes
+the least recently used entries once the cache is over its size.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import uuid
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from ..i18n.catalog import write_atomic
+from ..i18n.config import REPO_ROOT
+
+try:
+    import segno
+except ImportError:  # pragma: no cover - optional dependency
+    segno = None
+
+# QRConnectionData.platform
+PLATFORM = 'music-rights-platform'
+PAYLOAD_TYPES = {'split-sheet': 'split_sheet', 'protocol': 'protocol'}
+# 48 bits: a chance collision between two versions of one document is not a concern
+DIGEST_CHARS = 12
+ERROR_LEVEL = 'm'
+# quiet zone in modules, as the app's QRCode.toDataURL(margin: 2)
+BORDER = 2
+# pixels per module of the .png and .svg renderings
+SCALE = 8
+CACHE_DIR = REPO_ROOT / '.qr-cache'
+CACHE_BYTES = 256 * 1_048_576
+CACHE_VERSION = 1
+RENDERINGS = ('svg', 'png')
+# payloads per task of cache_codes
+CHUNK_CODES = 64
+
+
+def document_digest(text: str) -> str:
+    """Digest of the JSON text of one document, as ``source`` reads it."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:DIGEST_CHARS]
+
+
+def make_payload(layout: str, document_id: str, text: str) -> str:
+    data = {'platform': PLATFORM, 'type': PAYLOAD_TYPES[layout], 'id': document_id, 'digest': document_digest(text)}
+    return json.dumps(data, separators=(',', ':'))
+
+
+def parse_payload(text: str) -> tuple[str, str, str] | None:
+    """(layout, id, digest) of a payload this module wrote; None for any other code."""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return None
+    layouts = {value: key for key, value in PAYLOAD_TYPES.items()}
+    if not isinstance(data, dict) or data.get('platform') != PLATFORM or data.get('type') not in layouts:
+        return None
+    if not isinstance(data.get('digest'), str):
+        return None
+    try:
+        document_id = str(uuid.UUID(data.get('id')))
+    except (TypeError, ValueError):
+        return None
+    return layouts[data['type']], document_id, data['digest']
+
+
+@dataclass(frozen=True)
+class QrCode:
+    """The module matrix of one payload; ``rows`` are strings of 0 and 1, dark = 1, without the quiet zone."""
+
+    payload: str
+    version: int
+    rows: tuple[str, ...]
+
+    @property
+    def size(self) -> int:
+        return len(self.rows)
+
+    def runs(self) -> Iterator[tuple[int, int, int]]:
+        """(row, first column, length) of each horizontal run of dark modules."""
+        for y, row in enumerate(self.rows):
+            x = row.find('1')
+            while x >= 0:
+                end = row.find('0', x)
+                end = len(row) if end < 0 else end
+                yield y, x, end - x
+                x = row.find('1', end)
+
+    def to_json(self) -> bytes:
+        data = {'version': CACHE_VERSION, 'payload': self.payload, 'qr_version': self.version, 'rows': self.rows}
+        return json.dumps(data).encode('utf-8')
+
+
+def _key(payload: str) -> str:
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def encode(payload: str) -> tuple[QrCode, Any]:
+    """The matrix of ``payload`` and the ``segno`` code it was read from."""
+    if segno is None:
+        raise SystemExit('segno is not installed (pip install -r tools/requirements.txt)')
+    code = segno.make_qr(payload, error=ERROR_LEVEL)
+    rows = tuple(''.join('1' if module else '0' for module in row) for row in code.matrix)
+    return QrCode(payload, code.version, rows), code
+
+
+def _rendering(code: Any, kind: str) -> bytes:
+    buffer = io.BytesIO()
+    code.save(buffer, kind=kind, scale=SCALE, border=BORDER)
+    return buffer.getvalue()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class QrCache:
+    """Content-addressed QR codes on disk; safe to share between processes."""
+
+    def __init__(self, root: Path = CACHE_DIR, max_bytes: int = CACHE_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+    def path(self, key: str, suffix: str = 'json') -> Path:
+        return self.root / key[:2] / f'{key}.{suffix}'
+
+    def get(self, payload: str) -> QrCode:
+        """The matrix of ``payload``, encoded (and its renderings written) on a miss."""
+        key = _key(payload)
+        path = self.path(key)
+        try:
+            data = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            data = None
+        if data and data.get('version') == CACHE_VERSION and data.get('payload') == payload:
+            try:
+                os.utime(path)
+            except OSError:  # evicted by another process since the read
+                pass
+            self.stats.hits += 1
+            return QrCode(payload, data['qr_version'], tuple(data['rows']))
+
+        self.stats.misses += 1
+        matrix, code = encode(payload)
+        # renderings first: an entry whose .json exists is complete
+        for kind in RENDERINGS:
+            write_atomic(self.path(key, kind), _rendering(code, kind))
+        write_atomic(path, matrix.to_json())
+        return matrix
+
+    def rendering(self, payload: str, kind: str) -> bytes:
+        """The ``svg`` or ``png`` rendering of ``payload``."""
+        self.get(payload)
+        return self.path(_key(payload), kind).read_bytes()
+
+    def evict(self) -> tuple[int, int]:
+        """Remove least recently used entries until the cache fits; (entries, bytes) removed."""
+        entries: list[tuple[int, int, list[Path]]] = []
+        total = 0
+        for path in self.root.glob('*/*.json'):
+            paths = [path, *(self.path(path.stem, kind) for kind in RENDERINGS)]
+            try:
+                used = path.stat().st_mtime_ns
+                size = sum(other.stat().st_size for other in paths)
+            except FileNotFoundError:  # half-written or evicted by another process
+                continue
+            entries.append((used, size, paths))
+            total += size
+        removed = freed = 0
+        for _, size, paths in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for path in paths:
+                path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+            freed += size
+        return removed, freed
+
+
+def _cache_chunk(
+    root: Path, max_bytes: int, export: Path | None, chunk: list[tuple[str, str, str]]
+) -> tuple[int, int]:
+    cache = QrCache(root, max_bytes)
+    for layout, document_id, payload in chunk:
+        cache.get(payload)
+        if export:
+            key = _key(payload)
+            for kind in RENDERINGS:
+                shutil.copyfile(cache.path(key, kind), export / f'{layout}-{document_id}.{kind}')
+    return cache.stats.hits, cache.stats.misses
+
+
+def cache_codes(
+    documents: Iterable[tuple[str, str]],
+    layout: str,
+    cache: QrCache,
+    workers: int = os.cpu_count() or 1,
+    export: Path | None = None,
+) -> CacheStats:
+    """Encode the QR code of every document ((id, JSON text) pairs) into ``cache``.
+
+    With ``export``, the renderings are also copied there as ``<layout>-<id>.svg`` and ``.png``.
+    """
+    if segno is None:
+        raise SystemExit('segno is not installed (pip install -r tools/requirements.txt)')
+    if export:
+        export.mkdir(parents=True, exist_ok=True)
+    chunks: list[list[tuple[str, str, str]]] = [[]]
+    for document_id, text in documents:
+        if len(chunks[-1]) == CHUNK_CODES:
+            chunks.append([])
+        chunks[-1].append((layout, document_id, make_payload(layout, document_id, text)))
+    stats = CacheStats()
+    tasks = [(cache.root, cache.max_bytes, export, chunk) for chunk in chunks if chunk]
+    if workers <= 1 or len(tasks) <= 1:
+        results = [_cache_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_cache_chunk, *zip(*tasks)))
+    for hits, misses in results:
+        stats.hits += hits
+        stats.misses += misses
+    cache.evict()
+    return stats
@@ -0,0 +1,122 @@
+"""Read the documents to render from Postgres, one JSON document per row.
+
+Each row is a whole work (``split-sheet``) or protocol (``protocol``) with
+its child rows, built by Postgres with ``jsonb_build_object`` and streamed
+as text through a server-side cursor. The text is parsed by the worker that
+renders it, so the reading process only moves bytes. Child rows are
+aggregated in one grouped pass per table rather than a subquery per
+document, which needs no index on the foreign keys.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from ..db import connect, stream
+
+# rows per round trip; a row is one document of a few kilobytes
+FETCH_DOCUMENTS = 500
+
+_SPLIT_SHEETS = """
+WITH selected AS (
+  SELECT w.* FROM public.works w WHERE true {where}
+),
+splits AS (
+  SELECT s.work_id,
+         jsonb_agg(to_jsonb(s) || jsonb_build_object('rights_holder', to_jsonb(h)) ORDER BY s.created_at, s.id) AS rows
+    FROM public.work_splits s
+    JOIN selected ON selected.id = s.work_id
+    LEFT JOIN public.rights_holders h ON h.id = s.rights_holder_id
+   WHERE s.is_active IS NOT FALSE
+   GROUP BY s.work_id
+),
+declarations AS (
+  SELECT d.work_id, jsonb_agg(to_jsonb(d) ORDER BY d.created_at, d.id) AS rows
+    FROM public.work_creation_declarations d
+    JOIN selected ON selected.id = d.work_id
+   GROUP BY d.work_id
+)
+SELECT w.id::text,
+       jsonb_build_object(
+         'work', to_jsonb(w),
+         'splits', coalesce(s.rows, '[]'),
+         'declarations', coalesce(d.rows, '[]')
+       )::text
+  FROM selected w
+  LEFT JOIN splits s ON s.work_id = w.id
+  LEFT JOIN declarations d ON d.work_id = w.id
+ ORDER BY w.id
+"""
+
+_PROTOCOL_AUTHORS = """
+{name} AS (
+  SELECT a.protocol_id, jsonb_agg(to_jsonb(a) ORDER BY a.created_at, a.id) AS rows
+    FROM public.protocol_{name} a
+    JOIN selected ON selected.id = a.protocol_id
+   GROUP BY a.protocol_id
+)"""
+_AUTHOR_TABLES = ('lyric_authors', 'music_authors', 'neighbouring_rightsholders')
+_PROTOCOLS = """
+WITH selected AS (
+  SELECT p.* FROM public.protocols p WHERE true {where}
+),""" + ','.join(_PROTOCOL_AUTHORS.format(name=name) for name in _AUTHOR_TABLES) + """
+SELECT p.id::text,
+       jsonb_build_object(
+         'protocol', to_jsonb(p),
+         'lyric_authors', coalesce(lyric_authors.rows, '[]'),
+         'music_authors', coalesce(music_authors.rows, '[]'),
+         'neighbouring_rightsholders', coalesce(neighbouring_rightsholders.rows, '[]')
+       )::text
+  FROM selected p
+  LEFT JOIN lyric_authors ON lyric_authors.protocol_id = p.id
+  LEFT JOIN music_authors ON music_authors.protocol_id = p.id
+  LEFT JOIN neighbouring_rightsholders ON neighbouring_rightsholders.protocol_id = p.id
+ ORDER BY p.id
+"""
+
+
+@dataclass(frozen=True)
+class Selection:
+    """Which documents to render; unset filters select everything."""
+
+    workspace: str | None = None
+    works: tuple[str, ...] = ()
+    release: str | None = None
+    # protocol status; for split sheets, works with a protocol in this status
+    status: str | None = None
+    # the documents themselves: work ids for split sheets, protocol ids for protocols
+    ids: tuple[str, ...] = ()
+
+    def where(self, layout: str) -> tuple[str, dict[str, Any]]:
+        alias, work_column = ('w', 'id') if layout == 'split-sheet' else ('p', 'work_id')
+        clauses: list[str] = []
+        params: dict[str, Any] = {}
+        if self.workspace:
+            clauses.append(f'{alias}.workspace_id = %(workspace)s::uuid')
+            params['workspace'] = self.workspace
+        if self.works:
+            clauses.append(f'{alias}.{work_column} = ANY(%(works)s::uuid[])')
+            params['works'] = list(self.works)
+        if self.ids:
+            clauses.append(f'{alias}.id = ANY(%(ids)s::uuid[])')
+            params['ids'] = list(self.ids)
+        if self.release:
+            clauses.append(f'{alias}.release_title = %(release)s')
+            params['release'] = self.release
+        if self.status and layout == 'split-sheet':
+            clauses.append('EXISTS (SELECT 1 FROM public.protocols p WHERE p.work_id = w.id AND p.status = %(status)s)')
+            params['status'] = self.status
+        elif self.status:
+            clauses.append('p.status = %(status)s')
+            params['status'] = self.status
+        return ''.join(f'\n    AND {clause}' for clause in clauses), params
+
+
+def read_documents(dsn: str | None, layout: str, selection: Selection) -> Iterator[tuple[str, str]]:
+    """(id, JSON text) of every selected document, in id order."""
+    where, params = selection.where(layout)
+    query = (_SPLIT_SHEETS if layout == 'split-sheet' else _PROTOCOLS).format(where=where)
+    with connect(dsn) as connection:
+        for rows in stream(connection, query, params, FETCH_DOCUMENTS):
+            yield from rows
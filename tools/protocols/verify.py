@@ -0,0 +1,155 @@
+"""Check scanned documents against the rows they were printed from.
+
+Every PDF under the scan folder is rasterised page by page (``pymupdf``,
+grayscale) and searched for QR codes (``zxing-cpp``, the C++ port of the
+ZXing decoder ``QrScannerService`` uses in the browser). Pages are decoded
+in chunks across a process pool, so one long batch scan is split between
+workers as well as many small files. Each code this package printed names
+a protocol or work and the digest of its document; the named rows are then
+read once per layout and hashed again:
+
+* ``current``: the row still hashes to the printed digest;
+* ``changed``: the row was edited after the document was printed;
+* ``unknown``: no such row (deleted, or printed from another database);
+* ``foreign``: a QR code that is not one of ours;
+* ``no code`` / ``unreadable``: a file without any QR code, or one that
+  does not open as a PDF.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from .qr import document_digest, parse_payload
+from .source import Selection, read_documents
+
+try:
+    import pymupdf
+    import zxingcpp
+except ImportError:  # pragma: no cover - optional dependency
+    pymupdf = None
+
+# rasterising resolution: a 1.3 pt module is 3.6 pixels at 200 dpi
+DPI = 200
+PAGES_PER_TASK = 8
+STATUSES = ('current', 'changed', 'unknown', 'foreign', 'no code', 'unreadable')
+
+
+@dataclass(frozen=True)
+class Finding:
+    path: str
+    # 1-based; 0 for findings about the whole file
+    page: int
+    status: str
+    layout: str = ''
+    document_id: str = ''
+    detail: str = ''
+
+
+@dataclass
+class VerifyReport:
+    files: int = 0
+    pages: int = 0
+    findings: list[Finding] = field(default_factory=list)
+
+    def count(self, status: str) -> int:
+        return sum(1 for finding in self.findings if finding.status == status)
+
+    @property
+    def problems(self) -> list[Finding]:
+        return [finding for finding in self.findings if finding.status != 'current']
+
+
+def scan_files(folder: Path) -> list[Path]:
+    """The PDFs under ``folder`` (or ``folder`` itself when it is one), in path order."""
+    if folder.is_file():
+        return [folder]
+    return sorted(path for path in folder.rglob('*') if path.suffix.lower() == '.pdf' and path.is_file())
+
+
+def _decode_pages(path: str, first: int, last: int, dpi: int) -> tuple[list[tuple[int, str]], str | None]:
+    """(page, text) of every QR code on pages ``first`` to ``last`` (0-based, exclusive) of ``path``."""
+    codes = []
+    try:
+        with pymupdf.open(path) as pdf:
+            for number in range(first, last):
+                pixmap = pdf[number].get_pixmap(dpi=dpi, colorspace=pymupdf.csGRAY, alpha=False)
+                image = zxingcpp.ImageView(
+                    pixmap.samples_mv, pixmap.width, pixmap.height, zxingcpp.ImageFormat.Lum, pixmap.stride
+                )
+                for barcode in zxingcpp.read_barcodes(image, formats=zxingcpp.BarcodeFormat.QRCode):
+                    codes.append((number + 1, barcode.text))
+    except Exception as exc:  # one damaged page must not stop the batch
+        return codes, f'{type(exc).__name__}: {exc}'
+    return codes, None
+
+
+def _tasks(paths: Iterable[Path], dpi: int, report: VerifyReport) -> list[tuple[str, int, int, int]]:
+    tasks = []
+    for path in paths:
+        report.files += 1
+        try:
+            with pymupdf.open(path) as pdf:
+                pages = pdf.page_count
+        except Exception as exc:  # pymupdf raises its own types for damaged files
+            report.findings.append(Finding(str(path), 0, 'unreadable', detail=str(exc)))
+            continue
+        report.pages += pages
+        for first in range(0, pages, PAGES_PER_TASK):
+            tasks.append((str(path), first, min(first + PAGES_PER_TASK, pages), dpi))
+    return tasks
+
+
+def verify_scans(
+    paths: list[Path], dsn: str | None, workers: int = os.cpu_count() or 1, dpi: int = DPI
+) -> VerifyReport:
+    """Decode the QR codes of ``paths`` and check each against the database."""
+    if pymupdf is None:
+        raise SystemExit('pymupdf and zxing-cpp are not installed (pip install -r tools/requirements.txt)')
+    report = VerifyReport()
+    tasks = _tasks(paths, dpi, report)
+    if workers <= 1 or len(tasks) <= 1:
+        decoded = [_decode_pages(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            decoded = list(pool.map(_decode_pages, *zip(*tasks)))
+
+    # layout -> id -> [(path, page, printed digest)]
+    printed: dict[str, dict[str, list[tuple[str, int, str]]]] = defaultdict(lambda: defaultdict(list))
+    found: set[str] = set()
+    for (path, first, *_), (codes, error) in zip(tasks, decoded):
+        if error:
+            report.findings.append(Finding(path, first + 1, 'unreadable', detail=error))
+        for page, text in codes:
+            found.add(path)
+            parsed = parse_payload(text)
+            if parsed is None:
+                report.findings.append(Finding(path, page, 'foreign', detail=text[:80]))
+                continue
+            layout, document_id, digest = parsed
+            printed[layout][document_id].append((path, page, digest))
+    for path in dict.fromkeys(task[0] for task in tasks):
+        if path not in found:
+            report.findings.append(Finding(path, 0, 'no code'))
+
+    for layout, documents in printed.items():
+        current = {
+            document_id: document_digest(text)
+            for document_id, text in read_documents(dsn, layout, Selection(ids=tuple(documents)))
+        }
+        for document_id, copies in documents.items():
+            for path, page, digest in copies:
+                if document_id not in current:
+                    status = 'unknown'
+                elif current[document_id] != digest:
+                    status = 'changed'
+                else:
+                    status = 'current'
+                report.findings.append(Finding(path, page, status, layout, document_id))
+    report.findings.sort(key=lambda finding: (finding.path, finding.page))
+    return report
@@ -0,0 +1,15 @@
+"""Reference tables shipped as a static, content-hashed asset.
+
+CMO/PRO organizations, neighbouring functions and security questions only
+change with a migration. ``build`` reads them from Postgres into
+``public/assets/reference/`` with country, region and type indexes and the
+labels of every locale, and ``CmoProService``, ``NeighbouringFunctionsService``
+and ``AuthRecoveryService`` load that file instead of querying Supabase::
+
+    python -m tools.refdata build           # compile the tables, replace the published artifact
+    python -m tools.refdata check           # exit 1 if the published artifact is out of date
+"""
+
+from .snapshot import OUTPUT_DIR, ReferenceTables, SnapshotReport, build_snapshot, compile_snapshot, read_tables
+
+__all__ = ['OUTPUT_DIR', 'ReferenceTables', 'SnapshotReport', 'build_snapshot', 'compile_snapshot', 'read_tables']
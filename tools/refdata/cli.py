@@ -0,0 +1,70 @@
+"""Command line entry point: ``python -m tools.refdata <command>``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from ..db import psycopg
+from ..i18n.config import REPO_ROOT, Layout
+from .snapshot import OUTPUT_DIR, SnapshotReport, build_snapshot
+
+
+def _summary(report: SnapshotReport) -> str:
+    return (
+        f'{report.organizations} organizations, {report.functions} neighbouring functions, '
+        f'{report.questions} security questions, labels in {report.locales} locales'
+    )
+
+
+def cmd_build(args: argparse.Namespace) -> int:
+    report = build_snapshot(args.dsn, args.output, Layout(args.root))
+    state = 'written' if report.changed else 'unchanged'
+    print(f'✅ {_summary(report)}')
+    size = f'{report.bytes / 1024:.1f} KB, {report.compressed_bytes / 1024:.1f} KB gzipped'
+    print(f'   {args.output / report.name}: {size} ({state})')
+    for path in report.removed:
+        print(f'   removed {path.name}')
+    return 0
+
+
+def cmd_check(args: argparse.Namespace) -> int:
+    report = build_snapshot(args.dsn, args.output, Layout(args.root), write=False)
+    if report.changed:
+        print(f'❌ {args.output} does not hold the current reference data (python -m tools.refdata build)')
+        return 1
+    print(f'✅ {report.name} is current: {_summary(report)}')
+    return 0
+
+
+COMMANDS = {
+    'build': (cmd_build, 'compile the reference tables into a content-hashed JSON asset'),
+    'check': (cmd_check, 'exit 1 if the published asset differs from the tables'),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m tools.refdata', description=__doc__)
+    parser.add_argument('--root', type=Path, default=REPO_ROOT, help='repository root (for the locale files)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('--dsn', help='Postgres connection string (default: $DATABASE_URL, then local Supabase)')
+        sub.add_argument('-o', '--output', type=Path, default=OUTPUT_DIR, help='directory the asset is published in')
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    handler, _ = COMMANDS[args.command]
+    errors = (psycopg.Error,) if psycopg is not None else ()
+    try:
+        return handler(args)
+    except errors as exc:
+        print(f'❌ {exc}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""Compile the reference tables into one content-hashed JSON artifact.
+
+``cmo_pro_organizations``, ``neighbouring_functions`` and
+``security_questions`` change with a migration, not with use, yet every
+dropdown that lists them queries Supabase. The compiler reads them once
+(active rows only, in the order the services and RPCs return them) and
+writes ``public/assets/reference/reference.<hash>.json``, with ``.gz`` and
+``.br`` siblings, and ``reference-map.json`` naming the current hash. The
+artifact holds:
+
+* each table as ``columns`` plus ``rows`` of values, in the services' order
+  (organizations by acronym, the others by ``display_order``);
+* indexes of row positions: organizations ``byCountry`` (acronym order, as
+  ``get_cmo_pro_by_country``), ``byRegion`` (the ``cmo_pro_by_region``
+  view's regions) and ``byType`` (country, then acronym, as
+  ``get_cmo_pro_by_region`` and ``get_cmo_pro_by_type``), functions
+  ``byType`` and questions ``byCategory``;
+* ``labels`` per locale: region, organization type, function type and
+  question category names from ``REFERENCE`` in the locale files, and the
+  text of every security question, with the default locale merged under
+  each, as ``protocols`` does for its PDF labels.
+
+The tables are read rather than the seed migrations: the seeds leave ids
+to ``gen_random_uuid()`` and ``bigserial``, and a form stores those ids.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..db import connect
+from ..i18n.artifacts import artifact_name, compressed, prune, write_immutable
+from ..i18n.catalog import flatten, minify, short_digest, write_atomic
+from ..i18n.config import DEFAULT_LOCALE, REPO_ROOT, Layout
+from ..i18n.fallback import merge_fallback
+
+OUTPUT_DIR = REPO_ROOT / 'public' / 'assets' / 'reference'
+STEM = 'reference'
+MAP_FILE = 'reference-map.json'
+FORMAT_VERSION = 1
+NAMESPACE = 'REFERENCE'
+
+_ORGANIZATIONS = """
+SELECT o.id::text, o.name, o.acronym, o.organization_type, o.country, o.website, r.region
+  FROM public.cmo_pro_organizations o
+  LEFT JOIN public.cmo_pro_by_region r ON r.acronym = o.acronym
+ WHERE o.is_active = true
+ ORDER BY o.acronym
+"""
+# position of each organization (by acronym) in country, acronym order
+_BY_COUNTRY = """
+SELECT acronym
+  FROM public.cmo_pro_organizations
+ WHERE is_active = true
+ ORDER BY country, acronym
+"""
+_FUNCTIONS = """
+SELECT id, type, function_name, display_order
+  FROM public.neighbouring_functions
+ WHERE is_active = true
+ ORDER BY display_order
+"""
+_QUESTIONS = """
+SELECT id, question_key, question_text, category
+  FROM public.security_questions
+ WHERE is_active = true
+ ORDER BY display_order
+"""
+ORGANIZATION_COLUMNS = ('id', 'name', 'acronym', 'organization_type', 'country', 'website')
+FUNCTION_COLUMNS = ('id', 'type', 'function_name', 'display_order')
+QUESTION_COLUMNS = ('id', 'question_key', 'question_text', 'category')
+
+
+def label_key(value: str) -> str:
+    """``'Middle East'`` -> ``MIDDLE_EAST``, ``'Other/Global'`` -> ``OTHER_GLOBAL``."""
+    return re.sub(r'[^A-Z0-9]+', '_', value.upper()).strip('_')
+
+
+def _index(values: list[str | None], order: list[int] | None = None) -> dict[str, list[int]]:
+    """Row positions per value, in ``order`` (default: row order); rows without a value are left out."""
+    index: dict[str, list[int]] = {}
+    for position in order if order is not None else range(len(values)):
+        if values[position] is not None:
+            index.setdefault(values[position], []).append(position)
+    return index
+
+
+@dataclass
+class ReferenceTables:
+    organizations: list[tuple] = field(default_factory=list)
+    # region of each organization, by row
+    regions: list[str | None] = field(default_factory=list)
+    # organization rows in country, acronym order
+    country_order: list[int] = field(default_factory=list)
+    functions: list[tuple] = field(default_factory=list)
+    questions: list[tuple] = field(default_factory=list)
+
+
+def read_tables(dsn: str | None) -> ReferenceTables:
+    tables = ReferenceTables()
+    with connect(dsn) as connection, connection.cursor() as cursor:
+        cursor.execute(_ORGANIZATIONS)
+        for *row, region in cursor.fetchall():
+            tables.organizations.append(tuple(row))
+            tables.regions.append(region)
+        positions = {row[2]: position for position, row in enumerate(tables.organizations)}
+        cursor.execute(_BY_COUNTRY)
+        tables.country_order = [positions[acronym] for (acronym,) in cursor.fetchall()]
+        cursor.execute(_FUNCTIONS)
+        tables.functions = cursor.fetchall()
+        cursor.execute(_QUESTIONS)
+        tables.questions = cursor.fetchall()
+    return tables
+
+
+def _locale(lang: str, layout: Layout) -> dict[str, Any]:
+    data = json.loads(layout.locale_file(lang).read_text(encoding='utf-8'))
+    if lang != DEFAULT_LOCALE:
+        data, _ = merge_fallback(data, json.loads(layout.locale_file(DEFAULT_LOCALE).read_text(encoding='utf-8')))
+    return flatten(data)
+
+
+def _labels(tables: ReferenceTables, strings: dict[str, str]) -> dict[str, dict[str, str]]:
+    def group(name: str, values: set[str]) -> dict[str, str]:
+        return {value: strings.get(f'{NAMESPACE}.{name}.{label_key(value)}', value) for value in sorted(values)}
+
+    return {
+        'regions': group('REGIONS', {region for region in tables.regions if region}),
+        'organizationTypes': group('ORGANIZATION_TYPES', {row[3] for row in tables.organizations}),
+        'functionTypes': group('FUNCTION_TYPES', {row[1] for row in tables.functions}),
+        'questionCategories': group('QUESTION_CATEGORIES', {row[3] for row in tables.questions}),
+        # question_key is the key the forms translate (SECURITY.Q_...)
+        'securityQuestions': {row[1]: strings.get(row[1], row[2]) for row in tables.questions},
+    }
+
+
+def compile_snapshot(tables: ReferenceTables, layout: Layout = Layout()) -> dict[str, Any]:
+    """The artifact's content: every table, its indexes and the labels of every locale."""
+    organizations = [list(row) for row in tables.organizations]
+    return {
+        'version': FORMAT_VERSION,
+        'organizations': {
+            'columns': ORGANIZATION_COLUMNS,
+            'rows': organizations,
+            'byCountry': _index([row[4] for row in organizations]),
+            'byRegion': _index(tables.regions, tables.country_order),
+            'byType': _index([row[3] for row in organizations], tables.country_order),
+        },
+        'neighbouringFunctions': {
+            'columns': FUNCTION_COLUMNS,
+            'rows': [list(row) for row in tables.functions],
+            'byType': _index([row[1] for row in tables.functions]),
+        },
+        'securityQuestions': {
+            'columns': QUESTION_COLUMNS,
+            'rows': [list(row) for row in tables.questions],
+            'byCategory': _index([row[3] for row in tables.questions]),
+        },
+        'labels': {lang: _labels(tables, _locale(lang, layout)) for lang in layout.locales()},
+    }
+
+
+@dataclass
+class SnapshotReport:
+    organizations: int = 0
+    functions: int = 0
+    questions: int = 0
+    locales: int = 0
+    name: str = ''
+    bytes: int = 0
+    # size of the .gz sibling
+    compressed_bytes: int = 0
+    changed: bool = False
+    removed: list[Path] = field(default_factory=list)
+
+
+def _current(output: Path) -> str | None:
+    try:
+        return json.loads((output / MAP_FILE).read_bytes()).get(STEM)
+    except (OSError, ValueError):
+        return None
+
+
+def build_snapshot(
+    dsn: str | None, output: Path = OUTPUT_DIR, layout: Layout = Layout(), write: bool = True
+) -> SnapshotReport:
+    """Compile the tables; with ``write``, publish the artifact and drop the previous one."""
+    tables = read_tables(dsn)
+    payload = minify(compile_snapshot(tables, layout))
+    name = artifact_name(STEM, payload)
+    report = SnapshotReport(
+        organizations=len(tables.organizations),
+        functions=len(tables.functions),
+        questions=len(tables.questions),
+        locales=len(layout.locales()),
+        name=name,
+        bytes=len(payload),
+        compressed_bytes=len(compressed(payload)['.gz']),
+        changed=_current(output) != short_digest(payload) or not (output / name).exists(),
+    )
+    if write and report.changed:
+        write_immutable(output, name, payload)
+        head = {'version': FORMAT_VERSION, STEM: short_digest(payload), 'bytes': len(payload)}
+        write_atomic(output / MAP_FILE, json.dumps(head, indent=2).encode('utf-8') + b'\n')
+        report.removed = prune(output, {name, MAP_FILE})
+    return report
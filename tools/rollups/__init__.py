@@ -0,0 +1,18 @@
+"""Precomputed counters behind the admin overview dashboard.
+
+``admin_overview_snapshot()`` reads weekly counts of signups, works,
+protocols and waitlist entries, and the scalar user and work metrics, from
+tables this job keeps current. Each refresh only recounts the weeks since
+its last high-water mark, and recomputes the scalar totals once an hour,
+so schedule it (cron, ``pg_cron`` calling out, a CI job) every few
+minutes::
+
+    python -m tools.rollups refresh            # recount the weeks since the last run
+    python -m tools.rollups refresh --totals-every 15  # totals at most 15 minutes old
+    python -m tools.rollups refresh --rebuild  # recount every week
+    python -m tools.rollups check              # compare the stored counts with a full recount
+"""
+
+from .rollup import METRICS, REWIND, TOTALS_EVERY, Drift, MetricRefresh, RollupReport, check, refresh
+
+__all__ = ['Drift', 'METRICS', 'MetricRefresh', 'REWIND', 'RollupReport', 'TOTALS_EVERY', 'check', 'refresh']
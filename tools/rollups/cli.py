@@ -0,0 +1,85 @@
+"""Command line entry point: ``python -m tools.rollups <command>``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from datetime import timedelta
+
+from ..db import psycopg
+from .rollup import TOTALS_EVERY, check, refresh
+
+
+def cmd_refresh(args: argparse.Namespace) -> int:
+    report = refresh(args.dsn, args.rebuild, timedelta(minutes=args.totals_every))
+    print(f'✅ counters current to {report.high_water:%Y-%m-%d %H:%M:%S %Z} in {report.seconds:.2f} s')
+    for metric in report.metrics:
+        since = 'all' if metric.since is None else f'since {metric.since:%Y-%m-%d}'
+        print(f'   {metric.metric}: {metric.rows} rows in {metric.weeks} weeks ({since}) recounted')
+    if report.totals is None:
+        kept = f'{report.totals_at:%Y-%m-%d %H:%M:%S %Z}'
+        print(f'   totals: kept from {kept} (recomputed every {args.totals_every:g} min)')
+    else:
+        print('   totals: recomputed')
+    for metric in report.missing:
+        print(f'⚠️ {metric}: table not in this database, skipped')
+    if args.verbose and report.totals is not None:
+        for name, value in sorted(report.totals.items()):
+            print(f'   {name}: {value}')
+    return 0
+
+
+def cmd_check(args: argparse.Namespace) -> int:
+    drifts = check(args.dsn)
+    if not drifts:
+        print('✅ stored weekly counts match a full recount')
+        return 0
+    print(f'❌ {len(drifts)} week(s) differ from a full recount (run refresh --rebuild)')
+    for drift in drifts[: args.limit]:
+        print(f'   {drift.metric} {drift.week_start:%Y-%m-%d}: stored {drift.stored}, counted {drift.actual}')
+    if len(drifts) > args.limit:
+        print(f'   ... and {len(drifts) - args.limit} more')
+    return 1
+
+
+COMMANDS = {
+    'refresh': (cmd_refresh, 'recount the admin overview counters since the last high-water mark'),
+    'check': (cmd_check, 'compare the stored weekly counts with a full recount'),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m tools.rollups', description=__doc__)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('--dsn', help='Postgres connection string (default: $DATABASE_URL, then local Supabase)')
+        if name == 'refresh':
+            sub.add_argument('--rebuild', action='store_true', help='recount every week, not only the recent ones')
+            sub.add_argument(
+                '--totals-every',
+                type=float,
+                default=TOTALS_EVERY.total_seconds() / 60,
+                metavar='MINUTES',
+                help='recompute the scalar totals once they are this old (default: %(default)g, 0: every run)',
+            )
+            sub.add_argument('-v', '--verbose', action='store_true', help='also print recomputed scalar totals')
+        if name == 'check':
+            sub.add_argument('--limit', type=int, default=20, help='differing weeks to list (default: 20)')
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    handler, _ = COMMANDS[args.command]
+    errors = (psycopg.Error,) if psycopg is not None else ()
+    try:
+        return handler(args)
+    except errors as exc:
+        print(f'❌ {exc}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""Keep the admin overview counters current from a high-water mark.
+
+``admin_overview_snapshot()`` serves the dashboard from three tables the
+``20260110`` migration adds, and this job fills them:
+
+* ``admin_weekly_counts``: rows created per metric and week (Monday, UTC)
+  in ``profiles`` (signups), ``works``, ``protocols`` and
+  ``waitlist_requests``;
+* ``admin_rollup_state``: per metric, the ``high_water`` time up to which
+  the weekly counts are complete;
+* ``admin_overview_totals``: the scalar metrics (users, split and AI
+  declaration counts) from ``admin_overview_live()``. They depend on
+  updates and deletes as much as on new rows, so there is no mark to count
+  them from: they are recomputed whole, but only by a refresh that finds
+  them ``TOTALS_EVERY`` old, since that aggregation reads every profile,
+  work and split. Their ``refreshed_at`` is the dashboard's
+  ``refreshedAt``.
+
+A refresh recounts only the weeks from the one that holds ``high_water``
+less ``REWIND`` onward, reading their rows on the ``created_at`` indexes,
+and replaces those weeks' counts with the rows created before the new mark,
+the start of the refresh transaction. A week is always counted whole, so a
+rerun or an overlap never counts a row twice, and a row whose transaction
+committed up to ``REWIND`` after its ``created_at`` is still picked up.
+Rows deleted from older weeks are only reflected by ``rebuild``. The
+refresh runs in one transaction under an advisory lock: the dashboard
+sees all the counters of one run, and concurrent runs wait their turn.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from ..db import connect
+from ..periods import period_start
+
+# metric -> table whose rows are counted by created_at
+METRICS = {
+    'signups': 'public.profiles',
+    'works': 'public.works',
+    'protocols': 'public.protocols',
+    'waitlist': 'public.waitlist_requests',
+}
+# how late a row may commit after its created_at and still be counted by the next refresh
+REWIND = timedelta(hours=1)
+# pg_advisory_xact_lock key; any constant both runs agree on
+LOCK_KEY = 20260110
+# age at which a refresh recomputes the scalar totals
+TOTALS_EVERY = timedelta(hours=1)
+
+_LOCK = 'SELECT pg_advisory_xact_lock(%s), now()'
+_STATE = 'SELECT metric, high_water FROM public.admin_rollup_state'
+_CLEAR = 'DELETE FROM public.admin_weekly_counts WHERE metric = %(metric)s AND week_start >= %(week)s'
+_COUNT = """
+INSERT INTO public.admin_weekly_counts (metric, week_start, total)
+SELECT %(metric)s, date_trunc('week', timezone('utc', created_at))::date, COUNT(*)
+  FROM {table}
+ WHERE created_at >= %(since)s
+   AND created_at < %(high_water)s
+ GROUP BY 2
+RETURNING total
+"""
+_MARK = """
+INSERT INTO public.admin_rollup_state (metric, high_water, refreshed_at)
+VALUES (%(metric)s, %(high_water)s, now())
+ON CONFLICT (metric) DO UPDATE SET high_water = excluded.high_water, refreshed_at = excluded.refreshed_at
+"""
+_TOTALS_AT = 'SELECT refreshed_at FROM public.admin_overview_totals WHERE id = 1'
+_TOTALS = """
+INSERT INTO public.admin_overview_totals (id, metrics, refreshed_at)
+SELECT 1, public.admin_overview_live() - 'weeklySignups', now()
+ON CONFLICT (id) DO UPDATE SET metrics = excluded.metrics, refreshed_at = excluded.refreshed_at
+RETURNING metrics
+"""
+_STORED = 'SELECT week_start, total FROM public.admin_weekly_counts WHERE metric = %s'
+_RECOUNT = """
+SELECT date_trunc('week', timezone('utc', created_at))::date, COUNT(*)
+  FROM {table}
+ WHERE created_at < %s
+ GROUP BY 1
+"""
+
+
+def _exists(cursor: Any, table: str) -> bool:
+    cursor.execute('SELECT to_regclass(%s) IS NOT NULL', (table,))
+    return cursor.fetchone()[0]
+
+
+@dataclass
+class MetricRefresh:
+    metric: str
+    # first week recounted; None when every week was
+    since: date | None
+    rows: int
+    weeks: int
+
+
+@dataclass
+class RollupReport:
+    high_water: datetime | None = None
+    metrics: list[MetricRefresh] = field(default_factory=list)
+    # metrics whose table does not exist in this database
+    missing: list[str] = field(default_factory=list)
+    # the scalar totals, when this refresh recomputed them
+    totals: dict[str, Any] | None = None
+    # when the stored totals were computed
+    totals_at: datetime | None = None
+    seconds: float = 0.0
+
+
+def refresh(dsn: str | None, rebuild: bool = False, totals_every: timedelta = TOTALS_EVERY) -> RollupReport:
+    """Bring the weekly counts up to now, and the totals once ``totals_every`` old.
+
+    With ``rebuild``, every week is recounted and the totals recomputed.
+    """
+    report = RollupReport()
+    started = time.perf_counter()
+    with connect(dsn) as connection, connection.cursor() as cursor:
+        cursor.execute(_LOCK, (LOCK_KEY,))
+        report.high_water = cursor.fetchone()[1]
+        cursor.execute(_STATE)
+        marks = dict(cursor.fetchall())
+        for metric, table in METRICS.items():
+            if not _exists(cursor, table):
+                report.missing.append(metric)
+                continue
+            mark = None if rebuild else marks.get(metric)
+            since = period_start(mark - REWIND, 'week') if mark else None
+            week = since or date.min
+            params = {
+                'metric': metric,
+                'week': week,
+                'since': datetime(week.year, week.month, week.day, tzinfo=timezone.utc),
+                'high_water': report.high_water,
+            }
+            cursor.execute(_CLEAR, params)
+            cursor.execute(_COUNT.format(table=table), params)
+            counts = [total for (total,) in cursor.fetchall()]
+            cursor.execute(_MARK, params)
+            report.metrics.append(MetricRefresh(metric, since, sum(counts), len(counts)))
+        cursor.execute(_TOTALS_AT)
+        row = cursor.fetchone()
+        report.totals_at = row[0] if row else None
+        if rebuild or report.totals_at is None or report.high_water - report.totals_at >= totals_every:
+            cursor.execute(_TOTALS)
+            report.totals = cursor.fetchone()[0]
+            report.totals_at = report.high_water
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+@dataclass(frozen=True)
+class Drift:
+    metric: str
+    week_start: date
+    stored: int
+    actual: int
+
+
+def check(dsn: str | None) -> list[Drift]:
+    """Weeks whose stored count differs from a full recount of the rows created before the metric's mark."""
+    drifts = []
+    with connect(dsn) as connection, connection.cursor() as cursor:
+        cursor.execute(_STATE)
+        marks = dict(cursor.fetchall())
+        for metric, table in METRICS.items():
+            if metric not in marks or not _exists(cursor, table):
+                continue
+            cursor.execute(_STORED, (metric,))
+            stored = dict(cursor.fetchall())
+            cursor.execute(_RECOUNT.format(table=table), (marks[metric],))
+            actual = dict(cursor.fetchall())
+            for week in sorted(stored.keys() | actual.keys()):
+                if stored.get(week, 0) != actual.get(week, 0):
+                    drifts.append(Drift(metric, week, stored.get(week, 0), actual.get(week, 0)))
+    return drifts
@@ -0,0 +1,13 @@
+"""Offline checks over whole split catalogs.
+
+``validate_split_totals`` and ``WorksService.validateSplits`` check one
+work per call. This package checks every work of an export, or of the
+database, in one streaming pass::
+
+    python -m tools.splits validate splits.csv            # a table export
+    python -m tools.splits validate --db -w <workspace>   # Postgres (needs psycopg)
+"""
+
+from .totals import SplitIssue, SplitTotals, validate
+
+__all__ = ['SplitIssue', 'SplitTotals', 'validate']
@@ -0,0 +1,80 @@
+"""Command line entry point: ``python -m tools.splits <command>``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from .export import ExportError, read_database, read_export
+from .totals import TOLERANCE, np, validate
+
+
+def cmd_validate(args: argparse.Namespace) -> int:
+    if (args.export is None) == (not args.db):
+        raise SystemExit('pass either an export file or --db')
+    if np is None:
+        print('⚠️  numpy is not installed, totals are summed in pure Python (pip install -r tools/requirements.txt)')
+    started = time.perf_counter()
+    chunks = read_database(args.dsn, args.workspace) if args.db else read_export(args.export, args.workspace)
+    totals = validate(chunks)
+    issues = totals.issues()
+    elapsed = time.perf_counter() - started
+
+    for issue in issues[: None if args.verbose else args.limit]:
+        print(f'❌ {issue.work_id} {issue.split_type}/{issue.rights_layer}: {issue.message}')
+    if len(issues) > args.limit and not args.verbose:
+        print(f'   ... and {len(issues) - args.limit} more (-v lists all)')
+    if args.json:
+        report = {
+            'version': 1,
+            'tolerance': TOLERANCE,
+            'works': len(totals.works),
+            'groups': totals.groups,
+            'rows': totals.rows,
+            'issues': [issue.to_json() for issue in issues],
+        }
+        args.json.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+    mark = '❌' if issues else '✅'
+    print(
+        f'{mark} {len(totals.works)} works, {totals.groups} split groups, {totals.rows} rows checked in '
+        f'{elapsed:.2f} s: {len(issues)} not at 100%'
+    )
+    return 1 if issues else 0
+
+
+COMMANDS = {
+    'validate': (cmd_validate, 'report every work whose split totals are not 100%%'),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m tools.splits', description=__doc__)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('-v', '--verbose', action='store_true', help='list every issue')
+        if name == 'validate':
+            sub.add_argument('export', nargs='?', type=Path, help='work_splits export (.csv, .jsonl or .json, optionally .gz)')
+            sub.add_argument('--db', action='store_true', help='read work_splits from Postgres instead')
+            sub.add_argument('--dsn', help='Postgres connection string (default: $DATABASE_URL, then local Supabase)')
+            sub.add_argument('-w', '--workspace', help='only the works of this workspace id')
+            sub.add_argument('--limit', type=int, default=50, help='issues to print without -v (default: 50)')
+            sub.add_argument('--json', type=Path, help='also write the full report to this file')
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    handler, _ = COMMANDS[args.command]
+    try:
+        return handler(args)
+    except ExportError as exc:
+        print(f'❌ {exc}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Read ``work_splits`` rows as a stream of column chunks.
+
+An export is a CSV file (the Supabase table editor's format), JSON Lines,
+or a JSON array, optionally gzipped (``.csv.gz``). Only a JSON array is read
+whole. The columns used are ``work_id``, ``split_type``,
+``ownership_percentage`` (or the legacy ``percentage``), ``rights_layer`` and
+``is_active``, plus ``workspace_id`` when filtering by workspace.
+
+Rows with ``is_active`` false are skipped, as ``validate_split_totals``
+skips them. A missing ``rights_layer`` is derived from the split type, as
+``WorksService`` does when it saves splits.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from ..db import connect, stream
+
+# work_splits_split_type_check (20251230_update_work_splits_split_type_constraint.sql)
+SPLIT_TYPES = ('lyrics', 'music', 'publishing', 'performance', 'master_recording', 'neighboring_rights')
+IP_SPLIT_TYPES = ('lyrics', 'music', 'publishing')
+RIGHTS_LAYERS = ('ip', 'neighboring')
+_SPLIT_TYPE_SET = frozenset(SPLIT_TYPES)
+# split type -> rights layer, as WorksService.resolveRightsLayer assigns it
+_LAYERS = {kind: 'ip' if kind in IP_SPLIT_TYPES else 'neighboring' for kind in SPLIT_TYPES}
+CHUNK_ROWS = 50_000
+
+# columns read from an export, in tuple order
+FIELDS = ('work_id', 'split_type', 'ownership_percentage', 'rights_layer', 'is_active', 'workspace_id')
+_ALIASES = {'percentage': 'ownership_percentage'}
+_FALSE = {False, 'false', 'f', '0', 0}
+
+_SPLITS_QUERY = """
+SELECT s.work_id::text, s.split_type, s.rights_layer, s.ownership_percentage::float8
+  FROM public.work_splits s
+  {join}
+ WHERE s.is_active IS NOT FALSE {where}
+ ORDER BY s.work_id
+"""
+
+
+class ExportError(ValueError):
+    pass
+
+
+@dataclass
+class SplitChunk:
+    work_ids: list[str] = field(default_factory=list)
+    split_types: list[str] = field(default_factory=list)
+    rights_layers: list[str] = field(default_factory=list)
+    percentages: list[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.work_ids)
+
+    @classmethod
+    def from_columns(
+        cls,
+        work_ids: Iterable[str],
+        split_types: Iterable[str],
+        rights_layers: Iterable[str | None],
+        percentages: list[float],
+    ) -> SplitChunk:
+        """Chunk of the given columns; a missing rights layer is derived from the split type."""
+        split_types = list(split_types)
+        layers = [layer or _LAYERS[kind] for kind, layer in zip(split_types, rights_layers)]
+        return cls(list(work_ids), split_types, layers, percentages)
+
+
+def _is_number(value: Any) -> bool:
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _open(path: Path) -> io.TextIOBase:
+    if path.suffix == '.gz':
+        return io.TextIOWrapper(gzip.open(path), encoding='utf-8', newline='')
+    return path.open(encoding='utf-8', newline='')
+
+
+def _rows(path: Path, required: tuple[str, ...]) -> Iterator[tuple[Any, ...]]:
+    """Records of ``path`` as tuples in ``FIELDS`` order; absent columns read as ``''``."""
+    kind = path.name.removesuffix('.gz').rsplit('.', 1)[-1]
+    if kind not in ('csv', 'jsonl', 'ndjson', 'json'):
+        raise ExportError(f'{path.name}: expected .csv, .jsonl or .json')
+    with _open(path) as handle:
+        if kind == 'csv':
+            reader = csv.reader(handle)
+            header = [_ALIASES.get(name, name) for name in next(reader, [])]
+            missing = [name for name in required if name not in header]
+            if missing:
+                raise ExportError(f'{path.name}: no {", ".join(missing)} column')
+            pick = itemgetter(*(header.index(name) if name in header else len(header) for name in FIELDS))
+            for row in reader:
+                row.append('')
+                yield pick(row)
+            return
+        lines = (json.loads(line) for line in handle if line.strip()) if kind != 'json' else iter(json.load(handle))
+        for record in lines:
+            for alias, name in _ALIASES.items():
+                if alias in record and name not in record:
+                    record[name] = record[alias]
+            yield tuple(record.get(name, '') for name in FIELDS)
+
+
+def read_export(path: Path, workspace: str | None = None, size: int = CHUNK_ROWS) -> Iterator[SplitChunk]:
+    """Active splits in ``path``, ``size`` rows at a time."""
+    required = FIELDS[:3] + (('workspace_id',) if workspace is not None else ())
+    rows = _rows(path, required)
+    offset = 0
+    while batch := list(islice(rows, size)):
+        kept = [row for row in batch if row[4] not in _FALSE and (workspace is None or row[5] == workspace)]
+        offset += len(batch)
+        if not kept:
+            continue
+        work_ids, split_types, values, rights_layers, _, _ = zip(*kept)
+        try:
+            percentages = list(map(float, values))
+        except (TypeError, ValueError):
+            number = offset - len(batch) + next(i for i, row in enumerate(batch, 1) if not _is_number(row[2]))
+            raise ExportError(f'{path.name}: record {number} has no ownership_percentage') from None
+        unknown = set(split_types) - _SPLIT_TYPE_SET
+        if unknown:
+            number = offset - len(batch) + next(i for i, row in enumerate(batch, 1) if row[1] in unknown)
+            raise ExportError(f'{path.name}: record {number} has split_type {sorted(unknown)[0]!r}')
+        yield SplitChunk.from_columns(work_ids, split_types, rights_layers, percentages)
+
+
+def read_database(dsn: str | None, workspace: str | None = None, size: int = CHUNK_ROWS) -> Iterator[SplitChunk]:
+    """Active splits straight from Postgres, ordered by work so consecutive chunks stay local."""
+    join = where = ''
+    params: dict[str, Any] = {}
+    if workspace is not None:
+        join = 'JOIN public.works w ON w.id = s.work_id'
+        where = 'AND w.workspace_id = %(workspace)s'
+        params['workspace'] = workspace
+    with connect(dsn) as connection:
+        for rows in stream(connection, _SPLITS_QUERY.format(join=join, where=where), params, size):
+            work_ids, split_types, rights_layers, percentages = zip(*rows)
+            yield SplitChunk.from_columns(work_ids, split_types, rights_layers, [value or 0.0 for value in percentages])
@@ -0,0 +1,139 @@
+"""Split totals per work, split type and rights layer, summed over arrays.
+
+Each work gets a dense index on first sight, and each (split type, rights
+layer) pair a fixed slot, so a group is one integer:
+``work * GROUP_SLOTS + slot``. Percentages and row counts are summed into
+two flat arrays indexed by group, a chunk at a time, with
+``numpy.bincount`` over the range of groups the chunk touches. Exports read
+from the database are ordered by work, so that range stays about the size
+of the chunk. Without NumPy the same arrays are ``array.array`` buffers
+summed in a loop, which is slower but gives the same result.
+
+``ownership_percentage`` is ``numeric(5,2)``, so totals are compared in
+whole hundredths (``TOLERANCE``): a group is valid when its total rounds
+to exactly 100.00, as ``validate_split_totals`` checks in exact numeric.
+Comparing the float sum itself would let the summation error decide
+whether a total 0.01 off passes. The messages are those of
+``validate_split_totals``.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from .export import RIGHTS_LAYERS, SPLIT_TYPES, ExportError, SplitChunk
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+TOLERANCE = 0.01
+# 100% in units of TOLERANCE
+_TARGET = round(100 / TOLERANCE)
+GROUP_SLOTS = len(SPLIT_TYPES) * len(RIGHTS_LAYERS)
+
+_SLOTS = {
+    (split_type, layer): index * len(RIGHTS_LAYERS) + offset
+    for index, split_type in enumerate(SPLIT_TYPES)
+    for offset, layer in enumerate(RIGHTS_LAYERS)
+}
+
+
+@dataclass(frozen=True)
+class SplitIssue:
+    work_id: str
+    split_type: str
+    rights_layer: str
+    total: float
+    rows: int
+
+    @property
+    def message(self) -> str:
+        total = round(self.total, 2)
+        if total < 100:
+            return f'Splits total {total:g}% (missing {round(100 - total, 2):g}%)'
+        return f'Splits total {total:g}% (over by {round(total - 100, 2):g}%)'
+
+    def to_json(self) -> dict[str, Any]:
+        return {**vars(self), 'total': round(self.total, 4), 'message': self.message}
+
+
+class SplitTotals:
+    """Running totals of every (work, split type, rights layer) group seen so far."""
+
+    def __init__(self) -> None:
+        self.works: dict[str, int] = {}
+        self.rows = 0
+        if np is not None:
+            self._sums = np.zeros(GROUP_SLOTS * 1024)
+            self._counts = np.zeros(GROUP_SLOTS * 1024, dtype=np.int64)
+        else:
+            self._sums = array('d')
+            self._counts = array('q')
+
+    @property
+    def groups(self) -> int:
+        counts = self._counts[: len(self.works) * GROUP_SLOTS]
+        return int(np.count_nonzero(counts)) if np is not None else sum(1 for count in counts if count)
+
+    def _group_ids(self, chunk: SplitChunk) -> list[int]:
+        works = self.works
+        try:
+            return [
+                works.setdefault(work_id, len(works)) * GROUP_SLOTS + _SLOTS[split_type, layer]
+                for work_id, split_type, layer in zip(chunk.work_ids, chunk.split_types, chunk.rights_layers)
+            ]
+        except KeyError as exc:
+            raise ExportError(f'unknown split type or rights layer {exc.args[0]}') from None
+
+    def add(self, chunk: SplitChunk) -> None:
+        groups = self._group_ids(chunk)
+        if not groups:
+            return
+        size = len(self.works) * GROUP_SLOTS
+        self.rows += len(groups)
+        if np is None:
+            missing = size - len(self._sums)
+            if missing > 0:
+                self._sums.extend([0.0] * missing)
+                self._counts.extend([0] * missing)
+            for group, percentage in zip(groups, chunk.percentages):
+                self._sums[group] += percentage
+                self._counts[group] += 1
+            return
+        if size > len(self._sums):
+            capacity = max(size, 2 * len(self._sums))
+            self._sums = np.concatenate([self._sums, np.zeros(capacity - len(self._sums))])
+            self._counts = np.concatenate([self._counts, np.zeros(capacity - len(self._counts), dtype=np.int64)])
+        ids = np.asarray(groups, dtype=np.int64)
+        low, high = int(ids.min()), int(ids.max()) + 1
+        local = ids - low
+        self._sums[low:high] += np.bincount(local, weights=np.asarray(chunk.percentages), minlength=high - low)
+        self._counts[low:high] += np.bincount(local, minlength=high - low)
+
+    def issues(self) -> list[SplitIssue]:
+        """Groups whose total is not 100, in work order."""
+        size = len(self.works) * GROUP_SLOTS
+        if np is not None:
+            sums, counts = self._sums[:size], self._counts[:size]
+            bad = np.flatnonzero((counts != 0) & (np.rint(sums / TOLERANCE) != _TARGET)).tolist()
+        else:
+            sums, counts = self._sums, self._counts
+            bad = [group for group in range(size) if counts[group] and round(sums[group] / TOLERANCE) != _TARGET]
+        work_ids = list(self.works)
+        issues = []
+        for group in bad:
+            work, slot = divmod(group, GROUP_SLOTS)
+            split_type, layer = SPLIT_TYPES[slot // len(RIGHTS_LAYERS)], RIGHTS_LAYERS[slot % len(RIGHTS_LAYERS)]
+            issues.append(SplitIssue(work_ids[work], split_type, layer, float(sums[group]), int(counts[group])))
+        return issues
+
+
+def validate(chunks: Iterable[SplitChunk]) -> SplitTotals:
+    totals = SplitTotals()
+    for chunk in chunks:
+        totals.add(chunk)
+    return totals